@@ -0,0 +1,414 @@
+"""
+Command latency and MongoDB operation counts against synthetic users
+
+Seeds a throwaway database with synthetic users (inventory, shinies, event
+shinies, cooldowns and ID overrides), then drives the cog commands directly
+with a fake ctx - no Discord connection - and reports per command:
+- p50 / p99 / mean latency
+- MongoDB operations issued per call, by collection and operation
+
+Backends:
+- default: mongomock-motor (in-process, `pip install mongomock-motor "pymongo<4.9"`;
+  mongomock does not support pymongo 4.9+). mongomock checks unique indexes
+  and runs queries by scanning, so seeding grows quadratically; it defaults to
+  5 users with 500 inventory / 200 shinies each instead of 20 / 2000 / 500
+- --mongo-uri mongodb://localhost:27017: a local mongod (realistic latencies
+  and query plans; the bench database is dropped afterwards)
+
+Requires the bot's own dependencies (discord.py, motor). Commands that render
+images or download resources are not part of the run.
+
+Usage: python bench/bench_db.py [--users N] [--inventory N] [--shinies N] [--event-shinies N]
+                                [--cooldowns N] [--overrides N] [--iterations N] [--commands ...]
+                                [--mongo-uri URI] [--json PATH] [--seed S]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # cogs load their data files relative to the repository root
+
+import config
+import database
+from database import db
+
+BENCH_DATABASE = "minimeowth_bench"
+FIRST_USER_ID = 10 ** 17
+
+# Collection methods that go to the server (find/aggregate count once, when the cursor is created)
+MONGO_OPERATIONS = {
+    'find', 'find_one', 'aggregate', 'count_documents', 'distinct',
+    'insert_one', 'insert_many', 'update_one', 'update_many', 'replace_one',
+    'delete_one', 'delete_many', 'bulk_write', 'find_one_and_update',
+}
+COLLECTIONS = ('pokemon', 'user_data', 'shinies', 'event_shinies', 'sessions', 'shiny_summaries', 'leaderboards')
+
+
+# Op counting
+
+class CountingCollection:
+    """Forwards to a motor collection, counting server operations into a shared Counter"""
+
+    def __init__(self, collection, name: str, counter: Counter):
+        self._collection = collection
+        self._name = name
+        self._counter = counter
+
+    def __getattr__(self, attr):
+        value = getattr(self._collection, attr)
+        if attr in MONGO_OPERATIONS:
+            def counted(*args, **kwargs):
+                self._counter[f"{self._name}.{attr}"] += 1
+                return value(*args, **kwargs)
+            return counted
+        return value
+
+
+def instrument_collections(counter: Counter):
+    raw = {}
+    for name in COLLECTIONS:
+        collection = getattr(db, name, None)
+        if collection is not None:
+            raw[name] = collection
+            setattr(db, name, CountingCollection(collection, name, counter))
+    return raw
+
+
+# Fake Discord objects
+
+class FakeAsset:
+    url = "https://cdn.discordapp.com/embed/avatars/0.png"
+
+
+class FakeUser:
+    def __init__(self, user_id: int):
+        self.id = user_id
+        self.name = f"bench{user_id % 10000}"
+        self.display_name = self.name
+        self.display_avatar = FakeAsset()
+        self.avatar = None
+        self.bot = False
+        self.mention = f"<@{user_id}>"
+
+    def __str__(self):
+        return self.name
+
+
+class FakeMessage:
+    _next_id = 1
+
+    def __init__(self, channel, content=None, **kwargs):
+        FakeMessage._next_id += 1
+        self.id = FakeMessage._next_id
+        self.channel = channel
+        self.content = content
+        self.embeds = [kwargs['embed']] if kwargs.get('embed') else []
+        self.reference = None
+        self.author = None
+
+    async def edit(self, **kwargs):
+        self.channel.calls['edit'] += 1
+        return self
+
+    async def delete(self, **kwargs):
+        self.channel.calls['delete'] += 1
+
+    async def add_reaction(self, emoji):
+        self.channel.calls['reaction'] += 1
+
+
+class FakeChannel:
+    def __init__(self):
+        self.id = 1
+        self.calls = Counter()
+
+    async def send(self, content=None, **kwargs):
+        self.calls['send'] += 1
+        return FakeMessage(self, content, **kwargs)
+
+    async def fetch_message(self, message_id):
+        raise LookupError("No messages in the bench channel")
+
+
+class FakeContext:
+    """The parts of commands.Context the benchmarked commands use"""
+
+    def __init__(self, bot, user_id: int, channel: FakeChannel):
+        self.bot = bot
+        self.author = FakeUser(user_id)
+        self.channel = channel
+        self.guild = None
+        self.interaction = None
+        self.command = None
+        self.message = FakeMessage(channel, "")
+        self.message.author = self.author
+
+    async def send(self, content=None, **kwargs):
+        return await self.channel.send(content, **kwargs)
+
+    async def reply(self, content=None, **kwargs):
+        return await self.channel.send(content, **kwargs)
+
+
+class FakeBot:
+    def __init__(self):
+        self.cogs = {}
+        self.user = FakeUser(1)
+
+    def get_cog(self, name: str):
+        return self.cogs.get(name)
+
+    def add(self, cog):
+        self.cogs[cog.qualified_name] = cog
+        return cog
+
+
+# Synthetic data
+
+def make_users(utils, args, rng: random.Random):
+    """Yield (user_id, pokemon, shinies, event_shinies, user_data) per synthetic user"""
+    breedable = sorted(name for name in utils.egg_groups if 'Undiscovered' not in utils.egg_groups[name])
+    full_forms = utils.get_full_dex_entries()
+    event_forms = utils.get_event_entries()
+    categories = [config.NORMAL_CATEGORY] * 8 + [config.TRIPMAX_CATEGORY, config.TRIPZERO_CATEGORY]
+    now = datetime.utcnow()
+
+    for u in range(args.users):
+        user_id = FIRST_USER_ID + u
+        ids = rng.sample(range(1, config.OLD_ID_MAX + 400000), args.inventory + args.shinies + args.event_shinies)
+
+        pokemon = []
+        for pid in ids[:args.inventory]:
+            name = 'Ditto' if rng.random() < 0.03 else rng.choice(breedable)
+            base = utils.get_base_species(name)
+            category = rng.choice(categories)
+            iv = round(rng.uniform(90, 100) if category == config.TRIPMAX_CATEGORY else
+                       rng.uniform(0, 10) if category == config.TRIPZERO_CATEGORY else rng.uniform(0, 100), 2)
+            pokemon.append({
+                'user_id': user_id,
+                'pokemon_id': pid,
+                'name': name,
+                'gender': 'unknown' if name == 'Ditto' else rng.choice(('male', 'female')),
+                'level': rng.randint(1, 100),
+                'iv_percent': iv,
+                'dex_number': utils.get_dex_number(name) or 0,
+                'egg_groups': utils.get_egg_groups(base) or [],
+                'base_species': base,
+                'is_ditto': name == 'Ditto',
+                'is_gmax': rng.random() < 0.02,
+                'is_regional': utils.is_regional(name),
+                'categories': [category],
+            })
+
+        shinies = []
+        for pid in ids[args.inventory:args.inventory + args.shinies]:
+            dex_num, name, has_gender_diff = rng.choice(full_forms)
+            shinies.append({
+                'user_id': user_id, 'pokemon_id': pid, 'name': name, 'dex_number': dex_num,
+                'gender': rng.choice(('male', 'female')) if has_gender_diff else 'unknown',
+                'level': rng.randint(1, 100), 'iv_percent': round(rng.uniform(0, 100), 2),
+            })
+
+        event_shinies = []
+        for pid in ids[args.inventory + args.shinies:]:
+            name, has_gender_diff = rng.choice(event_forms)
+            event_shinies.append({
+                'user_id': user_id, 'pokemon_id': pid, 'name': name, 'dex_number': 0,
+                'gender': rng.choice(('male', 'female')) if has_gender_diff else 'unknown',
+                'level': rng.randint(1, 100), 'iv_percent': round(rng.uniform(0, 100), 2),
+            })
+
+        inventory_ids = [p['pokemon_id'] for p in pokemon]
+        cooldown_ids = rng.sample(inventory_ids, min(args.cooldowns, len(inventory_ids)))
+        override_ids = rng.sample(inventory_ids, min(args.overrides, len(inventory_ids)))
+        user_data = {
+            'user_id': user_id,
+            'settings': {
+                'mode': 'notselective', 'target': ['all'],
+                'mychoice_male': None, 'mychoice_female': None, 'show_info': 'detailed',
+            },
+            'cooldowns': {str(pid): now + timedelta(hours=rng.uniform(-24, 120)) for pid in cooldown_ids},
+            'id_overrides': {str(pid): rng.choice(('old', 'new')) for pid in override_ids},
+        }
+        yield user_id, pokemon, shinies, event_shinies, user_data
+
+
+async def seed(raw, utils, args, rng):
+    start = time.perf_counter()
+    user_ids = []
+    for user_id, pokemon, shinies, event_shinies, user_data in make_users(utils, args, rng):
+        if pokemon:
+            await raw['pokemon'].insert_many(pokemon, ordered=False)
+        if shinies:
+            await raw['shinies'].insert_many(shinies, ordered=False)
+        if event_shinies:
+            await raw['event_shinies'].insert_many(event_shinies, ordered=False)
+        await raw['user_data'].insert_one(user_data)
+        user_ids.append(user_id)
+    print(f"Seeded {len(user_ids)} users in {time.perf_counter() - start:.1f}s "
+          f"({args.inventory} inventory / {args.shinies} shinies / {args.event_shinies} event shinies each)")
+    return user_ids
+
+
+# Commands
+
+def command_table(cogs):
+    """name -> coroutine function(ctx) invoking the command callback like discord.py would"""
+    breeding, inventory = cogs['Breeding'], cogs['Inventory']
+    display, stats, chain = cogs['ShinyDexDisplay'], cogs['ShinyDexStats'], cogs['ChainBreeding']
+    return {
+        'breed': lambda ctx: breeding.breed_command.callback(breeding, ctx, 1),
+        'inv': lambda ctx: inventory.view_inventory.callback(inventory, ctx, filters=None),
+        'shinydex': lambda ctx: display.shiny_dex.callback(display, ctx, filters="--r kanto --unc"),
+        'shinydexfull': lambda ctx: display.shiny_dex_full.callback(display, ctx, filters=None),
+        'filter': lambda ctx: display.filter_dex.callback(display, ctx, "starters", options="--caught"),
+        'typestats': lambda ctx: stats.type_stats.callback(stats, ctx),
+        'iwant': lambda ctx: chain.iwant_command.callback(chain, ctx, "absol", moves="play rough, zen headbutt"),
+        'canlearn': lambda ctx: chain.canlearn_command.callback(chain, ctx, moves="play rough, zen headbutt"),
+    }
+
+
+def load_cogs(bot):
+    from cogs.utils import Utils
+    from cogs.breeding import Breeding
+    from cogs.inventory import Inventory
+    from cogs.shinydex_display import ShinyDexDisplay
+    from cogs.shinydexstats import ShinyDexStats
+    from cogs.chainbreeding import ChainBreeding
+
+    for cog_class in (Utils, Breeding, Inventory, ShinyDexDisplay, ShinyDexStats, ChainBreeding):
+        bot.add(cog_class(bot))
+    return bot.cogs
+
+
+def percentile(sorted_values, p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(p / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+async def run_command(name, invoke, bot, user_ids, counter, iterations):
+    latencies = []
+    ops = Counter()
+    channel = FakeChannel()
+    errors = 0
+    for i in range(iterations):
+        ctx = FakeContext(bot, user_ids[i % len(user_ids)], channel)
+        before = Counter(counter)
+        start = time.perf_counter()
+        try:
+            await invoke(ctx)
+        except Exception as e:
+            errors += 1
+            if errors == 1:
+                print(f"  ⚠️ {name}: {type(e).__name__}: {e}")
+        latencies.append(time.perf_counter() - start)
+        ops.update(counter - before)
+
+    latencies.sort()
+    return {
+        'iterations': iterations,
+        'errors': errors,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+        'mean_ms': round(sum(latencies) / len(latencies) * 1000, 3),
+        'mongo_ops_per_call': round(sum(ops.values()) / iterations, 2),
+        'mongo_ops': {op: round(count / iterations, 2) for op, count in sorted(ops.items())},
+        'discord_calls_per_call': {call: round(count / iterations, 2) for call, count in sorted(channel.calls.items())},
+    }
+
+
+async def main_async(args):
+    if args.mongo_uri:
+        config.MONGODB_URI = args.mongo_uri
+        backend = 'mongod'
+    else:
+        from mongomock_motor import AsyncMongoMockClient
+        database.AsyncIOMotorClient = AsyncMongoMockClient
+        # The placeholder URI in config (mongodb+srv://...) would need a DNS lookup
+        config.MONGODB_URI = "mongodb://localhost"
+        backend = 'mongomock'
+    config.DATABASE_NAME = BENCH_DATABASE
+
+    await db.connect()
+    await db.client.drop_database(BENCH_DATABASE)
+    await db.connect()  # recreate indexes on the empty database
+
+    counter = Counter()
+    raw = instrument_collections(counter)
+
+    bot = FakeBot()
+    cogs = load_cogs(bot)
+    rng = random.Random(args.seed)
+    user_ids = await seed(raw, cogs['Utils'], args, rng)
+
+    commands = command_table(cogs)
+    selected = args.commands or list(commands)
+    results = {}
+    print(f"\n{'command':<14}{'p50 ms':>10}{'p99 ms':>10}{'mean ms':>10}{'ops/call':>10}  top operations")
+    for name in selected:
+        if name not in commands:
+            print(f"  ⚠️ unknown command {name}")
+            continue
+        # One untimed warm-up call (caches, lazy imports)
+        await run_command(name, commands[name], bot, user_ids, Counter(), 1)
+        result = await run_command(name, commands[name], bot, user_ids, counter, args.iterations)
+        results[name] = result
+        top = ', '.join(f"{op}={n:g}" for op, n in sorted(result['mongo_ops'].items(), key=lambda kv: -kv[1])[:3])
+        print(f"{name:<14}{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}{result['mean_ms']:>10.2f}"
+              f"{result['mongo_ops_per_call']:>10g}  {top}")
+
+    if args.mongo_uri:
+        await db.client.drop_database(BENCH_DATABASE)
+
+    if args.json:
+        report = {
+            'backend': backend,
+            'seed': args.seed,
+            'scale': {
+                'users': args.users, 'inventory': args.inventory, 'shinies': args.shinies,
+                'event_shinies': args.event_shinies, 'cooldowns': args.cooldowns, 'overrides': args.overrides,
+            },
+            'python': platform.python_version(),
+            'timestamp': datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+            'results': results,
+        }
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {args.json}")
+
+    return 1 if any(r['errors'] for r in results.values()) else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, help="default 20, 5 on mongomock")
+    parser.add_argument('--inventory', type=int, help="Pokemon per user (default 2000, 500 on mongomock)")
+    parser.add_argument('--shinies', type=int, help="shinies per user (default 500, 200 on mongomock)")
+    parser.add_argument('--event-shinies', type=int, default=50, help="event shinies per user")
+    parser.add_argument('--cooldowns', type=int, default=200, help="cooldown entries per user")
+    parser.add_argument('--overrides', type=int, default=50, help="ID overrides per user")
+    parser.add_argument('--iterations', type=int, default=30, help="timed calls per command")
+    parser.add_argument('--commands', nargs='+', help="subset of: breed inv shinydex shinydexfull filter typestats iwant canlearn")
+    parser.add_argument('--mongo-uri', help="use a local mongod instead of mongomock-motor")
+    parser.add_argument('--json', help="write results to this file")
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+    for name, mongod, mongomock in (('users', 20, 5), ('inventory', 2000, 500), ('shinies', 500, 200)):
+        if getattr(args, name) is None:
+            setattr(args, name, mongod if args.mongo_uri else mongomock)
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
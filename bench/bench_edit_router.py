@@ -0,0 +1,279 @@
+"""
+Replay benchmark for the message_edit router
+
+Replays a high-volume stream of message edits (mostly Pokétwo messages
+nobody monitors, a small share hitting monitored ones) while createlist
+sources, ?track sessions and page ingestors are active, through:
+- fanout: a model of the previous handling - discord.py starts a task per
+  on_message_edit listener (main, PokemonListTools, UtilityCommands), the
+  ?track listener scans every session for a matching monitoring_message_id,
+  and every pending bot.wait_for check runs against every edit
+- router: main's on_raw_message_edit handing each edit to MessageEditRouter
+  (plus main's on_message_edit, which only reprocesses commands)
+
+Reports edits/s, per-edit cost, tasks started and checks evaluated, and
+verifies both deliver exactly the monitored edits to their sessions.
+A second phase runs real PageIngestors on the router and checks that each
+ingests every page of its own message and nothing else.
+
+No Discord connection or database; handlers only count.
+
+Usage: python bench/bench_edit_router.py [--edits N] [--monitored-share F] [--lists N]
+                                         [--tracks N] [--ingestors N] [--ingest-edits N] [--seed S]
+Exits non-zero if a delivery check fails.
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from edit_router import MessageEditRouter, edit_router
+from page_ingest import PageIngestor
+
+POKETWO = SimpleNamespace(id=716390085896962058, bot=True)
+DRAIN_EVERY = 1000  # edits between letting the scheduled handler tasks run
+SESSION_TTL = 600
+
+
+class Sessions:
+    """SessionStore's in-memory expiry semantics (get drops expired, items purges first)"""
+
+    def __init__(self, states: dict):
+        expires_at = datetime.utcnow() + timedelta(seconds=SESSION_TTL)
+        self._sessions = {key: (state, expires_at) for key, state in states.items()}
+
+    def get(self, key):
+        entry = self._sessions.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= datetime.utcnow():
+            del self._sessions[key]
+            return None
+        return entry[0]
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def items(self):
+        now = datetime.utcnow()
+        for key in [k for k, (_, expires_at) in self._sessions.items() if expires_at <= now]:
+            del self._sessions[key]
+        return [(key, state) for key, (state, _) in self._sessions.items()]
+
+
+def make_message(message_id: int):
+    return SimpleNamespace(id=message_id, author=POKETWO, content='', embeds=[SimpleNamespace(description='')])
+
+
+def make_payload(after):
+    """RawMessageUpdateEvent for an edit of an uncached message"""
+    return SimpleNamespace(message_id=after.id, channel_id=1, cached_message=None, message=after)
+
+
+def build_world(args):
+    """Monitored message IDs per kind, and the edit stream"""
+    rng = random.Random(args.seed)
+    next_id = iter(range(1, 10 ** 9))
+    world = {
+        'lists': [next(next_id) for _ in range(args.lists)],
+        'tracks': [next(next_id) for _ in range(args.tracks)],
+        'ingestors': [next(next_id) for _ in range(args.ingestors)],
+    }
+    monitored = world['lists'] + world['tracks'] + world['ingestors']
+    stream = []
+    for i in range(args.edits):
+        if monitored and rng.random() < args.monitored_share:
+            stream.append(make_message(rng.choice(monitored)))
+        else:
+            stream.append(make_message(10 ** 9 + i))
+    return world, stream
+
+
+async def main_on_message_edit(before, after):
+    """main.on_message_edit for bot-authored edits: nothing to process as a command"""
+    if after.author.bot:
+        return
+
+
+# Fan-out model
+
+async def replay_fanout(world, stream) -> dict:
+    delivered = Counter()
+    stats = {'tasks': 0, 'checks': 0}
+    lists = Sessions({message_id: {'list_key': f"list{i}"} for i, message_id in enumerate(world['lists'])})
+    tracks = Sessions({i: {'monitoring_message_id': message_id, 'status': 'tracking'}
+                       for i, message_id in enumerate(world['tracks'])})
+
+    async def pokemonlisttools_on_message_edit(before, after):
+        if after.id in lists:
+            delivered[after.id] += 1
+
+    async def utility_on_message_edit(before, after):
+        for channel_id, track_data in tracks.items():
+            stats['checks'] += 1
+            if track_data.get('monitoring_message_id') != after.id or track_data.get('status') != 'tracking':
+                continue
+            delivered[after.id] += 1
+
+    def ingestor_check(message_id):
+        return lambda before, after: after.id == message_id and after.author.id == POKETWO.id and after.embeds
+
+    waiters = [ingestor_check(message_id) for message_id in world['ingestors']]
+    listeners = (main_on_message_edit, pokemonlisttools_on_message_edit, utility_on_message_edit)
+    loop = asyncio.get_running_loop()
+
+    start = time.perf_counter()
+    for i, after in enumerate(stream, 1):
+        # discord.py dispatch: wait_for checks inline (a matched waiter re-arms after its page)
+        for check in waiters:
+            stats['checks'] += 1
+            if check(None, after):
+                delivered[after.id] += 1
+        for listener in listeners:
+            loop.create_task(listener(None, after))
+        stats['tasks'] += len(listeners)
+        if i % DRAIN_EVERY == 0:
+            await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    stats['seconds'] = time.perf_counter() - start
+    stats['delivered'] = delivered
+    return stats
+
+
+# Router
+
+async def replay_router(world, stream) -> dict:
+    delivered = Counter()
+    router = MessageEditRouter()
+
+    async def count(before, after):
+        delivered[after.id] += 1
+
+    for kind in ('lists', 'tracks', 'ingestors'):
+        for i, message_id in enumerate(world[kind]):
+            router.subscribe(message_id, (kind, i), count, SESSION_TTL)
+
+    async def on_raw_message_edit(payload):
+        await router.dispatch_raw(payload)
+
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    for i, after in enumerate(stream, 1):
+        loop.create_task(on_raw_message_edit(make_payload(after)))
+        loop.create_task(main_on_message_edit(None, after))
+        if i % DRAIN_EVERY == 0:
+            await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    return {'seconds': time.perf_counter() - start, 'tasks': 2 * len(stream), 'checks': 0,
+            'delivered': delivered, 'lookups': router.dispatched}
+
+
+def report(label: str, result: dict, edits: int):
+    seconds = result['seconds']
+    print(f"{label:<8}{edits / seconds:>12,.0f} edits/s{seconds / edits * 1e6:>9.2f} µs/edit"
+          f"{result['tasks']:>12,} tasks{result['checks']:>14,} checks")
+
+
+def check_delivery(label: str, delivered: Counter, expected: Counter) -> bool:
+    if delivered != expected:
+        missing = sum((expected - delivered).values())
+        extra = sum((delivered - expected).values())
+        print(f"❌ {label}: {missing} monitored edits not delivered, {extra} delivered wrongly")
+        return False
+    print(f"✅ {label}: {sum(delivered.values())} monitored edits delivered to {len(delivered)} sessions")
+    return True
+
+
+# Real PageIngestors on the router
+
+async def check_ingestors(args) -> bool:
+    rng = random.Random(args.seed)
+    message_ids = list(range(1, args.ingestors + 1))
+    pages = {message_id: 0 for message_id in message_ids}
+
+    def parse_page(message_id):
+        def parse(embed):
+            assert embed.message_id == message_id, "page of another message"
+            return [embed.page]
+        return parse
+
+    async def write_batch(items):
+        return len(items)
+
+    async def count_total():
+        return 0
+
+    ingestors = [
+        PageIngestor(None, message_id, parse_page(message_id), write_batch, count_total,
+                     render_status=lambda added, inventory: '', author_id=POKETWO.id,
+                     idle_timeout=0.3, poll_interval=0.1, flush_delay=0)
+        for message_id in message_ids
+    ]
+    runs = [asyncio.create_task(ingestor.run()) for ingestor in ingestors]
+    await asyncio.sleep(0)
+
+    for i in range(args.ingest_edits):
+        if rng.random() < 0.5:
+            message_id = rng.choice(message_ids)
+            pages[message_id] += 1
+            after = SimpleNamespace(id=message_id, author=POKETWO, content='',
+                                    embeds=[SimpleNamespace(message_id=message_id, page=pages[message_id])])
+        else:
+            after = make_message(10 ** 9 + i)
+        await edit_router.dispatch_raw(make_payload(after))
+        if i % 100 == 0:
+            await asyncio.sleep(0)
+
+    added = await asyncio.gather(*runs)
+    wrong = [ingestor.message_id for ingestor, total in zip(ingestors, added)
+             if ingestor.pages != pages[ingestor.message_id] or total != pages[ingestor.message_id]]
+    if wrong or len(edit_router):
+        print(f"❌ page ingestors: {len(wrong)} with missing or foreign pages, {len(edit_router)} subscriptions left")
+        return False
+    print(f"✅ page ingestors: {len(ingestors)} ingested all {sum(pages.values())} pages of their messages, "
+          f"unsubscribed afterwards")
+    return True
+
+
+async def main_async(args):
+    world, stream = build_world(args)
+    monitored = set(world['lists'] + world['tracks'] + world['ingestors'])
+    expected = Counter(after.id for after in stream if after.id in monitored)
+    print(f"{len(stream):,} edits, {sum(expected.values()):,} of monitored messages; "
+          f"{args.lists} createlist sources, {args.tracks} tracks, {args.ingestors} ingestors\n")
+
+    fanout = await replay_fanout(world, stream)
+    router = await replay_router(world, stream)
+    report("fanout", fanout, len(stream))
+    report("router", router, len(stream))
+    print(f"router: {router['lookups']:,} dict lookups, {fanout['seconds'] / router['seconds']:.1f}x faster\n")
+
+    ok = check_delivery("fanout", fanout['delivered'], expected)
+    ok &= check_delivery("router", router['delivered'], expected)
+    if args.ingestors:
+        ok &= await check_ingestors(args)
+    return 0 if ok else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--edits', type=int, default=200000)
+    parser.add_argument('--monitored-share', type=float, default=0.01, help="share of edits to monitored messages")
+    parser.add_argument('--lists', type=int, default=50, help="monitored createlist source messages")
+    parser.add_argument('--tracks', type=int, default=50, help="active ?track sessions")
+    parser.add_argument('--ingestors', type=int, default=20, help="running m!add/m!trackshiny/m!trackevent ingestors")
+    parser.add_argument('--ingest-edits', type=int, default=5000, help="edits replayed in the ingestor phase")
+    parser.add_argument('--seed', type=int, default=50)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Golden, fuzz and throughput checks for embed_parser
+
+- Golden: every line in fixtures/embed_lines.json must parse to its expected record
+- Fuzz: random mutations of the corpus must never raise and must yield sane records
+- Throughput: lines per second through parse_line
+
+Usage: python bench/bench_embed_parser.py [--lines N] [--fuzz N] [--seed S]
+Exits non-zero if the golden or fuzz checks fail.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..'))
+
+from embed_parser import ParsedLine, parse_line
+
+FIXTURE = os.path.join(BENCH_DIR, 'fixtures', 'embed_lines.json')
+FUZZ_ALPHABET = list("`*•　 <>:_!✨0123456789.%LvlmaefunkowPikachu") + ['<:male:1>', '<:female:2>', 'Lvl. ', '<:_:1242455099213877248>']
+
+
+def load_corpus():
+    with open(FIXTURE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def check_golden(corpus):
+    failures = 0
+    for case in corpus:
+        record = parse_line(case['line'])
+        got = record._asdict() if record else None
+        if got != case['expected']:
+            failures += 1
+            print(f"❌ {case['line']!r}\n   expected {case['expected']}\n   got      {got}")
+    print(f"golden     {len(corpus) - failures}/{len(corpus)} lines match")
+    return failures == 0
+
+
+def mutate(rng, line):
+    chars = list(line)
+    for _ in range(rng.randint(1, 4)):
+        op = rng.random()
+        pos = rng.randint(0, len(chars))
+        if op < 0.4:
+            chars.insert(pos, rng.choice(FUZZ_ALPHABET))
+        elif op < 0.8 and chars:
+            del chars[min(pos, len(chars) - 1)]
+        elif chars:
+            chars[min(pos, len(chars) - 1)] = rng.choice(FUZZ_ALPHABET)
+    return ''.join(chars)
+
+
+def check_fuzz(corpus, iterations, seed):
+    rng = random.Random(seed)
+    lines = [case['line'] for case in corpus if case['line']]
+    for i in range(iterations):
+        line = mutate(rng, rng.choice(lines))
+        try:
+            record = parse_line(line)
+        except Exception as e:
+            print(f"❌ fuzz #{i} raised {type(e).__name__}: {e} on {line!r}")
+            return False
+        if record is None:
+            continue
+        if not isinstance(record, ParsedLine) or not isinstance(record.pokemon_id, int):
+            print(f"❌ fuzz #{i} produced a malformed record {record!r} from {line!r}")
+            return False
+        if record.gender not in (None, 'male', 'female', 'unknown'):
+            print(f"❌ fuzz #{i} produced gender {record.gender!r} from {line!r}")
+            return False
+    print(f"fuzz       {iterations} mutated lines parsed without errors")
+    return True
+
+
+def bench_throughput(corpus, count):
+    lines = [case['line'] for case in corpus]
+    stream = (lines * (count // len(lines) + 1))[:count]
+    start = time.perf_counter()
+    for line in stream:
+        parse_line(line)
+    elapsed = time.perf_counter() - start
+    print(f"throughput {count / elapsed:,.0f} lines/s ({elapsed * 1e6 / count:.2f} µs/line)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--lines', type=int, default=200_000)
+    parser.add_argument('--fuzz', type=int, default=20_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    ok = check_golden(corpus)
+    ok = check_fuzz(corpus, args.fuzz, args.seed) and ok
+    bench_throughput(corpus, args.lines)
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Peak memory of .txt list ingestion (read-all vs streamed) for multi-megabyte lists
+
+Generates a Pokétwo-style list file on the fly in download-sized chunks and
+extracts names from it twice, measuring the Python heap peak with tracemalloc:
+- read-all: join every chunk (attachment.read()), decode, extract from the whole text
+- streamed: iter_text_blocks + PokemonNameExtractor block by block
+Both must find the same names. Also checks that the byte and line caps stop
+an oversized file early.
+
+Usage: python bench/bench_list_file.py [--mb N ...]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from list_text import PokemonNameExtractor, ListFileTooLarge, iter_text_blocks, DOWNLOAD_CHUNK_BYTES
+
+NAMES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'pokemonnames.txt')
+
+
+def load_names():
+    with open(NAMES_FILE, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+async def generate_chunks(names, size_bytes, seed=3):
+    """Yield ~size_bytes of list lines as UTF-8 chunks, without keeping the file around"""
+    rng = random.Random(seed)
+    produced = 0
+    buffer = bytearray()
+    number = 0
+    while produced < size_bytes:
+        number += 1
+        line = f"`{number}` **{rng.choice(names)}** • Lvl. {rng.randint(1, 100)} • {rng.random() * 100:.2f}%\n"
+        buffer += line.encode('utf-8')
+        if len(buffer) >= DOWNLOAD_CHUNK_BYTES:
+            # Cut mid-character on purpose now and then to exercise incremental decoding
+            chunk, buffer = bytes(buffer[:DOWNLOAD_CHUNK_BYTES - 1]), buffer[DOWNLOAD_CHUNK_BYTES - 1:]
+            produced += len(chunk)
+            yield chunk
+    if buffer:
+        yield bytes(buffer)
+
+
+async def read_all(extractor, chunks):
+    data = b''.join([chunk async for chunk in chunks])
+    return extractor.extract(data.decode('utf-8'))
+
+
+async def streamed(extractor, chunks, max_bytes, max_lines):
+    found = set()
+    pokemon = []
+    async for block in iter_text_blocks(chunks, max_bytes, max_lines):
+        pokemon.extend(extractor.extract(block, found))
+    return pokemon
+
+
+async def measure(label, coro):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = await coro
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<9} peak {peak / 1024 / 1024:>7.1f} MB  {elapsed:>6.2f}s  {len(result)} names")
+    return result
+
+
+async def main_async(args):
+    names = load_names()
+    extractor = PokemonNameExtractor(names)
+    failed = False
+
+    for mb in args.mb:
+        size = int(mb * 1024 * 1024)
+        print(f"{mb} MB list:")
+        whole = await measure("read-all", read_all(extractor, generate_chunks(names, size)))
+        stream = await measure("streamed", streamed(extractor, generate_chunks(names, size), size * 2, 10 ** 9))
+        if set(whole) != set(stream):
+            print("  ❌ streamed extraction found different names")
+            failed = True
+
+    # Caps stop early instead of reading everything
+    for label, max_bytes, max_lines in (("byte cap", 1024 * 1024, 10 ** 9), ("line cap", 10 ** 9, 5000)):
+        try:
+            await streamed(extractor, generate_chunks(names, 4 * 1024 * 1024), max_bytes, max_lines)
+            print(f"❌ {label} not enforced")
+            failed = True
+        except ListFileTooLarge as e:
+            print(f"{label}: rejected ({e})")
+
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mb', type=float, nargs='+', default=[1, 4])
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
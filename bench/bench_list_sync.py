@@ -0,0 +1,200 @@
+"""
+REST call counts for createlist list updates (old full re-edit vs ListMessageSync)
+
+A fake channel records every send/edit/delete. Each pattern replays typical
+list growth - small appends from a monitored message, one large paste,
+repeated updates that change nothing, and a burst of concurrent updates -
+through the old _update_list_message logic and through ListMessageSync,
+then checks the resulting messages against a fresh render of the list.
+(The old logic races under concurrent updates and posts duplicate
+continuation messages; that is reported, not treated as a failure.)
+
+Exits with status 1 if ListMessageSync leaves wrong contents or issues more
+calls than the old logic, so it can be used as a regression check.
+
+Usage: python bench/bench_list_sync.py [--rtt-ms MS]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from list_messages import ListMessageSync, split_chunks, render_chunks
+
+CHANNEL_ID = 10
+CALL_KINDS = ('send', 'edit', 'delete')
+
+
+class FakeChannel:
+    """Stores message contents by ID and counts REST calls"""
+
+    def __init__(self, rtt):
+        self.id = CHANNEL_ID
+        self.rtt = rtt
+        self.messages = {}
+        self.next_id = 1
+        self.calls = {'send': 0, 'edit': 0, 'delete': 0}
+
+    async def send(self, content):
+        await asyncio.sleep(self.rtt)
+        self.calls['send'] += 1
+        message = FakeMessage(self, self.next_id)
+        self.messages[message.id] = content
+        self.next_id += 1
+        return message
+
+    def get_partial_message(self, message_id):
+        return FakeMessage(self, message_id)
+
+
+class FakeMessage:
+    def __init__(self, channel, message_id):
+        self.channel = channel
+        self.id = message_id
+
+    async def edit(self, content):
+        await asyncio.sleep(self.channel.rtt)
+        self.channel.calls['edit'] += 1
+        self.channel.messages[self.id] = content
+
+    async def delete(self):
+        await asyncio.sleep(self.channel.rtt)
+        self.channel.calls['delete'] += 1
+        self.channel.messages.pop(self.id, None)
+
+
+class FakeBot:
+    def __init__(self, channel):
+        self.channel = channel
+
+    def get_channel(self, channel_id):
+        return self.channel
+
+
+def legacy_split(names):
+    ends = split_chunks(names)
+    return [", ".join(names[start:end]) for start, end in zip([0] + ends[:-1], ends)]
+
+
+async def legacy_update(channel, list_data):
+    """The old _update_list_message: every chunk is re-edited on every update"""
+    names = list_data['pokemon']
+    chunks = legacy_split(names)
+    await channel.get_partial_message(list_data['message_id']).edit(
+        content=f"**Pokemon List ({len(names)} total):**\n{chunks[0]}")
+
+    continuation_ids = list_data['continuation_message_ids']
+    for i, chunk in enumerate(chunks[1:], 2):
+        content = f"**Pokemon List (continued - part {i}):**\n{chunk}"
+        if i - 2 < len(continuation_ids):
+            await channel.get_partial_message(continuation_ids[i - 2]).edit(content=content)
+        else:
+            continuation_ids.append((await channel.send(content)).id)
+
+
+async def legacy_create(channel, names):
+    # The old createlist sent the whole list as one message; split it so contents compare
+    list_data = {'pokemon': list(names), 'channel_id': CHANNEL_ID, 'continuation_message_ids': []}
+    chunks = legacy_split(names)
+    list_data['message_id'] = (await channel.send(f"**Pokemon List ({len(names)} total):**\n{chunks[0]}")).id
+    for i, chunk in enumerate(chunks[1:], 2):
+        list_data['continuation_message_ids'].append(
+            (await channel.send(f"**Pokemon List (continued - part {i}):**\n{chunk}")).id)
+    return list_data
+
+
+def make_names(count, seed=7):
+    rng = random.Random(seed)
+    return [f"{rng.choice(['Alolan ', 'Galarian ', 'Shiny ', ''])}Pokemon{i:04d}" for i in range(count)]
+
+
+def patterns():
+    """(label, initial names, [list of names appended per update, ...], concurrent)"""
+    names = make_names(1200)
+    return [
+        ("small appends", names[:40], [names[40 + i * 5:45 + i * 5] for i in range(100)], False),
+        ("one paste", names[:40], [names[40:1000]], False),
+        ("no-op updates", names[:300], [[] for _ in range(20)], False),
+        ("concurrent burst", names[:300], [names[300 + i * 3:303 + i * 3] for i in range(30)], True),
+    ]
+
+
+async def run_legacy(rtt, initial, updates, concurrent):
+    channel = FakeChannel(rtt)
+    list_data = await legacy_create(channel, initial)
+    created = dict(channel.calls)
+
+    async def update(batch):
+        list_data['pokemon'].extend(batch)
+        await legacy_update(channel, list_data)
+
+    if concurrent:
+        await asyncio.gather(*(update(batch) for batch in updates))
+    else:
+        for batch in updates:
+            await update(batch)
+    return channel, created, list_data
+
+
+async def run_sync(rtt, initial, updates, concurrent):
+    channel = FakeChannel(rtt)
+    sync = ListMessageSync(FakeBot(channel), min_interval=0)
+    list_data = {'pokemon': list(initial), 'channel_id': CHANNEL_ID}
+    await sync.publish(channel, list_data)
+    created = dict(channel.calls)
+
+    async def update(batch):
+        list_data['pokemon'].extend(batch)
+        await sync.sync('list', list_data)
+
+    if concurrent:
+        await asyncio.gather(*(update(batch) for batch in updates))
+    else:
+        for batch in updates:
+            await update(batch)
+    return channel, created, list_data
+
+
+def visible(channel, list_data):
+    ids = [list_data['message_id']] + list_data['continuation_message_ids']
+    return [channel.messages.get(i) for i in ids]
+
+
+async def main_async(args):
+    rtt = args.rtt_ms / 1000
+    failed = False
+
+    print(f"{'pattern':<17} {'old calls':>10} {'new calls':>10}   new send/edit/delete")
+    for label, initial, updates, concurrent in patterns():
+        old_channel, old_created, old_data = await run_legacy(rtt, initial, updates, concurrent)
+        new_channel, new_created, new_data = await run_sync(rtt, initial, updates, concurrent)
+
+        old = [old_channel.calls[k] - old_created[k] for k in CALL_KINDS]
+        new = [new_channel.calls[k] - new_created[k] for k in CALL_KINDS]
+        print(f"{label:<17} {sum(old):>10} {sum(new):>10}   {'/'.join(map(str, new))}")
+
+        expected = render_chunks(new_data['pokemon'], split_chunks(new_data['pokemon']))
+        if visible(new_channel, new_data) != expected:
+            print(f"  ❌ {label}: message contents differ")
+            failed = True
+        if len(old_channel.messages) != len(expected):
+            print(f"  ⚠️ old logic left {len(old_channel.messages)} messages for {len(expected)} chunks")
+        if sum(new) > sum(old):
+            print(f"  ❌ {label}: more REST calls than before")
+            failed = True
+
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rtt-ms', type=float, default=2)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Latency and accuracy of the fuzzy name index over alldata/pokemon_data.json
+
+Every primary name is indexed together with its multilingual names (as the
+Pokedex cog does), then queried with a random single-character typo
+(substitution, deletion, insertion or adjacent swap) through both best()
+(the m!dex auto-correct path) and suggest() ("Did you mean" lists).
+
+Usage: python bench/bench_name_search.py [--queries N] [--seed S]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.join(BENCH_DIR, '..')
+sys.path.insert(0, ROOT)
+
+from name_search import NameSearchIndex
+
+ALPHABET = 'abcdefghijklmnopqrstuvwxyz'
+
+
+def build_index():
+    with open(os.path.join(ROOT, 'alldata', 'pokemon_data.json'), 'r', encoding='utf-8') as f:
+        pokemon_data = json.load(f)
+
+    index = NameSearchIndex()
+    primary = []
+    for form_key, data in pokemon_data.items():
+        name = data.get('name', '')
+        if name:
+            index.add(name, form_key)
+            primary.append((name, form_key))
+        for names in data.get('names', {}).values():
+            for alt in names if isinstance(names, list) else [names]:
+                index.add(alt, form_key)
+    return index, primary
+
+
+def typo(rng, name):
+    i = rng.randrange(len(name))
+    kind = rng.randrange(4)
+    if kind == 0:
+        return name[:i] + rng.choice(ALPHABET) + name[i + 1:]
+    if kind == 1 and len(name) > 1:
+        return name[:i] + name[i + 1:]
+    if kind == 2:
+        return name[:i] + rng.choice(ALPHABET) + name[i:]
+    if i + 1 < len(name):
+        return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+    return name
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index, primary = build_index()
+    print(f"build      {len(index)} names in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    rng = random.Random(args.seed)
+    queries = []
+    for _ in range(args.queries):
+        name, form_key = rng.choice(primary)
+        queries.append((typo(rng, name), name, form_key))
+
+    timings = []
+    best_timings = []
+    top1 = top5 = resolved = 0
+    for query, name, form_key in queries:
+        t0 = time.perf_counter()
+        match = index.best(query)
+        best_timings.append(time.perf_counter() - t0)
+        if match and (match.value == form_key or match.name.lower() == name.lower()):
+            resolved += 1
+
+        t0 = time.perf_counter()
+        suggestions = index.suggest(query)
+        timings.append(time.perf_counter() - t0)
+
+        values = [s.value for s in suggestions]
+        names = [s.name.lower() for s in suggestions]
+        if values[:1] == [form_key] or names[:1] == [name.lower()]:
+            top1 += 1
+        if form_key in values or name.lower() in names:
+            top5 += 1
+
+    for label, samples in (('best', best_timings), ('suggest', timings)):
+        samples.sort()
+        p50 = samples[len(samples) // 2] * 1e6
+        p99 = samples[int(len(samples) * 0.99)] * 1e6
+        print(f"{label:<10} p50 {p50:.0f} µs • p99 {p99:.0f} µs over {len(queries)} typo queries")
+    print(f"accuracy   auto-resolved {resolved / len(queries):.1%} • "
+          f"suggest top-1 {top1 / len(queries):.1%} • top-5 {top5 / len(queries):.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,211 @@
+"""
+Simulated paging benchmark for m!add / m!trackshiny / m!trackevent ingestion
+
+A fake bot replays a user clicking through a Pokétwo list. Like discord.py's
+wait_for, an edit is only delivered to the old serial loop if it is waiting
+for it at that moment - edits that arrive while it is busy with database
+round-trips are lost. PageIngestor gets every edit through the edit router.
+Database calls and status edits sleep for a fixed round-trip time.
+
+Reports pages/s, pages ingested vs clicked, bulk writes and status edits for
+the old serial loop and for PageIngestor, and for PageIngestor with every
+Nth bulk write failing (failed batches are retried, so nothing is lost).
+
+Usage: python bench/bench_page_ingest.py [--pages N] [--click-ms MS] [--rtt-ms MS] [--fail-every N]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from edit_router import edit_router
+from embed_parser import parse_lines
+from page_ingest import PageIngestor
+
+MESSAGE_ID = 1
+POKETWO_ID = 716390085896962058
+LINES_PER_PAGE = 20
+
+
+class FakeAuthor:
+    id = POKETWO_ID
+
+
+class FakeEmbed:
+    def __init__(self, description):
+        self.description = description
+
+
+class FakeMessage:
+    author = FakeAuthor()
+
+    def __init__(self, page):
+        self.id = MESSAGE_ID
+        start = page * LINES_PER_PAGE
+        self.embeds = [FakeEmbed('\n'.join(
+            f"`{start + i}`　<:1:1> Eevee<:female:1>　•　Lvl. {i + 1}　•　{i * 3.1:.2f}%"
+            for i in range(LINES_PER_PAGE)
+        ))]
+
+
+class FakeBot:
+    """wait_for semantics: edits are delivered only to currently waiting checks"""
+
+    def __init__(self):
+        self.waiters = []
+
+    async def wait_for(self, event, timeout=None, check=None):
+        future = asyncio.get_running_loop().create_future()
+        entry = (future, check)
+        self.waiters.append(entry)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            if entry in self.waiters:
+                self.waiters.remove(entry)
+
+    async def dispatch_edit(self, after):
+        await edit_router.dispatch_raw(SimpleNamespace(message_id=after.id, cached_message=None, message=after))
+        for entry in list(self.waiters):
+            future, check = entry
+            if not future.done() and check(None, after):
+                future.set_result((None, after))
+                self.waiters.remove(entry)
+
+
+class Stats:
+    def __init__(self, rtt, fail_every=0):
+        self.rtt = rtt
+        self.fail_every = fail_every
+        self.attempts = 0
+        self.writes = 0
+        self.edits = 0
+        self.stored = set()
+
+    async def write_batch(self, batch):
+        # Old bulk add: find existing, then write
+        await asyncio.sleep(self.rtt * 2)
+        self.attempts += 1
+        if self.fail_every and self.attempts % self.fail_every == 0:
+            raise ConnectionError("simulated write failure")
+        self.writes += 1
+        new = {p['pokemon_id'] for p in batch} - self.stored
+        self.stored |= new
+        return len(new)
+
+    async def count_total(self):
+        await asyncio.sleep(self.rtt)
+        return len(self.stored)
+
+
+class FakeStatus:
+    def __init__(self, stats):
+        self.stats = stats
+
+    async def edit(self, **kwargs):
+        await asyncio.sleep(self.stats.rtt)
+        self.stats.edits += 1
+
+
+def make_parser(seen):
+    def parse_page(embed):
+        items = []
+        for record in parse_lines(embed.description, marker='•'):
+            if record.pokemon_id not in seen:
+                seen.add(record.pokemon_id)
+                items.append({'pokemon_id': record.pokemon_id})
+        return items
+    return parse_page
+
+
+async def legacy_loop(bot, stats, idle_timeout):
+    """The pre-pipeline monitoring loop: parse, write, count, edit - serially"""
+    parse_page = make_parser(set())
+    status = FakeStatus(stats)
+    pages = 0
+
+    def check(before, after):
+        return after.id == MESSAGE_ID and after.embeds
+
+    while True:
+        try:
+            before, after = await bot.wait_for('message_edit', timeout=idle_timeout, check=check)
+        except asyncio.TimeoutError:
+            return pages
+        pages += 1
+        items = parse_page(after.embeds[0])
+        if items:
+            await stats.write_batch(items)
+            await stats.count_total()
+            await status.edit(content="")
+
+
+async def pipelined_loop(bot, stats, idle_timeout):
+    ingestor = PageIngestor(
+        bot,
+        MESSAGE_ID,
+        parse_page=make_parser(set()),
+        write_batch=stats.write_batch,
+        count_total=stats.count_total,
+        render_status=lambda added, inventory: "",
+        status_msg=FakeStatus(stats),
+        author_id=POKETWO_ID,
+        timeout=3600,
+        idle_timeout=idle_timeout,
+        poll_interval=idle_timeout,
+        flush_delay=stats.rtt * 4
+    )
+    await ingestor.run()
+    return ingestor.pages
+
+
+async def clicker(bot, pages, click_interval):
+    await asyncio.sleep(0.01)
+    for page in range(pages):
+        await bot.dispatch_edit(FakeMessage(page))
+        await asyncio.sleep(click_interval)
+
+
+async def run_case(label, loop_fn, pages, click_interval, rtt, fail_every=0):
+    bot = FakeBot()
+    stats = Stats(rtt, fail_every)
+    idle_timeout = max(0.2, rtt * 10)
+
+    start = time.perf_counter()
+    monitor = asyncio.create_task(loop_fn(bot, stats, idle_timeout))
+    await clicker(bot, pages, click_interval)
+    ingested_pages = await monitor
+    # Idle timeout is not ingestion work
+    elapsed = time.perf_counter() - start - idle_timeout
+
+    print(f"{label:<10} {ingested_pages / elapsed:>7.1f} pages/s  "
+          f"pages {ingested_pages}/{pages}  stored {len(stats.stored)}/{pages * LINES_PER_PAGE}  "
+          f"writes {stats.writes}  status edits {stats.edits}")
+
+
+async def main_async(args):
+    click_interval = args.click_ms / 1000
+    rtt = args.rtt_ms / 1000
+    await run_case("serial", legacy_loop, args.pages, click_interval, rtt)
+    await run_case("pipelined", pipelined_loop, args.pages, click_interval, rtt)
+    if args.fail_every:
+        await run_case("flaky db", pipelined_loop, args.pages, click_interval, rtt, args.fail_every)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=50)
+    parser.add_argument('--click-ms', type=float, default=40)
+    parser.add_argument('--rtt-ms', type=float, default=30)
+    parser.add_argument('--fail-every', type=int, default=3,
+                        help="also run PageIngestor with every Nth bulk write failing (0 to skip)")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Throughput, allocations and golden output of the embed ingestion parsers
+
+Runs the parsers behind m!add, m!trackshiny, m!addevent, ?track and
+m!createlist over fixtures/embed_pages.json, a corpus of embed descriptions
+in the layouts Pokétwo sends (normal, shiny, gigantamax emoji, event,
+marketplace and Japanese-space pages, with header and footer lines):
+- Utils.parse_embed_content
+- ShinyDexManagement.parse_shiny_embed
+- EventDexManagement.parse_event_shiny_embed
+- UtilityCommands._extract_pokemon_ids
+- PokemonListTools._extract_pokemon_from_text
+
+Golden: every page must give the expected records for every parser (the
+fields the callers store; derived breeding fields are not compared).
+Throughput: description lines per second. Allocations: traced Python heap
+per line - the peak while parsing a page and the blocks still held by the
+results afterwards (tracemalloc, so transient garbage only shows in the peak).
+
+--json writes the results; --baseline compares lines/s with such a file and
+fails when a parser got slower than --max-slowdown.
+
+Requires the bot's own dependencies (discord.py), no database or network.
+
+Usage: python bench/bench_parsers.py [--pages N] [--parsers ...] [--json PATH]
+                                     [--baseline PATH] [--max-slowdown F]
+Exits non-zero if a golden check fails or throughput regressed.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.join(BENCH_DIR, '..')
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # cogs load their data files relative to the repository root
+
+FIXTURE = os.path.join(BENCH_DIR, 'fixtures', 'embed_pages.json')
+
+
+class FakeBot:
+    """Just enough bot for the cog constructors"""
+
+    def __init__(self):
+        self.cogs = {}
+
+    def get_cog(self, name: str):
+        return self.cogs.get(name)
+
+
+def load_parsers() -> dict:
+    """Parser name -> (parse(description), project(result) -> the golden's JSON shape)"""
+    from cogs.utils import Utils
+    from cogs.shinydex_management import ShinyDexManagement
+    from cogs.event_management import EventDexManagement
+    from cogs.utility_commands import UtilityCommands
+    from cogs.pokemonlisttools import PokemonListTools
+
+    bot = FakeBot()
+    utils = bot.cogs['Utils'] = Utils(bot)
+    shinies = ShinyDexManagement(bot)
+    events = EventDexManagement(bot)
+    utility = UtilityCommands(bot)
+    lists = PokemonListTools(bot)
+
+    def shiny_rows(result):
+        return [[s['pokemon_id'], s['name'], s['gender'], s['level'], s['iv_percent']] for s in result]
+
+    return {
+        'parse_embed_content': (
+            utils.parse_embed_content,
+            lambda result: [[p['pokemon_id'], p['name'], p['gender'], p['iv_percent']] for p in result],
+        ),
+        'parse_shiny_embed': (lambda description: shinies.parse_shiny_embed(description, utils), shiny_rows),
+        'parse_event_shiny_embed': (lambda description: events.parse_event_shiny_embed(description, utils), shiny_rows),
+        'extract_pokemon_ids': (utility._extract_pokemon_ids, list),
+        'extract_pokemon_from_text': (lists._extract_pokemon_from_text, list),
+    }
+
+
+def line_count(description: str) -> int:
+    return description.count('\n') + 1
+
+
+def check_golden(pages, name, parse, project) -> bool:
+    failures = 0
+    for page in pages:
+        got = project(parse(page['description']))
+        expected = page['expected'][name]
+        if got != expected:
+            failures += 1
+            print(f"❌ {name} on {page['layout']} page\n   expected {expected}\n   got      {got}")
+    return failures == 0
+
+
+def bench_throughput(pages, parse, repeat: int) -> float:
+    descriptions = [page['description'] for page in pages]
+    lines = sum(line_count(d) for d in descriptions) * repeat
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for description in descriptions:
+            parse(description)
+    return lines / (time.perf_counter() - start)
+
+
+def measure_allocations(pages, parse) -> dict:
+    """Traced heap per line: peak while parsing, and what the results keep"""
+    peak_bytes = 0
+    kept_blocks = 0
+    kept_bytes = 0
+    lines = 0
+    tracemalloc.start()
+    try:
+        for page in pages:
+            description = page['description']
+            lines += line_count(description)
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            result = parse(description)
+            peak_bytes += tracemalloc.get_traced_memory()[1] - baseline
+            stats = tracemalloc.take_snapshot().compare_to(before, 'filename')
+            kept_blocks += sum(stat.count_diff for stat in stats if stat.count_diff > 0)
+            kept_bytes += sum(stat.size_diff for stat in stats if stat.size_diff > 0)
+            del result
+    finally:
+        tracemalloc.stop()
+    return {
+        'peak_bytes_per_line': peak_bytes / lines,
+        'kept_blocks_per_line': kept_blocks / lines,
+        'kept_bytes_per_line': kept_bytes / lines,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=2000, help="times the corpus is parsed for throughput")
+    parser.add_argument('--parsers', nargs='+', help="subset of parser names")
+    parser.add_argument('--json', help="write results to this file")
+    parser.add_argument('--baseline', help="results file from an earlier --json run to compare lines/s with")
+    parser.add_argument('--max-slowdown', type=float, default=0.25, help="allowed lines/s drop against the baseline")
+    args = parser.parse_args()
+
+    with open(FIXTURE, 'r', encoding='utf-8') as f:
+        pages = json.load(f)
+    parsers = load_parsers()
+    selected = args.parsers or list(parsers)
+    unknown = [name for name in selected if name not in parsers]
+    if unknown:
+        print(f"❌ Unknown parsers: {', '.join(unknown)}\nAvailable: {', '.join(parsers)}")
+        sys.exit(2)
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+
+    total_lines = sum(line_count(page['description']) for page in pages)
+    print(f"{len(pages)} pages, {total_lines} lines\n")
+    print(f"{'parser':<28}{'golden':>8}{'lines/s':>12}{'peak B/line':>13}{'kept blk/line':>15}{'kept B/line':>13}")
+
+    results = {}
+    ok = True
+    for name in selected:
+        parse, project = parsers[name]
+        golden = check_golden(pages, name, parse, project)
+        parse(pages[0]['description'])  # warm-up (lazy caches)
+        rate = bench_throughput(pages, parse, max(1, args.pages // len(pages)))
+        allocations = measure_allocations(pages, parse)
+        results[name] = dict(golden=golden, lines_per_second=rate, **allocations)
+        ok = ok and golden
+
+        verdict = "✅" if golden else "❌"
+        print(f"{name:<28}{verdict:>7}{rate:>13,.0f}{allocations['peak_bytes_per_line']:>13.0f}"
+              f"{allocations['kept_blocks_per_line']:>15.1f}{allocations['kept_bytes_per_line']:>13.0f}")
+
+        previous = baseline.get(name)
+        if previous:
+            change = rate / previous['lines_per_second'] - 1
+            if change < -args.max_slowdown:
+                ok = False
+                print(f"   ❌ {change:+.0%} lines/s against the baseline ({previous['lines_per_second']:,.0f})")
+            else:
+                print(f"   {change:+.0%} lines/s against the baseline")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'pages': len(pages), 'lines': total_lines, 'results': results}, f, indent=2)
+        print(f"\nWrote {args.json}")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Memory and lookup latency: raw pokemon_data.json dict vs PokedexStore
+
+Each variant runs in a fresh subprocess so RSS deltas are not polluted by the
+other one, and builds what the Pokedex cog holds: the dict variant the old
+two-keys-per-name index, both the fuzzy NameSearchIndex over every name.
+RSS counts the allocator arenas the JSON parse leaves behind; the store
+turns each form into an entry as soon as it is parsed, so it never holds the
+whole file as nested dicts.
+Also checks that every store entry matches the JSON it was built from.
+
+Usage: python bench/bench_pokedex_store.py [--lookups N]
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+import unicodedata
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.join(BENCH_DIR, '..')
+sys.path.insert(0, ROOT)
+
+from name_search import NameSearchIndex
+
+DATA_PATH = os.path.join(ROOT, 'alldata', 'pokemon_data.json')
+
+
+def rss_kb():
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1])
+    return 0
+
+
+def old_normalize(name):
+    normalized = unicodedata.normalize('NFD', name)
+    return ''.join(c for c in normalized if unicodedata.category(c) != 'Mn').lower().strip()
+
+
+def load_dict():
+    with open(DATA_PATH, 'r', encoding='utf-8') as f:
+        pokemon_data = json.load(f)
+    name_index = {}
+    for form_key, data in pokemon_data.items():
+        names = [data.get('name', '')]
+        for lang_names in data.get('names', {}).values():
+            names.extend(lang_names if isinstance(lang_names, list) else [lang_names])
+        for name in names:
+            if name:
+                name_index[name.lower()] = form_key
+                name_index[old_normalize(name)] = form_key
+
+    name_search = NameSearchIndex()
+    for form_key, data in pokemon_data.items():
+        name_search.add(data.get('name', ''), form_key)
+        for lang_names in data.get('names', {}).values():
+            for name in (lang_names if isinstance(lang_names, list) else [lang_names]):
+                name_search.add(name, form_key)
+
+    def lookup(query):
+        return name_index.get(query.lower().strip()) or name_index.get(old_normalize(query))
+
+    def render(form_key):
+        data = pokemon_data[form_key]
+        return (data['name'], data.get('description'), data['types'], data.get('base_stats'))
+
+    return (pokemon_data, name_index, name_search), lookup, render, list(pokemon_data)
+
+
+def load_store():
+    from pokedex_store import PokedexStore
+    store = PokedexStore.load(DATA_PATH)
+    name_search = NameSearchIndex()
+    for form_key, entry in store.entries.items():
+        for name in entry.all_names():
+            name_search.add(name, form_key)
+
+    def render(form_key):
+        entry = store[form_key]
+        return (entry.name, entry.description, entry.types, entry.base_stats)
+
+    return (store, name_search), store.lookup, render, list(store.entries)
+
+
+def measure(variant, lookups):
+    gc.collect()
+    before = rss_kb()
+    tracemalloc.start()
+    holder, lookup, render, form_keys = (load_dict if variant == 'dict' else load_store)()
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    after = rss_kb()
+
+    rng = random.Random(1)
+    with open(DATA_PATH, 'r', encoding='utf-8') as f:
+        names = [d['name'] for d in json.load(f).values()]
+    queries = [rng.choice(names).upper() for _ in range(lookups)]
+    keys = [rng.choice(form_keys) for _ in range(lookups)]
+
+    t0 = time.perf_counter()
+    for query in queries:
+        lookup(query)
+    lookup_us = (time.perf_counter() - t0) / lookups * 1e6
+
+    t0 = time.perf_counter()
+    for key in keys:
+        render(key)
+    render_us = (time.perf_counter() - t0) / lookups * 1e6
+
+    print(json.dumps({'variant': variant, 'rss_kb': after - before, 'retained_kb': retained // 1024,
+                      'peak_kb': peak // 1024, 'lookup_us': lookup_us, 'render_us': render_us}))
+
+
+def check_equivalence():
+    from pokedex_store import PokedexStore
+    with open(DATA_PATH, 'r', encoding='utf-8') as f:
+        raw = json.load(f)
+    store = PokedexStore.load(DATA_PATH)
+
+    failures = 0
+    for form_key, data in raw.items():
+        entry = store[form_key]
+        names = tuple((lang, tuple(n if isinstance(n, list) else [n])) for lang, n in data['names'].items())
+        egg_groups = tuple(data['egg_groups']) if isinstance(data['egg_groups'], list) else data['egg_groups']
+        checks = [
+            (entry.name, data['name']), (entry.dex_number, data['dex_number']),
+            (entry.description, data['description']), (entry.base_stats, data['base_stats']),
+            (entry.types, tuple(data['types'])), (entry.names, names), (entry.egg_groups, egg_groups),
+            (entry.evolution, data['fields'].get('Evolution')), (entry.image_url, data['image_url']),
+            (entry.height_m, data['appearance']['height_m']), (entry.gender_ratio, data['gender_ratio']),
+        ]
+        if any(a != b for a, b in checks):
+            failures += 1
+            print(f"❌ {form_key} differs")
+        for name in entry.all_names():
+            if store.lookup(name) is None:
+                failures += 1
+                print(f"❌ {name!r} not indexed")
+    print(f"equivalence {len(raw) - failures}/{len(raw)} entries match")
+    return failures == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--lookups', type=int, default=50000)
+    parser.add_argument('--variant', choices=['dict', 'store'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        measure(args.variant, args.lookups)
+        return
+
+    ok = check_equivalence()
+    results = {}
+    for variant in ('dict', 'store'):
+        out = subprocess.run([sys.executable, __file__, '--variant', variant, '--lookups', str(args.lookups)],
+                             capture_output=True, text=True, check=True).stdout
+        results[variant] = json.loads(out)
+
+    for variant, r in results.items():
+        print(f"{variant:<6} retained {r['retained_kb'] / 1024:.1f} MiB (load peak {r['peak_kb'] / 1024:.1f} MiB, "
+              f"RSS +{r['rss_kb'] / 1024:.1f} MiB) • name lookup {r['lookup_us']:.2f} µs • "
+              f"entry render {r['render_us']:.2f} µs")
+    saved = results['dict']['retained_kb'] - results['store']['retained_kb']
+    print(f"saved  {saved / 1024:.1f} MiB retained ({saved / max(results['dict']['retained_kb'], 1):.0%})")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
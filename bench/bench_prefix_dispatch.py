@@ -0,0 +1,123 @@
+"""
+Microbenchmark: messages per second through the prefix dispatch path
+
+Compares the old per-message prefix handling (rebuild mention prefixes,
+loop in get_prefix, loop again in on_message) with the precompiled
+PrefixMatcher used by main.py. Only the dispatch decision and content
+rewrite are measured - no Discord objects are involved.
+
+Usage: python bench/bench_prefix_dispatch.py [--messages N] [--command-ratio R]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from prefix_matcher import PrefixMatcher
+
+PREFIXES = ["m!", "M!", "n!", "N!"]
+BOT_ID = 1234567890123456789
+
+CHATTER = [
+    "anyone got a shiny eevee for trade?",
+    "lol",
+    "<@716390085896962058> p",
+    "gg",
+    "p!market search --name pikachu --sh",
+    "how do I breed ditto",
+    "https://discord.com/channels/1/2/3",
+]
+COMMANDS = [
+    "m!breed",
+    "m!   inv --name eevee",
+    "M!sdf --image",
+    "n! dex pikachu",
+    f"<@{BOT_ID}>   breed",
+    f"<@!{BOT_ID}> help",
+]
+
+
+class FakeMessage:
+    __slots__ = ('content',)
+
+    def __init__(self, content):
+        self.content = content
+
+
+def legacy_dispatch(content):
+    """Old main.on_message + get_prefix behaviour"""
+    # on_message rewrite
+    mention_patterns = [f'<@{BOT_ID}>', f'<@!{BOT_ID}>']
+    for pattern in mention_patterns:
+        if content.startswith(pattern):
+            remaining = content[len(pattern):].lstrip()
+            if remaining:
+                content = f'{pattern} {remaining}'
+            break
+    else:
+        for prefix in PREFIXES:
+            if content.startswith(prefix):
+                remaining = content[len(prefix):].lstrip()
+                if remaining:
+                    content = f'{prefix}{remaining}'
+                break
+
+    # get_prefix (called by process_commands for every message)
+    prefixes = [f'<@{BOT_ID}> ', f'<@!{BOT_ID}> '] + PREFIXES
+    for prefix in prefixes:
+        if content.startswith(prefix):
+            remaining = content[len(prefix):]
+            stripped = remaining.lstrip()
+            return prefix + ' ' * (len(remaining) - len(stripped))
+    return None
+
+
+def matcher_dispatch(matcher, content):
+    """New main.on_message + get_prefix behaviour"""
+    content = matcher.normalize(content)
+    if content is None:
+        return None
+    return matcher.command_prefix(content)
+
+
+def build_stream(count, command_ratio, seed=0):
+    rng = random.Random(seed)
+    return [
+        rng.choice(COMMANDS) if rng.random() < command_ratio else rng.choice(CHATTER)
+        for _ in range(count)
+    ]
+
+
+def run(label, fn, stream):
+    start = time.perf_counter()
+    hits = 0
+    for content in stream:
+        if fn(content) is not None:
+            hits += 1
+    elapsed = time.perf_counter() - start
+    print(f"{label:<10} {len(stream) / elapsed:>14,.0f} msg/s  ({hits} commands)")
+    return hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--messages', type=int, default=500_000)
+    parser.add_argument('--command-ratio', type=float, default=0.05)
+    args = parser.parse_args()
+
+    stream = build_stream(args.messages, args.command_ratio)
+    matcher = PrefixMatcher(PREFIXES, BOT_ID)
+
+    legacy_hits = run("legacy", legacy_dispatch, stream)
+    matcher_hits = run("matcher", lambda c: matcher_dispatch(matcher, c), stream)
+
+    if legacy_hits != matcher_hits:
+        print("❌ Dispatch results differ between legacy and matcher paths")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,536 @@
+"""
+Rendering benchmark and golden-image regression for the image cogs
+
+Renders representative pages through the real renderers with no network:
+- DexImageGenerator.create_dex_image: grid sizes, every uncaught style and
+  themes from dex_color_suggestions.txt
+- CustomImageGenerator.create_custom_image: shiny / normal / dark sprites
+- ShinyStatsImage.create_stats_image: stats cards with and without a showcase
+
+Sprites come from a local fixture directory standing in for cdn.poketwo.net
+(fixtures/sprites/shiny/<cdn>[F].png and fixtures/sprites/images/<cdn>.png).
+Missing sprites are generated there once, deterministically, so the goldens
+do not depend on the CDN; drop real CDN sprites in to bench realistic art.
+
+Per scenario it reports wall time (render and PNG encode), the process peak
+RSS after the scenario (a high-water mark, so scenarios run smallest first)
+and the PNG size, then compares the output with fixtures/golden/<name>.png.
+The comparison is perceptual: both images are lightly blurred so
+antialiasing and font hinting noise does not count, then the mean channel
+difference and the share of clearly changed pixels must stay under the
+tolerances. Fonts come from shinystats/fonts when present (default font
+otherwise); the golden manifest records which, and a mismatch is reported.
+
+Requires the bot's own dependencies (discord.py, aiohttp, Pillow).
+
+Usage: python bench/bench_render.py [--iterations N] [--scenarios ...] [--themes N]
+                                    [--update-golden] [--max-mean F] [--max-changed F]
+                                    [--json PATH] [--keep-output DIR]
+Exits non-zero if a render fails or an output drifts from its golden.
+"""
+import argparse
+import asyncio
+import hashlib
+import io
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import sys
+import time
+import types
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.join(BENCH_DIR, '..')
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # cogs load their data files relative to the repository root
+
+import PIL
+from PIL import Image, ImageChops, ImageDraw, ImageFilter
+
+import config
+import dex_image_generator
+from dex_image_generator import DEFAULT_SETTINGS, DexImageGenerator
+
+SPRITES_DIR = os.path.join(BENCH_DIR, 'fixtures', 'sprites')
+GOLDEN_DIR = os.path.join(BENCH_DIR, 'fixtures', 'golden')
+GOLDEN_MANIFEST = os.path.join(GOLDEN_DIR, 'manifest.json')
+THEMES_FILE = 'dex_color_suggestions.txt'
+FONTS_DIR = os.path.join(config.RESOURCES_DIR, 'fonts')
+
+SPRITE_SIZE = 475  # Same as the CDN's shiny artwork
+CHANGED_PIXEL_LEVEL = 24  # A channel difference above this counts as a visible change
+
+# m!dc setting -> dex setting key, as applied by m!dexapplytheme
+THEME_SETTINGS = {
+    'background': 'bg_color',
+    'glass': 'glass_color',
+    'border': 'border_color',
+    'badgetext': 'badge_text_color',
+    'badgebg': 'badge_bg_color',
+    'badgeborder': 'badge_border_color',
+    'countcolor': 'count_text_color_caught',
+    'uncaughtcount': 'count_text_color_uncaught',
+}
+
+
+# Local CDN
+
+def synthetic_sprite(key: str) -> Image.Image:
+    """Deterministic stand-in artwork: a few overlapping shapes on transparency"""
+    rng = random.Random(key)
+    img = Image.new('RGBA', (SPRITE_SIZE, SPRITE_SIZE), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    for _ in range(rng.randint(3, 6)):
+        x0 = rng.randint(40, SPRITE_SIZE // 2)
+        y0 = rng.randint(40, SPRITE_SIZE // 2)
+        x1 = x0 + rng.randint(80, SPRITE_SIZE // 2)
+        y1 = y0 + rng.randint(80, SPRITE_SIZE // 2)
+        color = (rng.randint(30, 255), rng.randint(30, 255), rng.randint(30, 255), 255)
+        if rng.random() < 0.5:
+            draw.ellipse([x0, y0, x1, y1], fill=color, outline=(20, 20, 20, 255), width=6)
+        else:
+            draw.polygon([(x0, y1), ((x0 + x1) // 2, y0), (x1, y1)], fill=color, outline=(20, 20, 20, 255))
+    return img
+
+
+class LocalCDN:
+    """Serves cdn.poketwo.net and avatar URLs from the sprite fixture directory"""
+
+    def __init__(self, root: str):
+        self.root = root
+        self.requests = 0
+        self.generated = 0
+
+    def path_for(self, url: str) -> str:
+        if 'cdn.poketwo.net/' in url:
+            # https://cdn.poketwo.net/<shiny|images>/<cdn>[F].png
+            kind, filename = url.rsplit('/', 2)[-2:]
+            return os.path.join(self.root, kind, filename)
+        return os.path.join(self.root, 'avatars', 'avatar.png')
+
+    def read(self, url: str):
+        """PNG bytes for url, generating the fixture sprite on first use"""
+        self.requests += 1
+        path = self.path_for(url)
+        if not os.path.exists(path):
+            filename = os.path.basename(path)
+            if filename.split('.')[0].rstrip('F') in ('0', ''):
+                return None  # No such Pokemon on the CDN
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            synthetic_sprite(os.path.relpath(path, self.root).replace(os.sep, '/')).save(path, format='PNG')
+            self.generated += 1
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def session_factory(self):
+        cdn = self
+
+        class Response:
+            def __init__(self, data):
+                self.status = 200 if data is not None else 404
+                self._data = data
+
+            async def read(self):
+                return self._data
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+        class ClientSession:
+            def get(self, url, **kwargs):
+                return Response(cdn.read(str(url)))
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return ClientSession
+
+    def install(self, *modules):
+        """Point each renderer module's aiohttp at this CDN"""
+        stub = types.SimpleNamespace(ClientSession=self.session_factory())
+        for module in modules:
+            module.aiohttp = stub
+
+    def digest(self) -> str:
+        """Checksum of the fixture sprites, so goldens can tell real art from synthetic"""
+        h = hashlib.sha256()
+        for dirpath, _, filenames in sorted(os.walk(self.root)):
+            for filename in sorted(filenames):
+                path = os.path.join(dirpath, filename)
+                h.update(os.path.relpath(path, self.root).encode())
+                with open(path, 'rb') as f:
+                    h.update(f.read())
+        return h.hexdigest()[:16]
+
+
+# Fake bot
+
+class FakeAsset:
+    url = "https://cdn.discordapp.com/embed/avatars/0.png"
+
+
+class FakeUser:
+    id = 10 ** 17
+    name = display_name = "Bench Trainer"
+    display_avatar = FakeAsset()
+
+
+class FakeBot:
+    def __init__(self):
+        self.cogs = {}
+
+    def get_cog(self, name: str):
+        return self.cogs.get(name)
+
+    def add(self, cog):
+        self.cogs[type(cog).__name__] = cog
+        return cog
+
+
+# Scenarios
+
+def load_themes(parse_color) -> dict:
+    """Theme name -> dex settings, parsed the way m!dexapplytheme does"""
+    themes = {}
+    current = None
+    with open(THEMES_FILE, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith('**') and line.endswith('**') and len(line) > 4:
+                current = themes.setdefault(line.strip('*').strip(), {})
+            elif current is not None and line.lower().startswith('m!dc'):
+                parts = line.split()
+                key = THEME_SETTINGS.get(parts[1].lower()) if len(parts) >= 3 else None
+                color = parse_color(parts[-1]) if key else None
+                if color:
+                    current[key] = color
+    return {name: settings for name, settings in themes.items() if settings}
+
+
+def pick_themes(themes: dict, count: int) -> list:
+    """count themes spread evenly over the suggestions file (all when count <= 0)"""
+    names = list(themes)
+    if count <= 0 or count >= len(names):
+        return names
+    step = len(names) / count
+    return [names[int(i * step)] for i in range(count)]
+
+
+def dex_entries(utils, count: int, seed: int) -> list:
+    """(dex_num, name, gender_key, count) like the full dex pages: about a third uncaught"""
+    rng = random.Random(seed)
+    full = utils.get_full_dex_entries()
+    start = rng.randrange(max(1, len(full) - count * 2))
+    entries = []
+    for dex_num, name, has_gender_diff in full[start:]:
+        genders = ('male', 'female') if has_gender_diff else (None,)
+        for gender_key in genders:
+            caught = rng.random() > 0.35
+            entries.append((dex_num, name, gender_key, rng.randint(1, 12) if caught else 0))
+        if len(entries) >= count:
+            break
+    return entries[:count]
+
+
+def custom_list(utils, count: int, seed: int) -> list:
+    """(name, image_type, gender, count) like a parsed m!generate input"""
+    rng = random.Random(seed)
+    names = [name for _, name, _ in utils.get_full_dex_entries()]
+    picked = rng.sample(names, min(count, len(names)))
+    result = []
+    for name in picked:
+        gender = rng.choice(('male', 'female')) if utils.has_gender_difference(name) else None
+        result.append((name, rng.choice(('shiny', 'normal', 'dark')), gender, rng.choice((None, 1, 3, 12))))
+    return result
+
+
+def stats_data(utils, seed: int, showcase: bool) -> dict:
+    rng = random.Random(seed)
+    names = [name for _, name, _ in utils.get_full_dex_entries()]
+    top = sorted(rng.sample(names, 5), key=len)
+    data = {
+        'total_non_event': 1834,
+        'event_shinies': 57,
+        'rare_shinies': 41,
+        'regional_shinies': 96,
+        'mint_shinies': 12,
+        'basic_dex': 612,
+        'full_dex': 803,
+        'total_unique_dex': utils.get_total_unique_dex(),
+        'total_forms': utils.get_total_forms_count(),
+        'top_5_pokemon': [(name, 60 - i * 11) for i, name in enumerate(top)],
+        'showcase_pokemon': None,
+    }
+    if showcase:
+        data['showcase_pokemon'] = {
+            'name': top[0], 'nickname': "Sparkles", 'level': 100, 'iv_percent': 97.85, 'gender': 'female',
+        }
+    return data
+
+
+def build_scenarios(bot, themes: dict, theme_count: int, seed: int) -> dict:
+    """Scenario name -> zero-argument coroutine function returning a PIL image, smallest first"""
+    utils = bot.get_cog('Utils')
+    dex = bot.get_cog('DexImageGenerator')
+    custom = bot.get_cog('CustomImageGenerator')
+    stats = bot.get_cog('ShinyStatsImage')
+
+    def dex_page(cols, rows, style, theme=None, name_seed=0):
+        settings = dict(DEFAULT_SETTINGS, grid_cols=cols, grid_rows=rows, uncaught_style=style)
+        settings.update(themes.get(theme, {}))
+        entries = dex_entries(utils, cols * rows, seed + name_seed)
+        header = {'dex_type': 'Full Shiny Dex', 'types': ['Fire'], 'regions': ['Kanto']}
+        page = {'current_page': 2, 'total_pages': 9, 'total_count': cols * rows * 9}
+
+        async def render():
+            # user_id=None renders with default_settings, so no database is needed
+            dex.default_settings = settings
+            return await dex.create_dex_image(entries, utils, header, page, None)
+        return render
+
+    def custom_page(count):
+        pokemon_list = custom_list(utils, count, seed + count)
+
+        async def render():
+            img, _ = await custom.create_custom_image("Bench Collection", pokemon_list, utils)
+            return img
+        return render
+
+    def stats_card(background, showcase):
+        data = stats_data(utils, seed, showcase)
+
+        async def render():
+            return await stats.create_stats_image(FakeUser(), data, background, "Shiny Hunter")
+        return render
+
+    scenarios = {
+        'dex_3x2_silhouette': dex_page(3, 2, 'silhouette'),
+        'dex_6x3_faded': dex_page(6, 3, 'faded'),
+        'dex_6x3_grayscale': dex_page(6, 3, 'grayscale'),
+        'dex_6x3_hidden': dex_page(6, 3, 'hidden'),
+        'dex_8x5_silhouette': dex_page(8, 5, 'silhouette'),
+        'dex_10x8_faded': dex_page(10, 8, 'faded'),
+    }
+    for theme in pick_themes(themes, theme_count):
+        slug = ''.join(c if c.isalnum() else '_' for c in theme.lower()).strip('_')
+        scenarios[f"dex_theme_{slug}"] = dex_page(6, 3, 'faded', theme, name_seed=len(scenarios))
+    scenarios.update({
+        'custom_6': custom_page(6),
+        'custom_30': custom_page(30),
+        'stats_plain': stats_card('black.png', False),
+        'stats_showcase': stats_card('purple.png', True),
+    })
+    return scenarios
+
+
+# Measurement
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024  # bytes on macOS, KiB elsewhere
+
+
+def encode_png(img) -> bytes:
+    """Same encode the cogs do before sending"""
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def compare(golden: Image.Image, output: Image.Image) -> dict:
+    """Perceptual difference: mean channel difference and share of visibly changed pixels after a light blur"""
+    if golden.size != output.size:
+        return {'size_mismatch': True, 'mean': 255.0, 'changed': 1.0}
+
+    blur = ImageFilter.GaussianBlur(1)
+    a = golden.convert('RGBA').filter(blur)
+    b = output.convert('RGBA').filter(blur)
+    channels = ImageChops.difference(a, b).split()
+    worst = channels[0]
+    for channel in channels[1:]:
+        worst = ImageChops.lighter(worst, channel)
+
+    histogram = worst.histogram()
+    pixels = golden.size[0] * golden.size[1]
+    mean = sum(level * n for level, n in enumerate(histogram)) / pixels
+    changed = sum(histogram[CHANGED_PIXEL_LEVEL + 1:]) / pixels
+    return {'size_mismatch': False, 'mean': mean, 'changed': changed}
+
+
+def environment(cdn: LocalCDN) -> dict:
+    """What the goldens depend on besides the code"""
+    fonts = sorted(os.listdir(FONTS_DIR)) if os.path.isdir(FONTS_DIR) else []
+    return {'pillow': PIL.__version__, 'fonts': fonts, 'sprites': cdn.digest()}
+
+
+async def run_scenario(render, iterations: int) -> dict:
+    render_times = []
+    encode_times = []
+    img = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        img = await render()
+        render_times.append(time.perf_counter() - start)
+        if img is None:
+            raise RuntimeError("renderer returned no image")
+        start = time.perf_counter()
+        data = encode_png(img)
+        encode_times.append(time.perf_counter() - start)
+    return {
+        'render_ms': statistics.median(render_times) * 1000,
+        'render_min_ms': min(render_times) * 1000,
+        'encode_ms': statistics.median(encode_times) * 1000,
+        'peak_rss_mb': peak_rss_mb(),
+        'png_bytes': len(data),
+        'size': list(img.size),
+        'image': img,
+    }
+
+
+def load_manifest() -> dict:
+    if not os.path.exists(GOLDEN_MANIFEST):
+        return {}
+    with open(GOLDEN_MANIFEST, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_renderers(bot):
+    import cogs.customimage
+    import cogs.shinyprofile
+    from cogs.utils import Utils
+    from cogs.customdex import DexCustomization
+    from cogs.customimage import CustomImageGenerator
+    from cogs.shinyprofile import ShinyStatsImage
+
+    cdn = LocalCDN(SPRITES_DIR)
+    cdn.install(dex_image_generator, cogs.customimage, cogs.shinyprofile)
+
+    bot.add(Utils(bot))
+    bot.add(DexImageGenerator(bot))
+    bot.add(CustomImageGenerator(bot))
+    bot.add(ShinyStatsImage(bot))
+    return cdn, DexCustomization(bot).parse_color
+
+
+async def main_async(args):
+    bot = FakeBot()
+    cdn, parse_color = load_renderers(bot)
+    themes = load_themes(parse_color)
+    scenarios = build_scenarios(bot, themes, args.themes, args.seed)
+
+    selected = args.scenarios or list(scenarios)
+    unknown = [name for name in selected if name not in scenarios]
+    if unknown:
+        print(f"❌ Unknown scenarios: {', '.join(unknown)}\nAvailable: {', '.join(scenarios)}")
+        return 2
+
+    # Untimed warm-up: generates missing fixture sprites and loads fonts
+    for name in selected:
+        await scenarios[name]()
+
+    env = environment(cdn)
+    manifest = load_manifest()
+    if not args.update_golden and manifest.get('environment') not in (None, env):
+        print(f"⚠️ Goldens were made with {manifest['environment']}\n   this run uses {env}\n"
+              f"   differences may come from the environment, not the code")
+
+    if args.keep_output:
+        os.makedirs(args.keep_output, exist_ok=True)
+
+    results = {}
+    failures = []
+    print(f"\n{'scenario':<28}{'size':>11}{'render ms':>11}{'encode ms':>11}{'peak MB':>9}{'PNG KB':>9}  golden")
+    for name in selected:
+        try:
+            result = await run_scenario(scenarios[name], args.iterations)
+        except Exception as e:
+            print(f"{name:<28}  ❌ {type(e).__name__}: {e}")
+            failures.append(name)
+            results[name] = {'error': f"{type(e).__name__}: {e}"}
+            continue
+
+        img = result.pop('image')
+        golden_path = os.path.join(GOLDEN_DIR, f"{name}.png")
+        if args.keep_output:
+            img.save(os.path.join(args.keep_output, f"{name}.png"), format='PNG')
+
+        if args.update_golden:
+            os.makedirs(GOLDEN_DIR, exist_ok=True)
+            img.save(golden_path, format='PNG')
+            verdict = "updated"
+        elif not os.path.exists(golden_path):
+            verdict = "missing (run with --update-golden)"
+        else:
+            with Image.open(golden_path) as golden:
+                diff = compare(golden, img)
+            result['diff'] = diff
+            if diff['size_mismatch']:
+                verdict = "❌ size differs"
+                failures.append(name)
+            elif diff['mean'] > args.max_mean or diff['changed'] > args.max_changed:
+                verdict = f"❌ mean {diff['mean']:.2f}, changed {diff['changed']:.2%}"
+                failures.append(name)
+            else:
+                verdict = f"✅ mean {diff['mean']:.2f}, changed {diff['changed']:.2%}"
+
+        results[name] = result
+        size = f"{result['size'][0]}x{result['size'][1]}"
+        print(f"{name:<28}{size:>11}{result['render_ms']:>11.1f}{result['encode_ms']:>11.1f}"
+              f"{result['peak_rss_mb']:>9.1f}{result['png_bytes'] / 1024:>9.1f}  {verdict}")
+
+    print(f"\nLocal CDN: {cdn.requests} sprite requests, {cdn.generated} fixture sprites generated")
+
+    if args.update_golden:
+        manifest = {
+            'environment': env,
+            'scenarios': {name: {'size': r['size'], 'png_bytes': r['png_bytes']}
+                          for name, r in results.items() if 'error' not in r},
+        }
+        with open(GOLDEN_MANIFEST, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        print(f"Wrote goldens and {GOLDEN_MANIFEST}")
+
+    if args.json:
+        report = {
+            'python': platform.python_version(),
+            'environment': env,
+            'iterations': args.iterations,
+            'tolerance': {'max_mean': args.max_mean, 'max_changed': args.max_changed},
+            'results': results,
+        }
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.json}")
+
+    if failures:
+        print(f"❌ {len(failures)} scenario(s) failed: {', '.join(failures)}")
+        return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=3, help="timed renders per scenario")
+    parser.add_argument('--scenarios', nargs='+', help="subset of scenario names")
+    parser.add_argument('--themes', type=int, default=4, help="themes from dex_color_suggestions.txt (0 = all)")
+    parser.add_argument('--update-golden', action='store_true', help="rewrite the golden PNGs from this run")
+    parser.add_argument('--max-mean', type=float, default=0.5, help="max mean channel difference (0-255)")
+    parser.add_argument('--max-changed', type=float, default=0.002, help="max share of visibly changed pixels")
+    parser.add_argument('--json', help="write results to this file")
+    parser.add_argument('--keep-output', help="also save every rendered PNG to this directory")
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Concurrency check for the upsert-based bulk adds (add_pokemon_bulk, add_shinies_bulk, add_event_shinies_bulk)
+
+Runs several overlapping tracking sessions for the same user at once - each
+one adds batches of Pokemon IDs that partly overlap with the others, the way
+two ?track or m!add pages over the same inventory do - and checks:
+- the "new" counts returned by all sessions add up to the documents created
+- every document exists once, with every category any session added
+- re-adding existing shinies updates their details instead of duplicating them
+
+Backends as in bench_db.py: mongomock-motor by default (needs pymongo<4.9),
+--mongo-uri for a local mongod (the interesting one: real concurrent upserts
+on the unique index). mongomock scans the collection on every upsert, so it
+defaults to 300 IDs (about 30s) instead of the 2000 used against mongod.
+The check database is dropped afterwards.
+
+Usage: python bench/check_bulk_upsert.py [--sessions N] [--ids N] [--batch N] [--mongo-uri URI] [--seed S]
+Exits non-zero if a check fails.
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+import config
+import database
+from database import db
+
+CHECK_DATABASE = "minimeowth_bulk_check"
+USER_ID = 10 ** 17
+
+
+def pokemon_doc(pokemon_id: int) -> dict:
+    return {
+        'pokemon_id': pokemon_id, 'name': 'Eevee', 'gender': 'female', 'iv_percent': 50.0,
+        'dex_number': 133, 'egg_groups': ['Field'], 'base_species': 'Eevee',
+        'is_gmax': False, 'is_regional': False, 'is_ditto': False,
+    }
+
+
+def shiny_doc(pokemon_id: int, level: int) -> dict:
+    return {'pokemon_id': pokemon_id, 'name': '✨ Eevee', 'gender': 'male', 'level': level,
+            'iv_percent': 75.0, 'dex_number': 133}
+
+
+def batches(ids: list, size: int):
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+async def session(add, ids: list, batch: int) -> int:
+    new = 0
+    for chunk in batches(ids, batch):
+        new += await add(chunk)
+        await asyncio.sleep(0)  # interleave with the other sessions
+    return new
+
+
+async def check(args) -> bool:
+    rng = random.Random(args.seed)
+    universe = list(range(1, args.ids + 1))
+    # Each session sees a random ~60% of the IDs in its own order, so sessions overlap heavily
+    plans = []
+    for _ in range(args.sessions):
+        ids = rng.sample(universe, int(len(universe) * 0.6))
+        plans.append(ids)
+    expected_ids = set().union(*plans)
+    ok = True
+
+    # Pokemon: each session adds its own category
+    results = await asyncio.gather(*(
+        session(lambda chunk, c=f"cat{i}": db.add_pokemon_bulk(USER_ID, [pokemon_doc(p) for p in chunk], c),
+                ids, args.batch)
+        for i, ids in enumerate(plans)
+    ))
+    docs = await db.pokemon.find({'user_id': USER_ID}).to_list(length=None)
+    wrong_categories = [
+        doc['pokemon_id'] for doc in docs
+        if set(doc['categories']) != {f"cat{i}" for i, ids in enumerate(plans) if doc['pokemon_id'] in ids}
+    ]
+    ok &= report("pokemon", sum(results), docs, expected_ids)
+    if wrong_categories:
+        ok = False
+        print(f"❌ pokemon: {len(wrong_categories)} documents with missing categories, e.g. {wrong_categories[:5]}")
+
+    # Shinies and event shinies: the last write wins for details, no duplicates
+    for name, add, collection in (
+        ('shinies', db.add_shinies_bulk, db.shinies),
+        ('event shinies', db.add_event_shinies_bulk, db.event_shinies),
+    ):
+        results = await asyncio.gather(*(
+            session(lambda chunk, level=i + 1: add(USER_ID, [shiny_doc(p, level) for p in chunk]), ids, args.batch)
+            for i, ids in enumerate(plans)
+        ))
+        docs = await collection.find({'user_id': USER_ID}).to_list(length=None)
+        ok &= report(name, sum(results), docs, expected_ids)
+
+        again = await add(USER_ID, [shiny_doc(p, 100) for p in sorted(expected_ids)])
+        docs = await collection.find({'user_id': USER_ID}).to_list(length=None)
+        stale = [doc['pokemon_id'] for doc in docs if doc['level'] != 100 or doc['name'] != 'Eevee']
+        if again or stale or len(docs) != len(expected_ids):
+            ok = False
+            print(f"❌ {name} re-add: {again} reported new, {len(stale)} not updated, {len(docs)} documents")
+        else:
+            print(f"✅ {name} re-add: 0 new, all {len(docs)} updated in place")
+
+    return ok
+
+
+def report(name: str, reported: int, docs: list, expected_ids: set) -> bool:
+    ids = [doc['pokemon_id'] for doc in docs]
+    problems = []
+    if reported != len(docs):
+        problems.append(f"sessions reported {reported} new, {len(docs)} documents exist")
+    if len(ids) != len(set(ids)):
+        problems.append(f"{len(ids) - len(set(ids))} duplicate documents")
+    if set(ids) != expected_ids:
+        problems.append(f"{len(expected_ids - set(ids))} missing, {len(set(ids) - expected_ids)} unexpected")
+    if problems:
+        print(f"❌ {name}: " + "; ".join(problems))
+        return False
+    print(f"✅ {name}: {reported} new across sessions = {len(docs)} documents")
+    return True
+
+
+async def main_async(args):
+    if args.mongo_uri:
+        config.MONGODB_URI = args.mongo_uri
+    else:
+        from mongomock_motor import AsyncMongoMockClient
+        database.AsyncIOMotorClient = AsyncMongoMockClient
+        # The placeholder URI in config (mongodb+srv://...) would need a DNS lookup
+        config.MONGODB_URI = "mongodb://localhost"
+    config.DATABASE_NAME = CHECK_DATABASE
+
+    await db.connect()
+    await db.client.drop_database(CHECK_DATABASE)
+    await db.connect()  # recreate the unique indexes on the empty database
+    try:
+        ok = await check(args)
+    finally:
+        await db.client.drop_database(CHECK_DATABASE)
+    return 0 if ok else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, default=8, help="concurrent tracking sessions")
+    parser.add_argument('--ids', type=int, help="distinct Pokemon IDs (default 2000, 300 on mongomock)")
+    parser.add_argument('--batch', type=int, default=50, help="Pokemon per bulk call (one embed page is 20)")
+    parser.add_argument('--mongo-uri', help="use a local mongod instead of mongomock-motor")
+    parser.add_argument('--seed', type=int, default=11)
+    args = parser.parse_args()
+    if args.ids is None:
+        args.ids = 2000 if args.mongo_uri else 300
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+Explain-plan check of the database indexes against a local mongod
+
+Connects through database.connect() (so the indexes are exactly the ones the
+bot creates and the redundant ones are dropped), seeds a few synthetic users
+and asks the server for the winning plan of the hot queries:
+- the breeding query must use an index scan already in IV order (no SORT)
+- queries that can be covered must not FETCH documents
+  (per-user counts, the leaderboard's per-user shiny $group)
+- lookups by ID, dex number and name must use their compound index
+The breeding projection cannot be covered: categories and egg_groups are
+arrays, and a multikey index never covers a query.
+
+mongomock has no query planner, so this needs a real server; the check
+database is dropped afterwards. The server is pinged first, so without one
+the check stops after --connect-timeout seconds instead of waiting out the
+driver's server selection for every index.
+
+Usage: python bench/check_indexes.py [--mongo-uri URI] [--connect-timeout S] [--users N] [--pokemon N] [--shinies N]
+Exits 1 if a plan does not match, 2 if no mongod is reachable.
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from pymongo.errors import PyMongoError
+
+import config
+import database
+from database import db
+
+CHECK_DATABASE = "minimeowth_index_check"
+FIRST_USER_ID = 10 ** 17
+EXIT_NO_SERVER = 2
+NAMES = [("Eevee", 133, ["Field"]), ("Charmander", 4, ["Monster", "Dragon"]), ("Ditto", 132, ["Ditto"]),
+         ("Dratini", 147, ["Water 1", "Dragon"]), ("Gigantamax Pikachu", 25, ["Field", "Fairy"])]
+
+
+# Seeding
+
+async def seed(args, rng: random.Random) -> list:
+    user_ids = [FIRST_USER_ID + i for i in range(args.users)]
+    for user_id in user_ids:
+        pokemon = []
+        for pid in range(1, args.pokemon + 1):
+            name, dex, egg_groups = rng.choice(NAMES)
+            pokemon.append({
+                'user_id': user_id, 'pokemon_id': pid, 'name': name, 'dex_number': dex,
+                'gender': rng.choice(('male', 'female', 'unknown')), 'iv_percent': round(rng.uniform(0, 100), 2),
+                'egg_groups': egg_groups, 'base_species': name.split()[-1], 'is_ditto': name == "Ditto",
+                'is_gmax': name.startswith("Gigantamax"), 'is_regional': False,
+                'categories': rng.sample(['normal', 'tripmax', 'tripzero'], rng.randint(1, 2)),
+            })
+        await db.pokemon.insert_many(pokemon)
+
+        shinies = []
+        for pid in range(1, args.shinies + 1):
+            name, dex, _ = rng.choice(NAMES)
+            shinies.append({'user_id': user_id, 'pokemon_id': pid, 'name': name, 'dex_number': dex,
+                            'gender': rng.choice(('male', 'female')), 'level': 1, 'iv_percent': 50.0})
+        await db.shinies.insert_many(shinies)
+        await db.event_shinies.insert_many([
+            {'user_id': user_id, 'pokemon_id': pid, 'name': "Autumn Eevee", 'gender': 'male', 'level': 1,
+             'iv_percent': 50.0}
+            for pid in range(1, args.shinies // 10 + 2)
+        ])
+    return user_ids
+
+
+# Plans
+
+def winning_stages(explain: dict) -> list:
+    """(stage, indexName) of every stage in the winning plan(s), wherever the server version nests them"""
+    stages = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            if 'stage' in node:
+                stages.append((node['stage'], node.get('indexName')))
+            for key, value in node.items():
+                if key != 'rejectedPlans':
+                    walk(value)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item)
+
+    def find_winning(node):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key == 'winningPlan':
+                    walk(value)
+                elif key != 'rejectedPlans':
+                    find_winning(value)
+        elif isinstance(node, list):
+            for item in node:
+                find_winning(item)
+
+    find_winning(explain)
+    return stages
+
+
+async def explain(command: dict) -> dict:
+    return await db.db.command({'explain': command, 'verbosity': 'queryPlanner'})
+
+
+def check_plan(label: str, stages: list, index: str = None, covered: bool = False, sorted_by_index: bool = False) -> bool:
+    names = [stage for stage, _ in stages]
+    used = {name for _, name in stages if name}
+    problems = []
+    if not any(stage in ('IXSCAN', 'COUNT_SCAN', 'DISTINCT_SCAN') for stage in names):
+        problems.append("no index scan")
+    if index and index not in used:
+        problems.append(f"expected index {index}, used {sorted(used) or 'none'}")
+    if covered and 'FETCH' in names:
+        problems.append("FETCH in a query that should be covered")
+    if sorted_by_index and any(stage in ('SORT', 'SORT_KEY_GENERATOR') for stage in names):
+        problems.append("in-memory SORT")
+
+    plan = ' <- '.join(f"{stage}({name})" if name else stage for stage, name in stages)
+    if problems:
+        print(f"❌ {label}: {'; '.join(problems)}\n   {plan}")
+        return False
+    print(f"✅ {label}: {plan}")
+    return True
+
+
+async def check_index_set() -> bool:
+    ok = True
+    for collection, redundant, required in (
+        (db.pokemon, database.REDUNDANT_POKEMON_INDEXES, ("user_pokemon_unique", "user_category_gender_iv")),
+        (db.shinies, database.REDUNDANT_SHINY_INDEXES, ("shiny_user_pokemon", "shiny_user_name_gender_dex")),
+        (db.event_shinies, database.REDUNDANT_EVENT_SHINY_INDEXES, ("event_shiny_user_pokemon",)),
+    ):
+        info = await collection.index_information()
+        left = [name for name in redundant if name in info]
+        missing = [name for name in required if name not in info]
+        if not info.get(required[0], {}).get('unique'):
+            missing.append(f"{required[0]} (unique)")
+        if left or missing:
+            ok = False
+            print(f"❌ {collection.name}: redundant indexes left {left}, missing {missing}")
+        else:
+            print(f"✅ {collection.name}: {len(info)} indexes, none redundant")
+    return ok
+
+
+async def check(args) -> bool:
+    rng = random.Random(args.seed)
+    user_ids = await seed(args, rng)
+    user_id = user_ids[len(user_ids) // 2]
+    ok = await check_index_set()
+
+    def breeding(gender=None, cooldown_ids=None):
+        query, projection = db.breeding_query(user_id, config.NORMAL_CATEGORY, gender, cooldown_ids=cooldown_ids)
+        return {'find': 'pokemon', 'filter': query, 'projection': projection, 'sort': {'iv_percent': -1}}
+
+    checks = [
+        ("breeding females", breeding('female'),
+         dict(index="user_category_gender_iv", sorted_by_index=True)),
+        ("breeding males minus cooldowns", breeding('male', set(range(1, 200, 3))),
+         dict(index="user_category_gender_iv", sorted_by_index=True)),
+        ("breeding any gender", breeding(),
+         dict(index="user_category_iv", sorted_by_index=True)),
+        ("count_pokemon(user)", {'count': 'pokemon', 'query': {'user_id': user_id}},
+         dict(covered=True)),
+        ("get_pokemon_by_id", {'find': 'pokemon', 'filter': {'user_id': user_id, 'pokemon_id': 42}},
+         dict(index="user_pokemon_unique")),
+        ("count_shinies", {'count': 'shinies', 'query': {'user_id': user_id}},
+         dict(covered=True)),
+        ("aggregate_shiny_groups", {'aggregate': 'shinies', 'pipeline': db.shiny_groups_pipeline(user_id), 'cursor': {}},
+         dict(index="shiny_user_name_gender_dex", covered=True)),
+        ("get_shinies_by_dex", {'find': 'shinies', 'filter': {'user_id': user_id, 'dex_number': 133}},
+         dict(index="shiny_user_dex")),
+        ("get_shinies_by_name", {'find': 'shinies', 'filter': {'user_id': user_id, 'name': "Eevee"}},
+         dict(index="shiny_user_name_gender_dex")),
+        ("event shinies by name", {'find': 'event_shinies', 'filter': {'user_id': user_id, 'name': "Autumn Eevee"}},
+         dict(index="event_shiny_user_name")),
+    ]
+    for label, command, expected in checks:
+        ok &= check_plan(label, winning_stages(await explain(command)), **expected)
+    return ok
+
+
+async def server_reachable(uri: str, timeout: float) -> bool:
+    client = database.AsyncIOMotorClient(uri, serverSelectionTimeoutMS=int(timeout * 1000))
+    try:
+        await client.admin.command('ping')
+        return True
+    except PyMongoError as e:
+        print(f"❌ No MongoDB server at {uri} ({type(e).__name__}); this check needs a local mongod")
+        return False
+    finally:
+        client.close()
+
+
+async def main_async(args):
+    if not await server_reachable(args.mongo_uri, args.connect_timeout):
+        return EXIT_NO_SERVER
+    config.MONGODB_URI = args.mongo_uri
+    config.DATABASE_NAME = CHECK_DATABASE
+
+    await db.connect()
+    await db.client.drop_database(CHECK_DATABASE)
+    await db.connect()  # create the indexes on the empty database
+    try:
+        ok = await check(args)
+    finally:
+        await db.client.drop_database(CHECK_DATABASE)
+    return 0 if ok else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mongo-uri', default="mongodb://localhost:27017")
+    parser.add_argument('--connect-timeout', type=float, default=3, help="seconds to wait for the server")
+    parser.add_argument('--users', type=int, default=5)
+    parser.add_argument('--pokemon', type=int, default=3000, help="Pokemon per user")
+    parser.add_argument('--shinies', type=int, default=500, help="shinies per user")
+    parser.add_argument('--seed', type=int, default=5)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+Check of the shiny leaderboards (leaderboards.py and the summary operations in database.py)
+
+- summarize_shinies: totals, rare shinies, basic completion by dex number,
+  full completion with gender difference forms counted once per gender,
+  and per-region completion
+- save_shiny_summary's stay-dirty rule: a summary computed from an older
+  dirty_at stays dirty when the user was marked again meanwhile
+- update_dirty_summaries finishes in one pass while every summary it
+  recomputes is marked dirty again (steady shiny writes), and leaves those
+  users dirty for the next refresh
+- refresh / rebuild_boards on mongomock-motor: ranked boards including a
+  region board, user and shiny totals, and get() from the in-memory cache
+  and from the stored document
+
+Needs mongomock-motor (`pip install mongomock-motor "pymongo<4.9"`), no
+MongoDB server or network. The check database is dropped afterwards.
+
+Usage: python bench/check_leaderboards.py [--users N] [--batch N]
+Exits non-zero if a check fails.
+"""
+import argparse
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+import config
+import database
+from database import db
+from leaderboards import LeaderboardService, region_board, summarize_shinies
+
+CHECK_DATABASE = "minimeowth_leaderboard_check"
+
+# A small dex: (dex number, name, has gender difference) and name -> region
+FULL_ENTRIES = [
+    (1, 'Bulbasaur', False),
+    (3, 'Venusaur', True),
+    (3, 'Mega Venusaur', False),
+    (25, 'Pikachu', True),
+    (150, 'Mewtwo', False),
+    (152, 'Chikorita', False),
+]
+BASIC_ENTRIES = [(1, 'Bulbasaur'), (3, 'Venusaur'), (25, 'Pikachu'), (150, 'Mewtwo'), (152, 'Chikorita')]
+POKEMON_INFO = {name: {'region': 'Johto' if dex_num == 152 else 'Kanto'} for dex_num, name, _ in FULL_ENTRIES}
+RARE_NAMES = {'Mewtwo'}
+
+
+def make_utils():
+    """The parts of the Utils cog LeaderboardService uses"""
+    return SimpleNamespace(
+        get_basic_dex_entries=lambda: BASIC_ENTRIES,
+        get_full_dex_entries=lambda: FULL_ENTRIES,
+        get_forms_by_region=lambda: {'Kanto': [], 'Johto': []},
+        pokemon_info=POKEMON_INFO,
+    )
+
+
+def expect(label: str, condition: bool, detail: str = '') -> bool:
+    print(f"{'✅' if condition else '❌'} {label}" + (f": {detail}" if detail else ''))
+    return condition
+
+
+def check_summarize() -> bool:
+    groups = [
+        ('Bulbasaur', 'male', 1, 2),
+        ('Venusaur', 'male', 3, 1),
+        ('Venusaur', 'female', 3, 1),
+        ('Mega Venusaur', 'male', 3, 1),
+        ('Pikachu', 'unknown', 25, 1),  # no gender: counts for neither Pikachu form
+        ('Mewtwo', None, 150, 3),
+    ]
+    summary = summarize_shinies(groups, BASIC_ENTRIES, FULL_ENTRIES, POKEMON_INFO, RARE_NAMES)
+    expected = {
+        'total_shinies': 9,
+        'rare_shinies': 3,
+        'basic_caught': 4,
+        'full_caught': 5,  # Bulbasaur, Venusaur male and female, Mega Venusaur, Mewtwo
+        'regions': {'Kanto': 5},
+    }
+    ok = expect("summarize_shinies", summary == expected, str(summary))
+    empty = summarize_shinies([], BASIC_ENTRIES, FULL_ENTRIES, POKEMON_INFO, RARE_NAMES)
+    ok &= expect("summarize_shinies without shinies",
+                 empty == {'total_shinies': 0, 'rare_shinies': 0, 'basic_caught': 0, 'full_caught': 0, 'regions': {}})
+    return ok
+
+
+async def dirty_at(user_id: int):
+    doc = await db.shiny_summaries.find_one({'user_id': user_id})
+    return doc.get('dirty_at') if doc else None
+
+
+async def check_stay_dirty() -> bool:
+    user_id = 1
+    await db.mark_summary_dirty(user_id)
+    first = await dirty_at(user_id)
+    await asyncio.sleep(0.002)
+    await db.mark_summary_dirty(user_id)  # a shiny write while the summary was being computed
+    second = await dirty_at(user_id)
+
+    await db.save_shiny_summary(user_id, {'total_shinies': 1}, first)
+    ok = expect("summary from an older mark stays dirty", await dirty_at(user_id) == second and second > first)
+    await db.save_shiny_summary(user_id, {'total_shinies': 2}, second)
+    doc = await db.shiny_summaries.find_one({'user_id': user_id})
+    ok &= expect("summary from the latest mark is clean", 'dirty_at' not in doc and doc['total_shinies'] == 2)
+    await db.shiny_summaries.delete_many({})
+    return ok
+
+
+class SteadyWrites:
+    """Database proxy marking every user dirty again while their summary is being computed"""
+
+    def __init__(self, database):
+        self._database = database
+        self.aggregations = 0
+
+    def __getattr__(self, name):
+        return getattr(self._database, name)
+
+    async def aggregate_shiny_groups(self, user_id: int):
+        self.aggregations += 1
+        await self._database.mark_summary_dirty(user_id)
+        return await self._database.aggregate_shiny_groups(user_id)
+
+
+async def check_one_pass(args) -> bool:
+    for user_id in range(1, args.users + 1):
+        await db.mark_summary_dirty(user_id)
+    await asyncio.sleep(0.002)
+
+    steady = SteadyWrites(db)
+    service = LeaderboardService(steady, make_utils(), RARE_NAMES, batch_size=args.batch)
+    try:
+        updated = await asyncio.wait_for(service.update_dirty_summaries(), timeout=30)
+    except asyncio.TimeoutError:
+        return expect("update_dirty_summaries finishes under steady writes", False, "still running after 30s")
+    still_dirty = await db.shiny_summaries.count_documents({'dirty_at': {'$exists': True}})
+    ok = expect("update_dirty_summaries finishes under steady writes",
+                updated == args.users and steady.aggregations == args.users,
+                f"{updated} summaries updated, {steady.aggregations} aggregations for {args.users} users")
+    ok &= expect("users written meanwhile stay dirty for the next refresh", still_dirty == args.users,
+                 f"{still_dirty} dirty")
+    await db.shiny_summaries.delete_many({})
+    return ok
+
+
+async def check_boards(args) -> bool:
+    # User n has n Bulbasaur, user 2 also a Mewtwo and user 3 a Chikorita
+    shinies = []
+    for user_id in range(1, 4):
+        shinies += [{'user_id': user_id, 'pokemon_id': i, 'name': 'Bulbasaur', 'gender': 'male', 'dex_number': 1}
+                    for i in range(user_id)]
+    shinies.append({'user_id': 2, 'pokemon_id': 100, 'name': 'Mewtwo', 'gender': None, 'dex_number': 150})
+    shinies.append({'user_id': 3, 'pokemon_id': 100, 'name': 'Chikorita', 'gender': 'male', 'dex_number': 152})
+    await db.shinies.insert_many(shinies)
+
+    service = LeaderboardService(db, make_utils(), RARE_NAMES, batch_size=args.batch)
+    await service.refresh()
+
+    total = await service.get('total')
+    ok = expect("total board ranked", [(e['user_id'], e['value']) for e in total['entries']] == [(3, 4), (2, 3), (1, 1)],
+                str(total['entries']))
+    ok &= expect("board totals", total['users'] == 3 and total['shinies'] == 8, f"{total['users']} users, {total['shinies']} shinies")
+    rare = await service.get('rare')
+    ok &= expect("rare board only lists users with rare shinies", [e['user_id'] for e in rare['entries']] == [2])
+    johto = await service.get(region_board('Johto'))
+    ok &= expect("region board", [(e['user_id'], e['value']) for e in johto['entries']] == [(3, 1)])
+    full = await service.get('full')
+    ok &= expect("full dex board", [(e['user_id'], e['value']) for e in full['entries']] == [(2, 2), (3, 2), (1, 1)]
+                 or [(e['user_id'], e['value']) for e in full['entries']] == [(3, 2), (2, 2), (1, 1)],
+                 str(full['entries']))
+
+    stored = await db.leaderboards.count_documents({})
+    ok &= expect("one stored document per board", stored == len(service.boards()), f"{stored} boards")
+    service._cache.clear()
+    again = await service.get('total')
+    ok &= expect("get() falls back to the stored board", again is not None and again['entries'] == total['entries'])
+    ok &= expect("no summaries left dirty", await db.shiny_summaries.count_documents({'dirty_at': {'$exists': True}}) == 0)
+    return ok
+
+
+async def main_async(args):
+    from mongomock_motor import AsyncMongoMockClient
+    database.AsyncIOMotorClient = AsyncMongoMockClient
+    # The placeholder URI in config (mongodb+srv://...) would need a DNS lookup
+    config.MONGODB_URI = "mongodb://localhost"
+    config.DATABASE_NAME = CHECK_DATABASE
+
+    await db.connect()
+    try:
+        ok = check_summarize()
+        ok &= await check_stay_dirty()
+        ok &= await check_one_pass(args)
+        ok &= await check_boards(args)
+    finally:
+        await db.client.drop_database(CHECK_DATABASE)
+    return 0 if ok else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=50, help="dirty users in the steady-writes pass")
+    parser.add_argument('--batch', type=int, default=8, help="LeaderboardService batch size")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
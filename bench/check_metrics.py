@@ -0,0 +1,186 @@
+"""
+Check of the metrics module (metrics.py) end to end
+
+- a registry renders the Prometheus text exposition: HELP/TYPE lines,
+  escaped label values, cumulative histogram buckets with +Inf, _sum and
+  _count, and nothing recorded while disabled
+- instrument_database times a Database on mongomock-motor: every call shows
+  up in bot_db_operation_seconds and bot_db_operations_total, failures with
+  status="error", and connect stays untimed
+- SpriteCache records its hits and misses in the shared registry and stays
+  under its byte bound
+- MetricsServer serves GET /metrics on localhost (404 for anything else),
+  scraped over a real socket
+
+Needs mongomock-motor (`pip install mongomock-motor "pymongo<4.9"`), no
+MongoDB server or network beyond localhost.
+
+Usage: python bench/check_metrics.py
+Exits non-zero if a check fails.
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+import config
+import database
+from database import Database
+from metrics import BotMetrics, MetricsServer, Registry, instrument_database, metrics
+from sprite_cache import SpriteCache
+
+CHECK_DATABASE = "minimeowth_metrics_check"
+USER_ID = 10 ** 17
+
+
+def expect(label: str, condition: bool, detail: str = '') -> bool:
+    print(f"{'✅' if condition else '❌'} {label}" + (f": {detail}" if detail else ''))
+    return condition
+
+
+def check_exposition() -> bool:
+    registry = Registry()
+    requests = registry.counter('check_requests_total', 'Requests', ('path',))
+    temperature = registry.gauge('check_temperature', 'Temperature')
+    latency = registry.histogram('check_latency_seconds', 'Latency', ('op',), buckets=(0.1, 1.0))
+
+    requests.inc(path='/a')
+    requests.inc(2, path='/a')
+    requests.inc(path='say "hi"\\\n')
+    temperature.set(21.5)
+    for value in (0.05, 0.5, 5.0):
+        latency.observe(value, op='read')
+
+    lines = registry.render().splitlines()
+    ok = expect("HELP and TYPE lines", {'# HELP check_requests_total Requests', '# TYPE check_requests_total counter',
+                                        '# TYPE check_temperature gauge',
+                                        '# TYPE check_latency_seconds histogram'} <= set(lines))
+    ok &= expect("counter and gauge samples", {'check_requests_total{path="/a"} 3',
+                                               'check_temperature 21.5'} <= set(lines))
+    ok &= expect("label values escaped", 'check_requests_total{path="say \\"hi\\"\\\\\\n"} 1' in lines)
+    ok &= expect("histogram buckets cumulative with +Inf, _sum and _count", [
+        line for line in lines if line.startswith('check_latency_seconds_')
+    ] == [
+        'check_latency_seconds_bucket{op="read",le="0.1"} 1',
+        'check_latency_seconds_bucket{op="read",le="1"} 2',
+        'check_latency_seconds_bucket{op="read",le="+Inf"} 3',
+        'check_latency_seconds_sum{op="read"} 5.55',
+        'check_latency_seconds_count{op="read"} 3',
+    ])
+
+    registry.enabled = False
+    before = registry.render()
+    requests.inc(path='/a')
+    latency.observe(1, op='read')
+    ok &= expect("nothing recorded while disabled", registry.render() == before)
+    return ok
+
+
+async def check_database(registry: BotMetrics) -> bool:
+    from mongomock_motor import AsyncMongoMockClient
+    database.AsyncIOMotorClient = AsyncMongoMockClient
+    # The placeholder URI in config (mongodb+srv://...) would need a DNS lookup
+    config.MONGODB_URI = "mongodb://localhost"
+    config.DATABASE_NAME = CHECK_DATABASE
+
+    instrumented = Database()
+    instrument_database(instrumented, registry)
+    await instrumented.connect()
+    try:
+        await instrumented.update_settings(USER_ID, {'theme': 'dark'})
+        for _ in range(3):
+            await instrumented.get_settings(USER_ID)
+        await instrumented.count_shinies(USER_ID)
+        # A failing call: the collection handle is gone
+        shinies, instrumented.shinies = instrumented.shinies, None
+        try:
+            await instrumented.get_all_shinies(USER_ID)
+            failed = False
+        except AttributeError:
+            failed = True
+        instrumented.shinies = shinies
+    finally:
+        await instrumented.client.drop_database(CHECK_DATABASE)
+
+    operations = registry.db_operations
+    ok = expect("every call counted", operations.get(method='update_settings', status='ok') == 1
+                and operations.get(method='get_settings', status='ok') == 3
+                and operations.get(method='count_shinies', status='ok') == 1)
+    # get_settings reads through get_user_data, which is wrapped on the instance too
+    ok &= expect("nested calls timed", registry.db_seconds.count(method='get_user_data') == 3
+                 and registry.db_seconds.count(method='get_settings') == 3)
+    ok &= expect("failed call counted as error", failed and operations.get(method='get_all_shinies', status='error') == 1
+                 and operations.get(method='get_all_shinies', status='ok') == 0)
+    ok &= expect("connect not timed", registry.db_seconds.count(method='connect') == 0
+                 and not any(key[0] == 'connect' for key in operations.values))
+    return ok
+
+
+def check_sprite_cache() -> bool:
+    metrics.enabled = True
+    cache = SpriteCache(max_bytes=250)
+    for url in ('a', 'b', 'a', 'c'):
+        if cache.get(url) is None:
+            cache.put(url, b'x' * 100)
+    metrics.enabled = False
+
+    hits = metrics.cache_requests.get(cache='sprite', result='hit')
+    misses = metrics.cache_requests.get(cache='sprite', result='miss')
+    ok = expect("sprite cache hits and misses recorded", (hits, misses) == (1, 3), f"{hits} hits, {misses} misses")
+    ok &= expect("sprite cache drops the least recently used", len(cache) == 2 and cache.size == 200
+                 and cache._entries.keys() == {'a', 'c'})
+    return ok
+
+
+async def scrape(port: int, path: str) -> tuple:
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode('latin-1'))
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b'\r\n\r\n')
+    return head.decode('latin-1'), body.decode('utf-8')
+
+
+async def check_server(registry: BotMetrics) -> bool:
+    server = MetricsServer(registry, port=0)
+    await server.start()
+    try:
+        port = server._server.sockets[0].getsockname()[1]
+        head, body = await scrape(port, '/metrics')
+        missing_head, _ = await scrape(port, '/other')
+        again = await scrape(port, '/metrics?x=1')
+    finally:
+        await server.stop()
+
+    ok = expect("GET /metrics answers 200 with the exposition content type",
+                head.startswith('HTTP/1.1 200') and 'text/plain; version=0.0.4' in head)
+    ok &= expect("scraped body is the registry's exposition", body == registry.render(),
+                 f"{len(body.splitlines())} lines")
+    ok &= expect("database samples exposed", 'bot_db_operations_total{method="get_settings",status="ok"} 3' in body)
+    ok &= expect("other paths answer 404", missing_head.startswith('HTTP/1.1 404'))
+    ok &= expect("query strings ignored", again[0].startswith('HTTP/1.1 200'))
+    ok &= expect("server stopped", not server.running)
+    return ok
+
+
+async def main_async(args):
+    ok = check_exposition()
+    ok &= check_sprite_cache()
+    registry = BotMetrics(enabled=True)
+    ok &= await check_database(registry)
+    ok &= await check_server(registry)
+    return 0 if ok else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+Check of the resource bootstrap (resources.py) against a local HTTP stub
+
+Serves a fake GitHub contents API, raw files and direct files from an
+aiohttp.web app on localhost, counts every request and the most requests in
+flight at once, and runs ResourceBootstrap into a temporary directory:
+- start() and overlapping run() calls download every file exactly once,
+  with no more than --concurrency requests in flight, and set `ready`
+- a second run downloads nothing (manifest checksums)
+- a file damaged on disk and a file changed upstream are downloaded again
+- a file whose content does not match the listed SHA is rejected and nothing
+  is written for it
+- files from before the manifest are adopted without downloading them
+- wait_ready() times out while nothing has run yet
+
+No network access; the stub adds a small delay to every response so
+parallel downloads actually overlap.
+
+Usage: python bench/check_resources.py [--files N] [--concurrency N] [--delay SECONDS]
+Exits non-zero if a check fails.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from aiohttp import web
+
+from resources import GITHUB_DIRECTORIES, ResourceBootstrap, git_blob_sha
+
+REPO = 'owner/resources'
+BRANCH = 'main'
+
+
+class GitHubStub:
+    """Contents API, raw files and direct files, with request counting"""
+
+    def __init__(self, files_per_directory: int, delay: float):
+        self.delay = delay
+        self.files = {}  # "directory/name" -> bytes
+        for directory, (_, extensions) in GITHUB_DIRECTORIES.items():
+            for i in range(files_per_directory):
+                self.files[f"{directory}/file{i}{extensions[0]}"] = f"{directory} {i}".encode() * 100
+        self.direct = {'male.png': b'male symbol' * 50, 'female.png': b'female symbol' * 50}
+        self.corrupt = set()  # paths served with content that does not match the listed SHA
+        self.requests = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        self.app = web.Application(middlewares=[self.count])
+        self.app.router.add_get('/repos/{owner}/{repo}/contents/{directory}', self.contents)
+        self.app.router.add_get('/raw/{owner}/{repo}/{branch}/{directory}/{name}', self.raw)
+        self.app.router.add_get('/direct/{name}', self.direct_file)
+        self.runner = None
+        self.base = None
+
+    async def start(self):
+        self.runner = web.AppRunner(self.app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+    @web.middleware
+    async def count(self, request, handler):
+        self.requests[request.path] = self.requests.get(request.path, 0) + 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            return await handler(request)
+        finally:
+            self.in_flight -= 1
+
+    def reset_counts(self):
+        self.requests = {}
+        self.max_in_flight = 0
+
+    def downloads(self) -> dict:
+        """Request path -> count, file downloads only"""
+        return {path: n for path, n in self.requests.items() if not path.startswith('/repos/')}
+
+    async def contents(self, request):
+        directory = request.match_info['directory']
+        listing = [
+            {'name': path.split('/', 1)[1], 'type': 'file', 'sha': git_blob_sha(data)}
+            for path, data in self.files.items() if path.startswith(f"{directory}/")
+        ]
+        listing.append({'name': 'nested', 'type': 'dir', 'sha': '0' * 40})
+        return web.json_response(listing)
+
+    async def raw(self, request):
+        path = f"{request.match_info['directory']}/{request.match_info['name']}"
+        if path not in self.files:
+            raise web.HTTPNotFound()
+        data = self.files[path]
+        return web.Response(body=data[::-1] if path in self.corrupt else data)
+
+    async def direct_file(self, request):
+        name = request.match_info['name']
+        if name not in self.direct:
+            raise web.HTTPNotFound()
+        return web.Response(body=self.direct[name])
+
+
+def make_bootstrap(stub: GitHubStub, root: str, concurrency: int) -> ResourceBootstrap:
+    return ResourceBootstrap(
+        root=root, repo=REPO, branch=BRANCH, concurrency=concurrency,
+        api_base=stub.base, raw_base=f"{stub.base}/raw",
+        direct_files={f"emojis/{name}": f"{stub.base}/direct/{name}" for name in stub.direct},
+    )
+
+
+def local_path(root: str, github_path: str) -> str:
+    directory, name = github_path.split('/', 1)
+    return os.path.join(root, GITHUB_DIRECTORIES[directory][0], name)
+
+
+def expect(label: str, condition: bool, detail: str = '') -> bool:
+    print(f"{'✅' if condition else '❌'} {label}" + (f": {detail}" if detail else ''))
+    return condition
+
+
+async def check(args, stub: GitHubStub, root: str) -> bool:
+    total = len(stub.files) + len(stub.direct)
+    ok = True
+
+    # First run: start() plus two overlapping manual runs
+    bootstrap = make_bootstrap(stub, root, args.concurrency)
+    ok &= expect("wait_ready times out before any run", not await bootstrap.wait_ready(0.05))
+    bootstrap.start()
+    bootstrap.start()
+    summaries = await asyncio.gather(bootstrap.task, bootstrap.run(), bootstrap.run())
+    downloads = stub.downloads()
+    ok &= expect("every file downloaded exactly once", len(downloads) == total and set(downloads.values()) == {1},
+                 f"{sum(downloads.values())} downloads of {len(downloads)} files, {total} expected")
+    ok &= expect("one run downloaded, the overlapping runs skipped",
+                 sorted(s['downloaded'] for s in summaries) == [0, 0, total], str(summaries))
+    ok &= expect("concurrency bound held", stub.max_in_flight <= args.concurrency,
+                 f"max {stub.max_in_flight} in flight, limit {args.concurrency}")
+    ok &= expect("downloads overlapped", stub.max_in_flight > 1 or args.concurrency == 1,
+                 f"max {stub.max_in_flight} in flight")
+    ok &= expect("ready set", bootstrap.ready.is_set() and await bootstrap.wait_ready(0))
+    ok &= expect("files on disk match", all(
+        open(local_path(root, path), 'rb').read() == data for path, data in stub.files.items()))
+
+    # Second run: nothing to download
+    stub.reset_counts()
+    summary = await bootstrap.run()
+    ok &= expect("second run downloads nothing", summary['downloaded'] == 0 and not stub.downloads()
+                 and summary['skipped'] == total, str(summary))
+
+    # Damaged on disk, changed upstream
+    damaged, changed = sorted(stub.files)[:2]
+    with open(local_path(root, damaged), 'wb') as f:
+        f.write(b'truncated')
+    stub.files[changed] = b'new version' * 100
+    stub.reset_counts()
+    summary = await bootstrap.run()
+    ok &= expect("damaged and changed files downloaded again",
+                 summary['downloaded'] == 2 and len(stub.downloads()) == 2
+                 and open(local_path(root, damaged), 'rb').read() == stub.files[damaged]
+                 and open(local_path(root, changed), 'rb').read() == stub.files[changed], str(summary))
+
+    # Checksum mismatch: a new file served with the wrong content
+    bad = 'fonts/corrupt.ttf'
+    stub.files[bad] = b'real content' * 100
+    stub.corrupt.add(bad)
+    summary = await bootstrap.run()
+    leftovers = [name for name in os.listdir(os.path.join(root, 'fonts')) if name.endswith('.tmp')]
+    ok &= expect("checksum mismatch rejected, nothing written",
+                 summary['failed'] == 1 and not os.path.exists(local_path(root, bad)) and not leftovers,
+                 str(summary))
+    del stub.files[bad]
+    stub.corrupt.clear()
+
+    # Files from before the manifest
+    legacy_root = os.path.join(root, 'legacy')
+    for path, data in stub.files.items():
+        os.makedirs(os.path.dirname(local_path(legacy_root, path)), exist_ok=True)
+        with open(local_path(legacy_root, path), 'wb') as f:
+            f.write(data)
+    stub.reset_counts()
+    summary = await make_bootstrap(stub, legacy_root, args.concurrency).run()
+    ok &= expect("existing GitHub files adopted without downloading",
+                 summary['downloaded'] == len(stub.direct) and len(stub.downloads()) == len(stub.direct),
+                 str(summary))
+
+    return ok
+
+
+async def main_async(args):
+    stub = GitHubStub(args.files, args.delay)
+    await stub.start()
+    try:
+        with tempfile.TemporaryDirectory() as root:
+            ok = await check(args, stub, root)
+    finally:
+        await stub.stop()
+    return 0 if ok else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--files', type=int, default=12, help="files per GitHub directory")
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--delay', type=float, default=0.02, help="stub response delay in seconds")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Check of SessionStore persistence (session_store.py) on mongomock-motor
+
+- put / load round trip of a createlist-shaped session
+- update pushes appended items and rewrites only the named fields: the
+  stored session matches the in-memory one after many small appends
+- update writes the whole state when the database has no copy
+- bytes sent to the database for a list growing by a few names per edit,
+  save (whole state every time) vs update
+
+Needs mongomock-motor (`pip install mongomock-motor "pymongo<4.9"`), no
+MongoDB server or network. The check database is dropped afterwards.
+
+Usage: python bench/check_sessions.py [--names N] [--edits N]
+Exits non-zero if a check fails.
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+import bson
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+import config
+import database
+from database import db
+from list_messages import LIST_SYNC_FIELDS
+from session_store import SessionStore
+
+CHECK_DATABASE = "minimeowth_sessions_check"
+
+
+def expect(label: str, condition: bool, detail: str = '') -> bool:
+    print(f"{'✅' if condition else '❌'} {label}" + (f": {detail}" if detail else ''))
+    return condition
+
+
+def make_list(names: int) -> dict:
+    return {
+        'pokemon': [f"Pokemon {i}" for i in range(names)],
+        'user_id': 1,
+        'channel_id': 2,
+        'message_id': 3,
+        'continuation_message_ids': [],
+        'chunk_ends': [names],
+        'chunk_checksums': [0],
+        'chunk_total': names,
+    }
+
+
+class WriteCounter:
+    """Wraps sessions.update_one and adds up the BSON size of every update document"""
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.bytes = 0
+        self.writes = 0
+
+    def __getattr__(self, name):
+        return getattr(self.collection, name)
+
+    async def update_one(self, query, update, **kwargs):
+        self.bytes += len(bson.encode(query)) + len(bson.encode(update))
+        self.writes += 1
+        return await self.collection.update_one(query, update, **kwargs)
+
+
+async def stored_state(kind: str, key):
+    doc = await db.sessions.find_one({'kind': kind, 'key': key})
+    return doc['state'] if doc else None
+
+
+async def grow(store: SessionStore, key, edits: int, partial: bool):
+    """Append a few names per edit, persisting like the createlist cog (or with save)"""
+    state = store.get(key)
+    for edit in range(edits):
+        added = [f"New {edit}.{i}" for i in range(3)]
+        state['pokemon'].extend(added)
+        state['chunk_total'] = len(state['pokemon'])
+        if partial:
+            await store.update(key, fields=LIST_SYNC_FIELDS, appended={'pokemon': added})
+        else:
+            await store.save(key)
+
+
+async def check_round_trip(args) -> bool:
+    store = SessionStore('check_list', ttl=600)
+    await store.put('a', make_list(args.names))
+    restored = SessionStore('check_list', ttl=600)
+    await restored.load()
+    ok = expect("put / load round trip", restored.get('a') == store.get('a'))
+
+    await grow(store, 'a', 20, partial=True)
+    ok &= expect("update pushes appended names and sets fields", await stored_state('check_list', 'a') == store.get('a'),
+                 f"{len(store.get('a')['pokemon'])} names")
+
+    # A session the database never got (its first write failed)
+    store._sessions['b'] = (make_list(5), store._sessions['a'][1])
+    store.get('b')['pokemon'].append('Late')
+    await store.update('b', appended={'pokemon': ['Late']})
+    ok &= expect("update writes the whole state when the database has no copy",
+                 await stored_state('check_list', 'b') == store.get('b'))
+    return ok
+
+
+async def check_bytes(args) -> bool:
+    counter = db.sessions = WriteCounter(db.sessions)
+    sent = {}
+    for label, partial in (('save', False), ('update', True)):
+        store = SessionStore(f'check_{label}', ttl=600)
+        await store.put('list', make_list(args.names))
+        counter.bytes = counter.writes = 0
+        await grow(store, 'list', args.edits, partial)
+        sent[label] = counter.bytes
+        print(f"{label:<7} {counter.bytes / 1024:>9.1f} KiB over {counter.writes} writes "
+              f"({args.names} names growing by 3 per edit)")
+    db.sessions = counter.collection
+
+    saved_state = await stored_state('check_save', 'list')
+    updated_state = await stored_state('check_update', 'list')
+    ok = expect("both stores end with the same list", saved_state == updated_state)
+    ok &= expect("update sends less than save", sent['update'] < sent['save'],
+                 f"{sent['save'] / max(sent['update'], 1):.0f}x less")
+    return ok
+
+
+async def main_async(args):
+    from mongomock_motor import AsyncMongoMockClient
+    database.AsyncIOMotorClient = AsyncMongoMockClient
+    # The placeholder URI in config (mongodb+srv://...) would need a DNS lookup
+    config.MONGODB_URI = "mongodb://localhost"
+    config.DATABASE_NAME = CHECK_DATABASE
+
+    await db.connect()
+    try:
+        ok = await check_round_trip(args)
+        ok &= await check_bytes(args)
+    finally:
+        await db.client.drop_database(CHECK_DATABASE)
+    return 0 if ok else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--names', type=int, default=2000, help="names in the list before the edits")
+    parser.add_argument('--edits', type=int, default=100, help="coalesced edits, 3 new names each")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Load check for the Utils cog's shared data and compiled filter tables
+
+Constructs Utils the way the bot does at startup (first instance loads the
+CSVs and builds the dex and filter tables, later instances reuse them) and
+checks:
+- the dex, species and event tables are not empty
+- every named filter's mask selects exactly its members, and the filter
+  table is in dex order
+- --name terms matching nothing resolve to the closest species name
+- a second instance shares the cached data without reloading
+
+Requires the bot's own dependencies (discord.py), no database or network.
+
+Usage: python bench/check_utils.py
+Exits non-zero if a check fails.
+"""
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # Utils loads its data files relative to the repository root
+
+from cogs.utils import Utils
+from filters import FILTER_MEMBERS
+
+
+def expect(label: str, condition: bool, detail: str = '') -> bool:
+    print(f"{'✅' if condition else '❌'} {label}" + (f": {detail}" if detail else ''))
+    return condition
+
+
+def main():
+    utils = Utils(None)
+    ok = True
+
+    for key in ('basic_dex_entries', 'full_dex_entries', 'event_entries', 'filter_entries'):
+        ok &= expect(f"{key} loaded", len(Utils._shared_data[key]) > 0, f"{len(Utils._shared_data[key])} entries")
+    ok &= expect("dex numbers loaded", len(utils.dex_numbers) > 0 and len(utils.dex_data) > 0)
+
+    entries, index, masks = utils.get_filter_table()
+    ok &= expect("filter table in dex order", list(entries) == sorted(entries, key=lambda e: (e[0], e[1])))
+
+    wrong = []
+    for key, members in FILTER_MEMBERS.items():
+        expected = {name for name in members if utils.get_dex_number(name) is not None}
+        if index.select(masks[key]) != expected:
+            wrong.append(key)
+    ok &= expect("every filter mask selects its members", not wrong,
+                 f"{len(FILTER_MEMBERS)} filters" + (f", wrong: {', '.join(wrong[:5])}" if wrong else ''))
+
+    species = utils.get_dex_index('species')
+    resolved = utils.resolve_name_searches(['Pikachuu', 'chu'], species)
+    ok &= expect("--name typos resolved, matching terms kept", resolved == ['Pikachu', 'chu'], str(resolved))
+
+    again = Utils(None)
+    ok &= expect("second instance reuses the cached data",
+                 again.dex_numbers is utils.dex_numbers and again.get_filter_table()[1] is index)
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
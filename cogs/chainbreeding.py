@@ -7,6 +7,7 @@ import config
 from collections import defaultdict, deque
 from typing import List, Dict, Tuple, Optional, Set
 import heapq
+from name_search import NameSearchIndex, format_suggestions
 
 
 class BreedingChain:
@@ -52,6 +53,7 @@ class ChainBreeding(commands.Cog):
         self.egg_groups = {}  # {pokemon_name: [group1, group2]}
         self.spawn_rates = {}  # {pokemon_name: spawn_rate_value}
         self.pokemon_list = []  # All Pokemon names
+        self.name_search = NameSearchIndex()  # Fuzzy lookup over pokemon_list
 
         # Reverse indexes for fast lookups
         self.learns_naturally = defaultdict(set)  # {move_name: {pokemon1, pokemon2, ...}}
@@ -125,6 +127,7 @@ class ChainBreeding(commands.Cog):
 
         # Build Pokemon list
         self.pokemon_list = list(self.movesets.keys())
+        self.name_search = NameSearchIndex((name, name) for name in self.pokemon_list)
 
     def get_spawn_cost(self, pokemon_name: str) -> float:
         """Get spawn rate cost (lower is easier to obtain)"""
@@ -664,18 +667,16 @@ class ChainBreeding(commands.Cog):
                           reference=ctx.message, mention_author=False)
             return
 
-        # Find in movesets (case-insensitive, exact match)
-        target_species = None
-        pokemon_lower = pokemon.lower()
-
-        for pkmn_name in self.pokemon_list:
-            if pkmn_name.lower() == pokemon_lower:
-                target_species = pkmn_name
-                break
+        # Find in movesets (case/accent-insensitive, then a confident fuzzy match)
+        match = self.name_search.best(pokemon)
+        target_species = match.value if match else None
 
         if not target_species:
-            await ctx.send(f"❌ Pokemon `{pokemon}` not found in database!", 
-                          reference=ctx.message, mention_author=False)
+            error_msg = f"❌ Pokemon `{pokemon}` not found in database!"
+            suggestions = self.name_search.suggest(pokemon)
+            if suggestions:
+                error_msg += f"\nDid you mean {format_suggestions(suggestions)}?"
+            await ctx.send(error_msg, reference=ctx.message, mention_author=False)
             return
 
         # Validate moves
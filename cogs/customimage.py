@@ -5,7 +5,12 @@ import io
 import re
 from PIL import Image, ImageDraw, ImageFont
 import aiohttp
+import os
+import config
 from config import EMBED_COLOR
+from metrics import metrics
+from sprite_cache import sprite_cache
+from resources import resources
 
 
 class CustomImageGenerator(commands.Cog):
@@ -13,8 +18,8 @@ class CustomImageGenerator(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        self.fonts_folder = 'shinystats/fonts'
-        self.emojis_folder = 'shinystats/emojis'
+        self.fonts_folder = os.path.join(config.RESOURCES_DIR, 'fonts')
+        self.emojis_folder = os.path.join(config.RESOURCES_DIR, 'emojis')
 
         # Layout settings - EXACT match to dex_image_generator.py
         self.cols = 6
@@ -66,12 +71,16 @@ class CustomImageGenerator(commands.Cog):
         else:
             url = f"{base_url}/{cdn_number}.png"
 
+        from io import BytesIO
+        data = sprite_cache.get(url)
+        if data is not None:
+            return Image.open(BytesIO(data)).convert('RGBA')
         async with aiohttp.ClientSession() as session:
             try:
                 async with session.get(url) as resp:
                     if resp.status == 200:
-                        from io import BytesIO
                         data = await resp.read()
+                        sprite_cache.put(url, data)
                         return Image.open(BytesIO(data)).convert('RGBA')
             except Exception as e:
                 print(f"Error fetching image for CDN {cdn_number} (type: {image_type}, gender: {gender}): {e}")
@@ -206,6 +215,7 @@ class CustomImageGenerator(commands.Cog):
         print(f"DEBUG: Final title: {title}, Pokemon count: {len(pokemon_list)}")
         return title, pokemon_list
 
+    @metrics.render_seconds.time(renderer='custom')
     async def create_custom_image(self, title: str, pokemon_list: list, utils):
         """Create custom image matching dex_image_generator.py design exactly
         pokemon_list: list of (pokemon_name, image_type, gender, count)
@@ -493,6 +503,8 @@ class CustomImageGenerator(commands.Cog):
                                     reference=ctx.message, mention_author=False)
 
         try:
+            # Fonts and gender symbols may still be downloading right after startup
+            await resources.wait_ready(config.RESOURCE_READY_TIMEOUT)
             img, failed_pokemon = await self.create_custom_image(title, pokemon_list, utils)
 
             if img:
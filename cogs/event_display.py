@@ -176,28 +176,6 @@ class EventDexDisplay(commands.Cog):
 
         return show_caught, show_uncaught, order, region, types, name_searches, page
 
-    def matches_filters(self, pokemon_name: str, utils, region_filter: str, type_filters: list):
-        """Check if a Pokemon matches region and type filters"""
-        info = utils.get_pokemon_info(pokemon_name)
-
-        if not info:
-            return False
-
-        if region_filter:
-            if info['region'] != region_filter:
-                return False
-
-        if type_filters:
-            pokemon_types = [info['type1']]
-            if info['type2']:
-                pokemon_types.append(info['type2'])
-
-            for type_filter in type_filters:
-                if type_filter not in pokemon_types:
-                    return False
-
-        return True
-
     @commands.hybrid_command(name='eventdex', aliases=['ed'])
     @app_commands.describe(filters="Filters: --caught, --uncaught, --orderd, --ordera, --region, --type, --name, --page")
     async def event_dex(self, ctx, *, filters: str = None):
@@ -235,20 +213,15 @@ class EventDexDisplay(commands.Cog):
         # Get all event forms from CSV
         all_forms = utils.get_event_entries()
 
+        # Name (accent-insensitive), region and type filters on the precomputed index
+        index = utils.get_dex_index('event')
+        name_searches = utils.resolve_name_searches(name_searches, index)
+        selected = index.query(region_filter, type_filters, name_searches)
+
         # Build filtered list
         form_entries = []
-        for pokemon_name, has_gender_diff in all_forms:
-            # Apply name search filter
-            if name_searches:
-                matches_any = any(search.lower() in pokemon_name.lower() for search in name_searches)
-                if not matches_any:
-                    continue
-
-            # Apply region/type filters
-            if region_filter or type_filters:
-                if not self.matches_filters(pokemon_name, utils, region_filter, type_filters):
-                    continue
-
+        for i in index.indices(selected):
+            pokemon_name, has_gender_diff = all_forms[i]
             if has_gender_diff:
                 # Add male and female entries
                 male_count = form_counts.get((pokemon_name, 'male'), 0)
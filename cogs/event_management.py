@@ -6,6 +6,8 @@ import re
 import config
 from config import EMBED_COLOR, POKETWO_BOT_ID
 from database import db
+from embed_parser import parse_lines
+from page_ingest import PageIngestor
 
 
 class EventDexManagement(commands.Cog):
@@ -14,10 +16,6 @@ class EventDexManagement(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.id_pattern = re.compile(r'\*?`\s*(\d+)\s*`\*?')
-        self.name_pattern = re.compile(r'✨\s*([^<]+?)(?:\s*<:|$)')
-        self.gender_pattern = re.compile(r'<:(male|female|unknown):')
-        self.level_pattern = re.compile(r'Lvl\.\s*(\d+)')
-        self.iv_pattern = re.compile(r'•\s*([\d.]+)%')
 
     async def add_event_context_callback(self, interaction: discord.Interaction, message: discord.Message):
         """Context menu command to add event shinies from a message"""
@@ -201,58 +199,50 @@ class EventDexManagement(commands.Cog):
                     f"💡 Keep clicking pages, I'll auto-detect more!"
         )
 
+        # Monitor for page changes: pages are parsed as they arrive, writes are coalesced
         if monitored_message_id:
-            def check(before, after):
-                return (after.id == monitored_message_id and 
-                       after.author.id == POKETWO_BOT_ID and 
-                       after.embeds)
-
-            timeout = 300
-            start_time = asyncio.get_event_loop().time()
-            last_update = start_time
-
-            while (asyncio.get_event_loop().time() - start_time) < timeout:
-                try:
-                    remaining = timeout - (asyncio.get_event_loop().time() - start_time)
-                    wait_time = min(remaining, 30.0)
-                    before, after = await self.bot.wait_for('message_edit', timeout=wait_time, check=check)
-
-                    embed = after.embeds[0]
-                    page_shinies = []
-
-                    page_total = 0
-                    if embed.description:
-                        page_lines = embed.description.strip().split('\n')
-                        page_total = sum(1 for line in page_lines if '✨' in line)
-
-                    total_found_in_embed += page_total
-
-                    shinies = self.parse_event_shiny_embed(embed.description, utils)
-
-                    for shiny in shinies:
-                        if shiny['pokemon_id'] not in processed_shiny_ids:
-                            page_shinies.append(shiny)
-                            processed_shiny_ids.add(shiny['pokemon_id'])
-                            all_shinies.append(shiny)
-
-                    if page_shinies:
-                        page_new_count = await db.add_event_shinies_bulk(user_id, page_shinies)
-                        new_count += page_new_count
-                        last_update = asyncio.get_event_loop().time()
-                        total_in_inventory = await db.count_event_shinies(user_id)
-
-                        await status_msg.edit(
-                            content=f"✅ **Page detected! Adding more event shinies**\n"
-                                    f"**Total Event Shinies Tracked:** {total_found_in_embed}\n"
-                                    f"**Total Event Shinies Added:** {new_count}\n"
-                                    f"**Currently In Inventory:** {total_in_inventory}\n\n"
-                                    f"💡 Keep clicking for more!"
-                        )
-
-                except asyncio.TimeoutError:
-                    if asyncio.get_event_loop().time() - last_update > 15:
-                        break
-                    continue
+            def parse_page(embed):
+                nonlocal total_found_in_embed
+                page_shinies = []
+
+                page_total = 0
+                if embed.description:
+                    page_lines = embed.description.strip().split('\n')
+                    page_total = sum(1 for line in page_lines if '✨' in line)
+
+                total_found_in_embed += page_total
+
+                shinies = self.parse_event_shiny_embed(embed.description, utils)
+
+                for shiny in shinies:
+                    if shiny['pokemon_id'] not in processed_shiny_ids:
+                        page_shinies.append(shiny)
+                        processed_shiny_ids.add(shiny['pokemon_id'])
+                        all_shinies.append(shiny)
+
+                return page_shinies
+
+            def render_status(added, inventory):
+                return (f"✅ **Page detected! Adding more event shinies**\n"
+                        f"**Total Event Shinies Tracked:** {total_found_in_embed}\n"
+                        f"**Total Event Shinies Added:** {added}\n"
+                        f"**Currently In Inventory:** {inventory}\n\n"
+                        f"💡 Keep clicking for more!")
+
+            ingestor = PageIngestor(
+                self.bot,
+                monitored_message_id,
+                parse_page=parse_page,
+                write_batch=lambda batch: db.add_event_shinies_bulk(user_id, batch),
+                count_total=lambda: db.count_event_shinies(user_id),
+                render_status=render_status,
+                status_msg=status_msg,
+                author_id=POKETWO_BOT_ID,
+                added=new_count,
+                inventory=total_in_inventory
+            )
+            new_count = await ingestor.run()
+            total_in_inventory = ingestor.inventory
 
         embed = discord.Embed(title="✨ Event Shiny Tracking Complete", color=EMBED_COLOR)
         total_processed = len(all_shinies)
@@ -279,52 +269,29 @@ class EventDexManagement(commands.Cog):
             return []
 
         shinies = []
-        lines = description.strip().split('\n')
 
-        for line in lines:
-            if '✨' not in line:
+        # Only lines with sparkles emoji, parsed in a single match each
+        for record in parse_lines(description, marker='✨'):
+            pokemon_name = record.name
+            if not pokemon_name:
                 continue
 
-            try:
-                id_match = self.id_pattern.search(line)
-                if not id_match:
-                    continue
-                pokemon_id = int(id_match.group(1).strip())
-
-                name_match = re.search(r'>\s*(.+?)\s*<:(?:male|female|unknown):', line)
-                if not name_match:
-                    continue
-
-                pokemon_name = name_match.group(1).strip()
-                pokemon_name = pokemon_name.replace('<:_:1242455099213877248>', '').strip()
-                pokemon_name = pokemon_name.replace('✨', '').strip()
-                pokemon_name = re.sub(r'<a?:[^:]*:\d+>', '', pokemon_name).strip()
-                pokemon_name = ' '.join(pokemon_name.split()).strip()
-
-                gender_match = self.gender_pattern.search(line)
-                gender = gender_match.group(1) if gender_match else 'unknown'
-
-                level_match = self.level_pattern.search(line)
-                level = int(level_match.group(1)) if level_match else 1
-
-                iv_match = self.iv_pattern.search(line)
-                iv_percent = float(iv_match.group(1)) if iv_match else 0.0
+            gender = record.gender or 'unknown'
+            level = record.level if record.level is not None else 1
+            iv_percent = record.iv_percent if record.iv_percent is not None else 0.0
 
-                # Check if it's an event Pokemon
-                if not utils.is_event_pokemon(pokemon_name):
-                    continue
-
-                shinies.append({
-                    'pokemon_id': pokemon_id,
-                    'name': pokemon_name,
-                    'gender': gender,
-                    'level': level,
-                    'iv_percent': iv_percent
-                })
-
-            except (ValueError, AttributeError):
+            # Check if it's an event Pokemon
+            if not utils.is_event_pokemon(pokemon_name):
                 continue
 
+            shinies.append({
+                'pokemon_id': record.pokemon_id,
+                'name': pokemon_name,
+                'gender': gender,
+                'level': level,
+                'iv_percent': iv_percent
+            })
+
         return shinies
 
     @commands.hybrid_command(name='removeevent', aliases=['rmevent'])
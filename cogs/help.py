@@ -655,6 +655,12 @@ class HelpCommands(commands.Cog):
             inline=False
         )
 
+        embed.add_field(
+            name=f"`{HELP_PREFIX}leaderboard [total/basic/full/rare/region]`",
+            value="> **Leaderboard** (`lb`) - Top collections across all users",
+            inline=False
+        )
+
         embed.add_field(
             name=f"`{HELP_PREFIX}removeshiny` `{HELP_PREFIX}clearshiny`",
             value="> Remove shinies by ID or clear all tracked shinies",
@@ -4,6 +4,7 @@ from discord import app_commands
 import asyncio
 import config
 from database import db
+from page_ingest import PageIngestor
 
 class InventoryView(discord.ui.View):
     """View with pagination buttons and inventory dropdown"""
@@ -134,7 +135,7 @@ class Inventory(commands.Cog):
         total_tracked = 0  # Total valid Pokemon found (excluding eggs)
         total_added = 0    # Total NEW Pokemon added to DB
 
-        async def process_embed(embed):
+        def process_embed(embed):
             """Process embed and return list of valid Pokemon (excluding eggs)"""
             if not embed or not embed.description:
                 return []
@@ -173,7 +174,7 @@ class Inventory(commands.Cog):
                 if not replied_msg.embeds:
                     await ctx.send("❌ Please reply to a Poketwo message with embeds!", reference=ctx.message, mention_author=False)
                     return
-                initial_pokemon = await process_embed(replied_msg.embeds[0])
+                initial_pokemon = process_embed(replied_msg.embeds[0])
                 all_pokemon.extend(initial_pokemon)
                 monitored_message_id = replied_msg.id
             except Exception as e:
@@ -184,7 +185,7 @@ class Inventory(commands.Cog):
             for msg_id in message_ids:
                 try:
                     embed = await utils.fetch_embed_by_id(ctx, int(msg_id))
-                    page_pokemon = await process_embed(embed)
+                    page_pokemon = process_embed(embed)
                     all_pokemon.extend(page_pokemon)
                 except:
                     continue
@@ -209,54 +210,34 @@ class Inventory(commands.Cog):
             reference=ctx.message, mention_author=False
         )
 
-        # Monitor for page updates
+        # Monitor for page updates: pages are parsed as they arrive, writes are coalesced
         if monitored_message_id:
-            def check(before, after):
-                return (after.id == monitored_message_id and after.embeds)
-
-            timeout = 60
-            start_time = asyncio.get_event_loop().time()
-            last_update = start_time
-
-            while (asyncio.get_event_loop().time() - start_time) < timeout:
-                try:
-                    remaining = timeout - (asyncio.get_event_loop().time() - start_time)
-                    wait_time = min(remaining, 30.0)
-                    before, after = await self.bot.wait_for('message_edit', timeout=wait_time, check=check)
-
-                    # Process the new page
-                    page_pokemon = await process_embed(after.embeds[0])
-
-                    if page_pokemon:
-                        # Update tracking count
-                        page_tracked = len(page_pokemon)
-                        total_tracked += page_tracked
-
-                        # Add to database
-                        page_added = await db.add_pokemon_bulk(user_id, page_pokemon, category)
-                        total_added += page_added
-
-                        # Get updated inventory count
-                        current_inventory = await db.count_pokemon(user_id, category=category)
-
-                        # Update status message
-                        last_update = asyncio.get_event_loop().time()
-                        await status_msg.edit(
-                            content=f"✅ **Pokemon Tracking In Progress**\n"
-                                    f"**Total Pokemon Tracked:** {total_tracked}\n"
-                                    f"**Total Pokemon Added (excluding events):** {total_added}\n"
-                                    f"**Currently In Inventory:** {current_inventory}\n"
-                                    f"💡 Keep clicking pages, I'll auto-detect more!"
-                        )
-
-                except asyncio.TimeoutError:
-                    # If no activity for 15 seconds after last update, stop monitoring
-                    if asyncio.get_event_loop().time() - last_update > 15:
-                        break
-                    continue
-                except Exception as e:
-                    print(f"Error during page monitoring: {e}")
-                    break
+            def parse_page(embed):
+                nonlocal total_tracked
+                page_pokemon = process_embed(embed)
+                total_tracked += len(page_pokemon)
+                return page_pokemon
+
+            def render_status(added, inventory):
+                return (f"✅ **Pokemon Tracking In Progress**\n"
+                        f"**Total Pokemon Tracked:** {total_tracked}\n"
+                        f"**Total Pokemon Added (excluding events):** {added}\n"
+                        f"**Currently In Inventory:** {inventory}\n"
+                        f"💡 Keep clicking pages, I'll auto-detect more!")
+
+            ingestor = PageIngestor(
+                self.bot,
+                monitored_message_id,
+                parse_page=parse_page,
+                write_batch=lambda batch: db.add_pokemon_bulk(user_id, batch, category),
+                count_total=lambda: db.count_pokemon(user_id, category=category),
+                render_status=render_status,
+                status_msg=status_msg,
+                added=total_added,
+                inventory=current_inventory,
+                timeout=60
+            )
+            total_added = await ingestor.run()
 
         # Final summary embed
         duplicates = total_tracked - total_added
@@ -0,0 +1,127 @@
+import discord
+from datetime import timezone
+from discord.ext import commands
+from discord import app_commands
+import config
+from config import EMBED_COLOR
+from database import db
+from leaderboards import LeaderboardService, BOARDS, region_board
+
+
+class Leaderboard(commands.Cog):
+    """Cross-user shiny leaderboards"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.service = None
+
+    async def cog_load(self):
+        utils = self.bot.get_cog('Utils')
+        if not utils:
+            print("❌ Leaderboards disabled: Utils cog not loaded")
+            return
+        self.service = LeaderboardService(
+            db, utils, config.RARE,
+            refresh_interval=config.LEADERBOARD_REFRESH_MINUTES * 60,
+            cache_ttl=config.LEADERBOARD_CACHE_TTL,
+            size=config.LEADERBOARD_SIZE
+        )
+        self.service.start()
+
+    async def cog_unload(self):
+        if self.service:
+            await self.service.stop()
+
+    def resolve_board(self, board: str):
+        """Board key for a user-facing board name or region"""
+        board = (board or 'total').lower()
+        aliases = {'shinies': 'total', 'dex': 'basic', 'basicdex': 'basic', 'fulldex': 'full', 'rares': 'rare'}
+        board = aliases.get(board, board)
+        if board in BOARDS:
+            return board
+        key = region_board(board.title())
+        return key if key in self.service.boards() else None
+
+    def format_value(self, key: str, value: int, utils) -> str:
+        """Counts for shiny boards, completion for dex and region boards"""
+        if key in ('total', 'rare'):
+            return f"{value:,} ✨"
+        if key == 'basic':
+            total = len(utils.get_basic_dex_entries())
+        elif key == 'full':
+            total = utils.get_total_forms_count()
+        else:
+            total = utils.get_forms_by_region().get(key.split(':', 1)[1], 0)
+        percent = (value / total * 100) if total else 0
+        return f"{value:,}/{total:,} ({percent:.1f}%)"
+
+    @commands.hybrid_command(name='leaderboard', aliases=['lb', 'top'])
+    @app_commands.describe(
+        board="total, basic, full, rare or a region (e.g. kanto)",
+        page="Page number (10 per page)"
+    )
+    async def leaderboard(self, ctx, board: str = None, page: int = 1):
+        """Top shiny collections across all users"""
+        if not self.service:
+            await ctx.send("❌ Leaderboards are not available right now.", reference=ctx.message, mention_author=False)
+            return
+
+        key = self.resolve_board(board)
+        if key is None:
+            await ctx.send(
+                "❌ Unknown leaderboard! Use `total`, `basic`, `full`, `rare` or a region name (e.g. `kanto`).",
+                reference=ctx.message, mention_author=False
+            )
+            return
+
+        document = await self.service.get(key)
+        if document is None:
+            await ctx.send("⏳ Leaderboards are still being computed, try again in a few minutes.",
+                           reference=ctx.message, mention_author=False)
+            return
+
+        utils = self.bot.get_cog('Utils')
+        entries = document['entries']
+        per_page = 10
+        pages = max(1, (len(entries) + per_page - 1) // per_page)
+        page = min(max(1, page), pages)
+        start = (page - 1) * per_page
+
+        lines = []
+        for rank, entry in enumerate(entries[start:start + per_page], start + 1):
+            medal = {1: "🥇", 2: "🥈", 3: "🥉"}.get(rank, f"`#{rank}`")
+            lines.append(f"{medal} <@{entry['user_id']}> - {self.format_value(key, entry['value'], utils)}")
+
+        embed = discord.Embed(
+            title=f"🏆 {document['title']}",
+            description="\n".join(lines) or "Nobody is on this leaderboard yet!",
+            color=EMBED_COLOR
+        )
+
+        own_rank = next((i for i, entry in enumerate(entries, 1) if entry['user_id'] == ctx.author.id), None)
+        if own_rank:
+            embed.add_field(name="Your rank", value=f"#{own_rank}", inline=True)
+        embed.add_field(
+            name="Global",
+            value=f"{document['users']:,} collectors • {document['shinies']:,} shinies",
+            inline=True
+        )
+        embed.set_footer(text=f"Page {page}/{pages} • Updated every {config.LEADERBOARD_REFRESH_MINUTES:g} minutes")
+        embed.timestamp = document['computed_at'].replace(tzinfo=timezone.utc)  # stored as naive UTC
+
+        await ctx.send(embed=embed, reference=ctx.message, mention_author=False)
+
+    @commands.command(name='refreshleaderboards')
+    @commands.is_owner()
+    async def refresh_leaderboards(self, ctx):
+        """Recompute leaderboards now (Owner only)"""
+        if not self.service:
+            await ctx.send("❌ Leaderboards are not available right now.", reference=ctx.message, mention_author=False)
+            return
+        message = await ctx.send("⏳ Refreshing leaderboards...", reference=ctx.message, mention_author=False)
+        await self.service.refresh()
+        await message.edit(content="✅ Leaderboards refreshed.")
+
+
+async def setup(bot):
+    await bot.add_cog(Leaderboard(bot))
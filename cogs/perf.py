@@ -0,0 +1,139 @@
+import discord
+from discord.ext import commands
+import os
+import re
+import time
+import config
+from command_profiler import CommandProfiler
+from loop_watchdog import watchdog
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.0f}ms"
+
+
+class Perf(commands.Cog):
+    """Owner-only performance diagnostics"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.profiler = CommandProfiler(config.PROFILE_OUTPUT_DIR, report=self._send_profile_report)
+
+    async def cog_unload(self):
+        # Leave no hooks behind on commands that were armed
+        for name in list(self.profiler.targets):
+            command = self.bot.get_command(name)
+            if command:
+                self.profiler.disarm(command)
+
+    @commands.command(name='perf')
+    @commands.is_owner()
+    async def perf(self, ctx, action: str = None, index: int = None):
+        """
+        Event loop lag and the code that blocked the loop the most since startup (Owner only)
+        Usage: m!perf | m!perf stack <n> | m!perf reset
+        """
+        if action == 'reset':
+            watchdog.reset()
+            return await ctx.send("✅ Loop watchdog statistics reset.", reference=ctx.message, mention_author=False)
+
+        offenders = watchdog.top(10)
+
+        if action == 'stack':
+            if index is None or not 1 <= index <= len(offenders):
+                return await ctx.send(f"❌ Usage: `m!perf stack <1-{max(1, len(offenders))}>`",
+                                      reference=ctx.message, mention_author=False)
+            offender = offenders[index - 1]
+            stack = offender.stack or "(no stack captured - reported by asyncio debug mode)"
+            return await ctx.send(f"**{offender.location}**\n```py\n{stack[-1800:]}\n```",
+                                  reference=ctx.message, mention_author=False)
+
+        lag = watchdog.lag_stats()
+        uptime = int(time.time() - watchdog.started_at) if watchdog.started_at else 0
+        description = (
+            f"**Loop lag:** now {_ms(lag['current'])} • p50 {_ms(lag['p50'])} • "
+            f"p99 {_ms(lag['p99'])} • max {_ms(lag['max'])}\n"
+            f"**Stalls over {_ms(watchdog.threshold)}:** {watchdog.stalls} in {uptime // 3600}h {uptime % 3600 // 60}m\n"
+            f"**Gateway latency:** {_ms(self.bot.latency)}"
+        )
+        if not watchdog.running:
+            description += "\n⚠️ Watchdog is not running"
+
+        embed = discord.Embed(title="⏱️ Performance", description=description, color=config.EMBED_COLOR)
+
+        if offenders:
+            lines = []
+            for i, offender in enumerate(offenders, 1):
+                tag = "🐢" if offender.kind == 'callback' else "🧊"
+                lines.append(
+                    f"`{i}.` {tag} `{offender.location[:70]}`\n"
+                    f"　{offender.count}× • total {_ms(offender.total)} • max {_ms(offender.max)}"
+                )
+            embed.add_field(name="Top offenders", value="\n".join(lines)[:1024], inline=False)
+            embed.set_footer(text="🧊 stack snapshot during a stall • 🐢 slow callback (asyncio debug) • m!perf stack <n>")
+        else:
+            embed.add_field(name="Top offenders", value="Nothing has blocked the loop yet 🎉", inline=False)
+
+        await ctx.send(embed=embed, reference=ctx.message, mention_author=False)
+
+    @commands.command(name='profile')
+    @commands.is_owner()
+    async def profile(self, ctx, command_name: str = None, *options):
+        """
+        Capture a cProfile of a command invocation (Owner only)
+        Usage: m!profile <command> [every <N>] [@user] | m!profile off <command> | m!profile
+        """
+        if command_name is None:
+            if not self.profiler.targets:
+                return await ctx.send("🔬 No commands are being profiled.", reference=ctx.message, mention_author=False)
+            armed = "\n".join(f"• {t.describe()}" for t in self.profiler.targets.values())
+            return await ctx.send(f"🔬 Profiling:\n{armed}", reference=ctx.message, mention_author=False)
+
+        if command_name == 'off':
+            command = self.bot.get_command(options[0]) if options else None
+            if command is None or not self.profiler.disarm(command):
+                return await ctx.send("❌ That command is not being profiled.", reference=ctx.message, mention_author=False)
+            return await ctx.send(f"✅ Stopped profiling `{command.qualified_name}`.",
+                                  reference=ctx.message, mention_author=False)
+
+        command = self.bot.get_command(command_name)
+        if command is None:
+            return await ctx.send(f"❌ Unknown command `{command_name}`.", reference=ctx.message, mention_author=False)
+
+        every = None
+        user_id = None
+        options = list(options)
+        while options:
+            option = options.pop(0)
+            mention = re.fullmatch(r'<@!?(\d+)>|(\d{15,})', option)
+            if option == 'every' and options and options[0].isdigit():
+                every = max(1, int(options.pop(0)))
+            elif mention:
+                user_id = int(mention.group(1) or mention.group(2))
+            else:
+                return await ctx.send("❌ Usage: `m!profile <command> [every <N>] [@user]`",
+                                      reference=ctx.message, mention_author=False)
+
+        target = self.profiler.arm(command, every=every, user_id=user_id, channel_id=ctx.channel.id)
+        await ctx.send(f"🔬 Profiling {target.describe()}. Reports will be posted here.",
+                       reference=ctx.message, mention_author=False)
+
+    async def _send_profile_report(self, target, ctx, path, summary, elapsed):
+        """Post the summary (and the .pstats file) where profiling was armed"""
+        channel = self.bot.get_channel(target.channel_id)
+        if channel is None:
+            return
+
+        content = (
+            f"🔬 **{target.command}** by {ctx.author} took {elapsed:.2f}s - saved `{path}`\n"
+            f"```\n{summary[:1800]}\n```"
+        )
+        # Attach the raw profile when it fits in an upload
+        if os.path.getsize(path) < 8 * 1024 * 1024:
+            await channel.send(content, file=discord.File(path))
+        else:
+            await channel.send(content)
+
+
+async def setup(bot):
+    await bot.add_cog(Perf(bot))
@@ -1,21 +1,22 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import json
 import config
-import unicodedata
+from collections import OrderedDict
+from name_search import NameSearchIndex, format_suggestions, normalize
+from pokedex_store import PokedexStore
+from metrics import metrics
 
 class PokedexView(discord.ui.View):
     """View with shiny toggle, gender toggle, form dropdowns, and navigation buttons"""
 
-    def __init__(self, ctx, pokemon_data, all_forms, current_form_key, has_gender_diff, all_dex_numbers, timeout=180):
+    def __init__(self, ctx, cog, all_forms, current_form_key, has_gender_diff, timeout=180):
         super().__init__(timeout=timeout)
         self.ctx = ctx
-        self.pokemon_data = pokemon_data
+        self.cog = cog  # Pokedex cog: shared store, dex navigation links and embed cache
         self.all_forms = all_forms  # List of (form_key, form_name) for this dex number
         self.current_form_key = current_form_key
         self.has_gender_diff = has_gender_diff
-        self.all_dex_numbers = all_dex_numbers  # Sorted list of all dex numbers
         self.is_shiny = False
         self.is_female = False  # False = male (default), True = female
         self.is_compare_mode = False  # New: Track if in compare mode
@@ -29,13 +30,13 @@ class PokedexView(discord.ui.View):
         """Build view components based on Pokemon properties"""
         self.clear_items()
 
-        # Get current dex number
-        current_data = self.pokemon_data[self.current_form_key]
-        current_dex = current_data.get('dex_number', '0')
+        # Get neighbouring dex numbers (None at either end)
+        current_dex = self.cog.store[self.current_form_key].dex_number
+        prev_dex, next_dex = self.cog.dex_links.get(current_dex, (None, None))
 
         # Row 1: Navigation buttons (Back, Shiny/Compare, Gender, Next)
         # Back button
-        self.add_item(self.create_dex_back_button(current_dex))
+        self.add_item(self.create_dex_back_button(prev_dex))
 
         # Shiny/Compare button (changes based on mode)
         if self.is_compare_mode:
@@ -53,7 +54,7 @@ class PokedexView(discord.ui.View):
             self.add_item(self.create_female_button())
 
         # Next button
-        self.add_item(self.create_dex_next_button(current_dex))
+        self.add_item(self.create_dex_next_button(next_dex))
 
         # Row 2 & 3: Form dropdowns (if multiple forms exist and not in compare mode)
         if len(self.all_forms) > 1 and not self.is_compare_mode:
@@ -78,36 +79,24 @@ class PokedexView(discord.ui.View):
             if first_batch_end < end_idx:
                 self.add_item(self.create_form_dropdown(first_batch_end, end_idx, 2))
 
-    def create_dex_back_button(self, current_dex):
+    def create_dex_back_button(self, prev_dex):
         """Create button to go to previous dex number"""
-        try:
-            current_idx = self.all_dex_numbers.index(current_dex)
-            is_first = (current_idx == 0)
-        except ValueError:
-            is_first = True
-
         button = discord.ui.Button(
             label="◀",
             style=discord.ButtonStyle.secondary,
             custom_id="dex_back",
-            disabled=is_first
+            disabled=prev_dex is None
         )
         button.callback = self.dex_back_callback
         return button
 
-    def create_dex_next_button(self, current_dex):
+    def create_dex_next_button(self, next_dex):
         """Create button to go to next dex number"""
-        try:
-            current_idx = self.all_dex_numbers.index(current_dex)
-            is_last = (current_idx == len(self.all_dex_numbers) - 1)
-        except ValueError:
-            is_last = True
-
         button = discord.ui.Button(
             label="▶",
             style=discord.ButtonStyle.secondary,
             custom_id="dex_next",
-            disabled=is_last
+            disabled=next_dex is None
         )
         button.callback = self.dex_next_callback
         return button
@@ -236,91 +225,38 @@ class PokedexView(discord.ui.View):
 
     async def dex_back_callback(self, interaction: discord.Interaction):
         """Go to previous dex number"""
-        if interaction.user.id != self.ctx.author.id:
-            await interaction.response.send_message("❌ This is not your pokedex!", ephemeral=True)
-            return
-
-        current_data = self.pokemon_data[self.current_form_key]
-        current_dex = current_data.get('dex_number', '0')
-
-        try:
-            current_idx = self.all_dex_numbers.index(current_dex)
-            if current_idx > 0:
-                # Get previous dex number
-                prev_dex = self.all_dex_numbers[current_idx - 1]
-
-                # Get the cog to look up the Pokemon
-                cog = self.ctx.bot.get_cog('Pokedex')
-                if cog and prev_dex in cog.dex_number_forms:
-                    # Get first form of previous dex number
-                    prev_form_key, _ = cog.dex_number_forms[prev_dex][0]
-
-                    # Update to new Pokemon
-                    self.current_form_key = prev_form_key
-                    self.all_forms = cog.dex_number_forms[prev_dex]
-
-                    # Check if new Pokemon has gender difference
-                    new_data = self.pokemon_data[prev_form_key]
-                    new_pokemon_name = new_data.get('name', '')
-                    self.has_gender_diff = new_pokemon_name in config.GENDER_DIFFERENCE_POKEMON
-
-                    # Reset states
-                    self.is_female = False
-                    self.current_dropdown_page = 0
-                    self.is_compare_mode = False  # Exit compare mode when navigating
-
-                    self.build_view()
-                    embed = await self.create_embed()
-                    await interaction.response.edit_message(embed=embed, view=self)
-                    return
-        except (ValueError, IndexError):
-            pass
-
-        await interaction.response.defer()
+        await self.navigate(interaction, 0)
 
     async def dex_next_callback(self, interaction: discord.Interaction):
         """Go to next dex number"""
+        await self.navigate(interaction, 1)
+
+    async def navigate(self, interaction: discord.Interaction, direction: int):
+        """Jump to the previous (0) or next (1) dex number using the precomputed links"""
         if interaction.user.id != self.ctx.author.id:
             await interaction.response.send_message("❌ This is not your pokedex!", ephemeral=True)
             return
 
-        current_data = self.pokemon_data[self.current_form_key]
-        current_dex = current_data.get('dex_number', '0')
+        current_dex = self.cog.store[self.current_form_key].dex_number
+        target_dex = self.cog.dex_links.get(current_dex, (None, None))[direction]
+        forms = self.cog.dex_number_forms.get(target_dex)
+        if not forms:
+            await interaction.response.defer()
+            return
 
-        try:
-            current_idx = self.all_dex_numbers.index(current_dex)
-            if current_idx < len(self.all_dex_numbers) - 1:
-                # Get next dex number
-                next_dex = self.all_dex_numbers[current_idx + 1]
-
-                # Get the cog to look up the Pokemon
-                cog = self.ctx.bot.get_cog('Pokedex')
-                if cog and next_dex in cog.dex_number_forms:
-                    # Get first form of next dex number
-                    next_form_key, _ = cog.dex_number_forms[next_dex][0]
-
-                    # Update to new Pokemon
-                    self.current_form_key = next_form_key
-                    self.all_forms = cog.dex_number_forms[next_dex]
-
-                    # Check if new Pokemon has gender difference
-                    new_data = self.pokemon_data[next_form_key]
-                    new_pokemon_name = new_data.get('name', '')
-                    self.has_gender_diff = new_pokemon_name in config.GENDER_DIFFERENCE_POKEMON
-
-                    # Reset states
-                    self.is_female = False
-                    self.current_dropdown_page = 0
-                    self.is_compare_mode = False  # Exit compare mode when navigating
-
-                    self.build_view()
-                    embed = await self.create_embed()
-                    await interaction.response.edit_message(embed=embed, view=self)
-                    return
-        except (ValueError, IndexError):
-            pass
-
-        await interaction.response.defer()
+        # Show the first form of the new dex number
+        self.current_form_key = forms[0][0]
+        self.all_forms = forms
+        self.has_gender_diff = self.cog.has_gender_diff(self.current_form_key)
+
+        # Reset states
+        self.is_female = False
+        self.current_dropdown_page = 0
+        self.is_compare_mode = False  # Exit compare mode when navigating
+
+        self.build_view()
+        embed = await self.create_embed()
+        await interaction.response.edit_message(embed=embed, view=self)
 
     async def toggle_shiny_callback(self, interaction: discord.Interaction):
         """Toggle between normal and shiny sprite"""
@@ -369,7 +305,7 @@ class PokedexView(discord.ui.View):
 
         self.is_female = not self.is_female
         self.build_view()
-        embed = self.create_embed()
+        embed = await self.create_embed()
         await interaction.response.edit_message(embed=embed, view=self)
 
     async def prev_dropdown_callback(self, interaction: discord.Interaction):
@@ -410,7 +346,7 @@ class PokedexView(discord.ui.View):
         # Get selected form key
         selected_form_key = interaction.data['values'][0]
 
-        if selected_form_key not in self.pokemon_data:
+        if selected_form_key not in self.cog.store:
             await interaction.response.send_message("❌ Form not found!", ephemeral=True)
             return
 
@@ -418,9 +354,7 @@ class PokedexView(discord.ui.View):
         self.current_form_key = selected_form_key
 
         # Check if new form has gender difference
-        new_data = self.pokemon_data[selected_form_key]
-        new_pokemon_name = new_data.get('name', '')
-        self.has_gender_diff = new_pokemon_name in config.GENDER_DIFFERENCE_POKEMON
+        self.has_gender_diff = self.cog.has_gender_diff(selected_form_key)
 
         # Reset gender to male when switching forms
         self.is_female = False
@@ -436,20 +370,155 @@ class PokedexView(discord.ui.View):
         await interaction.response.edit_message(embed=embed, view=self)
 
     async def create_embed(self):
-        """Create embed for current Pokemon form"""
-        data = self.pokemon_data[self.current_form_key]
+        """Create embed for current Pokemon form from the cog's cached payload"""
+        is_female = self.is_female and self.has_gender_diff
+        embed = discord.Embed.from_dict(
+            self.cog.get_embed_payload(self.current_form_key, self.is_shiny, is_female, self.is_compare_mode)
+        )
 
         if self.is_compare_mode:
-            # Create comparison embed
-            return await self.create_compare_embed(data)
+            return embed
+
+        # The shiny count is per user, so it is the only part built fresh every time
+        footer_parts = []
+
+        if is_female:
+            footer_parts.append("♀ Female")
+        elif self.has_gender_diff:
+            footer_parts.append("♂ Male")
+
+        # Pass gender info if this Pokemon has gender difference
+        gender_filter = None
+        if self.has_gender_diff:
+            gender_filter = 'female' if self.is_female else 'male'
+
+        pokemon_name = self.cog.store[self.current_form_key].name
+        shiny_count = await self.get_shiny_count(self.ctx.author.id, pokemon_name, gender_filter)
+
+        footer_parts.append(f"You have {shiny_count} shiny of this pokémon!")
+
+        embed.set_footer(text=" • ".join(footer_parts))
+        return embed
+
+    async def get_shiny_count(self, user_id, pokemon_name, gender_filter=None):
+        """Get the count of shinies for a specific Pokemon name (and gender if applicable)"""
+        try:
+            # Import db here to avoid circular imports
+            from database import db
+
+            # Get all user's shinies
+            all_shinies = await db.get_all_shinies(user_id)
+
+            # Count shinies matching this exact Pokemon name
+            if gender_filter:
+                # For gender difference Pokemon, count only matching gender
+                count = sum(1 for shiny in all_shinies 
+                           if shiny['name'] == pokemon_name and shiny['gender'] == gender_filter)
+            else:
+                # For non-gender difference Pokemon, count all
+                count = sum(1 for shiny in all_shinies if shiny['name'] == pokemon_name)
+
+            return count
+        except Exception as e:
+            print(f"Error getting shiny count: {e}")
+            return 0
+
+    async def on_timeout(self):
+        """Disable all buttons when view times out"""
+        if self.message:
+            try:
+                for item in self.children:
+                    item.disabled = True
+                await self.message.edit(view=self)
+            except:
+                pass
+
+
+class Pokedex(commands.Cog):
+    """Pokedex information commands"""
+
+    EMBED_CACHE_SIZE = 512  # Formatted embed payloads kept in memory
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.store = PokedexStore()  # Compact read-only entries + exact name index
+        self.dex_number_forms = {}  # Maps dex numbers to tuple of (form_key, form_name)
+        self.name_search = NameSearchIndex()  # Fuzzy index over every indexed name
+        self.all_dex_numbers = ()  # Dex numbers in navigation order
+        self.dex_links = {}  # Maps dex number to (previous dex number, next dex number)
+        self.embed_cache = OrderedDict()  # (form_key, shiny, female, compare) -> embed dict (LRU)
+        self.load_pokemon_data()
+        self.build_navigation()
+
+    def normalize_name(self, name):
+        """Remove accents and normalize name for searching"""
+        return normalize(name)
+
+    def load_pokemon_data(self):
+        """Load Pokemon data from JSON file into the compact store"""
+        try:
+            self.store = PokedexStore.load('alldata/pokemon_data.json')
+            self.dex_number_forms = self.store.dex_number_forms
+
+            # Fuzzy index over every name (primary first, then alternates)
+            for form_key, entry in self.store.entries.items():
+                for name in entry.all_names():
+                    self.name_search.add(name, form_key)
+
+            print(f"✅ Loaded {len(self.store)} Pokemon entries")
+            print(f"✅ Indexed {len(self.store.name_index)} Pokemon names ({len(self.name_search)} searchable)")
+            print(f"✅ Mapped {len(self.dex_number_forms)} unique dex numbers")
+        except Exception as e:
+            print(f"❌ Error loading alldata/pokemon_data.json: {e}")
+
+    def build_navigation(self):
+        """Precompute dex ordering and prev/next links so button navigation is a dict lookup"""
+        self.all_dex_numbers = tuple(sorted(self.dex_number_forms.keys(), key=lambda x: int(x) if x.isdigit() else 0))
+
+        self.dex_links = {}
+        last = len(self.all_dex_numbers) - 1
+        for i, dex_num in enumerate(self.all_dex_numbers):
+            prev_dex = self.all_dex_numbers[i - 1] if i > 0 else None
+            next_dex = self.all_dex_numbers[i + 1] if i < last else None
+            self.dex_links[dex_num] = (prev_dex, next_dex)
+
+    def has_gender_diff(self, form_key):
+        """Whether a form has separate male/female sprites"""
+        return self.store[form_key].name in config.GENDER_DIFFERENCE_POKEMON
+
+    def get_embed_payload(self, form_key, is_shiny, is_female, is_compare):
+        """
+        Formatted embed (as a dict) for one display state of a form, without the
+        per-user footer. Built once and kept in a small LRU.
+        """
+        # Compare mode always shows both sprites, so shiny does not change it
+        key = (form_key, False if is_compare else is_shiny, is_female, is_compare)
+        payload = self.embed_cache.get(key)
+        metrics.cache_lookup('pokedex_embed', payload is not None)
+        if payload is not None:
+            self.embed_cache.move_to_end(key)
         else:
-            # Create normal embed
-            return await self.create_normal_embed(data)
+            data = self.store[form_key]
+            if is_compare:
+                embed = self.build_compare_embed(data, is_female, self.has_gender_diff(form_key))
+            else:
+                embed = self.build_normal_embed(data, is_shiny, is_female)
+            payload = embed.to_dict()
 
-    async def create_compare_embed(self, data):
+            self.embed_cache[key] = payload
+            if len(self.embed_cache) > self.EMBED_CACHE_SIZE:
+                self.embed_cache.popitem(last=False)
+
+        # Callers may add a footer, so hand out a copy with its own field list
+        payload = dict(payload)
+        if 'fields' in payload:
+            payload['fields'] = [dict(field) for field in payload['fields']]
+        return payload
+
+    def build_compare_embed(self, data, is_female, has_gender_diff):
         """Create embed showing normal and shiny forms side by side"""
         # Create title
-        title = f"🔍 Comparison — #{data['dex_number']} {data['name']}"
+        title = f"🔍 Comparison — #{data.dex_number} {data.name}"
 
         # Create embed
         embed = discord.Embed(
@@ -459,11 +528,11 @@ class PokedexView(discord.ui.View):
         )
 
         # Get base image URL
-        normal_image_url = data['image_url']
-        shiny_image_url = data['image_url'].replace('/images/', '/shiny/')
+        normal_image_url = data.image_url
+        shiny_image_url = data.image_url.replace('/images/', '/shiny/')
 
         # Apply gender difference if applicable
-        if self.is_female and self.has_gender_diff:
+        if is_female:
             normal_image_url = normal_image_url.replace('.png', 'F.png')
             shiny_image_url = shiny_image_url.replace('.png', 'F.png')
 
@@ -474,62 +543,62 @@ class PokedexView(discord.ui.View):
         embed.set_thumbnail(url=normal_image_url)
 
         # Add gender info if applicable
-        if self.has_gender_diff:
-            gender_text = "♀ Female" if self.is_female else "♂ Male"
+        if has_gender_diff:
+            gender_text = "♀ Female" if is_female else "♂ Male"
             embed.add_field(name="Gender", value=gender_text, inline=True)
 
         embed.set_footer(text="Click 'Exit Compare' to return to normal view")
 
         return embed
 
-    async def create_normal_embed(self, data):
-        """Create normal Pokemon embed"""
+    def build_normal_embed(self, data, is_shiny, is_female):
+        """Create normal Pokemon embed (the footer is added per user by the view)"""
         # Create title with sparkles if shiny
-        title_prefix = "✨ " if self.is_shiny else ""
-        title = f"{title_prefix}#{data['dex_number']} — {data['name']}"
+        title_prefix = "✨ " if is_shiny else ""
+        title = f"{title_prefix}#{data.dex_number} — {data.name}"
 
         # Create embed
         embed = discord.Embed(
             title=title,
-            description=data.get('description', 'No description available.'),
+            description=data.description if data.description is not None else 'No description available.',
             color=discord.Color.from_str(config.EMBED_COLOR) if isinstance(config.EMBED_COLOR, str) else config.EMBED_COLOR
         )
 
         # Get image URL
-        image_url = data['image_url']
+        image_url = data.image_url
 
         # Apply gender difference (female suffix)
-        if self.is_female and self.has_gender_diff:
+        if is_female:
             # Replace .png with F.png (e.g., 1.png -> 1F.png)
             image_url = image_url.replace('.png', 'F.png')
 
         # Apply shiny transformation
-        if self.is_shiny:
+        if is_shiny:
             image_url = image_url.replace('/images/', '/shiny/')
 
         embed.set_image(url=image_url)
 
         # Add Evolution field if exists
-        evolution_text = self.format_evolution(data)
+        evolution_text = data.evolution
         if evolution_text:
             embed.add_field(name="Evolution", value=evolution_text, inline=False)
 
         # Add Types field
-        if data.get('types'):
-            types_text = '\n'.join(data['types'])
+        if data.types:
+            types_text = '\n'.join(data.types)
             embed.add_field(name="Types", value=types_text, inline=True)
 
         # Add Region field
-        if data.get('region'):
-            embed.add_field(name="Region", value=data['region'], inline=True)
+        if data.region:
+            embed.add_field(name="Region", value=data.region, inline=True)
 
         # Add Catchable field
-        if data.get('catchable'):
-            embed.add_field(name="Catchable", value=data['catchable'], inline=True)
+        if data.catchable:
+            embed.add_field(name="Catchable", value=data.catchable, inline=True)
 
         # Add Base Stats field
-        if data.get('base_stats'):
-            stats = data['base_stats']
+        stats = data.base_stats
+        if stats:
             # Filter out None values when calculating total
             total = sum(v for v in stats.values() if v is not None)
             stats_text = '\n'.join([
@@ -544,97 +613,41 @@ class PokedexView(discord.ui.View):
             embed.add_field(name="Base Stats", value=stats_text, inline=True)
 
         # Add Names field
-        if data.get('names'):
-            names_text = self.format_names(data['names'])
+        if data.names:
+            names_text = self.format_names(data.names)
             embed.add_field(name="Names", value=names_text, inline=True)
 
         # Add Appearance field
-        if data.get('appearance'):
-            appearance = data['appearance']
-            appearance_text = f"Height: {appearance.get('height_m', 'N/A')} m\nWeight: {appearance.get('weight_kg', 'N/A')} kg"
+        if data.height_m is not None or data.weight_kg is not None:
+            appearance_text = f"Height: {data.height_m or 'N/A'} m\nWeight: {data.weight_kg or 'N/A'} kg"
             embed.add_field(name="Appearance", value=appearance_text, inline=True)
 
         # Add Gender Ratio field
-        if data.get('gender_ratio'):
-            gender_text = self.format_gender_ratio(data['gender_ratio'])
+        if data.gender_ratio:
+            gender_text = self.format_gender_ratio(data.gender_ratio)
             embed.add_field(name="Gender Ratio", value=gender_text, inline=True)
 
         # Add Egg Groups field
-        if data.get('egg_groups'):
-            egg_groups = data['egg_groups']
-            if isinstance(egg_groups, list):
+        if data.egg_groups:
+            egg_groups = data.egg_groups
+            if isinstance(egg_groups, tuple):
                 egg_groups_text = '\n'.join(egg_groups)
             else:
                 egg_groups_text = egg_groups
             embed.add_field(name="Egg Groups", value=egg_groups_text, inline=True)
 
         # Add Hatch Time field
-        if data.get('hatch_time'):
-            embed.add_field(name="Hatch Time", value=data['hatch_time'], inline=True)
+        if data.hatch_time:
+            embed.add_field(name="Hatch Time", value=data.hatch_time, inline=True)
 
         # Add Rarity field
-        if data.get('rarity'):
-            embed.add_field(name="Rarity", value=data['rarity'], inline=True)
-
-        # Build footer
-        footer_parts = []
-
-        if self.is_female and self.has_gender_diff:
-            footer_parts.append("♀ Female")
-        elif self.has_gender_diff:
-            footer_parts.append("♂ Male")
-
-        # Get shiny count for this specific Pokemon (await the coroutine)
-        pokemon_name = data.get('name', '')
-        user_id = self.ctx.author.id
-
-        # Pass gender info if this Pokemon has gender difference
-        gender_filter = None
-        if self.has_gender_diff:
-            gender_filter = 'female' if self.is_female else 'male'
-
-        # This will be awaited when the embed is created
-        shiny_count = await self.get_shiny_count(user_id, pokemon_name, gender_filter)
-
-        footer_parts.append(f"You have {shiny_count} shiny of this pokémon!")
-
-        if footer_parts:
-            embed.set_footer(text=" • ".join(footer_parts))
+        if data.rarity:
+            embed.add_field(name="Rarity", value=data.rarity, inline=True)
 
         return embed
 
-    async def get_shiny_count(self, user_id, pokemon_name, gender_filter=None):
-        """Get the count of shinies for a specific Pokemon name (and gender if applicable)"""
-        try:
-            # Import db here to avoid circular imports
-            from database import db
-
-            # Get all user's shinies
-            all_shinies = await db.get_all_shinies(user_id)
-
-            # Count shinies matching this exact Pokemon name
-            if gender_filter:
-                # For gender difference Pokemon, count only matching gender
-                count = sum(1 for shiny in all_shinies 
-                           if shiny['name'] == pokemon_name and shiny['gender'] == gender_filter)
-            else:
-                # For non-gender difference Pokemon, count all
-                count = sum(1 for shiny in all_shinies if shiny['name'] == pokemon_name)
-
-            return count
-        except Exception as e:
-            print(f"Error getting shiny count: {e}")
-            return 0
-
-    def format_evolution(self, data):
-        """Format evolution information from fields"""
-        fields = data.get('fields', {})
-        if 'Evolution' in fields:
-            return fields['Evolution']
-        return None
-
-    def format_names(self, names_dict):
-        """Format Pokemon names in different languages"""
+    def format_names(self, names):
+        """Format Pokemon names in different languages ((lang, names) pairs)"""
         lines = []
         flag_map = {
             'ja': '🇯🇵',
@@ -643,13 +656,10 @@ class PokedexView(discord.ui.View):
             'fr': '🇫🇷'
         }
 
-        for lang, names in names_dict.items():
+        for lang, lang_names in names:
             flag = flag_map.get(lang, '🏳️')
-            if isinstance(names, list):
-                for name in names:
-                    lines.append(f"{flag} {name}")
-            else:
-                lines.append(f"{flag} {names}")
+            for name in lang_names:
+                lines.append(f"{flag} {name}")
 
         return '\n'.join(lines) if lines else 'N/A'
 
@@ -680,76 +690,6 @@ class PokedexView(discord.ui.View):
 
         return gender_ratio
 
-    async def on_timeout(self):
-        """Disable all buttons when view times out"""
-        if self.message:
-            try:
-                for item in self.children:
-                    item.disabled = True
-                await self.message.edit(view=self)
-            except:
-                pass
-
-
-class Pokedex(commands.Cog):
-    """Pokedex information commands"""
-
-    def __init__(self, bot):
-        self.bot = bot
-        self.pokemon_data = {}
-        self.name_index = {}  # Maps all possible names to form keys
-        self.dex_number_forms = {}  # Maps dex numbers to list of (form_key, form_name)
-        self.load_pokemon_data()
-
-    def normalize_name(self, name):
-        """Remove accents and normalize name for searching"""
-        # Normalize unicode characters (NFD = decompose accents)
-        normalized = unicodedata.normalize('NFD', name)
-        # Remove accent marks (combining characters)
-        without_accents = ''.join(char for char in normalized if unicodedata.category(char) != 'Mn')
-        return without_accents.lower().strip()
-
-    def load_pokemon_data(self):
-        """Load Pokemon data from JSON file"""
-        try:
-            with open('alldata/pokemon_data.json', 'r', encoding='utf-8') as f:
-                self.pokemon_data = json.load(f)
-
-            # Build name index and dex number mapping
-            for form_key, data in self.pokemon_data.items():
-                dex_num = data.get('dex_number', '0')
-                pokemon_name = data.get('name', '')
-
-                # Add to dex number forms mapping
-                if dex_num not in self.dex_number_forms:
-                    self.dex_number_forms[dex_num] = []
-                self.dex_number_forms[dex_num].append((form_key, pokemon_name))
-
-                # Index primary name (with and without accents)
-                if pokemon_name:
-                    self.name_index[pokemon_name.lower()] = form_key
-                    normalized = self.normalize_name(pokemon_name)
-                    self.name_index[normalized] = form_key
-
-                # Index all alternate names (with and without accents)
-                if 'names' in data:
-                    for lang, names in data['names'].items():
-                        if isinstance(names, list):
-                            for name in names:
-                                self.name_index[name.lower()] = form_key
-                                normalized = self.normalize_name(name)
-                                self.name_index[normalized] = form_key
-                        else:
-                            self.name_index[names.lower()] = form_key
-                            normalized = self.normalize_name(names)
-                            self.name_index[normalized] = form_key
-
-            print(f"✅ Loaded {len(self.pokemon_data)} Pokemon entries")
-            print(f"✅ Indexed {len(self.name_index)} Pokemon names")
-            print(f"✅ Mapped {len(self.dex_number_forms)} unique dex numbers")
-        except Exception as e:
-            print(f"❌ Error loading alldata/pokemon_data.json: {e}")
-
     @commands.hybrid_command(name='pokedex', aliases=['d', 'dex'])
     @app_commands.describe(pokemon="Name or dex number (e.g., 'bulbasaur' or '#1') of the Pokemon to look up")
     async def dex_command(self, ctx, *, pokemon: str):
@@ -779,39 +719,42 @@ class Pokedex(commands.Cog):
 
         # If not found by dex number, look up by name
         if not form_key:
-            # Look up Pokemon by name (try exact match first)
-            form_key = self.name_index.get(pokemon_lower)
-
-            # If not found, try normalized (accent-removed) version
-            if not form_key:
-                normalized = self.normalize_name(pokemon)
-                form_key = self.name_index.get(normalized)
+            # Look up Pokemon by name (case and accent insensitive)
+            form_key = self.store.lookup(pokemon)
 
+        # Still nothing: take a confident fuzzy match, otherwise offer suggestions
+        corrected_from = None
         if not form_key:
-            await ctx.send(f"❌ Pokemon `{pokemon}` not found in Pokedex", reference=ctx.message, mention_author=False)
-            return
-
-        if form_key not in self.pokemon_data:
+            match = self.name_search.best(pokemon)
+            if match:
+                form_key = match.value
+                corrected_from = pokemon
+            else:
+                suggestions = self.name_search.suggest(pokemon)
+                message = f"❌ Pokemon `{pokemon}` not found in Pokedex"
+                if suggestions:
+                    message += f"\nDid you mean {format_suggestions(suggestions)}?"
+                await ctx.send(message, reference=ctx.message, mention_author=False)
+                return
+
+        if form_key not in self.store:
             await ctx.send(f"❌ Pokemon data for `{pokemon}` not found", reference=ctx.message, mention_author=False)
             return
 
         # Get dex number and all forms for this Pokemon
-        data = self.pokemon_data[form_key]
-        dex_num = data.get('dex_number', '0')
-        all_forms = self.dex_number_forms.get(dex_num, [(form_key, data['name'])])
+        data = self.store[form_key]
+        all_forms = self.dex_number_forms.get(data.dex_number, ((form_key, data.name),))
 
         # Check if this Pokemon has gender differences
-        pokemon_name = data.get('name', '')
-        has_gender_diff = pokemon_name in config.GENDER_DIFFERENCE_POKEMON
-
-        # Get sorted list of all dex numbers for navigation
-        all_dex_numbers = sorted(self.dex_number_forms.keys(), key=lambda x: int(x) if x.isdigit() else 0)
+        pokemon_name = data.name
+        has_gender_diff = self.has_gender_diff(form_key)
 
         # Create view with buttons and dropdowns
-        view = PokedexView(ctx, self.pokemon_data, all_forms, form_key, has_gender_diff, all_dex_numbers)
+        view = PokedexView(ctx, self, all_forms, form_key, has_gender_diff)
         embed = await view.create_embed()
 
-        message = await ctx.send(embed=embed, view=view, reference=ctx.message, mention_author=False)
+        content = f"🔎 No exact match for `{corrected_from}`, showing **{pokemon_name}**" if corrected_from else None
+        message = await ctx.send(content=content, embed=embed, view=view, reference=ctx.message, mention_author=False)
         view.message = message
 
 
@@ -1,17 +1,22 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
+import aiohttp
 import asyncio
-import re
 import os
 import io
-from datetime import datetime
 from typing import List
-from config import EMBED_COLOR, POKETWO_BOT_ID
+from config import EMBED_COLOR, POKETWO_BOT_ID, LIST_FILE_MAX_BYTES, LIST_FILE_MAX_LINES
+from session_store import SessionStore
+from edit_router import edit_router
+from list_messages import ListMessageSync, LIST_SYNC_FIELDS
+from list_text import (PokemonNameExtractor, ListFileTooLarge, normalize_pokemon_name,
+                       iter_attachment_chunks, iter_text_blocks)
 
-# Global variables to track active commands
-pokemon_lists = {}
-monitored_messages = {}
+# Lists (and the messages feeding them) expire after 10 minutes without updates
+LIST_SESSION_TTL = 600
+# Edits arriving within this window are processed together (one list update)
+EDIT_COALESCE_DELAY = 1.0
 
 
 class PokemonListTools(commands.Cog):
@@ -21,6 +26,39 @@ class PokemonListTools(commands.Cog):
         self.bot = bot
         # Load Pokemon names from file
         self.pokemon_names = self._load_pokemon_names()
+        self.name_extractor = PokemonNameExtractor(self.pokemon_names)
+        # Used to stream .txt attachments (created on first use)
+        self._http_session = None
+
+        # Active lists keyed by "channel_user", and monitored source messages keyed by message ID.
+        # Both hold IDs only and survive restarts.
+        self.pokemon_lists = SessionStore('createlist', ttl=LIST_SESSION_TTL)
+        self.monitored_messages = SessionStore('createlist_source', ttl=LIST_SESSION_TTL)
+
+        # list_key -> set of the names in that list's 'pokemon', updated together with it
+        # (kept out of the session state, which is persisted as plain data)
+        self._list_names = {}
+        # Source message ID -> its text at the last edit, to diff the next one against.
+        # Not persisted: after a restart the first edit is read in full and becomes the baseline.
+        self._source_texts = {}
+
+        # Coalescing of rapid edits: list_key -> {message_id: latest edited message}
+        self._pending_edits = {}
+        self._flush_tasks = {}
+
+        # Chunk-diffed list messages, REST calls spaced per channel
+        self.list_sync = ListMessageSync(bot)
+
+    async def cog_load(self):
+        """Restore createlist sessions from the database"""
+        await self.pokemon_lists.load()
+        await self.monitored_messages.load()
+        for message_id, _ in self.monitored_messages.items():
+            self._monitor_source(message_id, self.monitored_messages.expires_in(message_id))
+
+    async def cog_unload(self):
+        if self._http_session and not self._http_session.closed:
+            await self._http_session.close()
 
     # ==================== Pokemon Name Loading ====================
 
@@ -46,81 +84,16 @@ class PokemonListTools(commands.Cog):
         Normalize Pokemon names for matching.
         Handles special cases like Nidoran♂/♀ by keeping gender variants distinct.
         """
-        if 'nidoran' in name.lower():
-            if '♂' in name:
-                return 'nidoran♂'
-            elif '♀' in name:
-                return 'nidoran♀'
-        return name.lower()
-
-    def _get_original_pokemon_name(self, normalized_name, original_names):
-        """Get the original Pokemon name from the normalized version."""
-        if normalized_name == 'nidoran':
-            for name in original_names:
-                if 'nidoran' in name.lower() and ('♂' in name or '♀' in name):
-                    return name
-
-        for name in original_names:
-            if self._normalize_pokemon_name(name) == normalized_name:
-                return name
-        return normalized_name
-
-    def _remove_markdown(self, text):
-        """Remove all markdown formatting from text"""
-        cleaned = re.sub(r'\*\*\*(.+?)\*\*\*', r'\1', text)
-        cleaned = re.sub(r'\*\*(.+?)\*\*', r'\1', cleaned)
-        cleaned = re.sub(r'\*(.+?)\*', r'\1', cleaned)
-        cleaned = re.sub(r'__(.+?)__', r'\1', cleaned)
-        cleaned = re.sub(r'_(.+?)_', r'\1', cleaned)
-        cleaned = re.sub(r'~~(.+?)~~', r'\1', cleaned)
-        cleaned = re.sub(r'`(.+?)`', r'\1', cleaned)
-        cleaned = re.sub(r'```.*?```', '', cleaned, flags=re.DOTALL)
-        cleaned = re.sub(r'\|\|(.+?)\|\|', r'\1', cleaned)
-        return cleaned
-
-    def _create_pokemon_pattern(self, pokemon_name):
-        """Create a regex pattern for matching Pokemon names."""
-        escaped = re.escape(pokemon_name)
-
-        if pokemon_name.endswith('.'):
-            escaped = escaped[:-2] + r'\.?'
-
-        pattern = r'\b' + escaped + r'(?=\W|$)'
-        return pattern
-
-    def _extract_pokemon_from_text(self, text):
-        """Extract Pokemon names from any text using the comprehensive method"""
+        return normalize_pokemon_name(name)
+
+    def _extract_pokemon_from_text(self, text, found: set = None):
+        """
+        Extract Pokemon names from any text using the comprehensive method
+        found: normalized names already extracted (shared across blocks/files, updated in place)
+        """
         if not self.pokemon_names:
             return []
-
-        cleaned = self._remove_markdown(text)
-        pokemon_found = []
-        found_set = set()
-
-        sorted_pokemon = sorted(self.pokemon_names, key=len, reverse=True)
-        matched_ranges = []
-
-        for pokemon in sorted_pokemon:
-            normalized_pokemon = self._normalize_pokemon_name(pokemon)
-            pattern = self._create_pokemon_pattern(pokemon)
-
-            for match in re.finditer(pattern, cleaned, re.IGNORECASE):
-                start, end = match.span()
-
-                overlap = False
-                for prev_start, prev_end in matched_ranges:
-                    if not (end <= prev_start or start >= prev_end):
-                        overlap = True
-                        break
-
-                if not overlap:
-                    if normalized_pokemon not in found_set:
-                        original_name = self._get_original_pokemon_name(normalized_pokemon, self.pokemon_names)
-                        pokemon_found.append(original_name)
-                        found_set.add(normalized_pokemon)
-                    matched_ranges.append((start, end))
-
-        return pokemon_found
+        return self.name_extractor.extract(text, found)
 
     def _extract_all_text_from_message(self, message: discord.Message) -> str:
         """Extract all text content from a message including embeds"""
@@ -146,28 +119,40 @@ class PokemonListTools(commands.Cog):
 
         return " ".join(all_text_parts)
 
-    async def _extract_text_from_file(self, attachment: discord.Attachment) -> str:
-        """Extract text from a .txt file attachment"""
+    async def _extract_pokemon_from_file(self, attachment: discord.Attachment, found: set = None) -> List[str]:
+        """
+        Extract Pokemon from a .txt file attachment without holding the whole file in memory
+        The file is downloaded in chunks and names are extracted block by block.
+        Raises ListFileTooLarge if the file goes over the byte or line cap.
+        """
         if not attachment.filename.endswith('.txt'):
-            return ""
+            return []
+        if attachment.size > LIST_FILE_MAX_BYTES:
+            raise ListFileTooLarge(f"File is larger than {LIST_FILE_MAX_BYTES // (1024 * 1024)} MB")
+
+        if found is None:
+            found = set()
+        # Only count this file's names as found once it was read completely
+        file_found = set(found)
+        pokemon = []
+
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession()
 
         try:
-            content = await attachment.read()
-            return content.decode('utf-8')
+            chunks = iter_attachment_chunks(attachment, self._http_session)
+            async for block in iter_text_blocks(chunks, LIST_FILE_MAX_BYTES, LIST_FILE_MAX_LINES):
+                pokemon.extend(self._extract_pokemon_from_text(block, file_found))
+                # Give other events a turn between blocks of a large file
+                await asyncio.sleep(0)
+        except ListFileTooLarge:
+            raise
         except Exception as e:
             print(f"Error reading file {attachment.filename}: {e}")
-            return ""
-
-    # ==================== Event Listeners ====================
-
-    @commands.Cog.listener()
-    async def on_message_edit(self, before, after):
-        """Handle message edits to update Pokemon lists"""
-        message_id = after.id
+            return []
 
-        # Handle createlist monitoring
-        if message_id in monitored_messages:
-            await self._handle_createlist_update(after)
+        found |= file_found
+        return pokemon
 
     # ==================== CreateList Command ====================
 
@@ -185,19 +170,16 @@ class PokemonListTools(commands.Cog):
 
             # Extract all text from the message
             all_text = self._extract_all_text_from_message(replied_message)
+            text_files = [a for a in replied_message.attachments if a.filename.endswith('.txt')]
 
-            # Also check for .txt file attachments
-            if replied_message.attachments:
-                for attachment in replied_message.attachments:
-                    if attachment.filename.endswith('.txt'):
-                        file_text = await self._extract_text_from_file(attachment)
-                        all_text += " " + file_text
-
-            if not all_text.strip():
+            if not all_text.strip() and not text_files:
                 return await self._send_error(ctx, "No text content found in the message!")
 
-            # Extract Pokemon names using comprehensive method
-            pokemon_names = self._extract_pokemon_from_text(all_text)
+            # Extract Pokemon names using comprehensive method, then from .txt files (streamed)
+            found = set()
+            pokemon_names = self._extract_pokemon_from_text(all_text, found)
+            for attachment in text_files:
+                pokemon_names += await self._extract_pokemon_from_file(attachment, found)
 
             if not pokemon_names:
                 return await self._send_error(ctx, "No Pokemon names found in the message!")
@@ -205,21 +187,26 @@ class PokemonListTools(commands.Cog):
             # Create or update list
             list_key = f"{ctx.channel.id}_{ctx.author.id}"
 
-            if list_key in pokemon_lists:
+            if list_key in self.pokemon_lists:
                 await self._update_pokemon_list(ctx, list_key, pokemon_names)
             else:
                 await self._create_pokemon_list(ctx, list_key, pokemon_names)
 
-            # Monitor for updates
-            monitored_messages[replied_message.id] = {
+            # Monitor for updates (expires with the list unless it keeps being edited).
+            # The last seen text lets edits be diffed instead of re-extracted in full.
+            await self.monitored_messages.put(replied_message.id, {
                 'list_key': list_key,
                 'user_id': ctx.author.id,
-                'channel_id': ctx.channel.id
-            }
-
-            # Auto cleanup after 15 seconds
-            asyncio.create_task(self._cleanup_list_after_timeout(list_key))
-
+                'channel_id': ctx.channel.id,
+                'attachment_ids': [a.id for a in replied_message.attachments]
+            })
+            for stale_id in [key for key in self._source_texts if key not in self.monitored_messages]:
+                del self._source_texts[stale_id]
+            self._source_texts[replied_message.id] = all_text
+            self._monitor_source(replied_message.id, LIST_SESSION_TTL)
+
+        except ListFileTooLarge as e:
+            await self._send_error(ctx, f"{e}! Split the list into smaller files.")
         except Exception as e:
             await self._send_error(ctx, f"An error occurred: {str(e)}")
 
@@ -282,6 +269,8 @@ class PokemonListTools(commands.Cog):
 
         except discord.NotFound:
             await self._send_error(ctx, "Replied message not found!")
+        except ListFileTooLarge as e:
+            await self._send_error(ctx, f"{e}! Split the list into smaller files.")
         except Exception as e:
             await self._send_error(ctx, f"An error occurred: {str(e)}")
 
@@ -378,6 +367,8 @@ class PokemonListTools(commands.Cog):
 
         except discord.NotFound:
             await self._send_error(ctx, "Replied message not found!")
+        except ListFileTooLarge as e:
+            await self._send_error(ctx, f"{e}! Split the list into smaller files.")
         except Exception as e:
             await self._send_error(ctx, f"An error occurred: {str(e)}")
 
@@ -440,18 +431,17 @@ class PokemonListTools(commands.Cog):
         list_key = f"{ctx.channel.id}_{ctx.author.id}"
 
         # Check if user has an active list
-        if list_key not in pokemon_lists:
+        if list_key not in self.pokemon_lists:
             return await self._send_error(ctx, "You don't have any active Pokemon lists in this channel!")
 
         # Remove the list from tracking
-        del pokemon_lists[list_key]
+        await self.pokemon_lists.delete(list_key)
+        self._list_names.pop(list_key, None)
 
         # Remove all monitored messages associated with this list
-        removed_count = 0
-        for msg_id in list(monitored_messages.keys()):
-            if monitored_messages[msg_id]['list_key'] == list_key:
-                del monitored_messages[msg_id]
-                removed_count += 1
+        removed_count = await self.monitored_messages.delete_where(
+            lambda msg_id, data: data['list_key'] == list_key
+        )
 
         embed = discord.Embed(
             title="🛑 CreateList Stopped",
@@ -476,20 +466,16 @@ class PokemonListTools(commands.Cog):
         Requires: Manage Messages permission
         """
         channel_id = ctx.channel.id
-        removed_lists = 0
-        removed_monitors = 0
 
         # Remove all lists for this channel
-        for list_key in list(pokemon_lists.keys()):
-            if pokemon_lists[list_key]['channel_id'] == channel_id:
-                del pokemon_lists[list_key]
-                removed_lists += 1
+        removed_lists = await self.pokemon_lists.delete_where(
+            lambda list_key, data: data['channel_id'] == channel_id
+        )
 
         # Remove all monitored messages for this channel
-        for msg_id in list(monitored_messages.keys()):
-            if monitored_messages[msg_id]['channel_id'] == channel_id:
-                del monitored_messages[msg_id]
-                removed_monitors += 1
+        removed_monitors = await self.monitored_messages.delete_where(
+            lambda msg_id, data: data['channel_id'] == channel_id
+        )
 
         if removed_lists == 0:
             return await self._send_error(ctx, "No active Pokemon lists found in this channel!")
@@ -564,21 +550,22 @@ class PokemonListTools(commands.Cog):
 
         except discord.NotFound:
             await self._send_error(ctx, "One or both message IDs not found in this channel!")
+        except ListFileTooLarge as e:
+            await self._send_error(ctx, f"{e}! Split the list into smaller files.")
         except Exception as e:
             await self._send_error(ctx, f"An error occurred: {str(e)}")
 
     async def _extract_pokemon_from_message(self, message: discord.Message) -> List[str]:
         """Extract Pokemon from a message (content, embeds, and files)"""
         all_text = self._extract_all_text_from_message(message)
+        found = set()
+        pokemon = self._extract_pokemon_from_text(all_text, found)
 
-        # Also check for .txt file attachments
-        if message.attachments:
-            for attachment in message.attachments:
-                if attachment.filename.endswith('.txt'):
-                    file_text = await self._extract_text_from_file(attachment)
-                    all_text += " " + file_text
+        # Also check for .txt file attachments (streamed)
+        for attachment in message.attachments:
+            pokemon += await self._extract_pokemon_from_file(attachment, found)
 
-        return self._extract_pokemon_from_text(all_text)
+        return pokemon
 
     def _build_compare_result(self, total_1: int, total_2: int,
                               only_1: List[str], only_2: List[str], 
@@ -787,166 +774,150 @@ class PokemonListTools(commands.Cog):
 
     # ==================== Helper Methods for CreateList ====================
 
+    def _monitor_source(self, message_id: int, ttl: float):
+        """Route edits of a createlist source message here (re-subscribing restarts the TTL)"""
+        edit_router.subscribe(message_id, 'createlist',
+                              lambda before, after: self._handle_createlist_update(after), ttl)
+
     async def _handle_createlist_update(self, message: discord.Message):
-        """Handle updates to monitored createlist messages"""
-        list_data = monitored_messages.get(message.id)
+        """Queue an edit of a monitored createlist message (rapid edits are coalesced)"""
+        list_data = self.monitored_messages.get(message.id)
         if not list_data:
+            # Stopped with ?stoplist / ?stopallists
+            edit_router.unsubscribe(message.id, 'createlist')
             return
 
         list_key = list_data['list_key']
-        if list_key not in pokemon_lists:
-            del monitored_messages[message.id]
-            return
-
-        # Extract all text from the updated message
-        all_text = self._extract_all_text_from_message(message)
-
-        # Also check for .txt file attachments
-        if message.attachments:
-            for attachment in message.attachments:
-                if attachment.filename.endswith('.txt'):
-                    file_text = await self._extract_text_from_file(attachment)
-                    all_text += " " + file_text
-
-        if not all_text.strip():
-            return
-
-        # Extract Pokemon names using comprehensive method
-        new_pokemon_names = self._extract_pokemon_from_text(all_text)
-
-        if not new_pokemon_names:
+        if list_key not in self.pokemon_lists:
+            edit_router.unsubscribe(message.id, 'createlist')
+            await self.monitored_messages.delete(message.id)
             return
 
-        existing_data = pokemon_lists[list_key]
-        added_count = sum(1 for name in new_pokemon_names if name not in existing_data['pokemon'])
+        # Only the latest version of each message matters
+        self._pending_edits.setdefault(list_key, {})[message.id] = message
+        if list_key not in self._flush_tasks:
+            self._flush_tasks[list_key] = asyncio.create_task(self._flush_createlist_edits(list_key))
 
-        if added_count == 0:
-            return
+    async def _flush_createlist_edits(self, list_key: str):
+        """Extract names from what changed since the last edit and update the list once"""
+        try:
+            await asyncio.sleep(EDIT_COALESCE_DELAY)
+            messages = self._pending_edits.pop(list_key, {})
+
+            existing_data = self.pokemon_lists.get(list_key)
+            if not existing_data:
+                return
+
+            known = self._known_names(list_key, existing_data)
+            added = []
+
+            for message in messages.values():
+                source = self.monitored_messages.get(message.id)
+                if not source:
+                    continue
+
+                all_text = self._extract_all_text_from_message(message)
+                changed_text = self._changed_text(self._source_texts.get(message.id), all_text)
+                self._source_texts[message.id] = all_text
+
+                names = self._extract_pokemon_from_text(changed_text) if changed_text.strip() else []
+
+                # Attachments don't change on edit, only read ones we haven't seen
+                seen_attachments = set(source.get('attachment_ids', []))
+                new_attachments = []
+                for attachment in message.attachments:
+                    if attachment.id in seen_attachments:
+                        continue
+                    source.setdefault('attachment_ids', []).append(attachment.id)
+                    new_attachments.append(attachment.id)
+                    try:
+                        names += await self._extract_pokemon_from_file(attachment)
+                    except ListFileTooLarge as e:
+                        print(f"⚠️ Skipped {attachment.filename} for createlist {list_key}: {e}")
 
-        # Add new pokemon
-        existing_data['pokemon'].extend(name for name in new_pokemon_names if name not in existing_data['pokemon'])
-        await self._update_list_message(existing_data)
-        existing_data['timestamp'] = datetime.now()
-
-    def _split_pokemon_list(self, pokemon_list: List[str]) -> List[str]:
-        """Split long pokemon lists into chunks"""
-        chunks = []
-        current_chunk = []
-        current_length = 0
-
-        for pokemon in pokemon_list:
-            test_length = current_length + len(pokemon) + 2
-            if test_length > 1900 and current_chunk:
-                chunks.append(", ".join(current_chunk))
-                current_chunk = [pokemon]
-                current_length = len(pokemon)
-            else:
-                current_chunk.append(pokemon)
-                current_length = test_length
+                for name in names:
+                    if name not in known:
+                        known.add(name)
+                        added.append(name)
 
-        if current_chunk:
-            chunks.append(", ".join(current_chunk))
-        return chunks
+                # Only the expiry and any new attachment IDs are written
+                await self.monitored_messages.update(
+                    message.id, appended={'attachment_ids': new_attachments} if new_attachments else None)
+                self._monitor_source(message.id, LIST_SESSION_TTL)
 
-    async def _update_list_message(self, list_data: dict):
-        """Update the list message with new pokemon"""
-        pokemon_list_str = ", ".join(list_data['pokemon'])
-        channel = self.bot.get_channel(list_data['channel_id'])
+            if not added:
+                return
 
-        if not channel:
-            return
+            # Add new pokemon (the stored list only gets the new names pushed onto it)
+            existing_data['pokemon'].extend(added)
+            await self._update_list_message(list_key, existing_data)
+            await self.pokemon_lists.update(list_key, fields=LIST_SYNC_FIELDS, appended={'pokemon': added})
 
-        try:
-            if len(pokemon_list_str) > 1900:
-                chunks = self._split_pokemon_list(list_data['pokemon'])
-
-                # Edit the first message
-                await list_data['message'].edit(content=f"**Pokemon List ({len(list_data['pokemon'])} total):**\n{chunks[0]}")
-
-                # Get existing continuation messages
-                continuation_msgs = list_data.get('continuation_messages', [])
-
-                # Update or create continuation messages
-                for i, chunk in enumerate(chunks[1:], 2):
-                    chunk_index = i - 2  # Index in continuation_messages list
-
-                    if chunk_index < len(continuation_msgs):
-                        # Edit existing continuation message
-                        try:
-                            await continuation_msgs[chunk_index].edit(content=f"**Pokemon List (continued - part {i}):**\n{chunk}")
-                        except discord.NotFound:
-                            # Message was deleted, create new one
-                            new_msg = await channel.send(f"**Pokemon List (continued - part {i}):**\n{chunk}")
-                            continuation_msgs[chunk_index] = new_msg
-                    else:
-                        # Create new continuation message
-                        new_msg = await channel.send(f"**Pokemon List (continued - part {i}):**\n{chunk}")
-                        continuation_msgs.append(new_msg)
-
-                # Delete extra continuation messages if list got shorter
-                if len(chunks) - 1 < len(continuation_msgs):
-                    for msg in continuation_msgs[len(chunks) - 1:]:
-                        try:
-                            await msg.delete()
-                        except:
-                            pass
-                    list_data['continuation_messages'] = continuation_msgs[:len(chunks) - 1]
-                else:
-                    list_data['continuation_messages'] = continuation_msgs
+        except Exception as e:
+            print(f"Error updating createlist {list_key}: {e}")
+        finally:
+            del self._flush_tasks[list_key]
+            # Edits that arrived while we were busy get their own pass
+            if self._pending_edits.get(list_key):
+                self._flush_tasks[list_key] = asyncio.create_task(self._flush_createlist_edits(list_key))
+
+    def _changed_text(self, old_text: str, new_text: str) -> str:
+        """
+        Lines of new_text that were not in old_text
+        Falls back to the whole text when there is nothing to diff against, or when
+        code blocks (which markdown removal strips across lines) are involved.
+        """
+        if not old_text or '```' in new_text or '```' in old_text:
+            return new_text
 
-            else:
-                # List fits in one message, update main message and delete continuations
-                await list_data['message'].edit(content=f"**Pokemon List ({len(list_data['pokemon'])} total):**\n{pokemon_list_str}")
+        old_lines = set(old_text.split('\n'))
+        return '\n'.join(line for line in new_text.split('\n') if line not in old_lines)
 
-                # Delete all continuation messages if they exist
-                for msg in list_data.get('continuation_messages', []):
-                    try:
-                        await msg.delete()
-                    except:
-                        pass
-                list_data['continuation_messages'] = []
+    def _known_names(self, list_key: str, list_data: dict) -> set:
+        """
+        Set of the names in a list, kept in step with list_data['pokemon']
+        Callers add to it whatever they append to the list. Rebuilt only for lists
+        restored from the database or when the two no longer have the same size.
+        """
+        known = self._list_names.get(list_key)
+        if known is None or len(known) != len(list_data['pokemon']):
+            known = self._list_names[list_key] = set(list_data['pokemon'])
+        return known
 
-        except discord.NotFound:
-            # Main message was deleted, recreate everything
-            if len(pokemon_list_str) > 1900:
-                chunks = self._split_pokemon_list(list_data['pokemon'])
-                new_message = await channel.send(f"**Pokemon List ({len(list_data['pokemon'])} total):**\n{chunks[0]}")
-                list_data['message'] = new_message
-
-                continuation_msgs = []
-                for i, chunk in enumerate(chunks[1:], 2):
-                    new_msg = await channel.send(f"**Pokemon List (continued - part {i}):**\n{chunk}")
-                    continuation_msgs.append(new_msg)
-                list_data['continuation_messages'] = continuation_msgs
-            else:
-                new_message = await channel.send(f"**Pokemon List ({len(list_data['pokemon'])} total):**\n{pokemon_list_str}")
-                list_data['message'] = new_message
-                list_data['continuation_messages'] = []
+    async def _update_list_message(self, list_key: str, list_data: dict):
+        """Bring the list messages up to date (only chunks whose content changed are edited)"""
+        await self.list_sync.sync(list_key, list_data)
 
     async def _create_pokemon_list(self, ctx, list_key: str, pokemon_names: List[str]):
         """Create a new Pokemon list"""
-        pokemon_list_str = ", ".join(pokemon_names)
-
-        # Create initial message
-        list_message = await ctx.channel.send(f"**Pokemon List ({len(pokemon_names)} total):**\n{pokemon_list_str}")
-
-        pokemon_lists[list_key] = {
+        list_data = {
             'pokemon': pokemon_names.copy(),
-            'message': list_message,
-            'continuation_messages': [],  # Track continuation messages
             'user_id': ctx.author.id,
-            'channel_id': ctx.channel.id,
-            'timestamp': datetime.now()
+            'channel_id': ctx.channel.id
         }
+        # Sends the main message plus continuation messages if the list is long
+        await self.list_sync.publish(ctx.channel, list_data)
+        await self.pokemon_lists.put(list_key, list_data)
+
+        # Drop the name sets of lists that were stopped or expired meanwhile
+        for stale_key in [key for key in self._list_names if key not in self.pokemon_lists]:
+            del self._list_names[stale_key]
+        self._list_names[list_key] = set(list_data['pokemon'])
 
     async def _update_pokemon_list(self, ctx, list_key: str, new_pokemon: List[str]):
         """Update an existing Pokemon list"""
-        existing_data = pokemon_lists[list_key]
-        added_count = sum(1 for name in new_pokemon if name not in existing_data['pokemon'])
+        existing_data = self.pokemon_lists.get(list_key)
+        known = self._known_names(list_key, existing_data)
+        added = []
+        for name in new_pokemon:
+            if name not in known:
+                known.add(name)
+                added.append(name)
+        added_count = len(added)
 
         if added_count > 0:
-            existing_data['pokemon'].extend(name for name in new_pokemon if name not in existing_data['pokemon'])
-            await self._update_list_message(existing_data)
+            existing_data['pokemon'].extend(added)
+            await self._update_list_message(list_key, existing_data)
 
             embed = discord.Embed(
                 description=f"✅ Added {added_count} new Pokemon to the list!",
@@ -954,18 +925,8 @@ class PokemonListTools(commands.Cog):
             )
             await ctx.channel.send(embed=embed)
 
-        existing_data['timestamp'] = datetime.now()
-
-    async def _cleanup_list_after_timeout(self, list_key: str):
-        """Clean up list after 15 seconds of inactivity"""
-        await asyncio.sleep(15)
-        if list_key in pokemon_lists:
-            time_diff = (datetime.now() - pokemon_lists[list_key]['timestamp']).total_seconds()
-            if time_diff >= 15:
-                del pokemon_lists[list_key]
-                for msg_id, data in list(monitored_messages.items()):
-                    if data['list_key'] == list_key:
-                        del monitored_messages[msg_id]
+        await self.pokemon_lists.update(list_key, fields=LIST_SYNC_FIELDS if added else (),
+                                        appended={'pokemon': added} if added else None)
 
     async def _send_error(self, ctx, message: str):
         """Send error embed"""
@@ -263,6 +263,9 @@ class Settings(commands.Cog):
         invalid_species = []
         
         for species_name in species_list:
+            # Correct typos/accents against the species index before validating
+            if utils.get_base_species(species_name) not in utils.egg_groups:
+                species_name = utils.resolve_species_name(species_name) or species_name
             egg_groups = utils.get_egg_groups(species_name)
             
             if 'Undiscovered' in egg_groups and 'Ditto' not in egg_groups:
@@ -322,6 +325,9 @@ class Settings(commands.Cog):
         invalid_species = []
         
         for species_name in species_list:
+            # Correct typos/accents against the species index before validating
+            if utils.get_base_species(species_name) not in utils.egg_groups:
+                species_name = utils.resolve_species_name(species_name) or species_name
             egg_groups = utils.get_egg_groups(species_name)
             
             if 'Undiscovered' in egg_groups and 'Ditto' not in egg_groups:
@@ -2,18 +2,14 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import io
-import unicodedata
 import config
 from config import EMBED_COLOR
 from database import db
-from filters import get_filter, get_all_filter_names
+from filters import (FILTERS, FilterExpressionError, get_all_filter_names, resolve_filter_key,
+                     is_filter_expression, parse_filter_expression, evaluate_filter_expression)
 from smartlist_utils import build_smartlist_sections
 from dex_image_generator import DexImageGenerator
-
-
-def normalize_string(s):
-    """Remove accents from string for comparison"""
-    return ''.join(c for c in unicodedata.normalize('NFD', s) if unicodedata.category(c) != 'Mn')
+from resources import resources
 
 
 class ShinyDexView(discord.ui.View):
@@ -232,41 +228,23 @@ class ShinyDexDisplay(commands.Cog):
 
         return show_caught, show_uncaught, order, region, types, name_searches, page, show_list, show_smartlist, ignore_gender, exclude_names, show_image, ignore_male, ignore_female
 
-    def matches_filters(self, pokemon_name: str, utils, region_filter: str, type_filters: list):
-        """Check if a Pokemon matches region and type filters"""
-        info = utils.get_pokemon_info(pokemon_name)
-
-        if not info:
-            return False
-
-        if region_filter:
-            if info['region'] != region_filter:
-                return False
-
-        if type_filters:
-            pokemon_types = [info['type1']]
-            if info['type2']:
-                pokemon_types.append(info['type2'])
-
-            for type_filter in type_filters:
-                if type_filter not in pokemon_types:
-                    return False
-
-        return True
-
-    def is_excluded(self, pokemon_name: str, exclude_names: list):
-        """Check if a Pokemon should be excluded based on exclude filters"""
-        if not exclude_names:
-            return False
-
-        normalized_pokemon = normalize_string(pokemon_name.lower())
-
-        for exclude_name in exclude_names:
-            normalized_exclude = normalize_string(exclude_name.lower())
-            if normalized_exclude in normalized_pokemon:
-                return True
-
-        return False
+    def filter_operand_mask(self, word: str, index, masks, caught_mask: int) -> int:
+        """Mask for one operand of a filter expression: a filter, region, type, caught/uncaught or a partial filter name"""
+        key = resolve_filter_key(word, partial=False)
+        if key:
+            return masks[key]
+        if word.title() in index.by_region:
+            return index.by_region[word.title()]
+        if word.title() in index.by_type:
+            return index.by_type[word.title()]
+        if word == 'caught':
+            return caught_mask
+        if word == 'uncaught':
+            return index.all & ~caught_mask
+        key = resolve_filter_key(word)
+        if key:
+            return masks[key]
+        raise FilterExpressionError(f"Unknown filter `{word}`")
 
     async def send_pokemon_list_simple(self, ctx, pokemon_names: list):
         """Send simple Pokemon names as --n formatted list (text or file)"""
@@ -351,6 +329,9 @@ class ShinyDexDisplay(commands.Cog):
                 'total_count': len(pokemon_entries)
             }
 
+            # Fonts and gender symbols may still be downloading right after startup
+            await resources.wait_ready(config.RESOURCE_READY_TIMEOUT)
+
             # Pass user_id so image generator uses their custom settings
             img = await self.image_generator.create_dex_image(
                 page_entries, 
@@ -430,26 +411,16 @@ class ShinyDexDisplay(commands.Cog):
 
         # Get all dex entries from CSV (one per dex number - the first/top one)
         all_dex_entries = utils.get_basic_dex_entries()
+        index = utils.get_dex_index('basic')
+        name_searches = utils.resolve_name_searches(name_searches, index)
+
+        # Exclude, name (accent-insensitive), region and type filters on the precomputed index
+        selected = index.query(region_filter, type_filters, name_searches, exclude_names)
 
         # Build filtered list
         dex_entries = []
-        for dex_num, pokemon_name in all_dex_entries:
-            # Apply exclude filter first
-            if self.is_excluded(pokemon_name, exclude_names):
-                continue
-
-            # Apply name search filter with accent-insensitive matching
-            if name_searches:
-                normalized_pokemon = normalize_string(pokemon_name.lower())
-                matches_any = any(normalize_string(search.lower()) in normalized_pokemon for search in name_searches)
-                if not matches_any:
-                    continue
-
-            # Apply region/type filters
-            if region_filter or type_filters:
-                if not self.matches_filters(pokemon_name, utils, region_filter, type_filters):
-                    continue
-
+        for i in index.indices(selected):
+            dex_num, pokemon_name = all_dex_entries[i]
             count = dex_counts.get(dex_num, 0)
             dex_entries.append((dex_num, pokemon_name, count))
 
@@ -582,26 +553,16 @@ class ShinyDexDisplay(commands.Cog):
 
         # Get all forms from CSV
         all_forms = utils.get_full_dex_entries()
+        index = utils.get_dex_index('full')
+        name_searches = utils.resolve_name_searches(name_searches, index)
+
+        # Exclude, name (accent-insensitive), region and type filters on the precomputed index
+        selected = index.query(region_filter, type_filters, name_searches, exclude_names)
 
         # Build filtered list
         form_entries = []
-        for dex_num, pokemon_name, has_gender_diff in all_forms:
-            # Apply exclude filter first
-            if self.is_excluded(pokemon_name, exclude_names):
-                continue
-
-            # Apply name search filter with accent-insensitive matching
-            if name_searches:
-                normalized_pokemon = normalize_string(pokemon_name.lower())
-                matches_any = any(normalize_string(search.lower()) in normalized_pokemon for search in name_searches)
-                if not matches_any:
-                    continue
-
-            # Apply region/type filters
-            if region_filter or type_filters:
-                if not self.matches_filters(pokemon_name, utils, region_filter, type_filters):
-                    continue
-
+        for i in index.indices(selected):
+            dex_num, pokemon_name, has_gender_diff = all_forms[i]
             if has_gender_diff:
                 if ignore_gender:
                     # Combine male and female counts into single entry
@@ -725,7 +686,7 @@ class ShinyDexDisplay(commands.Cog):
 
     @commands.hybrid_command(name='filter', aliases=['f'])
     @app_commands.describe(
-        filter_name="Filter name (e.g., eevos, starters, legendaries)",
+        filter_name="Filter name (e.g., eevos, starters, legendaries) or expression (e.g., starters & kanto - caught)",
         options="Options: --caught, --uncaught, --orderd, --ordera, --region, --type, --exclude, --nogender, --page, --list, --smartlist, --image, --ignoremale, --ignorefemale"
     )
     async def filter_dex(self, ctx, filter_name: str = None, *, options: str = None):
@@ -741,19 +702,30 @@ class ShinyDexDisplay(commands.Cog):
             filter_list = ", ".join([f"`{f}`" for f in available_filters])
             embed = discord.Embed(
                 title="📋 Available Filters",
-                description=f"Use `filter <name>` to view a filtered dex.\n\n**Available filters:**\n{filter_list}",
+                description=(
+                    f"Use `filter <name>` to view a filtered dex. Filters combine with `&`, `|` and `-` "
+                    f"together with regions, types and `caught`/`uncaught`, e.g. `filter starters & kanto - caught`."
+                    f"\n\n**Available filters:**\n{filter_list}"
+                ),
                 color=EMBED_COLOR
             )
             await ctx.send(embed=embed, reference=ctx.message, mention_author=False)
             return
 
+        # Everything before the first --option is the filter name or expression
+        words = f"{filter_name} {options or ''}".split()
+        cut = next((i for i, word in enumerate(words) if word.startswith('--')), len(words))
+        filter_text = ' '.join(words[:cut])
+        options = ' '.join(words[cut:]) or None
+
         # Get the filter
-        filter_data = get_filter(filter_name)
-        if not filter_data:
+        is_expression = is_filter_expression(filter_text)
+        filter_key = None if is_expression else resolve_filter_key(filter_text)
+        if not is_expression and not filter_key:
             available_filters = get_all_filter_names()
             filter_list = ", ".join([f"`{f}`" for f in available_filters])
             await ctx.send(
-                f"❌ Filter `{filter_name}` not found!\n\n**Available filters:** {filter_list}",
+                f"❌ Filter `{filter_text}` not found!\n\n**Available filters:** {filter_list}",
                 reference=ctx.message, mention_author=False
             )
             return
@@ -771,18 +743,27 @@ class ShinyDexDisplay(commands.Cog):
         # Get user's shinies
         user_shinies = await db.get_all_shinies(user_id)
 
-        # Get filter Pokemon set and apply region/type/exclude filters
-        filter_pokemon_set = set()
-        for pokemon_name in filter_data['pokemon']:
-            # Apply exclude filter first
-            if self.is_excluded(pokemon_name, exclude_names):
-                continue
+        # Filters are precompiled bitmasks over one entry table (dex number, name, gender difference)
+        filter_entries, index, filter_masks = utils.get_filter_table()
+        if is_expression:
+            caught_mask = index.mask_of({shiny['name'] for shiny in user_shinies})
+            try:
+                selected = evaluate_filter_expression(
+                    parse_filter_expression(filter_text),
+                    lambda word: self.filter_operand_mask(word, index, filter_masks, caught_mask),
+                    index.all
+                )
+            except FilterExpressionError as e:
+                await ctx.send(f"❌ {e}", reference=ctx.message, mention_author=False)
+                return
+            filter_display_name = filter_text
+        else:
+            selected = filter_masks[filter_key]
+            filter_display_name = FILTERS[filter_key]['name']
 
-            # Apply region/type filters
-            if region_filter or type_filters:
-                if not self.matches_filters(pokemon_name, utils, region_filter, type_filters):
-                    continue
-            filter_pokemon_set.add(pokemon_name)
+        # Apply region/type/exclude filters
+        selected &= index.query(region_filter, type_filters, exclude=exclude_names)
+        filter_pokemon_set = index.select(selected)
 
         # If no Pokemon match the filters, return early
         if not filter_pokemon_set:
@@ -814,14 +795,10 @@ class ShinyDexDisplay(commands.Cog):
                 form_counts[key] = 0
             form_counts[key] += 1
 
-        # Build entries from filter list
+        # Build entries from the filter table (already in dex order)
         dex_entries = []
-        for pokemon_name in filter_pokemon_set:
-            dex_num = utils.get_dex_number(pokemon_name)
-            if dex_num is None:
-                continue
-
-            has_gender_diff = utils.has_gender_difference(pokemon_name)
+        for i in index.indices(selected):
+            dex_num, pokemon_name, has_gender_diff = filter_entries[i]
 
             # If ignore_gender is True, create single entry with combined count
             if ignore_gender:
@@ -846,9 +823,6 @@ class ShinyDexDisplay(commands.Cog):
                 count = form_counts.get((dex_num, pokemon_name, None), 0)
                 dex_entries.append((dex_num, pokemon_name, None, count))
 
-        # Sort by dex number by default
-        dex_entries.sort(key=lambda x: x[0])
-
         # Apply caught/uncaught filters
         filtered_entries = []
         for entry in dex_entries:
@@ -872,7 +846,7 @@ class ShinyDexDisplay(commands.Cog):
         # If --image flag is set, generate image
         if show_image:
             # Build header info
-            header_info = {'filter_name': filter_data['name']}
+            header_info = {'filter_name': filter_display_name}
             if type_filters:
                 header_info['types'] = type_filters
             if region_filter:
@@ -927,7 +901,6 @@ class ShinyDexDisplay(commands.Cog):
             pages.append(page_content)
 
         # Create view with filters in display name
-        filter_display_name = filter_data['name']
         if region_filter:
             filter_display_name += f" - {region_filter}"
         if type_filters:
@@ -6,6 +6,8 @@ import re
 import config
 from config import EMBED_COLOR, POKETWO_BOT_ID
 from database import db
+from embed_parser import parse_lines
+from page_ingest import PageIngestor
 
 
 class ShinyDexManagement(commands.Cog):
@@ -14,10 +16,6 @@ class ShinyDexManagement(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.id_pattern = re.compile(r'\*?`\s*(\d+)\s*`\*?')
-        self.name_pattern = re.compile(r'✨\s*([^<]+?)(?:\s*<:|$)')
-        self.gender_pattern = re.compile(r'<:(male|female|unknown):')
-        self.level_pattern = re.compile(r'Lvl\.\s*(\d+)')
-        self.iv_pattern = re.compile(r'•\s*([\d.]+)%')
 
     async def add_shiny_context_callback(self, interaction: discord.Interaction, message: discord.Message):
         """Context menu command to add shinies from a message"""
@@ -226,64 +224,54 @@ class ShinyDexManagement(commands.Cog):
                     f"💡 Keep clicking pages, I'll auto-detect more!"
         )
 
-        # Monitor for page changes
+        # Monitor for page changes: pages are parsed as they arrive, writes are coalesced
         if monitored_message_id:
-            def check(before, after):
-                return (after.id == monitored_message_id and 
-                       after.author.id == POKETWO_BOT_ID and 
-                       after.embeds)
-
-            timeout = 300
-            start_time = asyncio.get_event_loop().time()
-            last_update = start_time
-
-            while (asyncio.get_event_loop().time() - start_time) < timeout:
-                try:
-                    remaining = timeout - (asyncio.get_event_loop().time() - start_time)
-                    wait_time = min(remaining, 30.0)
-                    before, after = await self.bot.wait_for('message_edit', timeout=wait_time, check=check)
-
-                    embed = after.embeds[0]
-                    page_shinies = []
-
-                    # Count total in this page
-                    page_total = 0
-                    if embed.description:
-                        page_lines = embed.description.strip().split('\n')
-                        page_total = sum(1 for line in page_lines if '✨' in line)
-
-                    total_found_in_embed += page_total
-
-                    shinies = self.parse_shiny_embed(embed.description, utils)
-                    page_event_count = page_total - len(shinies)
-                    event_pokemon_count += page_event_count
-
-                    for shiny in shinies:
-                        if shiny['pokemon_id'] not in processed_shiny_ids:
-                            page_shinies.append(shiny)
-                            processed_shiny_ids.add(shiny['pokemon_id'])
-                            all_shinies.append(shiny)
-
-                    if page_shinies:
-                        page_new_count = await db.add_shinies_bulk(user_id, page_shinies)
-                        new_count += page_new_count
-                        last_update = asyncio.get_event_loop().time()
-                        total_in_inventory = await db.count_shinies(user_id)
-
-                        event_note = f"\n⚠️ **Event Pokémon Are Not Counted Towards Dex!**" if event_pokemon_count > 0 else ""
-
-                        await status_msg.edit(
-                            content=f"✅ **Page detected! Adding more shinies**\n"
-                                    f"**Total Shiny Tracked:** {total_found_in_embed} (including {event_pokemon_count} events)\n"
-                                    f"**Total Shiny Added:** {new_count}\n"
-                                    f"**Currently In Inventory:** {total_in_inventory}{event_note}\n\n"
-                                    f"💡 Keep clicking for more!"
-                        )
-
-                except asyncio.TimeoutError:
-                    if asyncio.get_event_loop().time() - last_update > 15:
-                        break
-                    continue
+            def parse_page(embed):
+                nonlocal total_found_in_embed, event_pokemon_count
+                page_shinies = []
+
+                # Count total in this page
+                page_total = 0
+                if embed.description:
+                    page_lines = embed.description.strip().split('\n')
+                    page_total = sum(1 for line in page_lines if '✨' in line)
+
+                total_found_in_embed += page_total
+
+                shinies = self.parse_shiny_embed(embed.description, utils)
+                page_event_count = page_total - len(shinies)
+                event_pokemon_count += page_event_count
+
+                for shiny in shinies:
+                    if shiny['pokemon_id'] not in processed_shiny_ids:
+                        page_shinies.append(shiny)
+                        processed_shiny_ids.add(shiny['pokemon_id'])
+                        all_shinies.append(shiny)
+
+                return page_shinies
+
+            def render_status(added, inventory):
+                event_note = f"\n⚠️ **Event Pokémon Are Not Counted Towards Dex!**" if event_pokemon_count > 0 else ""
+                return (f"✅ **Page detected! Adding more shinies**\n"
+                        f"**Total Shiny Tracked:** {total_found_in_embed} (including {event_pokemon_count} events)\n"
+                        f"**Total Shiny Added:** {added}\n"
+                        f"**Currently In Inventory:** {inventory}{event_note}\n\n"
+                        f"💡 Keep clicking for more!")
+
+            ingestor = PageIngestor(
+                self.bot,
+                monitored_message_id,
+                parse_page=parse_page,
+                write_batch=lambda batch: db.add_shinies_bulk(user_id, batch),
+                count_total=lambda: db.count_shinies(user_id),
+                render_status=render_status,
+                status_msg=status_msg,
+                author_id=POKETWO_BOT_ID,
+                added=new_count,
+                inventory=total_in_inventory
+            )
+            new_count = await ingestor.run()
+            total_in_inventory = ingestor.inventory
 
         # Final summary
         embed = discord.Embed(title="✨ Shiny Tracking Complete", color=EMBED_COLOR)
@@ -314,72 +302,35 @@ class ShinyDexManagement(commands.Cog):
             return []
 
         shinies = []
-        lines = description.strip().split('\n')
 
-        for line in lines:
-            # Skip lines without sparkles emoji
-            if '✨' not in line:
+        # Only lines with sparkles emoji, parsed in a single match each
+        for record in parse_lines(description, marker='✨'):
+            pokemon_name = record.name
+            if not pokemon_name:
                 continue
 
-            try:
-                # Extract ID
-                id_match = self.id_pattern.search(line)
-                if not id_match:
-                    continue
-                pokemon_id = int(id_match.group(1).strip())
-
-                # Extract everything between > and <: (gender emoji)
-                name_match = re.search(r'>\s*(.+?)\s*<:(?:male|female|unknown):', line)
-                if not name_match:
-                    continue
-
-                pokemon_name = name_match.group(1).strip()
-
-                # Remove Gigantamax emoji specifically first
-                pokemon_name = pokemon_name.replace('<:_:1242455099213877248>', '').strip()
+            gender = record.gender or 'unknown'
+            level = record.level if record.level is not None else 1
+            iv_percent = record.iv_percent if record.iv_percent is not None else 0.0
 
-                # Remove sparkles emoji
-                pokemon_name = pokemon_name.replace('✨', '').strip()
-
-                # Remove any other Discord emojis
-                pokemon_name = re.sub(r'<a?:[^:]*:\d+>', '', pokemon_name).strip()
-
-                # Clean up extra whitespace
-                pokemon_name = ' '.join(pokemon_name.split()).strip()
-
-                # Extract gender
-                gender_match = self.gender_pattern.search(line)
-                gender = gender_match.group(1) if gender_match else 'unknown'
-
-                # Extract level
-                level_match = self.level_pattern.search(line)
-                level = int(level_match.group(1)) if level_match else 1
-
-                # Extract IV
-                iv_match = self.iv_pattern.search(line)
-                iv_percent = float(iv_match.group(1)) if iv_match else 0.0
-
-                # FIXED: Check if Pokemon name exists in the regular dex CSV first
-                # This prevents event Pokemon from being added with wrong dex numbers
-                if pokemon_name not in utils.dex_data:
-                    # Pokemon not in regular dex CSV - skip it (event Pokemon, etc.)
-                    continue
-
-                # Get dex number from utils (now safe since we know it exists in CSV)
-                dex_number = utils.get_dex_number(pokemon_name)
-
-                shinies.append({
-                    'pokemon_id': pokemon_id,
-                    'name': pokemon_name,
-                    'gender': gender,
-                    'level': level,
-                    'iv_percent': iv_percent,
-                    'dex_number': dex_number
-                })
-
-            except (ValueError, AttributeError):
+            # FIXED: Check if Pokemon name exists in the regular dex CSV first
+            # This prevents event Pokemon from being added with wrong dex numbers
+            if pokemon_name not in utils.dex_data:
+                # Pokemon not in regular dex CSV - skip it (event Pokemon, etc.)
                 continue
 
+            # Get dex number from utils (now safe since we know it exists in CSV)
+            dex_number = utils.get_dex_number(pokemon_name)
+
+            shinies.append({
+                'pokemon_id': record.pokemon_id,
+                'name': pokemon_name,
+                'gender': gender,
+                'level': level,
+                'iv_percent': iv_percent,
+                'dex_number': dex_number
+            })
+
         return shinies
 
     @commands.hybrid_command(name='removeshiny', aliases=['rmshiny'])
@@ -240,33 +240,12 @@ class ShinyDexStats(commands.Cog):
                     user_forms_by_type[ptype] = set()
                 user_forms_by_type[ptype].add(form_key)
 
-        # Calculate total forms per type from CSV
-        all_forms = utils.get_full_dex_entries()
-        total_forms_by_type = {}
-
-        for dex_num, pokemon_name, has_gender_diff in all_forms:
-            info = utils.get_pokemon_info(pokemon_name)
-            if not info:
-                continue
-
-            types = [info['type1']]
-            if info['type2']:
-                types.append(info['type2'])
-
-            # Count forms
-            if has_gender_diff:
-                form_count = 2  # Male and female
-            else:
-                form_count = 1
-
-            for ptype in types:
-                if ptype not in total_forms_by_type:
-                    total_forms_by_type[ptype] = 0
-                total_forms_by_type[ptype] += form_count
+        # Total forms per type (precomputed from CSV, sorted by type)
+        total_forms_by_type = utils.get_forms_by_type()
 
         # Build stats for each type
         type_stats = []
-        for ptype in sorted(total_forms_by_type.keys()):
+        for ptype in total_forms_by_type:
             caught = len(user_forms_by_type.get(ptype, set()))
             total = total_forms_by_type[ptype]
             progress = self.create_progress_bar(caught, total)
@@ -353,26 +332,8 @@ class ShinyDexStats(commands.Cog):
                 user_forms_by_region[region] = set()
             user_forms_by_region[region].add(form_key)
 
-        # Calculate total forms per region from CSV
-        all_forms = utils.get_full_dex_entries()
-        total_forms_by_region = {}
-
-        for dex_num, pokemon_name, has_gender_diff in all_forms:
-            info = utils.get_pokemon_info(pokemon_name)
-            if not info:
-                continue
-
-            region = info['region']
-
-            # Count forms
-            if has_gender_diff:
-                form_count = 2  # Male and female
-            else:
-                form_count = 1
-
-            if region not in total_forms_by_region:
-                total_forms_by_region[region] = 0
-            total_forms_by_region[region] += form_count
+        # Total forms per region (precomputed from CSV)
+        total_forms_by_region = utils.get_forms_by_region()
 
         # Build stats for each region
         region_stats = []
@@ -219,37 +219,24 @@ class ShinyPokemonViewer(commands.Cog):
 
         return True
 
-    def matches_filters(self, pokemon: dict, utils, names: list, iv_filter, types: list, region: str):
+    def allowed_species(self, utils, names: list, types: list, region: str):
+        """Species names passing the name/type/region filters (None when none of them are set)"""
+        if not (names or types or region):
+            return None
+        index = utils.get_dex_index('species')
+        names = utils.resolve_name_searches(names, index)
+        return index.select(index.query(region, types, names))
+
+    def matches_filters(self, pokemon: dict, allowed_species, iv_filter):
         """Check if a Pokemon matches all filters"""
-        # Name filter (partial match - search for substring)
-        if names:
-            pokemon_name_lower = pokemon['name'].lower()
-            matches_any = any(name.lower() in pokemon_name_lower for name in names)
-            if not matches_any:
-                return False
+        # Name (partial, accent-insensitive), type and region filters
+        if allowed_species is not None and pokemon['name'] not in allowed_species:
+            return False
 
         # IV filter
         if not self.matches_iv_filter(pokemon['iv_percent'], iv_filter):
             return False
 
-        # Type and region filters
-        if types or region:
-            info = utils.get_pokemon_info(pokemon['name'])
-            if not info:
-                return False
-
-            if region and info['region'] != region:
-                return False
-
-            if types:
-                pokemon_types = [info['type1']]
-                if info['type2']:
-                    pokemon_types.append(info['type2'])
-
-                for type_filter in types:
-                    if type_filter not in pokemon_types:
-                        return False
-
         return True
 
     async def get_user_order(self, user_id: int):
@@ -324,10 +311,11 @@ class ShinyPokemonViewer(commands.Cog):
                           reference=ctx.message, mention_author=False)
             return
 
-        # Apply filters
+        # Apply filters (species-level filters are resolved once on the precomputed index)
+        allowed_species = self.allowed_species(utils, names, types, region)
         filtered_pokemon = []
         for pokemon in all_shinies:
-            if self.matches_filters(pokemon, utils, names, iv_filter, types, region):
+            if self.matches_filters(pokemon, allowed_species, iv_filter):
                 filtered_pokemon.append(pokemon)
 
         if not filtered_pokemon:
@@ -9,6 +9,9 @@ import os
 import csv
 import config
 from database import db
+from metrics import metrics
+from sprite_cache import sprite_cache
+from resources import resources
 
 
 class BackgroundSelectView(discord.ui.View):
@@ -62,13 +65,9 @@ class ShinyStatsImage(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        self.backgrounds_folder = 'shinystats/backgrounds'
-        self.fonts_folder = 'shinystats/fonts'
-
-        # GitHub repository details
-        self.github_user = 'cynthiaofpower'
-        self.github_repo = 'meowthfonts'
-        self.github_branch = 'main'  # or 'master' - adjust if needed
+        # Downloaded at startup by the resource bootstrap (resources.py)
+        self.backgrounds_folder = os.path.join(config.RESOURCES_DIR, 'backgrounds')
+        self.fonts_folder = os.path.join(config.RESOURCES_DIR, 'fonts')
 
         # Predefined solid colors
         self.solid_colors = {
@@ -84,114 +83,6 @@ class ShinyStatsImage(commands.Cog):
             'gray.png': '#2F4F4F'
         }
 
-        # Initialize resource download on cog load
-        self.bot.loop.create_task(self.initialize_resources())
-
-    async def initialize_resources(self):
-        """Download fonts and backgrounds from GitHub on startup"""
-        await self.download_fonts()
-        await self.download_backgrounds()
-
-    async def download_file_from_github(self, file_path: str, save_path: str):
-        """Download a single file from GitHub repository"""
-        url = f"https://raw.githubusercontent.com/{self.github_user}/{self.github_repo}/{self.github_branch}/{file_path}"
-
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as resp:
-                    if resp.status == 200:
-                        content = await resp.read()
-
-                        # Create directory if it doesn't exist
-                        os.makedirs(os.path.dirname(save_path), exist_ok=True)
-
-                        with open(save_path, 'wb') as f:
-                            f.write(content)
-                        print(f"✅ Downloaded: {file_path}")
-                        return True
-                    else:
-                        print(f"❌ Failed to download {file_path}: Status {resp.status}")
-                        return False
-        except Exception as e:
-            print(f"❌ Error downloading {file_path}: {e}")
-            return False
-
-    async def get_github_directory_contents(self, directory: str):
-        """Get list of files in a GitHub directory"""
-        url = f"https://api.github.com/repos/{self.github_user}/{self.github_repo}/contents/{directory}?ref={self.github_branch}"
-
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as resp:
-                    if resp.status == 200:
-                        contents = await resp.json()
-                        return [item['name'] for item in contents if item['type'] == 'file']
-                    else:
-                        print(f"❌ Failed to fetch directory contents: Status {resp.status}")
-                        return []
-        except Exception as e:
-            print(f"❌ Error fetching directory contents: {e}")
-            return []
-
-    async def download_fonts(self):
-        """Download all fonts from GitHub repository"""
-        print("📥 Downloading fonts from GitHub...")
-
-        # Create fonts directory
-        os.makedirs(self.fonts_folder, exist_ok=True)
-
-        # Get list of font files
-        font_files = await self.get_github_directory_contents('fonts')
-
-        if not font_files:
-            print("⚠️ No fonts found in repository")
-            return
-
-        # Download each font
-        for font_file in font_files:
-            if font_file.endswith('.ttf') or font_file.endswith('.otf'):
-                github_path = f"fonts/{font_file}"
-                local_path = os.path.join(self.fonts_folder, font_file)
-
-                # Skip if already exists
-                if os.path.exists(local_path):
-                    print(f"⏭️ Font already exists: {font_file}")
-                    continue
-
-                await self.download_file_from_github(github_path, local_path)
-
-        print("✅ Font download complete!")
-
-    async def download_backgrounds(self):
-        """Download all backgrounds from GitHub repository"""
-        print("📥 Downloading backgrounds from GitHub...")
-
-        # Create backgrounds directory
-        os.makedirs(self.backgrounds_folder, exist_ok=True)
-
-        # Get list of background files
-        background_files = await self.get_github_directory_contents('backgrounds')
-
-        if not background_files:
-            print("⚠️ No backgrounds found in repository")
-            return
-
-        # Download each background
-        for bg_file in background_files:
-            if bg_file.endswith('.png') or bg_file.endswith('.jpg') or bg_file.endswith('.jpeg'):
-                github_path = f"backgrounds/{bg_file}"
-                local_path = os.path.join(self.backgrounds_folder, bg_file)
-
-                # Skip if already exists
-                if os.path.exists(local_path):
-                    print(f"⏭️ Background already exists: {bg_file}")
-                    continue
-
-                await self.download_file_from_github(github_path, local_path)
-
-        print("✅ Background download complete!")
-
-
     def get_available_backgrounds(self):
         """Get list of available background files"""
         backgrounds = []
@@ -238,11 +129,15 @@ class ShinyStatsImage(commands.Cog):
             return None
 
         url = f"https://cdn.poketwo.net/shiny/{cdn_number}.png"
+        data = sprite_cache.get(url)
+        if data is not None:
+            return Image.open(BytesIO(data))
         async with aiohttp.ClientSession() as session:
             try:
                 async with session.get(url) as resp:
                     if resp.status == 200:
                         data = await resp.read()
+                        sprite_cache.put(url, data)
                         return Image.open(BytesIO(data))
             except Exception as e:
                 print(f"Error fetching image for {pokemon_name} (CDN: {cdn_number}): {e}")
@@ -261,6 +156,7 @@ class ShinyStatsImage(commands.Cog):
                 pass
         return None
 
+    @metrics.render_seconds.time(renderer='shinystats')
     async def create_stats_image(self, user: discord.User, stats_data: dict, background_name: str, user_title: str):
         """Create the shiny stats image"""
         # Image dimensions: 1024x576
@@ -730,6 +626,8 @@ class ShinyStatsImage(commands.Cog):
             else:
                 status_msg = await ctx.send("🎨 Generating your shiny stats card...")
 
+            # Fonts and backgrounds may still be downloading right after startup
+            await resources.wait_ready(config.RESOURCE_READY_TIMEOUT)
             img = await self.create_stats_image(ctx.author, stats_data, background_name, user_title)
 
             # Save to bytes
@@ -892,10 +790,10 @@ class ShinyStatsImage(commands.Cog):
         """Refresh fonts and backgrounds from GitHub (Owner only)"""
         await ctx.send("🔄 Refreshing resources from GitHub...")
 
-        await self.download_fonts()
-        await self.download_backgrounds()
+        summary = await resources.run()
 
-        await ctx.send("✅ Resources refreshed successfully!")
+        await ctx.send(f"✅ Resources refreshed: {summary['downloaded']} downloaded, "
+                       f"{summary['skipped']} up to date, {summary['failed']} failed")
 
 
 async def setup(bot):
@@ -3,7 +3,11 @@ from discord.ext import commands
 from discord import app_commands
 import asyncio
 import re
+import time
 from config import EMBED_COLOR
+from embed_parser import parse_lines
+from session_store import SessionStore
+from edit_router import edit_router
 
 # Emoji Configuration (centralized for easy changes)
 EMOJI_INCENSE = "<:incense:1450840364499075164>"
@@ -15,14 +19,26 @@ EMOJI_TICK = "<:white_check_mark:1449749985057964094>"
 EMOJI_CROSS = "<:cross_mark:1449750002388959377>"
 EMOJI_GREEN_DOT = "<:green_dot:1450840704153686139>"
 
-# Global variables to track active commands
-active_track_commands = {}
+# Track sessions: 3 minutes to finish editing, then kept alive while commands are being sent
+TRACK_TIMEOUT = 180
+TRACK_SENDING_TTL = 900
 
 class UtilityCommands(commands.Cog):
     """Utility commands for text formatting and currency conversion"""
 
     def __init__(self, bot):
         self.bot = bot
+        # Active track/rarecandylevel commands, keyed by channel ID (survive restarts)
+        self.tracks = SessionStore('track', ttl=TRACK_TIMEOUT + 60)
+
+    async def cog_load(self):
+        """Restore track sessions and re-arm their timeouts"""
+        await self.tracks.load()
+        for channel_id, track_data in self.tracks.items():
+            if track_data.get('status') == 'tracking':
+                delay = max(0, track_data.get('deadline', 0) - time.time())
+                asyncio.create_task(self._track_timeout(channel_id, delay))
+                self._monitor_track(channel_id, track_data['monitoring_message_id'], delay)
 
     # ==================== Event Listeners ====================
 
@@ -34,11 +50,10 @@ class UtilityCommands(commands.Cog):
 
         channel_id = message.channel.id
 
-        if channel_id not in active_track_commands:
+        command_data = self.tracks.get(channel_id)
+        if not command_data:
             return
 
-        command_data = active_track_commands[channel_id]
-
         if command_data.get('status') != 'sending':
             return
 
@@ -74,33 +89,35 @@ class UtilityCommands(commands.Cog):
         command_data['current_index'] += 1
 
         if command_data['current_index'] < len(command_data['pokemon_data']):
+            await self.tracks.save(channel_id, ttl=TRACK_SENDING_TTL)
             await self._send_next_track_command(message.channel, command_data)
         else:
             await self._finish_track_sequence(message.channel, command_data)
 
     @commands.Cog.listener()
-    async def on_reaction_add(self, reaction, user):
-        """Handle reactions to start sending tracked commands"""
-        if user.bot or str(reaction.emoji) != '✅':
+    async def on_raw_reaction_add(self, payload):
+        """Handle reactions to start sending tracked commands (raw: the message may not be cached)"""
+        if str(payload.emoji) != '✅':
             return
 
-        channel_id = reaction.message.channel.id
-        if channel_id not in active_track_commands:
+        command_data = self.tracks.get(payload.channel_id)
+        if not command_data:
             return
 
-        command_data = active_track_commands[channel_id]
-
+        # Only the command's author counts, which also leaves out the bot's own ✅
         if (command_data.get('status') != 'tracking' or
-            user.id != command_data['user_id'] or
-            reaction.message.id != command_data['tracking_message_id']):
+            payload.user_id != command_data['user_id'] or
+            payload.message_id != command_data['tracking_message_id']):
             return
 
-        await self._start_track_sending(reaction.message.channel, command_data)
+        channel = self.bot.get_channel(payload.channel_id)
+        if channel is None:
+            try:
+                channel = await self.bot.fetch_channel(payload.channel_id)
+            except discord.HTTPException:
+                return
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, before, after):
-        """Handle message edits to update tracked Pokemon IDs"""
-        await self._handle_track_update(after)
+        await self._start_track_sending(channel, command_data)
 
     # ==================== Track Command ====================
 
@@ -116,7 +133,7 @@ class UtilityCommands(commands.Cog):
         if not ctx.message.reference:
             return await self._send_error(ctx, "Please reply to a Pokétwo list/marketplace message or a message containing Pokemon IDs!")
 
-        if ctx.channel.id in active_track_commands:
+        if ctx.channel.id in self.tracks:
             return await self._send_error(ctx, "There's already an active track command in this channel! Use `?stoptrack` first.")
 
         if '(id)' not in command_template:
@@ -155,7 +172,7 @@ class UtilityCommands(commands.Cog):
             await tracking_msg.add_reaction('✅')
 
             # Store track command data
-            active_track_commands[ctx.channel.id] = {
+            await self.tracks.put(ctx.channel.id, {
                 'pokemon_data': pokemon_data.copy(),
                 'template': command_template,
                 'user_id': ctx.author.id,
@@ -165,11 +182,13 @@ class UtilityCommands(commands.Cog):
                 'current_index': 0,
                 'total_count': 0,
                 'is_plain_text': not is_poketwo_embed,
-                'command_type': 'track'
-            }
+                'command_type': 'track',
+                'deadline': time.time() + TRACK_TIMEOUT
+            })
 
             # Set timeout
-            asyncio.create_task(self._track_timeout(ctx.channel.id, tracking_msg))
+            asyncio.create_task(self._track_timeout(ctx.channel.id, TRACK_TIMEOUT))
+            self._monitor_track(ctx.channel.id, replied_message.id, TRACK_TIMEOUT)
 
         except Exception as e:
             await self._send_error(ctx, f"An error occurred: {str(e)}")
@@ -187,7 +206,7 @@ class UtilityCommands(commands.Cog):
         if not ctx.message.reference:
             return await self._send_error(ctx, "Please reply to a Pokétwo list message!")
 
-        if ctx.channel.id in active_track_commands:
+        if ctx.channel.id in self.tracks:
             return await self._send_error(ctx, "There's already an active track command in this channel! Use `?stoptrack` first.")
 
         if target_level < 1 or target_level > 100:
@@ -229,7 +248,7 @@ class UtilityCommands(commands.Cog):
             await tracking_msg.add_reaction('✅')
 
             # Store track command data
-            active_track_commands[ctx.channel.id] = {
+            await self.tracks.put(ctx.channel.id, {
                 'pokemon_data': pokemon_to_level.copy(),
                 'template': '<@716390085896962058> buy (id) rare candy (candies)',
                 'user_id': ctx.author.id,
@@ -240,11 +259,13 @@ class UtilityCommands(commands.Cog):
                 'total_count': 0,
                 'target_level': target_level,
                 'is_plain_text': False,
-                'command_type': 'rarecandylevel'
-            }
+                'command_type': 'rarecandylevel',
+                'deadline': time.time() + TRACK_TIMEOUT
+            })
 
             # Set timeout
-            asyncio.create_task(self._track_timeout(ctx.channel.id, tracking_msg))
+            asyncio.create_task(self._track_timeout(ctx.channel.id, TRACK_TIMEOUT))
+            self._monitor_track(ctx.channel.id, replied_message.id, TRACK_TIMEOUT)
 
         except Exception as e:
             await self._send_error(ctx, f"An error occurred: {str(e)}")
@@ -252,8 +273,10 @@ class UtilityCommands(commands.Cog):
     @commands.command(name='stoptrack')
     async def stoptrack(self, ctx):
         """Stop the active track command in this channel"""
-        if ctx.channel.id in active_track_commands:
-            del active_track_commands[ctx.channel.id]
+        track_data = self.tracks.get(ctx.channel.id)
+        if track_data:
+            edit_router.unsubscribe(track_data['monitoring_message_id'], ('track', ctx.channel.id))
+            await self.tracks.delete(ctx.channel.id)
             await self._send_success(ctx, "Stopped active track command!")
         else:
             await self._send_error(ctx, "No active track command in this channel!")
@@ -457,57 +480,22 @@ class UtilityCommands(commands.Cog):
 
     def _extract_pokemon_ids(self, description: str) -> list:
         """Extract Pokemon IDs from embed description"""
-        pokemon_ids = []
-        for line in description.split('\n'):
-            # Match both formats:
-            # 1. **`33384252`** (with backticks and bold)
-            # 2. 33384252　 (plain with Japanese space)
-            # 3. `38749770`　 (with backticks, no bold)
-
-            # Try to find ID in backticks first
-            backtick_match = re.search(r'`(\d+)`', line)
-            if backtick_match:
-                pokemon_ids.append(backtick_match.group(1))
-                continue
-
-            # Try to find ID at start of line with Japanese space
-            if '　' in line or '•' in line:
-                id_part = line.split('　')[0] if '　' in line else line.split()[0]
-                id_match = id_part.replace('**', '').replace('`', '').strip()
-                if id_match.isdigit():
-                    pokemon_ids.append(id_match)
-
-        return pokemon_ids
+        # Handles **`33384252`**, `38749770`　 and plain 33384252　 (Japanese space) layouts
+        return [str(record.pokemon_id) for record in parse_lines(description)]
 
     def _extract_pokemon_with_levels(self, description: str, target_level: int) -> list:
         """Extract Pokemon IDs and calculate rare candies needed"""
         pokemon_data = []
-        for line in description.split('\n'):
-            # Extract ID
-            pokemon_id = None
-            backtick_match = re.search(r'`(\d+)`', line)
-            if backtick_match:
-                pokemon_id = backtick_match.group(1)
-            elif '　' in line or '•' in line:
-                id_part = line.split('　')[0] if '　' in line else line.split()[0]
-                id_match = id_part.replace('**', '').replace('`', '').strip()
-                if id_match.isdigit():
-                    pokemon_id = id_match
-
-            if not pokemon_id:
+        for record in parse_lines(description):
+            # Current level (format: "Lvl. 14")
+            if record.level is None:
                 continue
 
-            # Extract current level (format: "Lvl. 14")
-            level_match = re.search(r'Lvl\.\s*(\d+)', line)
-            if level_match:
-                current_level = int(level_match.group(1))
-                candies_needed = max(0, target_level - current_level)
-                
-                pokemon_data.append({
-                    'id': pokemon_id,
-                    'current_level': current_level,
-                    'candies_needed': candies_needed
-                })
+            pokemon_data.append({
+                'id': str(record.pokemon_id),
+                'current_level': record.level,
+                'candies_needed': max(0, target_level - record.level)
+            })
 
         return pokemon_data
 
@@ -517,97 +505,108 @@ class UtilityCommands(commands.Cog):
         ids = re.findall(r'\b\d+\b', text)
         return ids
 
-    async def _handle_track_update(self, message: discord.Message):
-        """Handle updates to tracked messages"""
-        for channel_id, track_data in list(active_track_commands.items()):
-            if (track_data.get('monitoring_message_id') != message.id or 
+    def _monitor_track(self, channel_id: int, message_id: int, ttl: float):
+        """Route edits of the tracked list message to this channel's session"""
+        edit_router.subscribe(message_id, ('track', channel_id),
+                              lambda before, after: self._handle_track_update(channel_id, after), ttl)
+
+    async def _handle_track_update(self, channel_id: int, message: discord.Message):
+        """Handle updates to a tracked message"""
+        track_data = self.tracks.get(channel_id)
+        if (not track_data or track_data.get('monitoring_message_id') != message.id or
                 track_data.get('status') != 'tracking'):
-                continue
+            return
 
-            command_type = track_data.get('command_type', 'track')
-            new_data = []
-
-            # Handle different command types
-            if command_type == 'rarecandylevel':
-                # For rare candy level, re-extract with levels
-                if message.author.id != 716390085896962058 or not message.embeds:
-                    continue
-
-                embed = message.embeds[0]
-                if not embed.title or "pokémon" not in embed.title.lower() or not embed.description:
-                    continue
-
-                target_level = track_data.get('target_level', 100)
-                new_data = self._extract_pokemon_with_levels(embed.description, target_level)
-                # Filter out Pokemon already at target level
-                new_data = [p for p in new_data if p.get('candies_needed', 0) > 0]
-
-            elif track_data.get('is_plain_text'):
-                # Plain text tracking
-                if message.content:
-                    new_data = [{'id': pid} for pid in self._extract_ids_from_plain_text(message.content)]
-            else:
-                # Regular track command
-                if message.author.id != 716390085896962058 or not message.embeds:
-                    continue
-
-                embed = message.embeds[0]
-                if not embed.title or not embed.description:
-                    continue
-
-                if "pokémon" not in embed.title.lower() and "marketplace" not in embed.title.lower():
-                    continue
-
-                new_data = [{'id': pid} for pid in self._extract_pokemon_ids(embed.description)]
-
-            # Add only new entries
-            added_count = 0
-            existing_ids = {p['id'] for p in track_data['pokemon_data']}
-            
-            for data_entry in new_data:
-                if data_entry['id'] not in existing_ids:
-                    track_data['pokemon_data'].append(data_entry)
-                    existing_ids.add(data_entry['id'])
-                    added_count += 1
-
-            # Update tracking message
-            if added_count > 0:
-                try:
-                    tracking_msg = await self.bot.get_channel(channel_id).fetch_message(
-                        track_data['tracking_message_id'])
-                    
-                    if command_type == 'rarecandylevel':
-                        total_candies = sum(p['candies_needed'] for p in track_data['pokemon_data'])
-                        embed = discord.Embed(
-                            description=f"{EMOJI_TICK} Started tracking! React with ✅ when done editing.\n"
-                                       f"Target Level: **{track_data['target_level']}**\n"
-                                       f"Pokemon to level: **{len(track_data['pokemon_data'])}**\n"
-                                       f"Total rare candies needed: **{total_candies}**",
-                            color=EMBED_COLOR
-                        )
-                    else:
-                        embed = discord.Embed(
-                            description=f"{EMOJI_TICK} Started tracking! React with ✅ when done editing.\nCommand: `{track_data['template']}`\nIDs collected: {len(track_data['pokemon_data'])}",
-                            color=EMBED_COLOR
-                        )
-                    await tracking_msg.edit(embed=embed)
-                except:
-                    pass
+        command_type = track_data.get('command_type', 'track')
+        new_data = []
+
+        # Handle different command types
+        if command_type == 'rarecandylevel':
+            # For rare candy level, re-extract with levels
+            if message.author.id != 716390085896962058 or not message.embeds:
+                return
+
+            embed = message.embeds[0]
+            if not embed.title or "pokémon" not in embed.title.lower() or not embed.description:
+                return
+
+            target_level = track_data.get('target_level', 100)
+            new_data = self._extract_pokemon_with_levels(embed.description, target_level)
+            # Filter out Pokemon already at target level
+            new_data = [p for p in new_data if p.get('candies_needed', 0) > 0]
+
+        elif track_data.get('is_plain_text'):
+            # Plain text tracking
+            if message.content:
+                new_data = [{'id': pid} for pid in self._extract_ids_from_plain_text(message.content)]
+        else:
+            # Regular track command
+            if message.author.id != 716390085896962058 or not message.embeds:
+                return
+
+            embed = message.embeds[0]
+            if not embed.title or not embed.description:
+                return
+
+            if "pokémon" not in embed.title.lower() and "marketplace" not in embed.title.lower():
+                return
+
+            new_data = [{'id': pid} for pid in self._extract_pokemon_ids(embed.description)]
+
+        # Add only new entries
+        added_count = 0
+        existing_ids = {p['id'] for p in track_data['pokemon_data']}
+        
+        for data_entry in new_data:
+            if data_entry['id'] not in existing_ids:
+                track_data['pokemon_data'].append(data_entry)
+                existing_ids.add(data_entry['id'])
+                added_count += 1
+
+        # Update tracking message
+        if added_count > 0:
+            # Keep the original timeout, edits don't extend it
+            await self.tracks.save(channel_id, ttl=self.tracks.expires_in(channel_id))
+            try:
+                tracking_msg = self.bot.get_channel(channel_id).get_partial_message(
+                    track_data['tracking_message_id'])
+                
+                if command_type == 'rarecandylevel':
+                    total_candies = sum(p['candies_needed'] for p in track_data['pokemon_data'])
+                    embed = discord.Embed(
+                        description=f"{EMOJI_TICK} Started tracking! React with ✅ when done editing.\n"
+                                   f"Target Level: **{track_data['target_level']}**\n"
+                                   f"Pokemon to level: **{len(track_data['pokemon_data'])}**\n"
+                                   f"Total rare candies needed: **{total_candies}**",
+                        color=EMBED_COLOR
+                    )
+                else:
+                    embed = discord.Embed(
+                        description=f"{EMOJI_TICK} Started tracking! React with ✅ when done editing.\nCommand: `{track_data['template']}`\nIDs collected: {len(track_data['pokemon_data'])}",
+                        color=EMBED_COLOR
+                    )
+                await tracking_msg.edit(embed=embed)
+            except:
+                pass
 
     async def _start_track_sending(self, channel, command_data):
         """Start sending tracked commands"""
+        # Editing is over, later edits of the list don't matter
+        edit_router.unsubscribe(command_data['monitoring_message_id'], ('track', channel.id))
+
         if not command_data['pokemon_data']:
             embed = discord.Embed(
                 description=f"{EMOJI_CROSS} No Pokemon data was collected!",
                 color=EMBED_COLOR
             )
             await channel.send(embed=embed)
-            del active_track_commands[channel.id]
+            await self.tracks.delete(channel.id)
             return
 
         command_data['status'] = 'sending'
         command_data['current_index'] = 0
         command_data['total_count'] = len(command_data['pokemon_data'])
+        await self.tracks.save(channel.id, ttl=TRACK_SENDING_TTL)
 
         # Send first command
         await self._send_next_track_command(channel, command_data)
@@ -665,22 +664,24 @@ class UtilityCommands(commands.Cog):
         else:
             await channel.send(f"{EMOJI_TICK} All commands completed! Total: {total}")
         
-        del active_track_commands[channel.id]
+        await self.tracks.delete(channel.id)
 
-    async def _track_timeout(self, channel_id: int, tracking_message: discord.Message):
+    async def _track_timeout(self, channel_id: int, delay: float):
         """Cancel track command after 3 minutes"""
-        await asyncio.sleep(180)
+        await asyncio.sleep(delay)
 
-        if channel_id in active_track_commands and active_track_commands[channel_id].get('status') == 'tracking':
+        track_data = self.tracks.get(channel_id)
+        if track_data and track_data.get('status') == 'tracking':
             embed = discord.Embed(
                 description="⏱️ Track command timed out after 3 minutes!",
                 color=EMBED_COLOR
             )
             try:
-                await tracking_message.edit(embed=embed)
+                channel = self.bot.get_channel(channel_id)
+                await channel.get_partial_message(track_data['tracking_message_id']).edit(embed=embed)
             except:
                 pass
-            del active_track_commands[channel_id]
+            await self.tracks.delete(channel_id)
 
     async def _send_long_message(self, ctx, text: str):
         """Send long text, splitting if necessary"""
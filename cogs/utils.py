@@ -4,6 +4,11 @@ import re
 import csv
 import config
 import os
+from types import MappingProxyType
+from embed_parser import parse_lines
+from dex_query import DexIndex
+from filters import FILTER_MEMBERS
+from name_search import NameSearchIndex
 
 class Utils(commands.Cog):
     """Utility functions for Pokemon parsing, breeding compatibility, and Shiny Dex"""
@@ -20,12 +25,17 @@ class Utils(commands.Cog):
         if not Utils._data_loaded:
             print("📦 Loading Utils data for the first time...")
             Utils._shared_data = self._initialize_data_structures()
+            # The loaders' helpers (get_dex_number, has_gender_difference, ...) read the instance references
+            self._bind_shared_data()
             self._load_all_data()
             Utils._data_loaded = True
             print(f"✅ Utils data loaded and cached")
         else:
             print("✅ Utils using cached data (no reload needed)")
+            self._bind_shared_data()
 
+    def _bind_shared_data(self):
+        """Instance references to the shared data (filled in place by the loaders)"""
         # Create instance references to shared data (for backward compatibility)
         self.egg_groups = Utils._shared_data['egg_groups']
         self.male_only_dex = Utils._shared_data['male_only_dex']
@@ -39,11 +49,7 @@ class Utils(commands.Cog):
         self.event_data = Utils._shared_data['event_data']
         self.event_pokemon_list = Utils._shared_data['event_pokemon_list']
         self.pokemon_cdn_mapping = Utils._shared_data['pokemon_cdn_mapping']  # ADD THIS LINE
-
-        # Precompile regex patterns (instance-specific is fine)
-        self.id_pattern = re.compile(r'`(\s*\d+\s*)`')
-        self.name_pattern = re.compile(r'> ([^<]+)<:(?:male|female|unknown):')
-        self.iv_pattern = re.compile(r'•\s*([\d.]+)%')
+        self.species_search = Utils._shared_data['species_search']
 
     def _initialize_data_structures(self):
         """Initialize all data structures (called once)"""
@@ -59,7 +65,27 @@ class Utils(commands.Cog):
             'pokemon_info': {},
             'event_data': {},
             'event_pokemon_list': [],
-            'pokemon_cdn_mapping': {}  # ADD THIS LINE
+            'pokemon_cdn_mapping': {},  # ADD THIS LINE
+            'species_search': NameSearchIndex(),
+            # Static shiny dex tables (see build_dex_tables)
+            'basic_dex_entries': (),
+            'basic_dex_names': (),
+            'full_dex_entries': (),
+            'full_dex_names': (),
+            'event_entries': (),
+            'total_forms_count': 0,
+            'total_event_count': 0,
+            'forms_by_type': MappingProxyType({}),
+            'forms_by_region': MappingProxyType({}),
+            # Filter indexes over the static dex (see dex_query.DexIndex)
+            'basic_dex_index': DexIndex((), {}),
+            'full_dex_index': DexIndex((), {}),
+            'event_dex_index': DexIndex((), {}),
+            'species_index': DexIndex((), {}),
+            # Named filters (filters.py) compiled against the dex (see build_filter_tables)
+            'filter_entries': (),
+            'filter_index': DexIndex((), {}),
+            'filter_masks': MappingProxyType({})
         }
 
     def _load_all_data(self):
@@ -70,6 +96,9 @@ class Utils(commands.Cog):
         self.load_pokemon_data()
         self.load_event_pokemon()
         self.load_pokemon_cdn_mapping()  # ADD THIS LINE
+        self.build_species_search()
+        self.build_dex_tables()
+        self.build_filter_tables()
 
     def load_dex_numbers(self):
         """Load both dex_number.csv (breeding) and dex_number_updated.csv (shiny dex)"""
@@ -260,6 +289,123 @@ class Utils(commands.Cog):
         except Exception as e:
             print(f"❌ Error loading Pokemon CDN mapping: {e}")
 
+    def build_species_search(self):
+        """Fuzzy index over every species/form name from the CSVs (for typo-tolerant name arguments)"""
+        species_search = Utils._shared_data['species_search']
+        for names in (Utils._shared_data['dex_data'], Utils._shared_data['dex_numbers'],
+                      Utils._shared_data['egg_groups'], Utils._shared_data['pokemon_info']):
+            for name in names:
+                species_search.add(name)
+        print(f"✅ Indexed {len(species_search)} species names for fuzzy search")
+
+    def build_dex_tables(self):
+        """
+        Precompute the shiny dex entry lists and totals once (they only change between deploys)
+        Entry lists are tuples and totals are read-only mappings, shared by every command.
+        """
+        shared = Utils._shared_data
+        dex_by_number = shared['dex_by_number']
+        pokemon_info = shared['pokemon_info']
+
+        basic_entries = []
+        full_entries = []
+        forms_by_type = {}
+        forms_by_region = {}
+        total_forms = 0
+
+        for dex_num in sorted(dex_by_number):
+            forms = dex_by_number[dex_num]
+            if forms:
+                basic_entries.append((dex_num, forms[0][0]))  # First/top form for the basic dex
+
+            for name, has_gender_diff in forms:
+                full_entries.append((dex_num, name, has_gender_diff))
+
+                # Gender difference forms count twice (male and female)
+                form_count = 2 if has_gender_diff else 1
+                total_forms += form_count
+
+                info = pokemon_info.get(name)
+                if not info:
+                    continue
+                types = [info['type1']]
+                if info['type2']:
+                    types.append(info['type2'])
+                for ptype in types:
+                    forms_by_type[ptype] = forms_by_type.get(ptype, 0) + form_count
+                forms_by_region[info['region']] = forms_by_region.get(info['region'], 0) + form_count
+
+        event_entries = tuple(shared['event_pokemon_list'])
+
+        shared['basic_dex_entries'] = tuple(basic_entries)
+        shared['basic_dex_names'] = tuple(name for _, name in basic_entries)
+        shared['full_dex_entries'] = tuple(full_entries)
+        shared['full_dex_names'] = tuple(name for _, name, _ in full_entries)
+        shared['event_entries'] = event_entries
+        shared['total_forms_count'] = total_forms
+        shared['total_event_count'] = sum(2 if has_gender_diff else 1 for _, has_gender_diff in event_entries)
+        shared['forms_by_type'] = MappingProxyType(dict(sorted(forms_by_type.items())))
+        shared['forms_by_region'] = MappingProxyType(forms_by_region)
+
+        # Filter indexes: entry i of each dex is bit i
+        rare = config.RARE
+        gender_diff_names = {name for _, name, has_gender_diff in full_entries if has_gender_diff}
+        shared['basic_dex_index'] = DexIndex(shared['basic_dex_names'], pokemon_info, rare, gender_diff_names)
+        shared['full_dex_index'] = DexIndex(shared['full_dex_names'], pokemon_info, rare, gender_diff_names)
+        shared['event_dex_index'] = DexIndex(
+            [name for name, _ in event_entries], pokemon_info, rare,
+            {name for name, has_gender_diff in event_entries if has_gender_diff}
+        )
+        # Every known species (with or without region/type info), for filtering a user's caught Pokemon
+        species = set(pokemon_info) | set(shared['full_dex_names']) | {name for name, _ in event_entries}
+        shared['species_index'] = DexIndex(sorted(species), pokemon_info, rare, gender_diff_names)
+        print(f"✅ Precomputed shiny dex tables ({len(full_entries)} forms, {total_forms} with gender variants)")
+
+    def build_filter_tables(self):
+        """
+        Compile every named filter into a bitmask over one shared entry table
+        The table holds every filter member with a dex number, as (dex_number, name, has_gender_diff)
+        in dex order, so filters combine with each other and with region/type masks without rescanning.
+        """
+        shared = Utils._shared_data
+        entries = {}
+        for members in FILTER_MEMBERS.values():
+            for name in members:
+                if name in entries:
+                    continue
+                dex_num = self.get_dex_number(name)
+                if dex_num is not None:
+                    entries[name] = (dex_num, name, self.has_gender_difference(name))
+
+        filter_entries = tuple(sorted(entries.values(), key=lambda entry: (entry[0], entry[1])))
+        index = DexIndex(
+            [name for _, name, _ in filter_entries], shared['pokemon_info'], config.RARE,
+            {name for _, name, has_gender_diff in filter_entries if has_gender_diff}
+        )
+        shared['filter_entries'] = filter_entries
+        shared['filter_index'] = index
+        shared['filter_masks'] = MappingProxyType({
+            key: index.mask_of(members) for key, members in FILTER_MEMBERS.items()
+        })
+        print(f"✅ Compiled {len(FILTER_MEMBERS)} filters over {len(filter_entries)} Pokemon")
+
+    def resolve_species_name(self, name: str):
+        """Canonical species name for user input (exact or confident fuzzy match), None if unsure"""
+        match = self.species_search.best(name)
+        return match.name if match else None
+
+    def resolve_name_searches(self, name_searches: list, index: DexIndex) -> list:
+        """Replace --name terms that match nothing in the dex index with their closest species name (typo tolerance)"""
+        if not name_searches:
+            return name_searches
+
+        resolved = []
+        for search in name_searches:
+            if not index.has_match(search):
+                search = self.resolve_species_name(search) or search
+            resolved.append(search)
+        return resolved
+
     def get_cdn_number(self, pokemon_name: str) -> int:
         """Get CDN number for a Pokemon name"""
         pokemon_cdn_mapping = Utils._shared_data['pokemon_cdn_mapping']
@@ -435,75 +581,40 @@ class Utils(commands.Cog):
             return []
 
         pokemon_data = []
-        lines = embed_description.strip().split('\n')
-
-        for line in lines:
-            # Quick pre-check to skip irrelevant lines
-            if '`' not in line or '•' not in line:
-                continue
-
-            try:
-                # Extract ID using precompiled regex
-                id_match = self.id_pattern.search(line)
-                if not id_match:
-                    continue
-                pokemon_id = int(id_match.group(1).strip())
 
-                # Extract name using precompiled regex
-                name_match = self.name_pattern.search(line)
-                if not name_match:
-                    continue
-                pokemon_name = name_match.group(1).strip()
-
-                # Skip shinies (early exit)
-                if '✨' in pokemon_name:
-                    continue
+        for record in parse_lines(embed_description, marker='•'):
+            pokemon_name = record.name
 
-                # Remove Gigantamax emoji if present
-                pokemon_name = pokemon_name.replace('✨ ', '').strip()
-
-                # Extract gender (optimized with elif)
-                if '<:male:' in line:
-                    gender = 'male'
-                elif '<:female:' in line:
-                    gender = 'female'
-                elif '<:unknown:' in line:
-                    gender = 'unknown'
-                else:
-                    continue
-
-                # Extract IV percentage using precompiled regex
-                iv_match = self.iv_pattern.search(line)
-                iv_percent = float(iv_match.group(1)) if iv_match else 0.0
-
-                # Get dex number
-                dex_number = self.get_dex_number(pokemon_name)
-
-                # Pre-compute all derived fields
-                egg_groups = self.get_egg_groups(pokemon_name)
-                base_species = self.get_base_species(pokemon_name)
-                is_gmax = self.is_gigantamax(pokemon_name)
-                is_regional = self.is_regional(pokemon_name)
-                is_ditto = 'Ditto' in egg_groups
-
-                pokemon_data.append({
-                    'pokemon_id': pokemon_id,
-                    'name': pokemon_name,
-                    'gender': gender,
-                    'iv_percent': iv_percent,
-                    'dex_number': dex_number,
-                    # Pre-computed fields for breeding logic
-                    'egg_groups': egg_groups,
-                    'base_species': base_species,
-                    'is_gmax': is_gmax,
-                    'is_regional': is_regional,
-                    'is_ditto': is_ditto
-                })
-
-            except (ValueError, AttributeError):
-                # Skip problematic lines silently
+            # Need both name and gender; skip shinies (early exit)
+            if not pokemon_name or record.gender is None or record.is_shiny:
                 continue
 
+            iv_percent = record.iv_percent if record.iv_percent is not None else 0.0
+
+            # Get dex number
+            dex_number = self.get_dex_number(pokemon_name)
+
+            # Pre-compute all derived fields
+            egg_groups = self.get_egg_groups(pokemon_name)
+            base_species = self.get_base_species(pokemon_name)
+            is_gmax = self.is_gigantamax(pokemon_name)
+            is_regional = self.is_regional(pokemon_name)
+            is_ditto = 'Ditto' in egg_groups
+
+            pokemon_data.append({
+                'pokemon_id': record.pokemon_id,
+                'name': pokemon_name,
+                'gender': record.gender,
+                'iv_percent': iv_percent,
+                'dex_number': dex_number,
+                # Pre-computed fields for breeding logic
+                'egg_groups': egg_groups,
+                'base_species': base_species,
+                'is_gmax': is_gmax,
+                'is_regional': is_regional,
+                'is_ditto': is_ditto
+            })
+
         return pokemon_data
 
     async def fetch_embed_by_id(self, ctx, message_id: int):
@@ -537,26 +648,24 @@ class Utils(commands.Cog):
         return self.pokemon_info.get(pokemon_name)
 
     def get_basic_dex_entries(self):
-        """Get list of (dex_number, pokemon_name) for basic dex - one per dex number (the first/top one)"""
-        entries = []
-        for dex_num in sorted(self.dex_by_number.keys()):
-            # Get the first Pokemon for this dex number
-            if self.dex_by_number[dex_num]:
-                first_pokemon = self.dex_by_number[dex_num][0][0]  # (name, has_gender_diff)[0] = name
-                entries.append((dex_num, first_pokemon))
-        return entries
+        """(dex_number, pokemon_name) for the basic dex - one per dex number (the first/top one), as a tuple"""
+        return Utils._shared_data['basic_dex_entries']
+
+    def get_basic_dex_names(self):
+        """Names of get_basic_dex_entries(), in the same order"""
+        return Utils._shared_data['basic_dex_names']
 
     def get_full_dex_entries(self):
-        """Get list of (dex_number, pokemon_name, has_gender_diff) for full dex - all forms"""
-        entries = []
-        for dex_num in sorted(self.dex_by_number.keys()):
-            for name, has_gender_diff in self.dex_by_number[dex_num]:
-                entries.append((dex_num, name, has_gender_diff))
-        return entries
+        """(dex_number, pokemon_name, has_gender_diff) for the full dex - all forms, as a tuple"""
+        return Utils._shared_data['full_dex_entries']
+
+    def get_full_dex_names(self):
+        """Names of get_full_dex_entries(), in the same order"""
+        return Utils._shared_data['full_dex_names']
 
     def get_event_entries(self):
-        """Get list of (pokemon_name, has_gender_diff) for event Pokemon"""
-        return self.event_pokemon_list.copy()
+        """(pokemon_name, has_gender_diff) for event Pokemon, as a tuple"""
+        return Utils._shared_data['event_entries']
 
     def get_total_unique_dex(self) -> int:
         """Get total number of unique dex numbers"""
@@ -564,24 +673,28 @@ class Utils(commands.Cog):
 
     def get_total_forms_count(self) -> int:
         """Get total count of all forms including gender variants"""
-        count = 0
-        for dex_num in self.dex_by_number:
-            for name, has_gender_diff in self.dex_by_number[dex_num]:
-                if has_gender_diff:
-                    count += 2  # Male and female
-                else:
-                    count += 1
-        return count
+        return Utils._shared_data['total_forms_count']
 
     def get_total_event_count(self) -> int:
         """Get total count of event Pokemon including gender variants"""
-        count = 0
-        for name, has_gender_diff in self.event_pokemon_list:
-            if has_gender_diff:
-                count += 2  # Male and female
-            else:
-                count += 1
-        return count
+        return Utils._shared_data['total_event_count']
+
+    def get_forms_by_type(self):
+        """Read-only {type: total forms incl. gender variants}, sorted by type name"""
+        return Utils._shared_data['forms_by_type']
+
+    def get_dex_index(self, dex: str) -> DexIndex:
+        """Filter index for 'basic', 'full' or 'event' dex entries, or 'species' (all Pokemon with info)"""
+        return Utils._shared_data[f'{dex}_dex_index' if dex != 'species' else 'species_index']
+
+    def get_filter_table(self):
+        """(entries, index, masks) for named filters: entry i is bit i of index and of masks[filter_key]"""
+        shared = Utils._shared_data
+        return shared['filter_entries'], shared['filter_index'], shared['filter_masks']
+
+    def get_forms_by_region(self):
+        """Read-only {region: total forms incl. gender variants}"""
+        return Utils._shared_data['forms_by_region']
 
     def is_rare_pokemon(self, pokemon_name: str) -> bool:
         """Check if a Pokemon is rare"""
@@ -0,0 +1,204 @@
+import discord
+import asyncio
+import json
+import time
+import config
+
+# Queued by stop(): the flusher sends its partial batch and exits
+_STOP = object()
+
+
+class CommandLogger:
+    """
+    Batched command-usage logger
+
+    Commands are queued without awaiting any REST call. A background flusher
+    coalesces queued events into one log-channel message per interval (or as
+    soon as a full batch is ready), and optionally appends every event as a
+    JSON line to disk for offline analysis.
+    """
+
+    def __init__(self, bot, channel_id: int, max_queue: int = 500, batch_size: int = 20,
+                 flush_interval: float = 10.0, sample_rate: int = 5, jsonl_path: str = None):
+        self.bot = bot
+        self.channel_id = channel_id
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.jsonl_path = jsonl_path
+
+        # Above this queue depth only 1 in `sample_rate` events is kept
+        self.sample_rate = max(1, sample_rate)
+        self.high_water = int(max_queue * 0.8)
+
+        self.queue = asyncio.Queue(maxsize=max_queue)
+        self.task = None
+        self._stopping = False
+        self.dropped = 0
+        self._sample_counter = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.channel_id) or bool(self.jsonl_path)
+
+    def start(self):
+        """Start the background flusher (safe to call on every on_ready)"""
+        if not self.enabled or (self.task and not self.task.done()):
+            return
+        self._stopping = False
+        self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the flusher and push out anything still queued"""
+        if self.task:
+            # Not cancelled: the flusher may hold a batch it already took off the queue
+            self._stopping = True
+            try:
+                self.queue.put_nowait(_STOP)
+            except asyncio.QueueFull:
+                pass  # A full queue never blocks the flusher; it checks _stopping after each flush
+            await self.task
+            self.task = None
+
+        batch = [event for event in self._drain(self.queue.qsize()) if event is not _STOP]
+        if batch:
+            await self._flush(batch)
+
+    def log(self, interaction_or_ctx, command_name: str, command_type: str):
+        """Queue a command usage event (never blocks, never awaits)"""
+        if not self.enabled:
+            return
+
+        # Under back-pressure keep only a sample, when full drop outright
+        if self.queue.qsize() >= self.high_water:
+            self._sample_counter += 1
+            if self._sample_counter % self.sample_rate:
+                self.dropped += 1
+                return
+
+        try:
+            self.queue.put_nowait(self._build_event(interaction_or_ctx, command_name, command_type))
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    @staticmethod
+    def _build_event(interaction_or_ctx, command_name: str, command_type: str) -> dict:
+        """Snapshot everything needed for the log line while the objects are still live"""
+        if isinstance(interaction_or_ctx, discord.Interaction):
+            user = interaction_or_ctx.user
+        else:  # commands.Context
+            user = interaction_or_ctx.author
+        guild = interaction_or_ctx.guild
+        channel = interaction_or_ctx.channel
+
+        return {
+            'ts': time.time(),
+            'user_id': user.id,
+            'user_name': user.name,
+            'command': command_name,
+            'type': command_type,
+            'guild_id': guild.id if guild else None,
+            'guild_name': guild.name if guild else None,
+            'channel_name': getattr(channel, 'name', None) if guild else None
+        }
+
+    def _drain(self, limit: int) -> list:
+        """Pop up to `limit` events that are already queued"""
+        batch = []
+        while len(batch) < limit:
+            try:
+                batch.append(self.queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _run(self):
+        """Flusher loop: one message per interval or per full batch"""
+        loop = asyncio.get_running_loop()
+        while not self._stopping:
+            first = await self.queue.get()
+            if first is _STOP:
+                return
+            batch = [first]
+            deadline = loop.time() + self.flush_interval
+
+            while len(batch) < self.batch_size and not self._stopping:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(self.queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if event is _STOP:
+                    break
+                batch.append(event)
+
+            try:
+                await self._flush(batch)
+            except Exception as e:
+                print(f"❌ Error flushing command log: {e}")
+
+    async def _flush(self, batch: list):
+        """Write a batch to disk and send it as a single embed"""
+        if self.jsonl_path:
+            try:
+                await asyncio.to_thread(self._write_jsonl, batch)
+            except Exception as e:
+                print(f"❌ Error writing command log file: {e}")
+
+        if not self.channel_id:
+            return
+
+        log_channel = self.bot.get_channel(self.channel_id)
+        if not log_channel:
+            return
+
+        dropped, self.dropped = self.dropped, 0
+
+        try:
+            await log_channel.send(embed=self._build_embed(batch, dropped))
+        except Exception as e:
+            print(f"❌ Error sending command log: {e}")
+
+    def _write_jsonl(self, batch: list):
+        with open(self.jsonl_path, 'a', encoding='utf-8') as f:
+            for event in batch:
+                f.write(json.dumps(event, ensure_ascii=False) + '\n')
+
+    @staticmethod
+    def _build_embed(batch: list, dropped: int = 0) -> discord.Embed:
+        """One embed summarising a whole batch of command events"""
+        lines = []
+        for event in batch:
+            if event['guild_id'] is None:
+                location = "DM"
+            else:
+                location = f"{event['guild_name']} (`{event['guild_id']}`) #{event['channel_name']}"
+            lines.append(
+                f"<t:{int(event['ts'])}:T> `{event['command']}` • {event['type']}\n"
+                f"> <@{event['user_id']}> ({event['user_name']}, `{event['user_id']}`) • {location}"
+            )
+
+        # Embed descriptions are capped at 4096 characters
+        description = ""
+        shown = 0
+        for line in lines:
+            if len(description) + len(line) + 1 > 4000:
+                break
+            description += line + "\n"
+            shown += 1
+
+        embed = discord.Embed(
+            title=f"📝 Commands Used ({len(batch)})",
+            description=description,
+            color=config.EMBED_COLOR,
+            timestamp=discord.utils.utcnow()
+        )
+
+        footer = ["Command Logger"]
+        if shown < len(batch):
+            footer.append(f"{len(batch) - shown} more not shown")
+        if dropped:
+            footer.append(f"{dropped} dropped under load")
+        embed.set_footer(text=" • ".join(footer))
+        return embed
@@ -0,0 +1,172 @@
+"""Opt-in cProfile capture of single command invocations (armed by the owner with m!profile)"""
+import cProfile
+import io
+import os
+import pstats
+import time
+
+
+class ProfileTarget:
+    """What to capture for one command: the next call, or every Nth, optionally for one user"""
+
+    __slots__ = ('command', 'every', 'user_id', 'channel_id', 'seen', 'captured', 'hooks')
+
+    def __init__(self, command: str, every: int = None, user_id: int = None, channel_id: int = None):
+        self.command = command
+        self.every = every
+        self.user_id = user_id
+        self.channel_id = channel_id  # where reports go
+        self.seen = 0
+        self.captured = 0
+        self.hooks = (None, None)  # the command's own before/after invoke hooks, restored on disarm
+
+    def describe(self) -> str:
+        who = f" by <@{self.user_id}>" if self.user_id else ""
+        when = f"every {self.every}th call" if self.every else "next call"
+        return f"`{self.command}` - {when}{who} ({self.captured} captured)"
+
+
+async def _call_hook(hook, command, ctx):
+    """Call a command-local invoke hook the way discord.py does (cog methods get the cog first)"""
+    if hook is None:
+        return
+    instance = getattr(hook, '__self__', command.cog)
+    if instance:
+        await hook(instance, ctx)
+    else:
+        await hook(ctx)
+
+
+class CommandProfiler:
+    """
+    Wraps armed commands in cProfile through per-command before/after invoke hooks
+
+    Hooks are only installed on armed commands; a command's own hooks keep
+    running inside them and are put back on disarm, so unarmed commands (and
+    everything when nothing is armed) run exactly as before. cProfile sees the whole event loop thread, so other tasks that
+    run while the command awaits show up in the profile too; with a single
+    slow synchronous section they are noise at the bottom of the summary.
+
+    report(target, ctx, path, summary, elapsed) is awaited after each capture.
+    """
+
+    def __init__(self, output_dir: str = 'profiles', top: int = 15, report=None):
+        self.output_dir = output_dir
+        self.top = top
+        self.report = report
+        self.targets = {}  # qualified command name -> ProfileTarget
+        self._active = False
+
+    def arm(self, command, every: int = None, user_id: int = None, channel_id: int = None) -> ProfileTarget:
+        """Profile the next (or every Nth) invocation of a commands.Command"""
+        target = ProfileTarget(command.qualified_name, every, user_id, channel_id)
+        previous = self.targets.get(target.command)
+        if previous is not None:
+            target.hooks = previous.hooks  # re-armed: our hooks are already installed
+        else:
+            # discord.py has no public getter for a command's hooks
+            target.hooks = (command._before_invoke, command._after_invoke)
+            before, after = target.hooks
+
+            async def profiled_before(*args):
+                await _call_hook(before, command, args[-1])
+                await self._before(args[-1])
+
+            async def profiled_after(*args):
+                await self._after(args[-1])
+                await _call_hook(after, command, args[-1])
+
+            command.before_invoke(profiled_before)
+            command.after_invoke(profiled_after)
+        self.targets[target.command] = target
+        return target
+
+    def disarm(self, command) -> bool:
+        """Put a command's own hooks back; returns whether it was armed"""
+        target = self.targets.pop(command.qualified_name, None)
+        if target is None:
+            return False
+        # discord.py has no public way to clear a command's hooks
+        command._before_invoke, command._after_invoke = target.hooks
+        return True
+
+    async def _before(self, ctx):
+        target = self.targets.get(ctx.command.qualified_name)
+        if target is None or (target.user_id and ctx.author.id != target.user_id):
+            return
+
+        target.seen += 1
+        if target.every and target.seen % target.every:
+            return
+        # Only one cProfile can be active at a time; overlapping calls are skipped
+        if self._active:
+            return
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            return  # Another profiler (e.g. a debugger) is running
+        self._active = True
+        ctx.profiler_run = (profile, time.perf_counter())
+
+    async def _after(self, ctx):
+        run = getattr(ctx, 'profiler_run', None)
+        if run is None:
+            return
+        profile, start = run
+        profile.disable()
+        elapsed = time.perf_counter() - start
+        self._active = False
+        ctx.profiler_run = None
+
+        target = self.targets.get(ctx.command.qualified_name)
+        if target is None:
+            return
+        target.captured += 1
+        if not target.every:
+            self.disarm(ctx.command)
+
+        try:
+            path = self._save(profile, target.command, ctx.author.id)
+            summary = self.summarize(profile)
+        except Exception as e:
+            print(f"⚠️ Could not save profile for {target.command}: {e}")
+            return
+
+        print(f"🔬 Profiled {target.command} ({elapsed:.2f}s) -> {path}")
+        if self.report:
+            try:
+                await self.report(target, ctx, path, summary, elapsed)
+            except Exception as e:
+                print(f"⚠️ Could not report profile for {target.command}: {e}")
+
+    def _save(self, profile, command: str, user_id: int) -> str:
+        """Dump pstats to output_dir (open with `python -m pstats` or snakeviz)"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        now = time.time()
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(now)) + f"{now % 1:.3f}"[1:]
+        path = os.path.join(self.output_dir, f"{stamp}_{command.replace(' ', '_')}_{user_id}.pstats")
+        profile.dump_stats(path)
+        return path
+
+    def summarize(self, profile) -> str:
+        """Top functions by cumulative time, one line each"""
+        stats = pstats.Stats(profile, stream=io.StringIO())
+        rows = []
+        for (filename, lineno, name), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+            rows.append((cumtime, tottime, ncalls, self._short_path(filename), lineno, name))
+        rows.sort(reverse=True)
+
+        lines = [f"{'cumtime':>8} {'tottime':>8} {'calls':>7}  function"]
+        for cumtime, tottime, ncalls, filename, lineno, name in rows[:self.top]:
+            location = f"{filename}:{lineno}({name})" if lineno else name
+            lines.append(f"{cumtime:>8.3f} {tottime:>8.3f} {ncalls:>7}  {location}")
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _short_path(filename: str) -> str:
+        for marker in ('site-packages' + os.sep, 'lib' + os.sep + 'python'):
+            if marker in filename:
+                return filename.split(marker, 1)[1]
+        return os.path.relpath(filename) if os.path.isabs(filename) else filename
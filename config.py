@@ -52,6 +52,36 @@ CROSS = "<:cross_mark:1449750002388959377>"
 
 # Poketwo id
 POKETWO_BOT_ID = 716390085896962058
+
+# Metrics: set METRICS_PORT to serve Prometheus metrics on http://METRICS_HOST:METRICS_PORT/metrics
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+
+# Loop watchdog: stalls of the event loop longer than this (seconds) are traced, see m!perf.
+# asyncio debug mode additionally times every callback but costs CPU, keep it off normally.
+WATCHDOG_STALL_THRESHOLD = float(os.getenv("WATCHDOG_STALL_THRESHOLD", "0.25"))
+WATCHDOG_ASYNCIO_DEBUG = os.getenv("WATCHDOG_ASYNCIO_DEBUG", "").lower() in ("1", "true", "yes")
+
+# m!profile writes .pstats files here
+PROFILE_OUTPUT_DIR = os.getenv("PROFILE_OUTPUT_DIR", "profiles")
+
+# Leaderboards: dirty per-user summaries are recomputed and boards rebuilt every N minutes,
+# m!leaderboard reads a cached copy of the stored board for up to LEADERBOARD_CACHE_TTL seconds
+LEADERBOARD_REFRESH_MINUTES = float(os.getenv("LEADERBOARD_REFRESH_MINUTES", "10"))
+LEADERBOARD_CACHE_TTL = 300
+LEADERBOARD_SIZE = 100
+
+# Image resources: fonts, backgrounds and gender symbols downloaded from GitHub at startup.
+# Image commands wait up to RESOURCE_READY_TIMEOUT seconds for the first download run.
+RESOURCES_DIR = "shinystats"
+RESOURCES_GITHUB_REPO = "cynthiaofpower/meowthfonts"
+RESOURCES_GITHUB_BRANCH = "main"
+RESOURCE_DOWNLOAD_CONCURRENCY = 4
+RESOURCE_READY_TIMEOUT = 15
+
+# List tools: .txt attachments are streamed, larger files are rejected
+LIST_FILE_MAX_BYTES = 8 * 1024 * 1024
+LIST_FILE_MAX_LINES = 200_000
 # Add this to config.py
 
 # Pokemon with visible gender differences that should be tracked separately in full dex
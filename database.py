@@ -3,6 +3,12 @@ from datetime import datetime, timedelta
 import re
 import config
 
+# Indexes from older versions whose queries are now served by a compound index
+REDUNDANT_POKEMON_INDEXES = ("user_id_idx", "categories_idx", "dex_number_idx", "user_category_gender")
+REDUNDANT_SHINY_INDEXES = ("shiny_user_id", "shiny_dex_number", "shiny_user_name")
+REDUNDANT_EVENT_SHINY_INDEXES = ("event_shiny_user_id",)
+
+
 class Database:
     def __init__(self):
         self.client = None
@@ -12,6 +18,9 @@ class Database:
         self.user_data = None  # NEW: Consolidated user data (settings + cooldowns + id_overrides)
         self.shinies = None
         self.event_shinies = None
+        self.sessions = None  # Short-lived command sessions (createlist, track)
+        self.shiny_summaries = None  # Per-user shiny totals for leaderboards
+        self.leaderboards = None  # Ranked boards computed from the summaries
 
     @staticmethod
     def clean_pokemon_name(name: str) -> str:
@@ -36,14 +45,19 @@ class Database:
         self.user_data = self.db['user_data']
         self.shinies = self.db['shinies']
         self.event_shinies = self.db['event_shinies']
+        self.sessions = self.db['sessions']
+        self.shiny_summaries = self.db['shiny_summaries']
+        self.leaderboards = self.db['leaderboards']
 
         # ===== CREATE OPTIMIZED INDEXES =====
 
         # Pokemon collection - compound indexes for common queries
+        # Breeding: user + category + gender equality, already in IV order (no in-memory sort).
+        # categories and egg_groups are arrays, so no index can cover the breeding projection.
         await self._create_index_safe(
             self.pokemon,
-            [("user_id", 1), ("categories", 1), ("gender", 1)],
-            name="user_category_gender"
+            [("user_id", 1), ("categories", 1), ("gender", 1), ("iv_percent", -1)],
+            name="user_category_gender_iv"
         )
 
         await self._create_index_safe(
@@ -52,6 +66,7 @@ class Database:
             name="user_category_iv"
         )
 
+        # Also serves every user_id-only query (counts are covered)
         await self._create_index_safe(
             self.pokemon,
             [("user_id", 1), ("pokemon_id", 1)],
@@ -59,25 +74,6 @@ class Database:
             name="user_pokemon_unique"
         )
 
-        # Additional indexes for filtering
-        await self._create_index_safe(
-            self.pokemon,
-            "user_id",
-            name="user_id_idx"
-        )
-
-        await self._create_index_safe(
-            self.pokemon,
-            "categories",
-            name="categories_idx"
-        )
-
-        await self._create_index_safe(
-            self.pokemon,
-            "dex_number",
-            name="dex_number_idx"
-        )
-
         # Partial indexes for special types
         await self._create_index_safe(
             self.pokemon,
@@ -108,20 +104,11 @@ class Database:
             unique=True,
             name="shiny_user_pokemon"
         )
+        # Covers the leaderboard's per-user $group on name/gender/dex_number
         await self._create_index_safe(
             self.shinies,
-            "user_id",
-            name="shiny_user_id"
-        )
-        await self._create_index_safe(
-            self.shinies,
-            "dex_number",
-            name="shiny_dex_number"
-        )
-        await self._create_index_safe(
-            self.shinies,
-            [("user_id", 1), ("name", 1)],
-            name="shiny_user_name"
+            [("user_id", 1), ("name", 1), ("gender", 1), ("dex_number", 1)],
+            name="shiny_user_name_gender_dex"
         )
         await self._create_index_safe(
             self.shinies,
@@ -138,14 +125,56 @@ class Database:
         )
         await self._create_index_safe(
             self.event_shinies,
+            [("user_id", 1), ("name", 1)],
+            name="event_shiny_user_name"
+        )
+
+        # Sessions: one document per (kind, key), removed by MongoDB once expired
+        await self._create_index_safe(
+            self.sessions,
+            [("kind", 1), ("key", 1)],
+            unique=True,
+            name="session_kind_key"
+        )
+        await self._create_index_safe(
+            self.sessions,
+            "expires_at",
+            expireAfterSeconds=0,
+            name="session_ttl"
+        )
+
+        # Shiny summaries: one per user, dirty ones are picked up by the leaderboard job
+        await self._create_index_safe(
+            self.shiny_summaries,
             "user_id",
-            name="event_shiny_user_id"
+            unique=True,
+            name="summary_user_id"
         )
         await self._create_index_safe(
-            self.event_shinies,
-            [("user_id", 1), ("name", 1)],
-            name="event_shiny_user_name"
+            self.shiny_summaries,
+            "dirty_at",
+            partialFilterExpression={"dirty_at": {"$exists": True}},
+            name="summary_dirty_partial"
         )
+        for field in ("total_shinies", "basic_caught", "full_caught", "rare_shinies"):
+            await self._create_index_safe(
+                self.shiny_summaries,
+                [(field, -1)],
+                name=f"summary_{field}"
+            )
+
+        # Leaderboards are keyed by board (_id) and removed by MongoDB once stale
+        await self._create_index_safe(
+            self.leaderboards,
+            "expires_at",
+            expireAfterSeconds=0,
+            name="leaderboard_ttl"
+        )
+
+        # Indexes that only added write cost: each one is a prefix of (or replaced by) a compound above
+        await self._drop_indexes_safe(self.pokemon, REDUNDANT_POKEMON_INDEXES)
+        await self._drop_indexes_safe(self.shinies, REDUNDANT_SHINY_INDEXES)
+        await self._drop_indexes_safe(self.event_shinies, REDUNDANT_EVENT_SHINY_INDEXES)
 
         print("✅ Connected to MongoDB with optimized indexes")
 
@@ -159,6 +188,63 @@ class Database:
             if "already exists" not in str(e).lower():
                 print(f"⚠️  Index creation warning: {e}")
 
+    async def _drop_indexes_safe(self, collection, names):
+        """Drop indexes left over from older versions, if present"""
+        try:
+            existing = await collection.index_information()
+        except Exception as e:
+            print(f"⚠️  Could not list indexes: {e}")
+            return
+        for name in names:
+            if name not in existing:
+                continue
+            try:
+                await collection.drop_index(name)
+                print(f"🗑️ Dropped redundant index: {name}")
+            except Exception as e:
+                print(f"⚠️  Index drop warning: {e}")
+
+    async def _bulk_upsert(self, collection, operations: list, label: str) -> int:
+        """
+        Run upsert operations as one unordered bulk_write, returning how many documents were created
+        Two tracking sessions adding the same new Pokemon can race on the unique
+        (user_id, pokemon_id) index; the losing upserts are retried once, when they
+        match the winner's document and turn into plain updates.
+        """
+        from pymongo.errors import BulkWriteError
+
+        created = 0
+        for attempt in range(2):
+            try:
+                result = await collection.bulk_write(operations, ordered=False)
+                return created + result.upserted_count
+            except BulkWriteError as e:
+                created += e.details.get('nUpserted', 0)
+                errors = e.details.get('writeErrors', [])
+                retry = [operations[error['index']] for error in errors if error.get('code') == 11000]
+                if len(retry) < len(errors):
+                    failed = next(error for error in errors if error.get('code') != 11000)
+                    print(f"Bulk {label} write error: {failed.get('errmsg')}")
+                if not retry or attempt:
+                    return created
+                operations = retry
+            except Exception as e:
+                print(f"Bulk {label} write error: {e}")
+                return created
+        return created
+
+    @staticmethod
+    def _shiny_upsert(user_id: int, shiny: dict, detail_fields: tuple):
+        """Upsert for one tracked shiny: details are always refreshed, other fields only set on insert"""
+        from pymongo import UpdateOne
+
+        details = {field: shiny[field] for field in detail_fields}
+        extra = {k: v for k, v in shiny.items() if k not in details and k not in ('user_id', 'pokemon_id')}
+        update = {"$set": details}
+        if extra:
+            update["$setOnInsert"] = extra
+        return UpdateOne({"user_id": user_id, "pokemon_id": shiny['pokemon_id']}, update, upsert=True)
+
     # ========================================
     # POKEMON OPERATIONS (BREEDING BOT)
     # ========================================
@@ -170,6 +256,16 @@ class Database:
         OPTIMIZED: Get Pokemon for breeding with all filters in single query
         Returns only necessary fields, excludes cooldowns at query level
         """
+        query, projection = self.breeding_query(user_id, category, gender, is_gmax, is_regional, cooldown_ids)
+
+        # Sort by IV descending (use index)
+        cursor = self.pokemon.find(query, projection).sort("iv_percent", -1)
+        return await cursor.to_list(length=None)
+
+    @staticmethod
+    def breeding_query(user_id: int, category: str, gender: str = None, is_gmax: bool = None,
+                       is_regional: bool = None, cooldown_ids: set = None):
+        """(filter, projection) of get_pokemon_for_breeding, also used by bench/check_indexes.py"""
         query = {
             "user_id": user_id,
             "categories": category
@@ -190,6 +286,7 @@ class Database:
 
         # Project only needed fields (reduces network transfer)
         projection = {
+            "_id": 0,
             "pokemon_id": 1,
             "name": 1,
             "gender": 1,
@@ -201,10 +298,7 @@ class Database:
             "is_regional": 1,
             "is_ditto": 1
         }
-
-        # Sort by IV descending (use index)
-        cursor = self.pokemon.find(query, projection).sort("iv_percent", -1)
-        return await cursor.to_list(length=None)
+        return query, projection
 
     async def get_pokemon_by_ids_bulk(self, user_id: int, pokemon_ids: list):
         """
@@ -259,31 +353,17 @@ class Database:
 
     async def add_pokemon_bulk(self, user_id: int, pokemon_list: list, category: str = "normal"):
         """
-        OPTIMIZED: Add multiple Pokemon using true bulk operations
-        Uses bulk_write for maximum performance
+        Add multiple Pokemon in one unordered bulk_write of upserts
+        New Pokemon are inserted with the category, existing ones get the category added.
+        Returns the number of new Pokemon.
         """
         if not pokemon_list:
             return 0
 
-        from pymongo import UpdateOne, InsertOne
-
-        pokemon_ids = [p['pokemon_id'] for p in pokemon_list]
+        from pymongo import UpdateOne
 
-        # Single query to find all existing Pokemon
-        existing_ids = set()
-        async for doc in self.pokemon.find(
-            {"user_id": user_id, "pokemon_id": {"$in": pokemon_ids}},
-            {"pokemon_id": 1}  # Only fetch pokemon_id field
-        ):
-            existing_ids.add(doc['pokemon_id'])
-
-        # Build bulk operations
         operations = []
-        new_count = 0
-
         for pokemon in pokemon_list:
-            pid = pokemon['pokemon_id']
-
             # Ensure required fields
             pokemon.setdefault('dex_number', 0)
             pokemon.setdefault('egg_groups', [])
@@ -292,30 +372,15 @@ class Database:
             pokemon.setdefault('is_regional', False)
             pokemon.setdefault('base_species', '')
 
-            if pid not in existing_ids:
-                # New Pokemon - insert
-                pokemon['user_id'] = user_id
-                pokemon['categories'] = [category]
-                operations.append(InsertOne(pokemon))
-                new_count += 1
-            else:
-                # Existing - add category
-                operations.append(UpdateOne(
-                    {"user_id": user_id, "pokemon_id": pid},
-                    {"$addToSet": {"categories": category}}
-                ))
-
-        if operations:
-            try:
-                await self.pokemon.bulk_write(operations, ordered=False)
-            except Exception as e:
-                if "duplicate key" in str(e).lower():
-                    # Some succeeded, count them
-                    pass
-                else:
-                    print(f"Bulk operation error: {e}")
+            # Fields are only written on insert; an existing Pokemon just gains the category
+            fields = {k: v for k, v in pokemon.items() if k not in ('user_id', 'pokemon_id', 'categories')}
+            operations.append(UpdateOne(
+                {"user_id": user_id, "pokemon_id": pokemon['pokemon_id']},
+                {"$setOnInsert": fields, "$addToSet": {"categories": category}},
+                upsert=True
+            ))
 
-        return new_count
+        return await self._bulk_upsert(self.pokemon, operations, "Pokemon")
 
     async def remove_pokemon(self, user_id: int, pokemon_ids: list, category: str = None):
         """Remove Pokemon by IDs. If category specified, only remove from that category"""
@@ -729,11 +794,13 @@ class Database:
                         }
                     }
                 )
+                await self.mark_summary_dirty(user_id)
                 return False
             else:
                 # Insert new
                 shiny_data['user_id'] = user_id
                 await self.shinies.insert_one(shiny_data)
+                await self.mark_summary_dirty(user_id)
                 return True
 
         except Exception as e:
@@ -741,72 +808,24 @@ class Database:
             return False
 
     async def add_shinies_bulk(self, user_id: int, shinies_list: list):
-        """Add multiple shinies using bulk operations"""
+        """
+        Add multiple shinies in one unordered bulk_write of upserts
+        New shinies are inserted, existing ones get their details updated.
+        Returns the number of new shinies.
+        """
         if not shinies_list:
             return 0
 
-        # Clean all names first
+        operations = []
         for shiny in shinies_list:
             if 'name' in shiny:
                 shiny['name'] = self.clean_pokemon_name(shiny['name'])
+            operations.append(self._shiny_upsert(
+                user_id, shiny, ('name', 'gender', 'level', 'iv_percent', 'dex_number')
+            ))
 
-        shiny_ids = [s['pokemon_id'] for s in shinies_list]
-
-        # Find existing shinies
-        existing_docs = await self.shinies.find(
-            {"user_id": user_id, "pokemon_id": {"$in": shiny_ids}},
-            {"pokemon_id": 1}
-        ).to_list(length=None)
-
-        existing_ids = {doc['pokemon_id'] for doc in existing_docs}
-
-        new_shinies = []
-        update_operations = []
-
-        for shiny in shinies_list:
-            pid = shiny['pokemon_id']
-
-            if pid not in existing_ids:
-                # New shiny
-                shiny['user_id'] = user_id
-                new_shinies.append(shiny)
-            else:
-                # Existing - update
-                update_operations.append({
-                    'filter': {'user_id': user_id, 'pokemon_id': pid},
-                    'update': {
-                        '$set': {
-                            'name': shiny['name'],
-                            'gender': shiny['gender'],
-                            'level': shiny['level'],
-                            'iv_percent': shiny['iv_percent'],
-                            'dex_number': shiny['dex_number']
-                        }
-                    }
-                })
-
-        new_count = 0
-
-        # Bulk insert new shinies
-        if new_shinies:
-            try:
-                result = await self.shinies.insert_many(new_shinies, ordered=False)
-                new_count = len(result.inserted_ids)
-            except Exception as e:
-                if "duplicate key" in str(e).lower():
-                    new_count = len(new_shinies)
-                else:
-                    print(f"Bulk insert shiny error: {e}")
-
-        # Bulk update existing shinies
-        if update_operations:
-            from pymongo import UpdateOne
-            bulk_ops = [UpdateOne(op['filter'], op['update']) for op in update_operations]
-            try:
-                await self.shinies.bulk_write(bulk_ops, ordered=False)
-            except Exception as e:
-                print(f"Bulk update shiny error: {e}")
-
+        new_count = await self._bulk_upsert(self.shinies, operations, "shiny")
+        await self.mark_summary_dirty(user_id)
         return new_count
 
     async def remove_shinies(self, user_id: int, pokemon_ids: list):
@@ -815,11 +834,15 @@ class Database:
             "user_id": user_id,
             "pokemon_id": {"$in": pokemon_ids}
         })
+        if result.deleted_count:
+            await self.mark_summary_dirty(user_id)
         return result.deleted_count
 
     async def clear_all_shinies(self, user_id: int):
         """Clear all shinies for a user"""
         result = await self.shinies.delete_many({"user_id": user_id})
+        if result.deleted_count:
+            await self.mark_summary_dirty(user_id)
         return result.deleted_count
 
     async def get_all_shinies(self, user_id: int):
@@ -847,6 +870,105 @@ class Database:
         })
         return await cursor.to_list(length=None)
 
+    # ========================================
+    # SHINY SUMMARY / LEADERBOARD OPERATIONS
+    # ========================================
+
+    async def mark_summary_dirty(self, user_id: int):
+        """Flag a user's shiny summary for recomputation by the leaderboard job"""
+        await self.shiny_summaries.update_one(
+            {"user_id": user_id},
+            {"$set": {"dirty_at": datetime.utcnow()}},
+            upsert=True
+        )
+
+    async def mark_missing_summaries_dirty(self):
+        """Create dirty summaries for users who have shinies but no summary yet (first run backfill)"""
+        user_ids = await self.shinies.distinct("user_id")
+        known = {doc['user_id'] for doc in await self.shiny_summaries.find(
+            {}, {"_id": 0, "user_id": 1}
+        ).to_list(length=None)}
+        missing = [user_id for user_id in user_ids if user_id not in known]
+        for user_id in missing:
+            await self.mark_summary_dirty(user_id)
+        return len(missing)
+
+    async def get_dirty_summaries(self, limit: int, marked_before: datetime):
+        """(user_id, dirty_at) for summaries marked for recomputation up to marked_before"""
+        cursor = self.shiny_summaries.find(
+            {"dirty_at": {"$exists": True, "$lte": marked_before}},
+            {"_id": 0, "user_id": 1, "dirty_at": 1}
+        ).limit(limit)
+        return [(doc['user_id'], doc['dirty_at']) for doc in await cursor.to_list(length=None)]
+
+    @staticmethod
+    def shiny_groups_pipeline(user_id: int) -> list:
+        """Per-user $group on indexed fields only, so shiny_user_name_gender_dex covers it"""
+        return [
+            {"$match": {"user_id": user_id}},
+            {"$group": {
+                "_id": {"name": "$name", "gender": "$gender", "dex_number": "$dex_number"},
+                "count": {"$sum": 1}
+            }}
+        ]
+
+    async def aggregate_shiny_groups(self, user_id: int):
+        """(name, gender, dex_number, count) for each distinct kind of shiny a user has"""
+        cursor = self.shinies.aggregate(self.shiny_groups_pipeline(user_id))
+        return [
+            (doc['_id'].get('name'), doc['_id'].get('gender'), doc['_id'].get('dex_number'), doc['count'])
+            for doc in await cursor.to_list(length=None)
+        ]
+
+    async def save_shiny_summary(self, user_id: int, summary: dict, dirty_at: datetime):
+        """Store a recomputed summary; it stays dirty if the user's shinies changed meanwhile"""
+        await self.shiny_summaries.update_one(
+            {"user_id": user_id},
+            {"$set": {**summary, "updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+        await self.shiny_summaries.update_one(
+            {"user_id": user_id, "dirty_at": dirty_at},
+            {"$unset": {"dirty_at": ""}}
+        )
+
+    async def get_top_summaries(self, field: str, limit: int):
+        """(user_id, value) of the highest summaries by a (possibly nested) field"""
+        cursor = self.shiny_summaries.find(
+            {field: {"$gt": 0}},
+            {"_id": 0, "user_id": 1, field: 1}
+        ).sort(field, -1).limit(limit)
+        entries = []
+        for doc in await cursor.to_list(length=None):
+            value = doc
+            for part in field.split('.'):
+                value = value.get(part, 0) if isinstance(value, dict) else 0
+            entries.append((doc['user_id'], value))
+        return entries
+
+    async def get_summary_totals(self):
+        """Number of users with shinies and their total shinies"""
+        cursor = self.shiny_summaries.aggregate([
+            {"$match": {"total_shinies": {"$gt": 0}}},
+            {"$group": {"_id": None, "users": {"$sum": 1}, "shinies": {"$sum": "$total_shinies"}}}
+        ])
+        docs = await cursor.to_list(length=1)
+        if not docs:
+            return {"users": 0, "shinies": 0}
+        return {"users": docs[0]['users'], "shinies": docs[0]['shinies']}
+
+    async def save_leaderboard(self, key: str, document: dict, expires_at: datetime):
+        """Replace a computed board"""
+        await self.leaderboards.replace_one(
+            {"_id": key},
+            {**document, "expires_at": expires_at},
+            upsert=True
+        )
+
+    async def get_leaderboard(self, key: str):
+        """A computed board by key (one _id lookup)"""
+        return await self.leaderboards.find_one({"_id": key})
+
     # ========================================
     # EVENT SHINY OPERATIONS
     # ========================================
@@ -892,74 +1014,21 @@ class Database:
             return False
 
     async def add_event_shinies_bulk(self, user_id: int, shinies_list: list):
-        """Add multiple event shinies using bulk operations"""
+        """
+        Add multiple event shinies in one unordered bulk_write of upserts
+        New shinies are inserted, existing ones get their details updated.
+        Returns the number of new event shinies.
+        """
         if not shinies_list:
             return 0
 
-        # Clean all names first
+        operations = []
         for shiny in shinies_list:
             if 'name' in shiny:
                 shiny['name'] = self.clean_pokemon_name(shiny['name'])
+            operations.append(self._shiny_upsert(user_id, shiny, ('name', 'gender', 'level', 'iv_percent')))
 
-        # Extract all shiny IDs
-        shiny_ids = [s['pokemon_id'] for s in shinies_list]
-
-        # Find existing shinies
-        existing_docs = await self.event_shinies.find(
-            {"user_id": user_id, "pokemon_id": {"$in": shiny_ids}},
-            {"pokemon_id": 1}
-        ).to_list(length=None)
-
-        existing_ids = {doc['pokemon_id'] for doc in existing_docs}
-
-        # Separate into new vs existing
-        new_shinies = []
-        update_operations = []
-
-        for shiny in shinies_list:
-            pid = shiny['pokemon_id']
-
-            if pid not in existing_ids:
-                # Brand new shiny
-                shiny['user_id'] = user_id
-                new_shinies.append(shiny)
-            else:
-                # Existing - update it
-                update_operations.append({
-                    'filter': {'user_id': user_id, 'pokemon_id': pid},
-                    'update': {
-                        '$set': {
-                            'name': shiny['name'],
-                            'gender': shiny['gender'],
-                            'level': shiny['level'],
-                            'iv_percent': shiny['iv_percent']
-                        }
-                    }
-                })
-
-        new_count = 0
-
-        # Bulk insert new shinies
-        if new_shinies:
-            try:
-                result = await self.event_shinies.insert_many(new_shinies, ordered=False)
-                new_count = len(result.inserted_ids)
-            except Exception as e:
-                if "duplicate key" in str(e).lower():
-                    new_count = len(new_shinies)
-                else:
-                    print(f"Bulk insert event shiny error: {e}")
-
-        # Bulk update existing shinies
-        if update_operations:
-            from pymongo import UpdateOne
-            bulk_ops = [UpdateOne(op['filter'], op['update']) for op in update_operations]
-            try:
-                await self.event_shinies.bulk_write(bulk_ops, ordered=False)
-            except Exception as e:
-                print(f"Bulk update event shiny error: {e}")
-
-        return new_count
+        return await self._bulk_upsert(self.event_shinies, operations, "event shiny")
 
     async def remove_event_shinies(self, user_id: int, pokemon_ids: list):
         """Remove event shinies by IDs"""
@@ -991,6 +1060,44 @@ class Database:
         })
         return await cursor.to_list(length=None)
 
+    # ========================================
+    # SESSION OPERATIONS (CREATELIST / TRACK)
+    # ========================================
+
+    async def get_sessions(self, kind: str):
+        """Get all unexpired sessions of a kind"""
+        cursor = self.sessions.find(
+            {"kind": kind, "expires_at": {"$gt": datetime.utcnow()}},
+            {"_id": 0, "key": 1, "state": 1, "expires_at": 1}
+        )
+        return await cursor.to_list(length=None)
+
+    async def save_session(self, kind: str, key, state: dict, expires_at: datetime):
+        """Create or replace a session"""
+        await self.sessions.update_one(
+            {"kind": kind, "key": key},
+            {"$set": {"state": state, "expires_at": expires_at}},
+            upsert=True
+        )
+
+    async def update_session(self, kind: str, key, fields: dict, appended: dict, expires_at: datetime) -> bool:
+        """
+        Set some state fields and push items onto list fields of a stored session
+        Returns False if there is no such session
+        """
+        update = {"$set": {"expires_at": expires_at, **{f"state.{name}": value for name, value in fields.items()}}}
+        if appended:
+            update["$push"] = {f"state.{name}": {"$each": items} for name, items in appended.items()}
+        result = await self.sessions.update_one({"kind": kind, "key": key}, update)
+        return result.matched_count > 0
+
+    async def delete_sessions(self, kind: str, keys: list):
+        """Delete sessions by key"""
+        if not keys:
+            return 0
+        result = await self.sessions.delete_many({"kind": kind, "key": {"$in": keys}})
+        return result.deleted_count
+
     async def get_shiny_by_id(self, user_id: int, pokemon_id: int):
         """Get a specific shiny by pokemon_id"""
         return await self.shinies.find_one({
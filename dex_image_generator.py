@@ -2,6 +2,9 @@ from PIL import Image, ImageDraw, ImageFont, ImageColor
 import aiohttp
 from io import BytesIO
 import os
+import config
+from metrics import metrics
+from sprite_cache import sprite_cache
 
 
 # ============================================================================
@@ -78,27 +81,13 @@ class DexImageGenerator:
 
     def __init__(self, bot):
         self.bot = bot
-        self.fonts_folder = 'shinystats/fonts'
-        self.emojis_folder = 'shinystats/emojis'
-
-        # GitHub repository details
-        self.github_user = 'cynthiaofpower'
-        self.github_repo = 'meowthfonts'
-        self.github_branch = 'main'
-
-        # Gender symbol URLs
-        self.gender_symbols = {
-            'male': 'https://cdn.discordapp.com/emojis/1207734081585152101.png',
-            'female': 'https://cdn.discordapp.com/emojis/1207734084210532483.png'
-        }
+        # Downloaded at startup by the resource bootstrap (resources.py)
+        self.fonts_folder = os.path.join(config.RESOURCES_DIR, 'fonts')
+        self.emojis_folder = os.path.join(config.RESOURCES_DIR, 'emojis')
 
         # Load default settings
         self.default_settings = DEFAULT_SETTINGS.copy()
 
-        # Initialize font and emoji download on cog load
-        self.bot.loop.create_task(self.download_fonts())
-        self.bot.loop.create_task(self.download_gender_symbols())
-
     async def get_user_settings(self, user_id: int = None):
         """Get settings for a specific user, falling back to defaults
         Loads from database if user has custom settings
@@ -169,118 +158,6 @@ class DexImageGenerator:
 
         return settings
 
-    async def download_file_from_github(self, file_path: str, save_path: str):
-        """Download a single file from GitHub repository"""
-        url = f"https://raw.githubusercontent.com/{self.github_user}/{self.github_repo}/{self.github_branch}/{file_path}"
-
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as resp:
-                    if resp.status == 200:
-                        content = await resp.read()
-
-                        # Create directory if it doesn't exist
-                        os.makedirs(os.path.dirname(save_path), exist_ok=True)
-
-                        with open(save_path, 'wb') as f:
-                            f.write(content)
-                        print(f"✅ Downloaded: {file_path}")
-                        return True
-                    else:
-                        print(f"❌ Failed to download {file_path}: Status {resp.status}")
-                        return False
-        except Exception as e:
-            print(f"❌ Error downloading {file_path}: {e}")
-            return False
-
-    async def download_file_from_url(self, url: str, save_path: str):
-        """Download a file from a direct URL"""
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as resp:
-                    if resp.status == 200:
-                        content = await resp.read()
-
-                        # Create directory if it doesn't exist
-                        os.makedirs(os.path.dirname(save_path), exist_ok=True)
-
-                        with open(save_path, 'wb') as f:
-                            f.write(content)
-                        print(f"✅ Downloaded gender symbol: {os.path.basename(save_path)}")
-                        return True
-                    else:
-                        print(f"❌ Failed to download from {url}: Status {resp.status}")
-                        return False
-        except Exception as e:
-            print(f"❌ Error downloading from {url}: {e}")
-            return False
-
-    async def get_github_directory_contents(self, directory: str):
-        """Get list of files in a GitHub directory"""
-        url = f"https://api.github.com/repos/{self.github_user}/{self.github_repo}/contents/{directory}?ref={self.github_branch}"
-
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as resp:
-                    if resp.status == 200:
-                        contents = await resp.json()
-                        return [item['name'] for item in contents if item['type'] == 'file']
-                    else:
-                        print(f"❌ Failed to fetch directory contents: Status {resp.status}")
-                        return []
-        except Exception as e:
-            print(f"❌ Error fetching directory contents: {e}")
-            return []
-
-    async def download_fonts(self):
-        """Download all fonts from GitHub repository"""
-        print("📥 Downloading fonts for dex images from GitHub...")
-
-        # Create fonts directory
-        os.makedirs(self.fonts_folder, exist_ok=True)
-
-        # Get list of font files
-        font_files = await self.get_github_directory_contents('fonts')
-
-        if not font_files:
-            print("⚠️ No fonts found in repository")
-            return
-
-        # Download each font
-        for font_file in font_files:
-            if font_file.endswith('.ttf') or font_file.endswith('.otf'):
-                github_path = f"fonts/{font_file}"
-                local_path = os.path.join(self.fonts_folder, font_file)
-
-                # Skip if already exists
-                if os.path.exists(local_path):
-                    print(f"⏭️ Font already exists: {font_file}")
-                    continue
-
-                await self.download_file_from_github(github_path, local_path)
-
-        print("✅ Font download complete for dex images!")
-
-    async def download_gender_symbols(self):
-        """Download gender symbol images from Discord CDN"""
-        print("📥 Downloading gender symbols for dex images...")
-
-        # Create emojis directory
-        os.makedirs(self.emojis_folder, exist_ok=True)
-
-        # Download each gender symbol
-        for gender, url in self.gender_symbols.items():
-            local_path = os.path.join(self.emojis_folder, f"{gender}.png")
-
-            # Skip if already exists
-            if os.path.exists(local_path):
-                print(f"⏭️ Gender symbol already exists: {gender}.png")
-                continue
-
-            await self.download_file_from_url(url, local_path)
-
-        print("✅ Gender symbol download complete for dex images!")
-
     def load_gender_symbol(self, gender: str, settings: dict):
         """Load gender symbol from local file"""
         try:
@@ -302,11 +179,15 @@ class DexImageGenerator:
         else:
             url = f"https://cdn.poketwo.net/shiny/{cdn_number}.png"
 
+        data = sprite_cache.get(url)
+        if data is not None:
+            return Image.open(BytesIO(data)).convert('RGBA')
         async with aiohttp.ClientSession() as session:
             try:
                 async with session.get(url) as resp:
                     if resp.status == 200:
                         data = await resp.read()
+                        sprite_cache.put(url, data)
                         return Image.open(BytesIO(data)).convert('RGBA')
             except Exception as e:
                 print(f"Error fetching image for CDN {cdn_number} (gender: {gender_key}): {e}")
@@ -450,6 +331,7 @@ class DexImageGenerator:
 
         return main_text, filter_text, title_x, title_y, title_font, filter_font, header_x, header_w, page_text, page_font
 
+    @metrics.render_seconds.time(renderer='dex')
     async def create_dex_image(self, pokemon_entries: list, utils, header_info: dict = None, page_info: dict = None, user_id: int = None):
         """
         Create dex image with Pokemon sprites
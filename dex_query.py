@@ -0,0 +1,147 @@
+"""Precomputed filter index over a static dex: bitsets per attribute and a substring name table"""
+import unicodedata
+from bisect import bisect_right
+
+
+def normalize_string(s: str) -> str:
+    """Remove accents from string for comparison"""
+    return ''.join(c for c in unicodedata.normalize('NFD', s) if unicodedata.category(c) != 'Mn')
+
+
+def iter_bits(mask: int):
+    """Positions of the set bits of mask, lowest first"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class DexIndex:
+    """
+    Filter index over a fixed, ordered list of Pokemon names
+
+    Entry i is bit i of every mask (Python ints used as bitsets):
+    - by_type / by_region: entries with that type / region (entries without
+      region/type info are in none of them, same as the old per-entry check)
+    - rare / gender_diff: entries flagged rare / with gender differences
+    Names are normalized once (lowercase, no accents) and joined into one
+    string, so a substring search is a few str.find calls instead of
+    normalizing every name for every term. Term results are memoized.
+    """
+
+    _SEPARATOR = '\x00'
+    _MAX_CACHED_TERMS = 512
+
+    def __init__(self, names, pokemon_info: dict, rare_names=(), gender_diff=None):
+        self.names = tuple(names)
+        self.position = {name: i for i, name in enumerate(self.names)}
+        self.all = (1 << len(self.names)) - 1
+
+        self.by_type = {}
+        self.by_region = {}
+        self.rare = 0
+        self.gender_diff = 0
+        rare_names = set(rare_names)
+        gender_diff = gender_diff or ()
+
+        for i, name in enumerate(self.names):
+            bit = 1 << i
+            if name in rare_names:
+                self.rare |= bit
+            if name in gender_diff:
+                self.gender_diff |= bit
+
+            info = pokemon_info.get(name)
+            if not info:
+                continue
+            self.by_region[info['region']] = self.by_region.get(info['region'], 0) | bit
+            types = [info['type1']]
+            if info['type2']:
+                types.append(info['type2'])
+            for ptype in types:
+                self.by_type[ptype] = self.by_type.get(ptype, 0) | bit
+
+        # Substring table: normalized names joined, with each name's start offset
+        normalized = [normalize_string(name.lower()) for name in self.names]
+        self._blob = self._SEPARATOR.join(normalized)
+        self._starts = []
+        offset = 0
+        for name in normalized:
+            self._starts.append(offset)
+            offset += len(name) + 1
+        self._term_cache = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def name_mask(self, term: str) -> int:
+        """Entries whose normalized name contains the (normalized) term"""
+        term = normalize_string(term.lower())
+        mask = self._term_cache.get(term)
+        if mask is not None:
+            return mask
+
+        mask = 0
+        if not term:
+            mask = self.all
+        elif self._SEPARATOR not in term:
+            find = self._blob.find
+            pos = find(term)
+            while pos != -1:
+                index = bisect_right(self._starts, pos) - 1
+                mask |= 1 << index
+                # Continue after this name; one hit per entry is enough
+                next_start = self._starts[index + 1] if index + 1 < len(self._starts) else len(self._blob)
+                pos = find(term, next_start)
+
+        if len(self._term_cache) >= self._MAX_CACHED_TERMS:
+            self._term_cache.clear()
+        self._term_cache[term] = mask
+        return mask
+
+    def has_match(self, term: str) -> bool:
+        return self.name_mask(term) != 0
+
+    def query(self, region: str = None, types=(), names=(), exclude=(), rare: bool = None,
+              gender_diff: bool = None) -> int:
+        """
+        Mask of entries matching every given filter
+        names: any of the substrings; exclude: none of the substrings;
+        types: all of the types; rare/gender_diff: True/False to require/forbid the flag
+        """
+        mask = self.all
+        if region:
+            mask &= self.by_region.get(region, 0)
+        for ptype in types:
+            mask &= self.by_type.get(ptype, 0)
+        if names:
+            wanted = 0
+            for term in names:
+                wanted |= self.name_mask(term)
+            mask &= wanted
+        for term in exclude:
+            mask &= ~self.name_mask(term)
+        if rare is not None:
+            mask &= self.rare if rare else ~self.rare
+        if gender_diff is not None:
+            mask &= self.gender_diff if gender_diff else ~self.gender_diff
+        return mask & self.all
+
+    def mask_of(self, names) -> int:
+        """Mask of the given names (names not in the index are ignored)"""
+        position = self.position
+        mask = 0
+        for name in names:
+            i = position.get(name)
+            if i is not None:
+                mask |= 1 << i
+        return mask
+
+    def indices(self, mask: int):
+        """Entry positions in mask, in dex order"""
+        return iter_bits(mask)
+
+    def select(self, mask: int) -> frozenset:
+        """Names in mask"""
+        names = self.names
+        return frozenset(names[i] for i in iter_bits(mask))
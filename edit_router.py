@@ -0,0 +1,91 @@
+"""Routes message_edit events to the sessions monitoring the edited message"""
+import time
+
+
+class MessageEditRouter:
+    """
+    Single entry point for message_edit events, indexed by message ID
+
+    Sessions that watch a message (createlist sources, ?track lists and the
+    m!add / m!trackshiny / m!trackevent page ingestors) subscribe to its ID
+    with a handler and a TTL, instead of every cog listening to every edit
+    and every bot.wait_for check running against it. An edit of a message
+    nobody watches costs one dict lookup.
+
+    A subscription is identified by (message ID, key); subscribing again with
+    the same key replaces the handler and restarts the TTL. Expired
+    subscriptions are dropped when their message is edited and whenever a
+    subscription is added. Handlers must cope with their session having
+    ended in the meantime (they look it up and return).
+
+    Fed from on_raw_message_edit, which discord.py fires for every edit,
+    not only for messages still in its message cache (sessions restored
+    after a restart watch messages that are not). `after` is the updated
+    message the payload carries (discord.py 2.5+), `before` the cached
+    message when there is one, None otherwise.
+    """
+
+    def __init__(self):
+        self._subscriptions = {}  # message_id -> {key: (handler, expires_at)}
+        self.dispatched = 0
+        self.delivered = 0
+
+    def __len__(self):
+        return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def subscribe(self, message_id: int, key, handler, ttl: float):
+        """Call `await handler(before, after)` for edits of message_id during the next ttl seconds"""
+        self.purge()
+        self._subscriptions.setdefault(message_id, {})[key] = (handler, time.monotonic() + ttl)
+
+    def unsubscribe(self, message_id: int, key):
+        """Remove a subscription (no-op if missing)"""
+        subscriptions = self._subscriptions.get(message_id)
+        if subscriptions is None:
+            return
+        subscriptions.pop(key, None)
+        if not subscriptions:
+            del self._subscriptions[message_id]
+
+    def is_subscribed(self, message_id: int, key) -> bool:
+        entry = self._subscriptions.get(message_id, {}).get(key)
+        return entry is not None and entry[1] > time.monotonic()
+
+    async def dispatch_raw(self, payload) -> int:
+        """Hand a raw edit event to the subscribers of payload.message_id; returns how many handlers ran"""
+        self.dispatched += 1
+        subscriptions = self._subscriptions.get(payload.message_id)
+        if subscriptions is None:
+            return 0
+        before, after = payload.cached_message, payload.message
+
+        now = time.monotonic()
+        delivered = 0
+        for key, entry in list(subscriptions.items()):
+            handler, expires_at = entry
+            if expires_at <= now:
+                # Unless a handler above re-subscribed it meanwhile
+                if subscriptions.get(key) is entry:
+                    self.unsubscribe(after.id, key)
+                continue
+            try:
+                await handler(before, after)
+            except Exception as e:
+                print(f"❌ Error in message edit handler {key}: {e}")
+            delivered += 1
+        self.delivered += delivered
+        return delivered
+
+    def purge(self):
+        """Drop expired subscriptions"""
+        now = time.monotonic()
+        for message_id in list(self._subscriptions):
+            subscriptions = self._subscriptions[message_id]
+            for key in [k for k, (_, expires_at) in subscriptions.items() if expires_at <= now]:
+                del subscriptions[key]
+            if not subscriptions:
+                del self._subscriptions[message_id]
+
+
+# Shared instance; fed by on_raw_message_edit in main.py
+edit_router = MessageEditRouter()
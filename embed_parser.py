@@ -0,0 +1,87 @@
+"""Single-pass parser for Pokétwo list/shiny/marketplace embed lines"""
+import re
+from collections import namedtuple
+
+# One parsed embed line. Fields that are not present on the line are None.
+ParsedLine = namedtuple('ParsedLine', 'pokemon_id name gender level iv_percent is_shiny')
+
+# Everything on a list line in one match:
+#   **`12345`**　<:sprite:1> ✨ <:_:1242455099213877248> Charizard<:male:1>　•　Lvl. 14　•　85.48%
+# IDs may also be plain (Japanese-space layout): 12345　<:sprite:1> Pikachu<:female:1>　•　...
+LINE_PATTERN = re.compile(
+    r'(?:.*?`\s*(?P<id>\d+)\s*`|^[*`\s]*(?P<plain_id>\d+)[*`]*(?=\s|$))'
+    r'(?:[^>]*>\s*(?P<name>.+?)\s*<:(?P<gender>male|female|unknown):)?'
+    r'(?:.*?Lvl\.\s*(?P<level>\d+))?'
+    r'(?:.*?•\s*(?P<iv>[\d.]+)%)?'
+)
+
+GMAX_EMOJI = '<:_:1242455099213877248>'
+_EMOJI_PATTERN = re.compile(r'<a?:[^:]*:\d+>')
+
+
+def clean_name(raw_name: str) -> str:
+    """Strip emojis (Gigantamax, sparkles, custom) and collapse whitespace"""
+    if '<' in raw_name:
+        raw_name = _EMOJI_PATTERN.sub('', raw_name.replace(GMAX_EMOJI, ''))
+    if '✨' in raw_name:
+        raw_name = raw_name.replace('✨', '')
+    return ' '.join(raw_name.split())
+
+
+def parse_line(line: str):
+    """
+    Parse one embed line into a ParsedLine
+    Returns None if the line carries no Pokémon ID
+    """
+    m = LINE_PATTERN.match(line)
+    if not m:
+        return None
+
+    pokemon_id = m.group('id')
+    if pokemon_id is None:
+        # Plain IDs only count on real list layouts, not arbitrary text
+        if '　' not in line and '•' not in line:
+            return None
+        pokemon_id = m.group('plain_id')
+
+    name = gender = None
+    is_shiny = False
+    raw_name = m.group('name')
+    if raw_name is not None:
+        is_shiny = '✨' in raw_name
+        name = clean_name(raw_name)
+        gender = m.group('gender')
+
+    level = m.group('level')
+    iv = m.group('iv')
+    try:
+        iv = float(iv) if iv is not None else None
+    except ValueError:
+        iv = None
+
+    return ParsedLine(
+        int(pokemon_id),
+        name,
+        gender,
+        int(level) if level is not None else None,
+        iv,
+        is_shiny
+    )
+
+
+def parse_lines(description: str, marker: str = None):
+    """
+    Parse every line of an embed description
+    marker: optional substring a line must contain (e.g. '✨') - checked before the regex
+    """
+    if not description:
+        return []
+
+    records = []
+    for line in description.strip().split('\n'):
+        if marker and marker not in line:
+            continue
+        record = parse_line(line)
+        if record is not None:
+            records.append(record)
+    return records
@@ -1,5 +1,6 @@
 # Custom filters for shiny dex
 # Each filter is a list of Pokemon names (exact match with base species names or forms)
+import re
 
 FILTERS = {
     "eevee": {
@@ -1001,10 +1002,68 @@ for key, data in FILTERS.items():
         for alias in data["aliases"]:
             ALIAS_MAP[alias.lower()] = key
 
+# Compiled member sets (bound to dex numbers and bitsets by the Utils cog once the CSVs are loaded)
+FILTER_MEMBERS = {key: frozenset(data["pokemon"]) for key, data in FILTERS.items()}
+
+
+class AliasTrie:
+    """Prefix trie over filter names and aliases, so partial names resolve"""
+
+    def __init__(self):
+        self.root = {}
+
+    def insert(self, alias: str, key: str):
+        node = self.root
+        for char in alias:
+            node = node.setdefault(char, {})
+        node[None] = key  # None marks the end of an alias
+
+    def get(self, alias: str):
+        """Filter key for an exact name/alias"""
+        node = self._walk(alias)
+        return node.get(None) if node else None
+
+    def complete(self, prefix: str) -> set:
+        """Filter keys of every alias starting with prefix"""
+        node = self._walk(prefix)
+        keys = set()
+        stack = [node] if node else []
+        while stack:
+            node = stack.pop()
+            for char, child in node.items():
+                if char is None:
+                    keys.add(child)
+                else:
+                    stack.append(child)
+        return keys
+
+    def _walk(self, prefix: str):
+        node = self.root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return None
+        return node
+
+
+ALIAS_TRIE = AliasTrie()
+for alias, key in ALIAS_MAP.items():
+    ALIAS_TRIE.insert(alias, key)
+
+
+def resolve_filter_key(filter_name, partial=True):
+    """Filter key for a name or alias; with partial, also an unambiguous prefix of one"""
+    name = filter_name.lower()
+    key = ALIAS_TRIE.get(name)
+    if key or not partial or not name:
+        return key
+    keys = ALIAS_TRIE.complete(name)
+    return keys.pop() if len(keys) == 1 else None
+
 
 def get_filter(filter_name):
-    """Get filter by name or alias (case-insensitive)"""
-    filter_key = ALIAS_MAP.get(filter_name.lower())
+    """Get filter by name, alias or unambiguous partial name (case-insensitive)"""
+    filter_key = resolve_filter_key(filter_name)
     if filter_key:
         return FILTERS.get(filter_key)
     return None
@@ -1013,3 +1072,87 @@ def get_filter(filter_name):
 def get_all_filter_names():
     """Get list of all available filter names (main keys only)"""
     return list(FILTERS.keys())
+
+
+# Filter expressions: "starters & kanto - caught", "(eevee | starters) - caught"
+# & (intersection) binds tighter than | / + (union) and - (difference), which apply left to right.
+# "-" is only an operator on its own, since filter names contain dashes.
+
+class FilterExpressionError(ValueError):
+    pass
+
+
+_EXPRESSION_TOKEN = re.compile(r'[&|+()]|[^\s&|+()]+')
+_OPERATORS = {'&', '|', '+', '-', '(', ')'}
+
+
+def is_filter_expression(text: str) -> bool:
+    """Whether text combines several operands (rather than naming a single filter)"""
+    return any(token in _OPERATORS for token in _EXPRESSION_TOKEN.findall(text))
+
+
+def parse_filter_expression(text: str):
+    """
+    Parse a filter expression into a tree of ('name', word) leaves and (op, left, right) nodes
+    Raises FilterExpressionError on malformed input.
+    """
+    tokens = _EXPRESSION_TOKEN.findall(text.lower())
+    if not tokens:
+        raise FilterExpressionError("Empty filter expression")
+    position = 0
+
+    def peek():
+        return tokens[position] if position < len(tokens) else None
+
+    def take():
+        nonlocal position
+        position += 1
+        return tokens[position - 1]
+
+    def atom():
+        token = peek()
+        if token is None:
+            raise FilterExpressionError("Filter expression ends unexpectedly")
+        if token == '(':
+            take()
+            node = expression()
+            if peek() != ')':
+                raise FilterExpressionError("Missing `)` in filter expression")
+            take()
+            return node
+        if token in _OPERATORS:
+            raise FilterExpressionError(f"Unexpected `{token}` in filter expression")
+        return ('name', take())
+
+    def term():
+        node = atom()
+        while peek() == '&':
+            take()
+            node = ('&', node, atom())
+        return node
+
+    def expression():
+        node = term()
+        while peek() in ('|', '+', '-'):
+            op = '-' if take() == '-' else '|'
+            node = (op, node, term())
+        return node
+
+    tree = expression()
+    if position != len(tokens):
+        raise FilterExpressionError(f"Unexpected `{tokens[position]}` in filter expression")
+    return tree
+
+
+def evaluate_filter_expression(tree, resolve, universe: int) -> int:
+    """Evaluate a parsed expression to a bitmask; resolve(word) returns the mask for one operand"""
+    if tree[0] == 'name':
+        return resolve(tree[1])
+    op, left, right = tree
+    left = evaluate_filter_expression(left, resolve, universe)
+    right = evaluate_filter_expression(right, resolve, universe)
+    if op == '&':
+        return left & right
+    if op == '|':
+        return left | right
+    return left & ~right & universe
@@ -0,0 +1,193 @@
+"""Cross-user shiny leaderboards from precomputed per-user summary documents"""
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+# Board key -> (summary field, title)
+BOARDS = {
+    'total': ('total_shinies', "Total Shinies"),
+    'basic': ('basic_caught', "Basic Dex Completion"),
+    'full': ('full_caught', "Full Dex Completion"),
+    'rare': ('rare_shinies', "Rare Shinies"),
+}
+REGION_BOARD_PREFIX = 'region:'
+
+
+def region_board(region: str) -> str:
+    return f"{REGION_BOARD_PREFIX}{region}"
+
+
+def summarize_shinies(groups, basic_entries, full_entries, pokemon_info: dict, rare_names) -> dict:
+    """
+    Summary document fields for one user
+    groups: (name, gender, dex_number, count) per distinct shiny kind, as aggregated by the database
+    Completion follows the shiny dex commands: the basic dex counts dex numbers, the full dex
+    counts forms with gender difference forms counted once per gender.
+    """
+    gender_diff_names = {name for _, name, has_gender_diff in full_entries if has_gender_diff}
+
+    total = 0
+    rare = 0
+    caught_dex = set()
+    caught_forms = set()
+    for name, gender, dex_num, count in groups:
+        total += count
+        if name in rare_names:
+            rare += count
+        caught_dex.add(dex_num)
+        if name in gender_diff_names and gender in ('male', 'female'):
+            caught_forms.add((dex_num, name, gender))
+        else:
+            caught_forms.add((dex_num, name, None))
+
+    full_caught = 0
+    regions = {}
+    for dex_num, name, has_gender_diff in full_entries:
+        if has_gender_diff:
+            caught = ((dex_num, name, 'male') in caught_forms) + ((dex_num, name, 'female') in caught_forms)
+        else:
+            caught = int((dex_num, name, None) in caught_forms)
+        if not caught:
+            continue
+        full_caught += caught
+        info = pokemon_info.get(name)
+        if info:
+            regions[info['region']] = regions.get(info['region'], 0) + caught
+
+    return {
+        'total_shinies': total,
+        'rare_shinies': rare,
+        'basic_caught': sum(1 for dex_num, _ in basic_entries if dex_num in caught_dex),
+        'full_caught': full_caught,
+        'regions': regions,
+    }
+
+
+class LeaderboardService:
+    """
+    Keeps per-user shiny summaries and the ranked boards up to date
+
+    Every shiny write marks the user's summary dirty (database.mark_summary_dirty).
+    A background job recomputes only the dirty summaries from a per-user
+    aggregation, then ranks each board with one sorted query over the
+    summaries and stores the result as a single leaderboard document.
+    Reads go to an in-memory copy with a TTL, falling back to that one
+    document by _id.
+
+    utils provides get_basic_dex_entries / get_full_dex_entries /
+    get_forms_by_region and the pokemon_info mapping (the Utils cog).
+    """
+
+    def __init__(self, db, utils, rare_names, refresh_interval: float = 600, cache_ttl: float = 300,
+                 size: int = 100, batch_size: int = 200):
+        self.db = db
+        self.utils = utils
+        self.rare_names = rare_names
+        self.refresh_interval = refresh_interval
+        self.cache_ttl = cache_ttl
+        self.size = size
+        self.batch_size = batch_size
+
+        self.task = None
+        self.last_refresh = None
+        self._cache = {}  # board key -> (expires monotonic, document)
+        self._refresh_lock = asyncio.Lock()
+        self._backfilled = False
+
+    def boards(self) -> dict:
+        """Board key -> (summary field, title), including one board per region"""
+        boards = dict(BOARDS)
+        for region in self.utils.get_forms_by_region():
+            if region:
+                boards[region_board(region)] = (f"regions.{region}", f"{region} Completion")
+        return boards
+
+    def start(self):
+        """Start the periodic refresh job (safe to call more than once)"""
+        if self.task and not self.task.done():
+            return
+        self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ Leaderboard refresh failed: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+    async def refresh(self):
+        """Recompute dirty summaries, then rebuild and store every board"""
+        async with self._refresh_lock:
+            start = time.perf_counter()
+            if not self._backfilled:
+                marked = await self.db.mark_missing_summaries_dirty()
+                self._backfilled = True
+                if marked:
+                    print(f"📊 Queued {marked} users without a shiny summary")
+
+            updated = await self.update_dirty_summaries()
+            await self.rebuild_boards()
+            self.last_refresh = datetime.utcnow()
+            print(f"📊 Leaderboards refreshed ({updated} summaries updated, {time.perf_counter() - start:.2f}s)")
+
+    async def update_dirty_summaries(self) -> int:
+        basic_entries = self.utils.get_basic_dex_entries()
+        full_entries = self.utils.get_full_dex_entries()
+        pokemon_info = self.utils.pokemon_info
+
+        # One pass: users marked again after this point wait for the next refresh, so
+        # steady shiny writes cannot keep the loop (and the refresh lock) going
+        cutoff = datetime.utcnow()
+        updated = 0
+        while True:
+            dirty = await self.db.get_dirty_summaries(self.batch_size, cutoff)
+            if not dirty:
+                return updated
+            for user_id, dirty_at in dirty:
+                groups = await self.db.aggregate_shiny_groups(user_id)
+                summary = summarize_shinies(groups, basic_entries, full_entries, pokemon_info, self.rare_names)
+                await self.db.save_shiny_summary(user_id, summary, dirty_at)
+                updated += 1
+            if len(dirty) < self.batch_size:
+                return updated
+            await asyncio.sleep(0)
+
+    async def rebuild_boards(self):
+        computed_at = datetime.utcnow()
+        # Stored boards outlive a few missed refreshes before MongoDB expires them
+        expires_at = computed_at + timedelta(seconds=max(self.refresh_interval * 3, self.cache_ttl))
+        totals = await self.db.get_summary_totals()
+
+        for key, (field, title) in self.boards().items():
+            entries = await self.db.get_top_summaries(field, self.size)
+            document = {
+                'title': title,
+                'entries': [{'user_id': user_id, 'value': value} for user_id, value in entries],
+                'users': totals['users'],
+                'shinies': totals['shinies'],
+                'computed_at': computed_at,
+            }
+            await self.db.save_leaderboard(key, document, expires_at)
+            self._cache[key] = (time.monotonic() + self.cache_ttl, document)
+
+    async def get(self, key: str):
+        """Stored board document, or None if it has not been computed yet"""
+        cached = self._cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        document = await self.db.get_leaderboard(key)
+        if document is not None:
+            self._cache[key] = (time.monotonic() + self.cache_ttl, document)
+        return document
@@ -0,0 +1,225 @@
+"""Chunk-diff reconciliation of multi-message Pokémon lists (createlist)"""
+import asyncio
+import zlib
+
+CHUNK_LIMIT = 1900
+# The list_data fields sync and publish write (everything about the messages, none of the names)
+LIST_SYNC_FIELDS = ('message_id', 'continuation_message_ids', 'chunk_ends', 'chunk_checksums', 'chunk_total')
+
+
+def split_chunks(names: list, limit: int = CHUNK_LIMIT, chunk_ends: list = None) -> list:
+    """
+    Greedy split of names into chunks that fit in a message, returned as end indices
+
+    Greedy packing only ever changes the last chunk when names are appended,
+    so previous boundaries (chunk_ends) are kept and only the tail from the
+    start of the last previous chunk is re-split.
+    """
+    start = 0
+    ends = []
+    if chunk_ends and chunk_ends[-1] <= len(names) and all(a < b for a, b in zip(chunk_ends, chunk_ends[1:])):
+        ends = list(chunk_ends[:-1])
+        start = ends[-1] if ends else 0
+
+    current_length = 0
+    chunk_start = start
+    for i in range(start, len(names)):
+        test_length = current_length + len(names[i]) + 2
+        if test_length > limit and i > chunk_start:
+            ends.append(i)
+            chunk_start = i
+            current_length = len(names[i])
+        else:
+            current_length = test_length
+
+    if len(names) > chunk_start or not ends:
+        ends.append(len(names))
+    return ends
+
+
+def chunk_header(part: int, total: int) -> str:
+    """Header line of a chunk's message; only the first one depends on the total"""
+    if part == 1:
+        return f"**Pokemon List ({total} total):**"
+    return f"**Pokemon List (continued - part {part}):**"
+
+
+def render_chunks(names: list, chunk_ends: list) -> list:
+    """Message contents for every chunk (first one carries the total)"""
+    contents = []
+    start = 0
+    for part, end in enumerate(chunk_ends, 1):
+        contents.append(f"{chunk_header(part, len(names))}\n{', '.join(names[start:end])}")
+        start = end
+    return contents
+
+
+def _checksum(content: str) -> int:
+    return zlib.crc32(content.encode('utf-8'))
+
+
+def _is_not_found(error: Exception) -> bool:
+    # discord.NotFound without importing discord here
+    return getattr(error, 'status', None) == 404
+
+
+class ListMessageSync:
+    """
+    Keeps a list's messages in sync with its names using as few REST calls as possible
+
+    - chunk boundaries and a checksum of each chunk's names are remembered in
+      the list state; an append only re-renders the chunks from the last one
+      on, and only messages whose content changed are edited (the main one
+      also when the total in its header changed)
+    - REST calls are spaced per channel (min_interval) so bursts of updates
+      don't run into rate limits
+    - updates for the same list are coalesced: while one sync is running,
+      further requests just mark the list dirty and the running sync does
+      one more pass with the latest names
+    """
+
+    def __init__(self, bot, limit: int = CHUNK_LIMIT, min_interval: float = 0.25):
+        self.bot = bot
+        self.limit = limit
+        self.min_interval = min_interval
+        self.calls = 0  # REST calls issued (send/edit/delete)
+
+        self._channel_locks = {}
+        self._next_slot = {}
+        self._running = set()
+        self._dirty = set()
+
+    async def sync(self, list_key, list_data: dict):
+        """
+        Reconcile the list's messages with list_data['pokemon']
+        list_data needs channel_id and message_id; continuation_message_ids,
+        chunk_ends, chunk_checksums and chunk_total are maintained here.
+        """
+        if list_key in self._running:
+            self._dirty.add(list_key)
+            return
+
+        self._running.add(list_key)
+        try:
+            while True:
+                self._dirty.discard(list_key)
+                await self._sync_once(list_data)
+                if list_key not in self._dirty:
+                    break
+        finally:
+            self._running.discard(list_key)
+            self._dirty.discard(list_key)
+
+    async def _sync_once(self, list_data: dict):
+        channel = self.bot.get_channel(list_data['channel_id'])
+        if not channel:
+            return
+
+        names = list_data['pokemon']
+        total = len(names)  # names may grow while this pass awaits its calls
+        previous_ends = list_data.get('chunk_ends') or []
+        previous = list_data.get('chunk_checksums') or []
+        chunk_ends = split_chunks(names, self.limit, previous_ends)
+
+        # Names are only appended: chunks before the last previous one kept their boundaries
+        # and content, so only the tail from there is rendered and checksummed again
+        first = len(previous_ends) - 1
+        if first < 0 or chunk_ends[:first] != previous_ends[:first] or len(previous) < first:
+            first = 0
+        bodies = {}
+        checksums = previous[:first]
+        for index in range(first, len(chunk_ends)):
+            start = chunk_ends[index - 1] if index else 0
+            bodies[index] = ", ".join(names[start:chunk_ends[index]])
+            checksums.append(_checksum(bodies[index]))
+
+        def content(index: int) -> str:
+            if index not in bodies:
+                start = chunk_ends[index - 1] if index else 0
+                bodies[index] = ", ".join(names[start:chunk_ends[index]])
+            return f"{chunk_header(index + 1, total)}\n{bodies[index]}"
+
+        def changed(index: int) -> bool:
+            return index >= len(previous) or previous[index] != checksums[index]
+
+        continuation_ids = list(list_data.get('continuation_message_ids', []))
+
+        # Main message: its body, or the total in its header
+        if changed(0) or list_data.get('chunk_total') != total:
+            main = channel.get_partial_message(list_data['message_id'])
+            try:
+                await self._call(channel, lambda: main.edit(content=content(0)))
+            except Exception as e:
+                if not _is_not_found(e):
+                    raise
+                # Main message was deleted, recreate everything
+                await self.publish(channel, list_data)
+                return
+
+        # Continuation messages: edit changed ones, send new ones
+        for index in range(max(first, 1), len(chunk_ends)):
+            text = content(index)
+            position = index - 1
+            if position < len(continuation_ids):
+                if not changed(index):
+                    continue
+                message = channel.get_partial_message(continuation_ids[position])
+                try:
+                    await self._call(channel, lambda: message.edit(content=text))
+                except Exception as e:
+                    if not _is_not_found(e):
+                        raise
+                    # Message was deleted, create new one
+                    new_msg = await self._call(channel, lambda: channel.send(text))
+                    continuation_ids[position] = new_msg.id
+            else:
+                new_msg = await self._call(channel, lambda: channel.send(text))
+                continuation_ids.append(new_msg.id)
+
+        # Delete extra continuation messages if the list got shorter
+        for msg_id in continuation_ids[len(chunk_ends) - 1:]:
+            try:
+                await self._call(channel, lambda: channel.get_partial_message(msg_id).delete())
+            except Exception:
+                pass
+
+        list_data['continuation_message_ids'] = continuation_ids[:len(chunk_ends) - 1]
+        list_data['chunk_ends'] = chunk_ends
+        list_data['chunk_checksums'] = checksums
+        list_data['chunk_total'] = total
+
+    async def publish(self, channel, list_data: dict):
+        """Send a list's messages from scratch (new list, or its main message is gone)"""
+        names = list_data['pokemon']
+        chunk_ends = split_chunks(names, self.limit)
+        contents = render_chunks(names, chunk_ends)
+
+        new_message = await self._call(channel, lambda: channel.send(contents[0]))
+        list_data['message_id'] = new_message.id
+
+        continuation_ids = []
+        for content in contents[1:]:
+            new_msg = await self._call(channel, lambda: channel.send(content))
+            continuation_ids.append(new_msg.id)
+        list_data['continuation_message_ids'] = continuation_ids
+        list_data['chunk_ends'] = chunk_ends
+        list_data['chunk_checksums'] = [_checksum(content.split('\n', 1)[1]) for content in contents]
+        list_data['chunk_total'] = len(names)
+
+    async def _call(self, channel, request):
+        """
+        Run one REST call, spaced at least min_interval after the previous one in this channel
+        request is a zero-argument callable returning the call's coroutine; it is only
+        created once the channel's turn comes, so a cancelled wait leaves nothing unawaited.
+        """
+        lock = self._channel_locks.setdefault(channel.id, asyncio.Lock())
+        async with lock:
+            loop = asyncio.get_running_loop()
+            wait = self._next_slot.get(channel.id, 0) - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                self.calls += 1
+                return await request()
+            finally:
+                self._next_slot[channel.id] = loop.time() + self.min_interval
@@ -0,0 +1,179 @@
+"""Pokémon name extraction from free text and streamed .txt attachments (createlist, compare)"""
+import codecs
+import re
+
+# Streamed files are processed in blocks of whole lines of about this many characters
+BLOCK_CHARS = 64 * 1024
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+_MARKDOWN_PATTERNS = [
+    (re.compile(r'\*\*\*(.+?)\*\*\*'), r'\1'),
+    (re.compile(r'\*\*(.+?)\*\*'), r'\1'),
+    (re.compile(r'\*(.+?)\*'), r'\1'),
+    (re.compile(r'__(.+?)__'), r'\1'),
+    (re.compile(r'_(.+?)_'), r'\1'),
+    (re.compile(r'~~(.+?)~~'), r'\1'),
+    (re.compile(r'`(.+?)`'), r'\1'),
+    (re.compile(r'```.*?```', re.DOTALL), ''),
+    (re.compile(r'\|\|(.+?)\|\|'), r'\1'),
+]
+
+
+class ListFileTooLarge(Exception):
+    """A .txt attachment went over the configured byte or line cap"""
+
+
+def normalize_pokemon_name(name: str) -> str:
+    """
+    Normalize Pokemon names for matching.
+    Handles special cases like Nidoran♂/♀ by keeping gender variants distinct.
+    """
+    if 'nidoran' in name.lower():
+        if '♂' in name:
+            return 'nidoran♂'
+        elif '♀' in name:
+            return 'nidoran♀'
+    return name.lower()
+
+
+def remove_markdown(text: str) -> str:
+    """Remove all markdown formatting from text"""
+    for pattern, replacement in _MARKDOWN_PATTERNS:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def pokemon_pattern(pokemon_name: str) -> str:
+    """Create a regex pattern for matching Pokemon names."""
+    escaped = re.escape(pokemon_name)
+
+    if pokemon_name.endswith('.'):
+        escaped = escaped[:-2] + r'\.?'
+
+    return r'\b' + escaped + r'(?=\W|$)'
+
+
+class PokemonNameExtractor:
+    """
+    Finds known Pokémon names in text
+
+    Longest names are matched first and a match may not overlap an earlier
+    one, so "Alolan Raichu" never also counts as "Raichu". Patterns are
+    compiled once here instead of on every call, and only run when the name
+    occurs in the text at all. `extract` can be called block by block with a
+    shared `found` set to process a long text as a stream; names are
+    reported once across all blocks.
+    """
+
+    def __init__(self, names: list):
+        self.names = names
+        # (normalized, lowercase needle for a cheap substring pre-check, compiled pattern)
+        self._patterns = [
+            (normalize_pokemon_name(name), name.lower().rstrip('.'),
+             re.compile(pokemon_pattern(name), re.IGNORECASE))
+            for name in sorted(names, key=len, reverse=True)
+        ]
+
+        # normalized -> original name (first one wins, as the old linear scan did)
+        self._originals = {}
+        for name in names:
+            self._originals.setdefault(normalize_pokemon_name(name), name)
+        if 'nidoran' in self._originals:
+            gendered = next((n for n in names if 'nidoran' in n.lower() and ('♂' in n or '♀' in n)), None)
+            if gendered:
+                self._originals['nidoran'] = gendered
+
+    def __bool__(self):
+        return bool(self.names)
+
+    def original_name(self, normalized_name: str) -> str:
+        return self._originals.get(normalized_name, normalized_name)
+
+    def extract(self, text: str, found: set = None) -> list:
+        """Names in text not already in found (a set of normalized names, updated in place)"""
+        if found is None:
+            found = set()
+
+        cleaned = remove_markdown(text)
+        lowered = cleaned.lower()
+        # lower() keeps positions for almost all text; otherwise let the regex scan everything
+        aligned = len(lowered) == len(cleaned)
+        pokemon_found = []
+        # Character positions already claimed by a longer name
+        claimed = bytearray(len(cleaned))
+
+        for normalized_pokemon, needle, pattern in self._patterns:
+            if needle not in lowered:
+                continue
+            matches = self._find(pattern, needle, cleaned, lowered) if aligned else pattern.finditer(cleaned)
+            for match in matches:
+                start, end = match.span()
+                if any(claimed[start:end]):
+                    continue
+
+                if normalized_pokemon not in found:
+                    pokemon_found.append(self.original_name(normalized_pokemon))
+                    found.add(normalized_pokemon)
+                claimed[start:end] = b'\x01' * (end - start)
+
+        return pokemon_found
+
+    @staticmethod
+    def _find(pattern, needle: str, cleaned: str, lowered: str):
+        """
+        Same matches as pattern.finditer(cleaned), but located with str.find
+        and only confirmed by the regex (word boundaries) where the name occurs
+        """
+        position = lowered.find(needle)
+        while position != -1:
+            match = pattern.match(cleaned, position)
+            if match:
+                yield match
+                position = lowered.find(needle, max(match.end(), position + 1))
+            else:
+                position = lowered.find(needle, position + 1)
+
+
+async def iter_text_blocks(chunks, max_bytes: int, max_lines: int, block_chars: int = BLOCK_CHARS):
+    """
+    Decode an async iterable of UTF-8 byte chunks into blocks of whole lines
+
+    Blocks never split a line (names can't straddle two blocks) or an open
+    ``` code block. Raises ListFileTooLarge as soon as max_bytes or max_lines
+    is exceeded and UnicodeDecodeError on invalid UTF-8.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    total_bytes = 0
+    total_lines = 0
+    pending = ''
+
+    async for chunk in chunks:
+        total_bytes += len(chunk)
+        if total_bytes > max_bytes:
+            raise ListFileTooLarge(f"File is larger than {max_bytes // (1024 * 1024)} MB")
+
+        text = decoder.decode(chunk)
+        total_lines += text.count('\n')
+        if total_lines > max_lines:
+            raise ListFileTooLarge(f"File has more than {max_lines:,} lines")
+
+        pending += text
+        if len(pending) < block_chars:
+            continue
+
+        cut = pending.rfind('\n') + 1
+        if cut and pending.count('```', 0, cut) % 2 == 0:
+            block, pending = pending[:cut], pending[cut:]
+            yield block
+
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield pending
+
+
+async def iter_attachment_chunks(attachment, session, chunk_size: int = DOWNLOAD_CHUNK_BYTES):
+    """Download an attachment in chunks (session: aiohttp.ClientSession)"""
+    async with session.get(attachment.url) as response:
+        response.raise_for_status()
+        async for chunk in response.content.iter_chunked(chunk_size):
+            yield chunk
@@ -0,0 +1,238 @@
+"""Event loop lag watchdog: finds the synchronous code that freezes the bot"""
+import asyncio
+import logging
+import os
+import re
+import statistics
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# "coro=<name() running at path:line>" in a Task repr
+_TASK_CORO = re.compile(r'coro=<([\w.<>]+)\(\) running at (.+?):(\d+)>')
+
+
+class Offender:
+    """One place that blocked the loop, aggregated over every stall it caused"""
+
+    __slots__ = ('location', 'kind', 'count', 'total', 'max', 'last_seen', 'stack')
+
+    def __init__(self, location: str, kind: str):
+        self.location = location
+        self.kind = kind  # 'stall' (stack snapshot) or 'callback' (asyncio debug)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last_seen = 0.0
+        self.stack = ''
+
+    def record(self, duration: float, stack: str = None):
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.last_seen = time.time()
+        if stack:
+            self.stack = stack
+
+
+class _SlowCallbackHandler(logging.Handler):
+    """Collects asyncio debug-mode 'Executing <Handle ...> took N seconds' warnings"""
+
+    def __init__(self, watchdog):
+        super().__init__(logging.WARNING)
+        self.watchdog = watchdog
+
+    def emit(self, record):
+        if record.msg != 'Executing %s took %.3f seconds' or len(record.args or ()) != 2:
+            return
+        handle, duration = record.args
+        self.watchdog.record_offender(_describe_handle(handle), 'callback', duration)
+
+
+def _describe_handle(handle) -> str:
+    """Short name for the formatted Handle/Task asyncio logs: the coroutine it was running"""
+    match = _TASK_CORO.search(str(handle))
+    if match:
+        name, path, lineno = match.groups()
+        return f"{_relative(path)}:{lineno} {name}"
+    return str(handle)[:120]
+
+
+def _relative(path: str) -> str:
+    if path.startswith(PROJECT_ROOT):
+        return os.path.relpath(path, PROJECT_ROOT)
+    return os.path.basename(path)
+
+
+class LoopWatchdog:
+    """
+    Samples event loop lag and snapshots whatever is blocking the loop
+
+    - a heartbeat task on the loop wakes up every `interval` and records how
+      late it ran (the loop lag)
+    - a watcher thread notices when the heartbeat is overdue by more than
+      `threshold` and captures the loop thread's stack right then, while the
+      blocking code is still running; the stall's duration is attached once
+      the heartbeat runs again
+    - optionally, asyncio debug mode logs every callback slower than
+      `threshold`, which are collected too
+    Offenders are keyed by the innermost frame inside this project.
+    """
+
+    def __init__(self, threshold: float = 0.25, interval: float = 0.1, asyncio_debug: bool = False,
+                 max_offenders: int = 200, history: int = 600):
+        self.threshold = threshold
+        self.interval = interval
+        self.asyncio_debug = asyncio_debug
+        self.max_offenders = max_offenders
+
+        self.started_at = None
+        self.stalls = 0
+        self.offenders = {}               # location -> Offender
+        self.lag_samples = deque(maxlen=history)
+
+        self._lock = threading.Lock()
+        self._loop = None
+        self._loop_thread_id = None
+        self._last_beat = 0.0
+        self._pending = None              # (beat timestamp, location, stack) captured mid-stall
+        self._heartbeat_task = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._log_handler = None
+
+    @property
+    def running(self) -> bool:
+        return self._heartbeat_task is not None and not self._heartbeat_task.done()
+
+    def start(self):
+        """Start watching the running loop (safe to call on every on_ready)"""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self.started_at = self.started_at or time.time()
+        self._stop.clear()
+
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watch, name='loop-watchdog', daemon=True)
+        self._thread.start()
+
+        if self.asyncio_debug:
+            self._loop.slow_callback_duration = self.threshold
+            self._loop.set_debug(True)
+            self._log_handler = _SlowCallbackHandler(self)
+            logging.getLogger('asyncio').addHandler(self._log_handler)
+
+        print(f"🐶 Loop watchdog started (stall threshold {self.threshold * 1000:.0f}ms)")
+
+    def stop(self):
+        self._stop.set()
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        if self._log_handler:
+            logging.getLogger('asyncio').removeHandler(self._log_handler)
+            self._log_handler = None
+            if self._loop:
+                self._loop.set_debug(False)
+
+    def reset(self):
+        with self._lock:
+            self.offenders.clear()
+            self.stalls = 0
+            self.lag_samples.clear()
+
+    # Recording
+
+    async def _heartbeat(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            previous_beat, self._last_beat = self._last_beat, time.monotonic()
+            self.lag_samples.append(lag)
+
+            if lag > self.threshold:
+                with self._lock:
+                    pending, self._pending = self._pending, None
+                self.stalls += 1
+                if pending and pending[0] == previous_beat:
+                    _, location, stack = pending
+                    self.record_offender(location, 'stall', lag, stack)
+                else:
+                    # Over before the watcher looked (shorter than its poll interval)
+                    self.record_offender('(no snapshot)', 'stall', lag)
+
+    def _watch(self):
+        """Watcher thread: snapshot the loop thread's stack while it is blocked"""
+        poll = max(0.01, self.threshold / 4)
+        while not self._stop.wait(poll):
+            beat = self._last_beat
+            if time.monotonic() - beat <= self.interval + self.threshold:
+                continue
+            with self._lock:
+                if self._pending and self._pending[0] == beat:
+                    continue  # Already captured this stall
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            summary = traceback.extract_stack(frame)
+            location = self._locate(summary)
+            stack = ''.join(traceback.format_list(summary[-12:]))
+            with self._lock:
+                self._pending = (beat, location, stack)
+
+    @staticmethod
+    def _locate(summary) -> str:
+        """Innermost frame inside the project (else the innermost frame)"""
+        for frame in reversed(summary):
+            path = frame.filename
+            if path.startswith(PROJECT_ROOT) and 'site-packages' not in path and not path.endswith('loop_watchdog.py'):
+                return f"{_relative(path)}:{frame.lineno} {frame.name}"
+        if summary:
+            frame = summary[-1]
+            return f"{_relative(frame.filename)}:{frame.lineno} {frame.name}"
+        return '(unknown)'
+
+    def record_offender(self, location: str, kind: str, duration: float, stack: str = None):
+        with self._lock:
+            offender = self.offenders.get(location)
+            if offender is None:
+                if len(self.offenders) >= self.max_offenders:
+                    # Forget the least significant offender
+                    weakest = min(self.offenders.values(), key=lambda o: o.total)
+                    del self.offenders[weakest.location]
+                offender = self.offenders[location] = Offender(location, kind)
+            offender.record(duration, stack)
+
+    # Reporting
+
+    def top(self, limit: int = 10) -> list:
+        """Offenders ordered by total blocked time"""
+        with self._lock:
+            return sorted(self.offenders.values(), key=lambda o: o.total, reverse=True)[:limit]
+
+    def lag_stats(self) -> dict:
+        """current/p50/p99/max loop lag (seconds) over the recent samples"""
+        samples = list(self.lag_samples)
+        if not samples:
+            return {'current': 0.0, 'p50': 0.0, 'p99': 0.0, 'max': 0.0}
+        ordered = sorted(samples)
+        return {
+            'current': samples[-1],
+            'p50': statistics.median(ordered),
+            'p99': ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+            'max': ordered[-1],
+        }
+
+
+# Shared instance; started from main.py
+watchdog = LoopWatchdog()
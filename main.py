@@ -7,6 +7,12 @@ import signal
 import sys
 import config
 from database import db
+from command_logger import CommandLogger
+from prefix_matcher import PrefixMatcher
+from metrics import metrics, instrument_database, MetricsServer
+from loop_watchdog import watchdog
+from resources import resources
+from edit_router import edit_router
 import re
 
 load_dotenv()
@@ -16,7 +22,9 @@ intents = discord.Intents.default()
 intents.message_content = True
 intents.guilds = True
 
-# Custom prefix function to handle bot mentions and strip spaces
+# Prefix matcher - rebuilt once the bot user ID is known (see on_ready)
+prefix_matcher = PrefixMatcher(config.PREFIX)
+
 def get_prefix(bot, message):
     """
     Custom prefix handler that:
@@ -24,25 +32,12 @@ def get_prefix(bot, message):
     2. Allows configured prefixes from config
     3. Strips whitespace after prefix
     """
-    # Get bot mentions as prefixes
-    mention_prefixes = [f'<@{bot.user.id}> ', f'<@!{bot.user.id}> ']
-
-    # Combine with config prefixes
-    prefixes = mention_prefixes + config.PREFIX
-
-    # Check each prefix
-    for prefix in prefixes:
-        if message.content.startswith(prefix):
-            # Find where the actual command starts (skip whitespace after prefix)
-            remaining = message.content[len(prefix):]
-            stripped = remaining.lstrip()
-            # Calculate how much whitespace was stripped
-            whitespace_len = len(remaining) - len(stripped)
-            # Return the prefix + whitespace so discord.py can parse the command
-            return prefix + ' ' * whitespace_len
+    prefix = prefix_matcher.command_prefix(message.content)
+    if prefix:
+        return prefix
 
     # If no prefix matched, return the list for discord.py to handle
-    return prefixes
+    return prefix_matcher.all_prefixes()
 
 # Bot setup
 bot = commands.Bot(
@@ -55,56 +50,46 @@ bot = commands.Bot(
 # Command Logger Configuration
 LOG_CHANNEL_ID = 1367051039181901885  # Set this to your log channel ID (e.g., 1234567890123456789)
 
-async def log_command_usage(interaction_or_ctx, command_name: str, command_type: str):
-    """Log command usage to the designated log channel"""
-    if not LOG_CHANNEL_ID:
-        return  # Logging disabled if no channel set
-
-    log_channel = bot.get_channel(LOG_CHANNEL_ID)
-    if not log_channel:
-        return
-
-    # Determine if it's an interaction or context
-    if isinstance(interaction_or_ctx, discord.Interaction):
-        user = interaction_or_ctx.user
-        guild = interaction_or_ctx.guild
-        channel = interaction_or_ctx.channel
-    else:  # commands.Context
-        user = interaction_or_ctx.author
-        guild = interaction_or_ctx.guild
-        channel = interaction_or_ctx.channel
-
-    # Determine location
-    if guild is None:
-        location = "DM"
-        location_detail = f"Direct Message"
-    else:
-        location = f"Server: {guild.name}"
-        location_detail = f"{guild.name} (ID: {guild.id}) in #{channel.name}"
+# Batching: one log message per interval / batch instead of one per command
+LOG_FLUSH_INTERVAL = 10.0  # Seconds between log messages
+LOG_BATCH_SIZE = 20  # Max commands per log message
+LOG_QUEUE_SIZE = 500  # Events beyond this are dropped (sampled above 80%)
+LOG_JSONL_PATH = os.getenv("COMMAND_LOG_FILE")  # Optional JSONL file for offline analysis
+
+command_logger = CommandLogger(
+    bot,
+    LOG_CHANNEL_ID,
+    max_queue=LOG_QUEUE_SIZE,
+    batch_size=LOG_BATCH_SIZE,
+    flush_interval=LOG_FLUSH_INTERVAL,
+    jsonl_path=LOG_JSONL_PATH
+)
 
-    # Create embed
-    embed = discord.Embed(
-        title="📝 Command Used",
-        color=config.EMBED_COLOR,
-        timestamp=discord.utils.utcnow()
-    )
+# Metrics (optional): recorded in-process and served on /metrics when METRICS_PORT is set
+async def count_gateway_event(event_type):
+    """Count gateway events"""
+    metrics.gateway_event(event_type)
 
-    embed.add_field(name="User", value=f"{user.mention} ({user.name})", inline=True)
-    embed.add_field(name="User ID", value=f"`{user.id}`", inline=True)
-    embed.add_field(name="Command Type", value=f"`{command_type}`", inline=True)
-    embed.add_field(name="Command", value=f"`{command_name}`", inline=True)
-    embed.add_field(name="Location", value=location, inline=True)
-    embed.add_field(name="Details", value=location_detail, inline=False)
+metrics.enabled = bool(config.METRICS_PORT)
+metrics_server = MetricsServer(metrics, config.METRICS_HOST, config.METRICS_PORT)
+if metrics.enabled:
+    instrument_database(db, metrics)
+    # discord.py starts a task per listener per gateway event, so only listen when counting
+    bot.add_listener(count_gateway_event, 'on_socket_event_type')
 
-    embed.set_footer(text="Command Logger")
+# Event loop watchdog (always on, cheap): see m!perf
+watchdog.threshold = config.WATCHDOG_STALL_THRESHOLD
+watchdog.asyncio_debug = config.WATCHDOG_ASYNCIO_DEBUG
 
-    try:
-        await log_channel.send(embed=embed)
-    except Exception as e:
-        print(f"❌ Error sending command log: {e}")
+def log_command_usage(interaction_or_ctx, command_name: str, command_type: str):
+    """Queue command usage for the batched log channel flusher (non-blocking)"""
+    command_logger.log(interaction_or_ctx, command_name, command_type)
 
 @bot.event
 async def on_ready():
+    global prefix_matcher
+    prefix_matcher = PrefixMatcher(config.PREFIX, bot.user.id)
+
     print(f'✅ Logged in as {bot.user.name} ({bot.user.id})')
     print(f'📝 Prefix: {config.PREFIX} + <@{bot.user.id}>')
     print(f'🎨 Embed Color: #{config.EMBED_COLOR:06x}')
@@ -114,9 +99,21 @@ async def on_ready():
     else:
         print(f'⚠️ Command logging disabled (set LOG_CHANNEL_ID to enable)')
 
+    command_logger.start()
+    watchdog.start()
+
+    if metrics.enabled:
+        try:
+            await metrics_server.start()
+        except Exception as e:
+            print(f'❌ Failed to start metrics server: {e}')
+
     # Connect to database
     await db.connect()
 
+    # Fonts, backgrounds and gender symbols for the image commands (downloads in the background)
+    resources.start()
+
     # Load cogs
     cogs = [
         'cogs.utils',
@@ -138,7 +135,9 @@ async def on_ready():
         'cogs.utility_commands',
         'cogs.inventory',
         'cogs.settings',
-        'cogs.shinyprofile'
+        'cogs.shinyprofile',
+        'cogs.leaderboard',
+        'cogs.perf'
     ]
 
     for cog in cogs:
@@ -181,32 +180,20 @@ async def on_message(message):
     if message.author.bot:
         return
 
-    # Custom processing to handle spaces after prefix
-    content = message.content
-
-    # Check for bot mention prefix
-    mention_patterns = [f'<@{bot.user.id}>', f'<@!{bot.user.id}>']
-    for pattern in mention_patterns:
-        if content.startswith(pattern):
-            # Remove mention and strip spaces
-            remaining = content[len(pattern):].lstrip()
-            if remaining:
-                # Reconstruct message content with single space after mention
-                message.content = f'{pattern} {remaining}'
-            break
-    else:
-        # Check for regular prefixes
-        for prefix in config.PREFIX:
-            if content.startswith(prefix):
-                # Remove prefix and strip spaces
-                remaining = content[len(prefix):].lstrip()
-                if remaining:
-                    # Reconstruct message content with no space after prefix
-                    message.content = f'{prefix}{remaining}'
-                break
+    # Fast path: anything without a prefix is not a command
+    content = prefix_matcher.normalize(message.content)
+    if content is None:
+        return
 
+    message.content = content
     await bot.process_commands(message)
 
+@bot.event
+async def on_raw_message_edit(payload):
+    """Route edits of monitored messages, cached or not, by message ID"""
+    # createlist sources, ?track lists and page ingestors
+    await edit_router.dispatch_raw(payload)
+
 @bot.event
 async def on_message_edit(before, after):
     """Process commands from edited messages"""
@@ -214,44 +201,47 @@ async def on_message_edit(before, after):
         return
 
     # Only process if the content actually changed
-    if before.content != after.content:
-        # Apply same space handling as on_message
-        content = after.content
-
-        mention_patterns = [f'<@{bot.user.id}>', f'<@!{bot.user.id}>']
-        for pattern in mention_patterns:
-            if content.startswith(pattern):
-                remaining = content[len(pattern):].lstrip()
-                if remaining:
-                    after.content = f'{pattern} {remaining}'
-                break
-        else:
-            for prefix in config.PREFIX:
-                if content.startswith(prefix):
-                    remaining = content[len(prefix):].lstrip()
-                    if remaining:
-                        after.content = f'{prefix}{remaining}'
-                    break
-
-        await bot.process_commands(after)
+    if before.content == after.content:
+        return
+
+    # Apply same space handling as on_message
+    content = prefix_matcher.normalize(after.content)
+    if content is None:
+        return
+
+    after.content = content
+    await bot.process_commands(after)
 
 # Command logging listeners
+@bot.event
+async def on_command(ctx):
+    """Start the latency clock for prefix/hybrid commands"""
+    metrics.command_started(ctx)
+
+@bot.event
+async def on_interaction(interaction: discord.Interaction):
+    """Start the latency clock for slash commands"""
+    metrics.command_started(interaction)
+
 @bot.event
 async def on_command_completion(ctx):
     """Log prefix/hybrid commands"""
-    await log_command_usage(ctx, ctx.command.name, "Prefix Command")
+    metrics.command_finished(ctx, ctx.command.name, "prefix")
+    log_command_usage(ctx, ctx.command.name, "Prefix Command")
 
 @bot.event
 async def on_app_command_completion(interaction: discord.Interaction, command):
     """Log slash commands"""
-    await log_command_usage(interaction, command.name, "Slash Command")
+    metrics.command_finished(interaction, command.name, "slash")
+    log_command_usage(interaction, command.name, "Slash Command")
 
 @bot.tree.error
 async def on_app_command_error(interaction: discord.Interaction, error):
     """Handle slash command errors (still log the attempt)"""
     # Log the command even if it errored
     if interaction.command:
-        await log_command_usage(interaction, interaction.command.name, "Slash Command (Error)")
+        metrics.command_finished(interaction, interaction.command.name, "slash", status="error")
+        log_command_usage(interaction, interaction.command.name, "Slash Command (Error)")
 
 @bot.event
 async def on_disconnect():
@@ -269,7 +259,10 @@ async def on_command_error(ctx, error):
     """Handle command errors"""
     if isinstance(error, commands.CommandNotFound):
         return
-    elif isinstance(error, commands.MissingRequiredArgument):
+    if ctx.command:
+        metrics.command_finished(ctx, ctx.command.name, "prefix", status="error")
+
+    if isinstance(error, commands.MissingRequiredArgument):
         await ctx.send(f"❌ Missing required argument: `{error.param.name}`")
     elif isinstance(error, commands.BadArgument):
         await ctx.send(f"❌ Invalid argument provided")
@@ -290,6 +283,9 @@ async def shutdown():
     """Properly shutdown bot and database"""
     print("\n🛑 Shutting down bot...")
     try:
+        await command_logger.stop()
+        await metrics_server.stop()
+        watchdog.stop()
         await db.close()
         await bot.close()
         print("✅ Shutdown complete")
@@ -0,0 +1,371 @@
+"""In-process metrics (counters, gauges, histograms) with an optional Prometheus /metrics endpoint"""
+import asyncio
+import bisect
+import functools
+import inspect
+import time
+from datetime import datetime, timezone
+
+# Seconds; fits everything from a cached embed to a slow image render
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Database methods that are lifecycle, not operations
+_UNTIMED_DB_METHODS = {'connect', 'close'}
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(pairs) -> str:
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = 'untyped'
+
+    def __init__(self, registry, name: str, documentation: str, labelnames=()):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = {}  # label values tuple -> value/state
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def samples(self):
+        """(sample name, label pairs, value) for the text exposition"""
+        for key, value in sorted(self.values.items()):
+            yield self.name, tuple(zip(self.labelnames, key)), value
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+        for name, pairs, value in self.samples():
+            lines.append(f'{name}{_format_labels(pairs)} {_format_value(value)}')
+        return lines
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        if not self.registry.enabled:
+            return
+        key = self._key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def get(self, **labels):
+        return self.values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    kind = 'gauge'
+
+    def set(self, value: float, **labels):
+        if not self.registry.enabled:
+            return
+        self.values[self._key(labels)] = value
+
+    def get(self, **labels):
+        return self.values.get(self._key(labels), 0)
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram; state per label set is [bucket counts, sum, count]"""
+
+    kind = 'histogram'
+
+    def __init__(self, registry, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(registry, name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        if not self.registry.enabled:
+            return
+        key = self._key(labels)
+        state = self.values.get(key)
+        if state is None:
+            state = self.values[key] = [[0] * len(self.buckets), 0.0, 0]
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            state[0][index] += 1
+        state[1] += value
+        state[2] += 1
+
+    def time(self, **labels):
+        """Context manager / decorator (sync or async functions) observing elapsed seconds"""
+        return _Timer(self, labels)
+
+    def count(self, **labels) -> int:
+        state = self.values.get(self._key(labels))
+        return state[2] if state else 0
+
+    def samples(self):
+        for key, (counts, total, count) in sorted(self.values.items()):
+            pairs = tuple(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                yield f'{self.name}_bucket', pairs + (('le', _format_value(float(bound))),), cumulative
+            yield f'{self.name}_bucket', pairs + (('le', '+Inf'),), count
+            yield f'{self.name}_sum', pairs, total
+            yield f'{self.name}_count', pairs, count
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: dict):
+        self.histogram = histogram
+        self.labels = labels
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self._start, **self.labels)
+        return False
+
+    def __call__(self, func):
+        histogram, labels = self.histogram, self.labels
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not histogram.registry.enabled:
+                    return await func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    histogram.observe(time.perf_counter() - start, **labels)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not histogram.registry.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start, **labels)
+        return wrapper
+
+
+class Registry:
+    """A set of metrics rendered together; recording is a no-op while disabled"""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.metrics = []
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self._register(Counter(self, name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self._register(Gauge(self, name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(self, name, documentation, labelnames, buckets))
+
+    def _register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+class BotMetrics(Registry):
+    """The bot's metrics: commands, database, rendering, caches, event loop and gateway"""
+
+    def __init__(self, enabled: bool = False):
+        super().__init__(enabled)
+        self.command_seconds = self.histogram(
+            'bot_command_seconds', 'Command latency from invocation to completion',
+            ('command', 'type', 'status'))
+        self.db_seconds = self.histogram(
+            'bot_db_operation_seconds', 'Latency of Database methods (MongoDB round-trips)', ('method',))
+        self.db_operations = self.counter(
+            'bot_db_operations_total', 'Database method calls', ('method', 'status'))
+        self.render_seconds = self.histogram(
+            'bot_render_seconds', 'Image render time', ('renderer',))
+        self.cache_requests = self.counter(
+            'bot_cache_requests_total', 'Cache lookups by result (hit/miss)', ('cache', 'result'))
+        self.loop_lag_seconds = self.histogram(
+            'bot_event_loop_lag_seconds', 'How late the event loop ran a scheduled wakeup',
+            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0))
+        self.loop_lag = self.gauge(
+            'bot_event_loop_lag_last_seconds', 'Most recent event loop lag sample')
+        self.gateway_events = self.counter(
+            'bot_gateway_events_total', 'Gateway events received', ('event',))
+        self.gateway_rate = self.gauge(
+            'bot_gateway_events_per_second', 'Gateway events per second over the last sample interval')
+
+        self._gateway_total = 0
+
+    # Commands
+
+    def command_started(self, ctx_or_interaction):
+        """Remember when a command started (on_command / on_interaction)"""
+        if not self.enabled:
+            return
+        extras = getattr(ctx_or_interaction, 'extras', None)
+        if isinstance(extras, dict):
+            extras['metrics_start'] = time.perf_counter()
+        else:
+            ctx_or_interaction.metrics_start = time.perf_counter()
+
+    def command_finished(self, ctx_or_interaction, command_name: str, command_type: str, status: str = 'ok'):
+        """Observe a command's latency (on_command_completion / on_app_command_completion / errors)"""
+        if not self.enabled:
+            return
+        extras = getattr(ctx_or_interaction, 'extras', None)
+        if isinstance(extras, dict):
+            start = extras.pop('metrics_start', None)
+        else:
+            start = getattr(ctx_or_interaction, 'metrics_start', None)
+
+        if start is not None:
+            elapsed = time.perf_counter() - start
+        else:
+            # Interaction seen without on_interaction: fall back to its creation time
+            created_at = getattr(ctx_or_interaction, 'created_at', None)
+            if created_at is None:
+                return
+            elapsed = (datetime.now(timezone.utc) - created_at).total_seconds()
+
+        self.command_seconds.observe(elapsed, command=command_name, type=command_type, status=status)
+
+    # Caches and gateway
+
+    def cache_lookup(self, cache: str, hit: bool):
+        self.cache_requests.inc(cache=cache, result='hit' if hit else 'miss')
+
+    def gateway_event(self, event_type: str):
+        if not self.enabled:
+            return
+        self.gateway_events.inc(event=event_type)
+        self._gateway_total += 1
+
+    async def sample_loop(self, interval: float = 1.0):
+        """Background task: event loop lag and gateway event rate, once per interval"""
+        loop = asyncio.get_running_loop()
+        last_total = self._gateway_total
+        while True:
+            start = loop.time()
+            await asyncio.sleep(interval)
+            elapsed = loop.time() - start
+            lag = max(0.0, elapsed - interval)
+            self.loop_lag_seconds.observe(lag)
+            self.loop_lag.set(lag)
+            self.gateway_rate.set((self._gateway_total - last_total) / elapsed)
+            last_total = self._gateway_total
+
+
+def instrument_database(database, registry: BotMetrics):
+    """Time every public async method of a Database instance (wrapped on the instance, in place)"""
+    for name, method in inspect.getmembers(database, inspect.iscoroutinefunction):
+        if name.startswith('_') or name in _UNTIMED_DB_METHODS:
+            continue
+        setattr(database, name, _timed_db_method(method, name, registry))
+
+
+def _timed_db_method(method, name: str, registry: BotMetrics):
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        if not registry.enabled:
+            return await method(*args, **kwargs)
+        start = time.perf_counter()
+        status = 'error'
+        try:
+            result = await method(*args, **kwargs)
+            status = 'ok'
+            return result
+        finally:
+            registry.db_seconds.observe(time.perf_counter() - start, method=name)
+            registry.db_operations.inc(method=name, status=status)
+    return wrapper
+
+
+class MetricsServer:
+    """
+    Minimal HTTP server exposing GET /metrics (plain asyncio, no extra dependency)
+    Binds to localhost by default; put it behind a scraper on the same host.
+    """
+
+    def __init__(self, registry: Registry, host: str = '127.0.0.1', port: int = 9108):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server = None
+        self._sampler = None
+
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+
+    async def start(self):
+        """Start serving (safe to call on every on_ready)"""
+        if self._server is not None:
+            return
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        if isinstance(self.registry, BotMetrics):
+            self._sampler = asyncio.create_task(self.registry.sample_loop())
+        print(f"📈 Metrics on http://{self.host}:{self.port}/metrics")
+
+    async def stop(self):
+        if self._sampler:
+            self._sampler.cancel()
+            self._sampler = None
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader, writer):
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            # Skip the headers, nothing in them matters here
+            for _ in range(100):
+                line = await asyncio.wait_for(reader.readline(), timeout=5)
+                if line in (b'\r\n', b'\n', b''):
+                    break
+
+            parts = request_line.decode('latin-1').split()
+            path = parts[1].split('?')[0] if len(parts) >= 2 else ''
+            if len(parts) >= 2 and parts[0] == 'GET' and path == '/metrics':
+                status, body = '200 OK', self.registry.render().encode('utf-8')
+                content_type = 'text/plain; version=0.0.4; charset=utf-8'
+            else:
+                status, body, content_type = '404 Not Found', b'Not Found\n', 'text/plain'
+
+            writer.write(
+                f'HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n'
+                f'Content-Length: {len(body)}\r\nConnection: close\r\n\r\n'.encode('latin-1') + body
+            )
+            await writer.drain()
+        except Exception:
+            pass
+        finally:
+            writer.close()
+
+
+# Shared instance; enabled in main.py when METRICS_PORT is set
+metrics = BotMetrics()
@@ -0,0 +1,241 @@
+"""In-memory fuzzy name index (character trigrams + bounded edit distance)"""
+import heapq
+import sys
+import unicodedata
+from collections import Counter, namedtuple
+from itertools import chain
+
+# One ranked suggestion: the name as it was indexed, its payload and the edit distance
+Suggestion = namedtuple('Suggestion', 'name value distance')
+
+
+def normalize(name: str) -> str:
+    """Lowercase, strip accents and collapse whitespace (same rules as Pokedex.normalize_name)"""
+    decomposed = unicodedata.normalize('NFD', name)
+    without_accents = ''.join(c for c in decomposed if unicodedata.category(c) != 'Mn')
+    return ' '.join(without_accents.lower().split())
+
+
+def _trigrams(key: str) -> set:
+    padded = f'  {key} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _deletes(key: str) -> set:
+    """Every string one deletion away from key"""
+    return {key[:i] + key[i + 1:] for i in range(len(key))}
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Optimal string alignment distance (adjacent swaps count as one edit)
+    Only the diagonal band of width 2 * limit + 1 is computed; anything
+    further apart than `limit` comes back as limit + 1.
+    """
+    len_a, len_b = len(a), len(b)
+    if abs(len_a - len_b) > limit:
+        return limit + 1
+
+    over = limit + 1
+    prev_prev = None
+    prev = [j if j <= limit else over for j in range(len_b + 1)]
+    for i in range(1, len_a + 1):
+        cur = [over] * (len_b + 1)
+        if i <= limit:
+            cur[0] = i
+        ca = a[i - 1]
+        row_min = over
+        for j in range(max(1, i - limit), min(len_b, i + limit) + 1):
+            cb = b[j - 1]
+            value = prev[j - 1] if ca == cb else prev[j - 1] + 1
+            if prev[j] + 1 < value:
+                value = prev[j] + 1
+            if cur[j - 1] + 1 < value:
+                value = cur[j - 1] + 1
+            if prev_prev is not None and j > 1 and ca == b[j - 2] and a[i - 2] == cb \
+                    and prev_prev[j - 2] + 1 < value:
+                value = prev_prev[j - 2] + 1
+            cur[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > limit:
+            return over
+        prev_prev, prev = prev, cur
+    return min(prev[len_b], over)
+
+
+class NameSearchIndex:
+    """
+    Fuzzy lookup over a fixed set of names
+
+    Names are normalized once and indexed two ways:
+    - single-character deletes (SymSpell-style), which find every name one
+      typo away with a handful of dict lookups - the common case
+    - padded character trigrams (trigram -> entry ids); a query only scores
+      the entries that share trigrams with it and ranks the best few by
+      edit distance, for suggestions further away
+    Works the same for any script (Latin, kana, hangul...).
+    """
+
+    __slots__ = ('_keys', '_names', '_values', '_lookup', '_deletes', '_grams', '_gram_counts')
+
+    def __init__(self, names=None):
+        """names: optional mapping or iterable of (name, value) pairs"""
+        self._keys = []          # entry id -> normalized key
+        self._names = []         # entry id -> name as first indexed
+        self._values = []        # entry id -> payload
+        self._lookup = {}        # normalized key -> entry id
+        self._deletes = {}       # key with one character deleted -> entry ids
+        self._grams = {}         # trigram -> list of entry ids
+        self._gram_counts = []   # entry id -> number of distinct trigrams
+
+        if names:
+            items = names.items() if isinstance(names, dict) else names
+            for name, value in items:
+                self.add(name, value)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, name):
+        return normalize(name) in self._lookup
+
+    def add(self, name: str, value=None):
+        """Index a name (the first value indexed under a normalized key wins)"""
+        if not name:
+            return
+        # Interned: callers that also index the normalized names (PokedexStore) share the strings
+        key = sys.intern(normalize(name))
+        if not key or key in self._lookup:
+            return
+
+        entry_id = len(self._keys)
+        self._keys.append(key)
+        self._names.append(name)
+        self._values.append(name if value is None else value)
+        self._lookup[key] = entry_id
+
+        for variant in _deletes(key):
+            self._deletes.setdefault(variant, []).append(entry_id)
+
+        grams = _trigrams(key)
+        self._gram_counts.append(len(grams))
+        for gram in grams:
+            self._grams.setdefault(gram, []).append(entry_id)
+
+    def get(self, name: str, default=None):
+        """Exact (case/accent-insensitive) lookup"""
+        entry_id = self._lookup.get(normalize(name))
+        if entry_id is None:
+            return default
+        return self._values[entry_id]
+
+    def suggest(self, query: str, limit: int = 5, max_distance: int = None) -> list:
+        """
+        Ranked suggestions for a (possibly misspelled) name
+        max_distance defaults to roughly one edit per four characters (at least 1, at most 3)
+        """
+        key = normalize(query)
+        if not key:
+            return []
+
+        entry_id = self._lookup.get(key)
+        if entry_id is not None:
+            return [Suggestion(self._names[entry_id], self._values[entry_id], 0)]
+
+        if max_distance is None:
+            max_distance = min(3, max(1, len(key) // 4))
+
+        # Everything one edit away, straight from the deletes index
+        ranked = self._one_edit(key)
+        if len(ranked) >= limit or max_distance <= 1:
+            ranked.sort()
+            return [Suggestion(self._names[c], self._values[c], d) for d, _, c in ranked[:limit]]
+
+        # Count shared trigrams per candidate
+        query_grams = _trigrams(key)
+        shared = Counter(chain.from_iterable(self._grams.get(gram, ()) for gram in query_grams))
+
+        # One edit touches at most 4 trigrams (an adjacent swap), so anything
+        # sharing fewer than this (or differing too much in length) cannot be within range
+        needed = len(query_grams) - 4 * max_distance
+        keys = self._keys
+        key_len = len(key)
+        candidates = [c for c, n in shared.items()
+                      if n >= needed and abs(len(keys[c]) - key_len) <= max_distance]
+        # Only the most similar (Jaccard over trigrams) go through the edit-distance check
+        query_size = len(query_grams)
+        candidates = heapq.nlargest(
+            (limit - len(ranked)) * 2 + 5, candidates,
+            key=lambda c: shared[c] / (query_size + self._gram_counts[c] - shared[c])
+        )
+
+        # Once `limit` results are in hand, later candidates only need to beat the worst of them
+        found = {c for _, _, c in ranked}
+        bound = max_distance
+        for candidate in candidates:
+            if candidate in found:
+                continue
+            distance = _edit_distance(key, keys[candidate], bound)
+            if distance <= bound:
+                ranked.append((distance, 0, candidate))
+                if len(ranked) >= limit:
+                    ranked.sort()
+                    del ranked[limit:]
+                    bound = ranked[-1][0]
+
+        ranked.sort()
+        return [Suggestion(self._names[c], self._values[c], d) for d, _, c in ranked[:limit]]
+
+    def _one_edit(self, key: str) -> list:
+        """(distance, 0, entry id) for every entry exactly one edit from key"""
+        candidates = set()
+        for variant in _deletes(key):
+            entry_id = self._lookup.get(variant)       # query has an extra character
+            if entry_id is not None:
+                candidates.add(entry_id)
+            candidates.update(self._deletes.get(variant, ()))  # substitution / swap
+        candidates.update(self._deletes.get(key, ()))  # query is missing a character
+
+        keys = self._keys
+        return [(1, 0, c) for c in candidates if _edit_distance(key, keys[c], 1) == 1]
+
+    def best(self, query: str):
+        """
+        Single confident match: exact, or the only name at the smallest distance
+        Returns a Suggestion or None when the query is ambiguous or too far off
+        """
+        key = normalize(query)
+        if not key:
+            return None
+
+        entry_id = self._lookup.get(key)
+        if entry_id is not None:
+            return Suggestion(self._names[entry_id], self._values[entry_id], 0)
+
+        # One-typo matches are complete from the deletes index, no need to rank further
+        nearest = [c for _, _, c in self._one_edit(key)]
+        if not nearest:
+            suggestions = self.suggest(query, limit=2)
+            if len(suggestions) > 1 and suggestions[1].distance == suggestions[0].distance \
+                    and suggestions[1].value != suggestions[0].value:
+                return None
+            return suggestions[0] if suggestions else None
+
+        values = {self._values[c] for c in nearest}
+        if len(values) > 1:
+            return None
+        entry_id = min(nearest)
+        return Suggestion(self._names[entry_id], self._values[entry_id], 1)
+
+
+def format_suggestions(suggestions, limit: int = 5) -> str:
+    """'`A`, `B` or `C`' for 'Did you mean ...?' messages (empty string if none)"""
+    names = []
+    for suggestion in suggestions:
+        if suggestion.name not in names:
+            names.append(suggestion.name)
+    names = [f'`{n}`' for n in names[:limit]]
+    if len(names) <= 1:
+        return ''.join(names)
+    return f"{', '.join(names[:-1])} or {names[-1]}"
@@ -0,0 +1,148 @@
+"""Producer/consumer pipeline for monitored Pokétwo page edits (m!add, m!trackshiny, m!trackevent)"""
+import asyncio
+from edit_router import edit_router
+
+
+class PageIngestor:
+    """
+    Monitor a paginated Pokétwo message and ingest every page the user clicks to
+
+    Producer: receives edits of the message from the edit router and parses
+    each page immediately, so clicks never queue behind database round-trips.
+    Consumer: a background task that coalesces everything parsed since its
+    last run into a single bulk write, then refreshes the status message at
+    most once per flush cycle (debounced).
+    """
+
+    def __init__(self, bot, message_id: int, parse_page, write_batch, count_total, render_status,
+                 status_msg=None, author_id: int = None, added: int = 0, inventory: int = 0,
+                 timeout: float = 300, idle_timeout: float = 15, poll_interval: float = 30.0,
+                 flush_delay: float = 1.0):
+        """
+        parse_page(embed) -> list: new (deduplicated) items on a page, called synchronously
+        write_batch(items) -> int: async bulk write, returns how many were newly added
+        count_total() -> int: async count of the user's collection after a write
+        render_status(added, inventory) -> str: status message content
+        """
+        self.bot = bot
+        self.message_id = message_id
+        self.author_id = author_id
+        self.parse_page = parse_page
+        self.write_batch = write_batch
+        self.count_total = count_total
+        self.render_status = render_status
+        self.status_msg = status_msg
+
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.poll_interval = poll_interval
+        self.flush_delay = flush_delay
+
+        self.added = added
+        self.inventory = inventory
+        self.pages = 0
+        self.writes = 0
+
+        self._edits = asyncio.Queue()
+        self._pending = []
+        self._wake = asyncio.Event()
+        self._closed = False
+
+    def check(self, before, after):
+        """Edits of the monitored message that still have an embed"""
+        return (after.id == self.message_id and
+                (self.author_id is None or after.author.id == self.author_id) and
+                after.embeds)
+
+    async def _on_edit(self, before, after):
+        if self.check(before, after):
+            self._edits.put_nowait((before, after))
+
+    async def run(self):
+        """Monitor until timeout/idle, then flush everything and return total added"""
+        key = ('ingest', id(self))
+        edit_router.subscribe(self.message_id, key, self._on_edit, self.timeout)
+        consumer = asyncio.create_task(self._consume())
+        try:
+            await self._produce()
+        finally:
+            edit_router.unsubscribe(self.message_id, key)
+            self._closed = True
+            self._wake.set()
+            await consumer
+        return self.added
+
+    async def _produce(self):
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        last_update = start_time
+
+        while (loop.time() - start_time) < self.timeout:
+            try:
+                remaining = self.timeout - (loop.time() - start_time)
+                wait_time = min(remaining, self.poll_interval)
+                before, after = await asyncio.wait_for(self._edits.get(), timeout=wait_time)
+
+                self.pages += 1
+                items = self.parse_page(after.embeds[0])
+                if items:
+                    self._pending.extend(items)
+                    self._wake.set()
+                    last_update = loop.time()
+
+            except asyncio.TimeoutError:
+                # If no activity for idle_timeout after last update, stop monitoring
+                if loop.time() - last_update > self.idle_timeout:
+                    break
+                continue
+            except Exception as e:
+                print(f"Error during page monitoring: {e}")
+                break
+
+    async def _consume(self):
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+
+            # Let quick clicks pile up so they share one write
+            if not self._closed and self.flush_delay:
+                await asyncio.sleep(self.flush_delay)
+
+            if not await self._flush() and self._closed:
+                # Nothing will wake us again: retry the failed batch once, then give up on it
+                if not await self._flush():
+                    print(f"Dropped {len(self._pending)} tracked items after two failed writes")
+                    self._pending = []
+
+            if self._closed and not self._pending:
+                return
+
+    async def _flush(self) -> bool:
+        """
+        Write everything pending, False if the write failed: the batch goes back
+        to the front of the queue for the next flush (next page or close)
+        """
+        batch, self._pending = self._pending, []
+        if not batch:
+            return True
+
+        try:
+            self.added += await self.write_batch(batch)
+            self.writes += 1
+        except Exception as e:
+            print(f"Error writing tracked pages: {e}")
+            self._pending[:0] = batch
+            return False
+
+        try:
+            self.inventory = await self.count_total()
+        except Exception as e:
+            print(f"Error counting tracked pages: {e}")
+
+        # Final summary replaces the status message once monitoring stops
+        if self.status_msg is not None and not self._closed:
+            try:
+                await self.status_msg.edit(content=self.render_status(self.added, self.inventory))
+            except Exception as e:
+                print(f"Error updating tracking status: {e}")
+        return True
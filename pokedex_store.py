@@ -0,0 +1,127 @@
+"""Compact read-only Pokédex store built from alldata/pokemon_data.json"""
+import json
+import sys
+from name_search import normalize
+
+BASE_STAT_KEYS = ('HP', 'Attack', 'Defense', 'Sp. Atk', 'Sp. Def', 'Speed')
+
+
+def _intern(value):
+    """Intern short repeated strings (types, regions, egg groups...) so every entry shares one copy"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class PokedexEntry:
+    """
+    One Pokédex form, stored as slots instead of a nested dict
+
+    Fields are stored the way the embeds read them, so rendering an entry is
+    plain attribute access; the savings come from the slots, the flattened
+    nesting and interning the strings many entries share.
+    """
+
+    __slots__ = ('form_key', 'dex_number', 'name', 'image_url', 'evolution', 'types', 'region',
+                 'catchable', 'names', 'height_m', 'weight_kg', 'gender_ratio', 'egg_groups',
+                 'hatch_time', 'rarity', 'description', 'base_stats')
+
+    def __init__(self, form_key: str, data: dict):
+        self.form_key = sys.intern(form_key)
+        self.dex_number = sys.intern(str(data.get('dex_number', '0')))
+        self.name = sys.intern(data.get('name', ''))
+        self.image_url = data.get('image_url', '')
+        self.evolution = (data.get('fields') or {}).get('Evolution')
+        self.types = tuple(_intern(t) for t in data.get('types') or ())
+        self.region = _intern(data.get('region'))
+        self.catchable = _intern(data.get('catchable'))
+
+        # (lang, (name, ...)) pairs in file order
+        names = []
+        for lang, lang_names in (data.get('names') or {}).items():
+            if not isinstance(lang_names, list):
+                lang_names = [lang_names]
+            names.append((sys.intern(lang), tuple(sys.intern(n) for n in lang_names)))
+        self.names = tuple(names)
+
+        appearance = data.get('appearance') or {}
+        self.height_m = _intern(appearance.get('height_m'))
+        self.weight_kg = _intern(appearance.get('weight_kg'))
+
+        self.gender_ratio = _intern(data.get('gender_ratio'))
+        egg_groups = data.get('egg_groups')
+        self.egg_groups = tuple(_intern(g) for g in egg_groups) if isinstance(egg_groups, list) else _intern(egg_groups)
+        self.hatch_time = _intern(data.get('hatch_time'))
+        self.rarity = _intern(data.get('rarity'))
+
+        self.description = data.get('description')
+        base_stats = data.get('base_stats')
+        self.base_stats = {k: base_stats.get(k) for k in BASE_STAT_KEYS} if base_stats else None
+
+    def all_names(self):
+        """Every name for this form: primary name first, then alternate names"""
+        yield self.name
+        for _, lang_names in self.names:
+            yield from lang_names
+
+
+class PokedexStore:
+    """
+    Read-only Pokédex shared by the cog and every PokedexView
+
+    - entries: form_key -> PokedexEntry
+    - dex_number_forms: dex number -> ((form_key, form_name), ...)
+    - name_index: one normalized key per name -> form_key
+    """
+
+    __slots__ = ('entries', 'dex_number_forms', 'name_index')
+
+    def __init__(self):
+        self.entries = {}
+        self.dex_number_forms = {}
+        self.name_index = {}
+
+    @classmethod
+    def load(cls, path: str):
+        def parse_object(pairs):
+            # The parser finishes objects inside out, so each form is turned into an entry as
+            # soon as its own object is complete: the file never exists as nested dicts all at once
+            data = dict(pairs)
+            return PokedexEntry('', data) if 'dex_number' in data else data
+
+        with open(path, 'r', encoding='utf-8') as f:
+            parsed = json.load(f, object_pairs_hook=parse_object)
+
+        store = cls()
+        dex_number_forms = {}
+        for form_key, entry in parsed.items():
+            entry.form_key = sys.intern(form_key)
+            store.entries[entry.form_key] = entry
+            dex_number_forms.setdefault(entry.dex_number, []).append((entry.form_key, entry.name))
+
+            # Later entries win, as with the old lowercase/accent-stripped index
+            for name in entry.all_names():
+                key = normalize(name)
+                if key:
+                    store.name_index[sys.intern(key)] = entry.form_key
+
+        store.dex_number_forms = {dex: tuple(forms) for dex, forms in dex_number_forms.items()}
+        return store
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, form_key):
+        return form_key in self.entries
+
+    def __getitem__(self, form_key) -> PokedexEntry:
+        return self.entries[form_key]
+
+    def get(self, form_key, default=None):
+        return self.entries.get(form_key, default)
+
+    def lookup(self, name: str):
+        """form_key for an exact (case/accent-insensitive) name, or None"""
+        # Plain lowercase hits directly for unaccented input, skipping the unicode pass
+        form_key = self.name_index.get(name.lower().strip())
+        if form_key is None:
+            form_key = self.name_index.get(normalize(name))
+        return form_key
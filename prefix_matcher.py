@@ -0,0 +1,63 @@
+import re
+
+
+class PrefixMatcher:
+    """
+    Precompiled prefix matcher for message dispatch
+
+    Built once (after on_ready, when the bot's user ID is known) from the
+    configured prefixes plus both mention forms. A single anchored regex
+    match tells us whether a message is a command at all, which prefix it
+    used and how much whitespace follows it.
+    """
+
+    __slots__ = ('prefixes', 'bot_id', 'pattern')
+
+    def __init__(self, prefixes, bot_id: int = None):
+        self.prefixes = tuple(prefixes)
+        self.bot_id = bot_id
+
+        # Longest first so overlapping prefixes resolve the same way every time
+        alternatives = [re.escape(p) for p in sorted(self.prefixes, key=len, reverse=True)]
+        if bot_id:
+            alternatives.insert(0, rf'<@!?{bot_id}>')
+
+        self.pattern = re.compile(rf'(?P<prefix>{"|".join(alternatives)})(?P<space>\s*)')
+
+    def match(self, content: str):
+        """Return the regex match for a command message, or None"""
+        if not content:
+            return None
+        return self.pattern.match(content)
+
+    def command_prefix(self, content: str):
+        """Prefix (including any whitespace after it) that discord.py should strip"""
+        m = self.match(content)
+        return m.group(0) if m else None
+
+    def normalize(self, content: str):
+        """
+        Rewrite a command message so discord.py can parse it
+        - Mentions keep exactly one space: '<@id>   breed' -> '<@id> breed'
+        - Text prefixes lose the space: 'm!  breed' -> 'm!breed'
+        Returns None for non-command messages, the content unchanged when
+        there is nothing after the prefix.
+        """
+        m = self.match(content)
+        if not m:
+            return None
+
+        remaining = content[m.end():]
+        if not remaining:
+            return content
+
+        prefix = m.group('prefix')
+        if prefix.startswith('<@'):
+            return f'{prefix} {remaining}'
+        return f'{prefix}{remaining}'
+
+    def all_prefixes(self) -> list:
+        """Every accepted prefix, for discord.py's fallback handling"""
+        if not self.bot_id:
+            return list(self.prefixes)
+        return [f'<@{self.bot_id}> ', f'<@!{self.bot_id}> '] + list(self.prefixes)
@@ -0,0 +1,232 @@
+"""Fonts, backgrounds and gender symbols for the image cogs, downloaded once at startup"""
+import asyncio
+import hashlib
+import json
+import os
+import time
+
+import aiohttp
+
+import config
+
+# GitHub directory -> (local folder under the resources root, file extensions to fetch)
+GITHUB_DIRECTORIES = {
+    'fonts': ('fonts', ('.ttf', '.otf')),
+    'backgrounds': ('backgrounds', ('.png', '.jpg', '.jpeg')),
+}
+
+# Local path under the resources root -> direct URL
+DIRECT_FILES = {
+    'emojis/male.png': 'https://cdn.discordapp.com/emojis/1207734081585152101.png',
+    'emojis/female.png': 'https://cdn.discordapp.com/emojis/1207734084210532483.png',
+}
+
+MANIFEST_NAME = 'manifest.json'
+
+
+def git_blob_sha(data: bytes) -> str:
+    """The SHA GitHub lists for a file in the contents API"""
+    return hashlib.sha1(b'blob %d\x00' % len(data) + data).hexdigest()
+
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def write_atomic(path: str, data: bytes):
+    """Write to a temporary file next to path, then rename over it (readers never see half a file)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class ResourceBootstrap:
+    """
+    Downloads the image cogs' fonts, backgrounds and gender symbols
+
+    One run lists each GitHub directory once and downloads only missing or
+    changed files, through a single ClientSession with at most `concurrency`
+    requests in flight. Files are verified against the SHA GitHub lists
+    (direct files have no published checksum) and written atomically.
+    root/manifest.json records every file's source, git SHA and SHA-256, so
+    later runs skip files that are present and unchanged without downloading.
+
+    `ready` is set once the first run finished (successfully or not); image
+    commands await it with a timeout and otherwise render with whatever is
+    on disk, falling back to the default font like before.
+    """
+
+    def __init__(self, root: str = 'shinystats', repo: str = 'cynthiaofpower/meowthfonts', branch: str = 'main',
+                 concurrency: int = 4, api_base: str = 'https://api.github.com',
+                 raw_base: str = 'https://raw.githubusercontent.com', direct_files: dict = None):
+        self.root = root
+        self.repo = repo
+        self.branch = branch
+        self.concurrency = concurrency
+        self.api_base = api_base.rstrip('/')
+        self.raw_base = raw_base.rstrip('/')
+        self.direct_files = DIRECT_FILES if direct_files is None else direct_files
+
+        self.ready = asyncio.Event()
+        self.task = None
+        self.last_run = None  # summary of the latest run, for m!refreshresources
+        self._lock = asyncio.Lock()
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.root, MANIFEST_NAME)
+
+    def start(self):
+        """Start the first download run in the background (safe to call more than once)"""
+        if self.task is None:
+            self.task = asyncio.create_task(self.run())
+        return self.task
+
+    async def wait_ready(self, timeout: float = None) -> bool:
+        """Wait for the first run; False if it is still going after timeout seconds"""
+        if self.ready.is_set():
+            return True
+        try:
+            await asyncio.wait_for(self.ready.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def run(self) -> dict:
+        """Download everything missing or changed; returns counts of downloaded, skipped and failed files"""
+        async with self._lock:
+            start = time.perf_counter()
+            summary = {'downloaded': 0, 'skipped': 0, 'failed': 0}
+            try:
+                manifest = self._load_manifest()
+                semaphore = asyncio.Semaphore(self.concurrency)
+                async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=60)) as session:
+                    wanted = await self._list_files(session, semaphore)
+                    results = await asyncio.gather(*(
+                        self._fetch(session, semaphore, manifest, path, url, git_sha)
+                        for path, (url, git_sha) in wanted.items()
+                    ))
+                for result in results:
+                    summary[result] += 1
+                self._save_manifest(manifest)
+            except Exception as e:
+                print(f"❌ Resource download failed: {e}")
+            finally:
+                self.ready.set()
+
+            summary['seconds'] = round(time.perf_counter() - start, 2)
+            self.last_run = summary
+            print(f"📦 Resources: {summary['downloaded']} downloaded, {summary['skipped']} up to date, "
+                  f"{summary['failed']} failed ({summary['seconds']}s)")
+            return summary
+
+    async def _list_files(self, session, semaphore) -> dict:
+        """Local path -> (download URL, expected git SHA or None)"""
+        wanted = {path: (url, None) for path, url in self.direct_files.items()}
+        listings = await asyncio.gather(*(
+            self._list_directory(session, semaphore, directory) for directory in GITHUB_DIRECTORIES
+        ))
+        for directory, items in zip(GITHUB_DIRECTORIES, listings):
+            folder, extensions = GITHUB_DIRECTORIES[directory]
+            for item in items:
+                if item.get('type') == 'file' and item['name'].lower().endswith(extensions):
+                    url = f"{self.raw_base}/{self.repo}/{self.branch}/{directory}/{item['name']}"
+                    wanted[f"{folder}/{item['name']}"] = (url, item.get('sha'))
+        return wanted
+
+    async def _list_directory(self, session, semaphore, directory: str) -> list:
+        url = f"{self.api_base}/repos/{self.repo}/contents/{directory}?ref={self.branch}"
+        try:
+            async with semaphore, session.get(url) as resp:
+                if resp.status == 200:
+                    return await resp.json()
+                print(f"❌ Failed to list {directory}: Status {resp.status}")
+        except Exception as e:
+            print(f"❌ Error listing {directory}: {e}")
+        return []
+
+    async def _is_current(self, manifest: dict, path: str, local_path: str, git_sha: str) -> bool:
+        """Present on disk and matching what we would download, without fetching it"""
+        if not os.path.exists(local_path):
+            return False
+        entry = manifest.get(path)
+        if entry:
+            # Changed on disk (damaged) or upstream (new git SHA)
+            if entry.get('sha256') != await asyncio.to_thread(file_sha256, local_path):
+                return False
+            return git_sha is None or entry.get('git_sha') == git_sha
+        # Files from before the manifest: adopt them if they match GitHub's checksum
+        adopted = await asyncio.to_thread(self._adopt, local_path, git_sha)
+        if adopted is None:
+            return False
+        manifest[path] = adopted
+        return True
+
+    @classmethod
+    def _adopt(cls, local_path: str, git_sha: str):
+        """Manifest entry for a file already on disk, None if it doesn't match git_sha"""
+        with open(local_path, 'rb') as f:
+            data = f.read()
+        if git_sha is not None and git_blob_sha(data) != git_sha:
+            return None
+        return cls._manifest_entry(data, git_sha)
+
+    async def _fetch(self, session, semaphore, manifest: dict, path: str, url: str, git_sha: str) -> str:
+        local_path = os.path.join(self.root, *path.split('/'))
+        if await self._is_current(manifest, path, local_path, git_sha):
+            return 'skipped'
+        try:
+            async with semaphore, session.get(url) as resp:
+                if resp.status != 200:
+                    print(f"❌ Failed to download {path}: Status {resp.status}")
+                    return 'failed'
+                data = await resp.read()
+        except Exception as e:
+            print(f"❌ Error downloading {path}: {e}")
+            return 'failed'
+
+        if git_sha is not None and git_blob_sha(data) != git_sha:
+            print(f"❌ Checksum mismatch for {path}, keeping the existing file")
+            return 'failed'
+        await asyncio.to_thread(write_atomic, local_path, data)
+        manifest[path] = self._manifest_entry(data, git_sha, url)
+        print(f"✅ Downloaded: {path}")
+        return 'downloaded'
+
+    @staticmethod
+    def _manifest_entry(data: bytes, git_sha: str, url: str = None) -> dict:
+        entry = {'sha256': hashlib.sha256(data).hexdigest(), 'size': len(data), 'git_sha': git_sha}
+        if url:
+            entry['source'] = url
+        return entry
+
+    def _load_manifest(self) -> dict:
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, manifest: dict):
+        write_atomic(self.manifest_path, json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+
+
+# Shared instance; started from main.py once the bot is ready
+resources = ResourceBootstrap(
+    root=config.RESOURCES_DIR,
+    repo=config.RESOURCES_GITHUB_REPO,
+    branch=config.RESOURCES_GITHUB_BRANCH,
+    concurrency=config.RESOURCE_DOWNLOAD_CONCURRENCY,
+)
@@ -0,0 +1,142 @@
+"""Restart-safe store for short-lived command sessions (createlist, track)"""
+from datetime import datetime, timedelta
+from database import db
+
+
+class SessionStore:
+    """
+    In-memory sessions of one kind, mirrored to the `sessions` collection
+
+    State must be plain data (IDs, names, counters) - never discord objects;
+    callers re-fetch messages lazily from the stored IDs. Every session has
+    a sliding TTL: expired sessions are dropped on access here and by the
+    MongoDB TTL index in the database, and at most `max_sessions` are kept
+    in memory (the ones closest to expiry are evicted first).
+    """
+
+    def __init__(self, kind: str, ttl: float, max_sessions: int = 1000):
+        self.kind = kind
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._sessions = {}  # key -> (state, expires_at)
+
+    def __len__(self):
+        self.purge()
+        return len(self._sessions)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    async def load(self):
+        """Restore unexpired sessions from the database (call from cog_load)"""
+        try:
+            docs = await db.get_sessions(self.kind)
+        except Exception as e:
+            print(f"⚠️ Could not restore {self.kind} sessions: {e}")
+            return 0
+
+        for doc in docs:
+            self._sessions[doc['key']] = (doc['state'], doc['expires_at'])
+        self._evict()
+        if docs:
+            print(f"✅ Restored {len(self._sessions)} {self.kind} session(s)")
+        return len(self._sessions)
+
+    def get(self, key):
+        """Session state (a mutable dict), or None if missing/expired"""
+        entry = self._sessions.get(key)
+        if entry is None:
+            return None
+        state, expires_at = entry
+        if expires_at <= datetime.utcnow():
+            del self._sessions[key]
+            return None
+        return state
+
+    def items(self):
+        """(key, state) pairs of every live session"""
+        self.purge()
+        return [(key, state) for key, (state, _) in self._sessions.items()]
+
+    def expires_in(self, key) -> float:
+        """Seconds until a session expires (0 if missing/expired)"""
+        entry = self._sessions.get(key)
+        if entry is None:
+            return 0
+        return max(0.0, (entry[1] - datetime.utcnow()).total_seconds())
+
+    async def put(self, key, state: dict, ttl: float = None):
+        """Create or replace a session and persist it"""
+        expires_at = datetime.utcnow() + timedelta(seconds=self.ttl if ttl is None else ttl)
+        self._sessions[key] = (state, expires_at)
+        self._evict()
+        await self._persist(key, state, expires_at)
+
+    async def save(self, key, ttl: float = None):
+        """Persist a session after mutating its state, extending its TTL"""
+        state = self.get(key)
+        if state is not None:
+            await self.put(key, state, ttl)
+
+    async def update(self, key, fields=(), appended: dict = None, ttl: float = None):
+        """
+        Persist part of a mutated session, extending its TTL
+        fields are written as they are now; appended ({field: items}) names items the
+        caller has already appended to list fields, so long lists aren't rewritten.
+        The whole state is written if the database has no copy of the session.
+        """
+        state = self.get(key)
+        if state is None:
+            return
+        expires_at = datetime.utcnow() + timedelta(seconds=self.ttl if ttl is None else ttl)
+        self._sessions[key] = (state, expires_at)
+        try:
+            stored = await db.update_session(self.kind, key, {name: state[name] for name in fields if name in state},
+                                             appended or {}, expires_at)
+        except Exception as e:
+            print(f"⚠️ Could not persist {self.kind} session {key}: {e}")
+            return
+        if not stored:
+            await self._persist(key, state, expires_at)
+
+    async def delete(self, key):
+        """Remove a session (no-op if missing)"""
+        await self.delete_many([key])
+
+    async def delete_where(self, predicate) -> int:
+        """Remove every session whose state matches predicate(key, state); returns how many"""
+        keys = [key for key, state in self.items() if predicate(key, state)]
+        await self.delete_many(keys)
+        return len(keys)
+
+    async def delete_many(self, keys: list):
+        keys = [key for key in keys if self._sessions.pop(key, None) is not None]
+        if not keys:
+            return
+        try:
+            await db.delete_sessions(self.kind, keys)
+        except Exception as e:
+            print(f"⚠️ Could not delete {self.kind} sessions: {e}")
+
+    def purge(self):
+        """Drop expired sessions from memory"""
+        now = datetime.utcnow()
+        for key in [k for k, (_, expires_at) in self._sessions.items() if expires_at <= now]:
+            del self._sessions[key]
+
+    def _evict(self):
+        if len(self._sessions) <= self.max_sessions:
+            return
+        self.purge()
+        overflow = len(self._sessions) - self.max_sessions
+        if overflow > 0:
+            oldest = sorted(self._sessions, key=lambda k: self._sessions[k][1])[:overflow]
+            for key in oldest:
+                del self._sessions[key]
+
+    async def _persist(self, key, state: dict, expires_at: datetime):
+        try:
+            await db.save_session(self.kind, key, state, expires_at)
+        except Exception as e:
+            # The session keeps working in memory, it just won't survive a restart
+            print(f"⚠️ Could not persist {self.kind} session {key}: {e}")
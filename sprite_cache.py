@@ -0,0 +1,52 @@
+"""In-process LRU of CDN sprite bytes shared by the image renderers"""
+from collections import OrderedDict
+
+from metrics import metrics
+
+# A Pokétwo sprite is 20-80 KB, so this keeps roughly the last thousand
+DEFAULT_MAX_BYTES = 48 * 1024 * 1024
+
+
+class SpriteCache:
+    """
+    Sprite PNG bytes by CDN URL, least recently used dropped first once max_bytes is exceeded
+
+    Bytes rather than decoded images: they are a fraction of the size, and every
+    renderer converts, resizes or recolours its own copy anyway. Every lookup is
+    recorded as a hit or miss of the 'sprite' cache.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()  # url -> bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, url: str):
+        data = self._entries.get(url)
+        metrics.cache_lookup('sprite', data is not None)
+        if data is not None:
+            self._entries.move_to_end(url)
+        return data
+
+    def put(self, url: str, data: bytes):
+        if len(data) > self.max_bytes:
+            return
+        previous = self._entries.pop(url, None)
+        if previous is not None:
+            self.size -= len(previous)
+        self._entries[url] = data
+        self.size += len(data)
+        while self.size > self.max_bytes:
+            _, dropped = self._entries.popitem(last=False)
+            self.size -= len(dropped)
+
+    def clear(self):
+        self._entries.clear()
+        self.size = 0
+
+
+# Shared instance; used by dex_image_generator, customimage and shinyprofile
+sprite_cache = SpriteCache()